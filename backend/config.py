@@ -156,6 +156,116 @@ LLM_CONNECT_TIMEOUT = int(os.getenv('LLM_CONNECT_TIMEOUT', '10'))
 LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '50'))
 OLLAMA_REQUEST_TIMEOUT = int(os.getenv('OLLAMA_REQUEST_TIMEOUT', '120'))
 
+# LLM Scheduler Configuration
+# Per-organization fair-share admission control in front of the connectors.
+# Organizations can override the per-org values in their config under
+# "llm_scheduler" (see lamb/completions/llm_scheduler.py).
+LLM_SCHEDULER_ENABLED = os.getenv('LLM_SCHEDULER_ENABLED', 'true').lower() == 'true'
+LLM_SCHEDULER_PROVIDER_MAX_CONCURRENT = int(
+    os.getenv('LLM_SCHEDULER_PROVIDER_MAX_CONCURRENT', str(LLM_MAX_CONNECTIONS)))
+LLM_SCHEDULER_ORG_MAX_CONCURRENT = int(os.getenv('LLM_SCHEDULER_ORG_MAX_CONCURRENT', '20'))
+LLM_SCHEDULER_ORG_MAX_QUEUE = int(os.getenv('LLM_SCHEDULER_ORG_MAX_QUEUE', '100'))
+LLM_SCHEDULER_ORG_TOKENS_PER_MINUTE = int(os.getenv('LLM_SCHEDULER_ORG_TOKENS_PER_MINUTE', '0'))
+LLM_SCHEDULER_MAX_QUEUE_WAIT = float(os.getenv('LLM_SCHEDULER_MAX_QUEUE_WAIT', '30'))
+LLM_SCHEDULER_RETRY_AFTER = float(os.getenv('LLM_SCHEDULER_RETRY_AFTER', '5'))
+LLM_SCHEDULER_CONFIG_CACHE_TTL = float(os.getenv('LLM_SCHEDULER_CONFIG_CACHE_TTL', '30'))
+
+# LLM Provider Circuit Breaker
+# Per (provider, base_url, model) health tracking; while a circuit is open the
+# OpenAI connector routes straight to the organization's fallback model.
+LLM_CIRCUIT_WINDOW_SECONDS = float(os.getenv('LLM_CIRCUIT_WINDOW_SECONDS', '60'))
+LLM_CIRCUIT_MIN_REQUESTS = int(os.getenv('LLM_CIRCUIT_MIN_REQUESTS', '5'))
+LLM_CIRCUIT_ERROR_THRESHOLD = float(os.getenv('LLM_CIRCUIT_ERROR_THRESHOLD', '0.5'))
+LLM_CIRCUIT_CONSECUTIVE_FAILURES = int(os.getenv('LLM_CIRCUIT_CONSECUTIVE_FAILURES', '5'))
+LLM_CIRCUIT_COOLDOWN_SECONDS = float(os.getenv('LLM_CIRCUIT_COOLDOWN_SECONDS', '30'))
+
+# Provider status / model catalog cache
+# Org dashboard status checks and /completions/list model catalogs are served
+# from a cache refreshed in the background every N seconds.
+PROVIDER_STATUS_REFRESH_INTERVAL = int(os.getenv('PROVIDER_STATUS_REFRESH_INTERVAL', '300'))
+PROVIDER_STATUS_REFRESH_CONCURRENCY = int(os.getenv('PROVIDER_STATUS_REFRESH_CONCURRENCY', '4'))
+
+# /v1/models cache
+# The model list is rebuilt when assistants change in this process; the TTL
+# bounds staleness when several workers share the database.
+MODELS_CACHE_TTL = int(os.getenv('MODELS_CACHE_TTL', '60'))
+
+# Pooled HTTP clients for the KB server and Library Manager
+# (creator_interface/http_client_pool.py)
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv('HTTP_POOL_MAX_CONNECTIONS', '100'))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv('HTTP_POOL_MAX_KEEPALIVE', '20'))
+HTTP_POOL_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_POOL_KEEPALIVE_EXPIRY', '30'))
+HTTP_POOL_HTTP2 = os.getenv('HTTP_POOL_HTTP2', 'true').lower() in ('true', '1', 'yes')
+KB_SERVER_HTTP_TIMEOUT = float(os.getenv('KB_SERVER_HTTP_TIMEOUT', '5'))
+LIBRARY_MANAGER_HTTP_TIMEOUT = float(os.getenv('LIBRARY_MANAGER_HTTP_TIMEOUT', '120'))
+# Concurrent per-KB detail requests when the KB server has no batch endpoint
+KB_DETAIL_FETCH_CONCURRENCY = int(os.getenv('KB_DETAIL_FETCH_CONCURRENCY', '8'))
+# Concurrent file uploads to the KB server per request
+KB_UPLOAD_CONCURRENCY = int(os.getenv('KB_UPLOAD_CONCURRENCY', '3'))
+
+# Library permalink proxy: seconds a positive (user, library) ACL check is reused
+PERMALINK_ACL_CACHE_TTL = float(os.getenv('PERMALINK_ACL_CACHE_TTL', '60'))
+
+# Password hashing pool (lamb/password_hasher.py)
+# bcrypt hash/verify runs in this many worker processes ("thread" pool if
+# PASSWORD_HASH_POOL=thread) instead of on the event loop. Operations beyond
+# PASSWORD_HASH_MAX_PENDING (queued + running) are rejected with a 503.
+PASSWORD_HASH_POOL = os.getenv('PASSWORD_HASH_POOL', 'process').lower()
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '256'))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv('PASSWORD_HASH_RETRY_AFTER', '2'))
+
+# Bulk user import (creator_interface/bulk_operations.py)
+# Rows hashed in parallel and written per transaction; background jobs
+# report progress after each batch.
+BULK_IMPORT_BATCH_SIZE = int(os.getenv('BULK_IMPORT_BATCH_SIZE', '100'))
+# Background jobs accept larger files than /bulk-import/execute (500 rows).
+# A job in 'pending'/'running' with no progress for BULK_IMPORT_JOB_STALE_SECONDS
+# was interrupted (restart, crashed worker) and is marked failed.
+BULK_IMPORT_JOB_MAX_USERS = int(os.getenv('BULK_IMPORT_JOB_MAX_USERS', '5000'))
+BULK_IMPORT_JOB_STALE_SECONDS = int(os.getenv('BULK_IMPORT_JOB_STALE_SECONDS', '600'))
+
+# LTI student launch fast path (lamb/lti_activity_manager.py)
+# Seconds an active activity lookup is reused per worker; group additions
+# arriving within the batch window share one OWI group write, and students
+# already in the group skip it.
+LTI_ACTIVITY_CACHE_TTL = float(os.getenv('LTI_ACTIVITY_CACHE_TTL', '30'))
+LTI_GROUP_BATCH_WINDOW_MS = float(os.getenv('LTI_GROUP_BATCH_WINDOW_MS', '50'))
+
+# AAC agent loop (lamb/aac/agent/loop.py)
+# Read-only tool calls from the same model turn run concurrently, at most
+# AAC_TOOL_CONCURRENCY at a time. Once the context sent to the model passes
+# AAC_CONTEXT_TOKEN_BUDGET tokens (0 = never), older tool results are cut to
+# AAC_COMPACT_RESULT_CHARS characters; the newest AAC_COMPACT_KEEP_RECENT_RESULTS
+# stay whole. The stored session conversation is not changed.
+AAC_TOOL_CONCURRENCY = int(os.getenv('AAC_TOOL_CONCURRENCY', '4'))
+AAC_CONTEXT_TOKEN_BUDGET = int(os.getenv('AAC_CONTEXT_TOKEN_BUDGET', '24000'))
+AAC_COMPACT_KEEP_RECENT_RESULTS = int(os.getenv('AAC_COMPACT_KEEP_RECENT_RESULTS', '4'))
+AAC_COMPACT_RESULT_CHARS = int(os.getenv('AAC_COMPACT_RESULT_CHARS', '400'))
+
+# Assistant test suites (lamb/services/test_service.py)
+# Scenario completions in flight per organization per worker during suite
+# runs. Results are kept for TEST_RUNNER_CACHE_TTL seconds (0 = no cache)
+# for runs that ask to reuse them.
+TEST_RUNNER_ORG_CONCURRENCY = int(os.getenv('TEST_RUNNER_ORG_CONCURRENCY', '4'))
+TEST_RUNNER_CACHE_TTL = float(os.getenv('TEST_RUNNER_CACHE_TTL', '3600'))
+TEST_RUNNER_CACHE_MAX_ENTRIES = int(os.getenv('TEST_RUNNER_CACHE_MAX_ENTRIES', '1000'))
+
+# AI rubric generation (lamb/evaluaitor/ai_generator.py)
+# Seconds one rubric generation/modification LLM call may take, including
+# streamed output. The call is cancelled if the client disconnects first.
+RUBRIC_AI_TIMEOUT = float(os.getenv('RUBRIC_AI_TIMEOUT', '180'))
+
+# Completion pipeline stage metrics (lamb/completions/stage_metrics.py)
+# Per-stage latency histograms for run_lamb_assistant, served in Prometheus
+# format on /metrics, which requires "Authorization: Bearer <METRICS_TOKEN>".
+# METRICS_TOKEN is empty by default, and /metrics answers 404 until it is set.
+# COMPLETION_SERVER_TIMING adds a Server-Timing header to completion
+# responses.
+COMPLETION_METRICS_ENABLED = os.getenv('COMPLETION_METRICS_ENABLED', 'true').lower() == 'true'
+COMPLETION_SERVER_TIMING = os.getenv('COMPLETION_SERVER_TIMING', 'true').lower() == 'true'
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
 # Validate required environment variables
 required_vars = ['OWI_PATH']
 missing_vars = [var for var in required_vars if not os.getenv(var)]
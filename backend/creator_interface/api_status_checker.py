@@ -10,6 +10,7 @@ import aiohttp
 import logging
 from typing import Dict, List, Any, Optional
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
+from lamb.completions.provider_health import provider_health, OPEN
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,22 @@ class APIStatusChecker:
                 if result:
                     provider_name = result["provider"]
                     results["providers"][provider_name] = result
+
+                    # Live circuit-breaker state from real completion traffic
+                    health = provider_health.snapshot(
+                        provider=provider_name,
+                        base_url=providers.get(provider_name, {}).get("base_url") or ""
+                    )
+                    result["health"] = health
+                    open_circuits = [h["model"] for h in health if h["state"] == OPEN]
+                    if open_circuits:
+                        results["summary"]["open_circuits"] = (
+                            results["summary"].get("open_circuits", 0) + len(open_circuits)
+                        )
+                        result.setdefault(
+                            "warning",
+                            f"Requests to {', '.join(open_circuits)} are being routed to the fallback model after repeated errors."
+                        )
                     
                     if result["status"] == "working":
                         results["summary"]["working_count"] += 1
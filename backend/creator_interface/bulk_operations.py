@@ -10,13 +10,16 @@ Date: November 2025
 
 import re
 import json
+import asyncio
 import logging
 import secrets
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from fastapi import UploadFile
 
-from backend.lamb.database_manager import LambDatabaseManager
-from backend.utils.pipelines.user_creator_manager import UserCreatorManager
+import config
+from lamb.database_manager import LambDatabaseManager
+from lamb.owi_bridge.owi_users import OwiUserManager
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +33,16 @@ class BulkImportValidator:
     VALID_USER_TYPES = ['creator', 'end_user']
     SUPPORTED_VERSION = '1.0'
     
-    def __init__(self, organization_id: int):
+    def __init__(self, organization_id: int, max_users: Optional[int] = None):
         """
         Initialize validator for specific organization
         
         Args:
             organization_id: ID of the organization to validate against
+            max_users: Maximum rows per file (default: MAX_USERS)
         """
         self.organization_id = organization_id
+        self.max_users = max_users or self.MAX_USERS
         self.db_manager = LambDatabaseManager()
     
     def validate_import_data(self, data: Dict) -> Dict:
@@ -76,9 +81,9 @@ class BulkImportValidator:
         if len(data['users']) < self.MIN_USERS:
             return self._error_response("'users' array cannot be empty")
         
-        if len(data['users']) > self.MAX_USERS:
+        if len(data['users']) > self.max_users:
             return self._error_response(
-                f"Too many users (max {self.MAX_USERS}, got {len(data['users'])})"
+                f"Too many users (max {self.max_users}, got {len(data['users'])})"
             )
         
         # 2. Validate each user
@@ -210,13 +215,23 @@ class BulkImportValidator:
 
 
 class BulkUserCreator:
-    """Handles bulk user creation with detailed result tracking"""
-    
+    """Handles bulk user creation with detailed result tracking
+
+    Rows are processed in batches of ``BULK_IMPORT_BATCH_SIZE``: existing
+    emails are found with one query up front, the random passwords of a
+    batch are hashed in parallel on the shared password pool, and each batch
+    is written with one transaction for the OWI mirror and one for LAMB.
+    """
+
+    # Attempts per password when the hashing pool is saturated by logins
+    HASH_ATTEMPTS = 3
+
     def __init__(
         self,
         organization_id: int,
         admin_user_id: int,
-        admin_email: str
+        admin_email: str,
+        batch_size: Optional[int] = None
     ):
         """
         Initialize bulk user creator
@@ -225,19 +240,28 @@ class BulkUserCreator:
             organization_id: Organization to create users in
             admin_user_id: ID of admin performing the operation
             admin_email: Email of admin (for logging)
+            batch_size: Rows per batch (default: config.BULK_IMPORT_BATCH_SIZE)
         """
         self.organization_id = organization_id
         self.admin_user_id = admin_user_id
         self.admin_email = admin_email
-        self.user_creator = UserCreatorManager()
+        self.batch_size = max(1, batch_size or config.BULK_IMPORT_BATCH_SIZE)
         self.db_manager = LambDatabaseManager()
+        self.hasher = get_password_hasher()
+        self._owi_manager = None
     
-    async def create_users(self, users: List[Dict]) -> Dict:
+    async def create_users(
+        self,
+        users: List[Dict],
+        on_batch: Optional[Callable[[List[Dict]], Any]] = None
+    ) -> Dict:
         """
         Create multiple users with result tracking
         
         Args:
             users: List of user dicts with email, name, user_type, enabled
+            on_batch: Called (in a worker thread) with the results of each
+                      finished batch, in import order
         
         Returns:
             {
@@ -260,25 +284,27 @@ class BulkUserCreator:
             }
         """
         results = []
-        created_count = 0
-        failed_count = 0
-        skipped_count = 0
         
         logger.info(
             f"Bulk user creation started by {self.admin_email} "
             f"for organization {self.organization_id}: {len(users)} users"
         )
         
-        for user in users:
-            result = await self._create_single_user(user)
-            results.append(result)
-            
-            if result['status'] == 'success':
-                created_count += 1
-            elif result['status'] == 'failed':
-                failed_count += 1
-            elif result['status'] == 'skipped':
-                skipped_count += 1
+        # Users that already exist are skipped (shouldn't happen if validation worked)
+        existing = await asyncio.to_thread(
+            self.db_manager.get_creator_user_ids_by_emails,
+            [user['email'] for user in users]
+        )
+        
+        for start in range(0, len(users), self.batch_size):
+            batch_results = await self._create_batch(users[start:start + self.batch_size], existing)
+            results.extend(batch_results)
+            if on_batch is not None:
+                await asyncio.to_thread(on_batch, batch_results)
+        
+        created_count = sum(1 for r in results if r['status'] == 'success')
+        failed_count = sum(1 for r in results if r['status'] == 'failed')
+        skipped_count = sum(1 for r in results if r['status'] == 'skipped')
         
         logger.info(
             f"Bulk user creation completed: "
@@ -296,89 +322,102 @@ class BulkUserCreator:
             "results": results
         }
     
-    async def _create_single_user(self, user: Dict) -> Dict:
+    async def _create_batch(self, users: List[Dict], existing: Dict[str, int]) -> List[Dict]:
         """
-        Create a single user with error handling
+        Create one batch of users
         
         Args:
-            user: User data dict
+            users: User data dicts for this batch
+            existing: Email -> user ID of users that already exist
         
         Returns:
-            {
-                "email": str,
-                "name": str,
-                "status": str,
-                "user_id": int | None,
-                "message": str
-            }
+            Result dicts aligned with ``users``
         """
-        email = user['email']
-        name = user['name']
-        user_type = user.get('user_type', 'creator')
-        enabled = user.get('enabled', False)
-        
-        try:
-            # Check if user already exists (shouldn't happen if validation worked)
-            existing_user = self.db_manager.get_creator_user_by_email(email)
-            if existing_user:
-                logger.warning(f"User {email} already exists, skipping")
-                return {
-                    "email": email,
-                    "name": name,
-                    "status": "skipped",
-                    "user_id": existing_user['id'],
-                    "message": "User already exists"
-                }
-            
-            # Generate random secure password
-            password = secrets.token_urlsafe(32)
-            
-            # Create user via UserCreatorManager
-            result = await self.user_creator.create_user(
-                email=email,
-                name=name,
-                password=password,
-                role='user',  # Default role
-                organization_id=self.organization_id,
-                user_type=user_type
+        results: List[Optional[Dict]] = [None] * len(users)
+        pending = []
+        
+        for index, user in enumerate(users):
+            if user['email'] in existing:
+                logger.warning(f"User {user['email']} already exists, skipping")
+                results[index] = self._result(
+                    user, "skipped", existing[user['email']], "User already exists"
+                )
+            else:
+                pending.append(index)
+        
+        # Random secure passwords, hashed in parallel; a few per pool worker at
+        # a time so the import never fills the queue that logins also use
+        slots = asyncio.Semaphore(self.hasher.workers * 2)
+        hashes = await asyncio.gather(*(self._hash_random_password(slots) for _ in pending))
+        to_insert = []
+        for index, password_hash in zip(pending, hashes):
+            if isinstance(password_hash, Exception):
+                logger.error(f"Failed to hash password for {users[index]['email']}: {password_hash}")
+                results[index] = self._result(
+                    users[index], "failed", None, f"Error: {password_hash}"
+                )
+            else:
+                to_insert.append((index, {
+                    "email": users[index]['email'],
+                    "name": users[index]['name'],
+                    "user_type": users[index].get('user_type', 'creator'),
+                    "enabled": users[index].get('enabled', False),
+                    "password_hash": password_hash,
+                }))
+        
+        if to_insert:
+            rows = [row for _, row in to_insert]
+            await asyncio.to_thread(self._create_owi_users, rows)
+            outcomes = await asyncio.to_thread(
+                self.db_manager.create_creator_users_batch, self.organization_id, rows
             )
-            
-            if not result.get('success'):
-                logger.error(f"Failed to create user {email}: {result.get('message')}")
-                return {
-                    "email": email,
-                    "name": name,
-                    "status": "failed",
-                    "user_id": None,
-                    "message": result.get('message', 'Unknown error')
-                }
-            
-            user_id = result['user_id']
-            
-            # Set enabled status if different from default (default is enabled=1)
-            if not enabled:
-                self.db_manager.disable_user(user_id)
-                logger.info(f"User {email} created in disabled state")
-            
-            logger.info(f"Created user {email} (ID: {user_id})")
-            
-            return {
-                "email": email,
-                "name": name,
-                "status": "success",
-                "user_id": user_id,
-                "message": "User created successfully" + (" (disabled)" if not enabled else "")
-            }
+            for (index, row), outcome in zip(to_insert, outcomes):
+                if outcome['user_id'] is None:
+                    logger.error(f"Failed to create user {row['email']}: {outcome['error']}")
+                    results[index] = self._result(
+                        users[index], "failed", None, outcome['error'] or 'Unknown error'
+                    )
+                else:
+                    logger.info(f"Created user {row['email']} (ID: {outcome['user_id']})")
+                    results[index] = self._result(
+                        users[index], "success", outcome['user_id'],
+                        "User created successfully" + (" (disabled)" if not row['enabled'] else "")
+                    )
         
+        return results
+    
+    async def _hash_random_password(self, slots: asyncio.Semaphore):
+        """Hash a random password, waiting out a saturated pool; returns the exception on failure"""
+        password = secrets.token_urlsafe(32)
+        for attempt in range(self.HASH_ATTEMPTS):
+            try:
+                async with slots:
+                    return await self.hasher.hash_async(password)
+            except PasswordHashingBusy as e:
+                if attempt == self.HASH_ATTEMPTS - 1:
+                    return e
+                await asyncio.sleep(e.retry_after)
+            except Exception as e:
+                return e
+    
+    def _create_owi_users(self, rows: List[Dict]) -> None:
+        """Mirror a batch into OWI (best-effort, non-fatal during dual-write)"""
+        try:
+            if self._owi_manager is None:
+                self._owi_manager = OwiUserManager()
+            self._owi_manager.create_users_batch(rows)
         except Exception as e:
-            logger.error(f"Exception creating user {email}: {str(e)}", exc_info=True)
-            return {
-                "email": email,
-                "name": name,
-                "status": "failed",
-                "user_id": None,
-                "message": f"Error: {str(e)}"
-            }
+            logger.warning(f"OWI mirror user creation failed for batch (non-fatal): {e}")
+    
+    @staticmethod
+    def _result(user: Dict, status: str, user_id: Optional[int], message: str) -> Dict:
+        return {
+            "email": user['email'],
+            "name": user['name'],
+            "status": status,
+            "user_id": user_id,
+            "message": message
+        }
 
 
 # Utility Functions
@@ -424,8 +463,8 @@ async def validate_bulk_import_file(
             "error": f"Invalid JSON syntax: {str(e)}"
         }
     
-    # Validate data
-    validator = BulkImportValidator(organization_id)
+    # Validate data (files too large for /execute can still run as a job)
+    validator = BulkImportValidator(organization_id, max_users=config.BULK_IMPORT_JOB_MAX_USERS)
     return validator.validate_import_data(data)
 
 
@@ -443,7 +482,7 @@ def generate_import_template() -> Dict:
             "Required fields: email, name",
             "Optional fields: user_type (default: creator), enabled (default: false)",
             "Valid user_types: creator, end_user",
-            "Maximum 500 users per import",
+            "Maximum 500 users per import (larger files run as a background job)",
             "Users will be created with random secure passwords",
             "Administrators should provide passwords to users separately"
         ],
@@ -522,3 +561,60 @@ def log_bulk_operation(
         logger.error(f"Failed to log bulk operation: {str(e)}", exc_info=True)
         return None
 
+
+
+async def run_bulk_import_job(
+    job_id: str,
+    organization_id: int,
+    admin_user_id: int,
+    admin_email: str,
+    users: List[Dict],
+    filename: Optional[str] = None
+) -> None:
+    """
+    Run a registered bulk import job in the background
+
+    Row results are stored after every batch so any worker can serve
+    progress for the job; the finished operation is logged like a
+    synchronous import.
+
+    Args:
+        job_id: Job created with ``LambDatabaseManager.create_bulk_import_job``
+        organization_id: Organization to create users in
+        admin_user_id: ID of admin performing the operation
+        admin_email: Email of admin
+        users: Validated user dicts
+        filename: Name of the imported file (optional)
+    """
+    db_manager = LambDatabaseManager()
+    try:
+        creator = BulkUserCreator(
+            organization_id=organization_id,
+            admin_user_id=admin_user_id,
+            admin_email=admin_email
+        )
+        result = await creator.create_users(
+            users,
+            on_batch=lambda results: db_manager.append_bulk_import_job_results(job_id, results)
+        )
+
+        log_id = await asyncio.to_thread(
+            log_bulk_operation,
+            db_manager=db_manager,
+            organization_id=organization_id,
+            admin_user_id=admin_user_id,
+            admin_email=admin_email,
+            operation_type='user_creation',
+            total_count=result['summary']['total'],
+            success_count=result['summary']['created'],
+            failure_count=result['summary']['failed'],
+            details={
+                "filename": filename or "direct_api",
+                "job_id": job_id,
+                "results": result['results']
+            }
+        )
+        await asyncio.to_thread(db_manager.finish_bulk_import_job, job_id, 'completed', None, log_id)
+    except Exception as e:
+        logger.error(f"Bulk import job {job_id} failed: {str(e)}", exc_info=True)
+        await asyncio.to_thread(db_manager.finish_bulk_import_job, job_id, 'failed', str(e))
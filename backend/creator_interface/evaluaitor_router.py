@@ -3,6 +3,7 @@ Creator Interface Router for Evaluaitor (Rubrics)
 Direct business logic layer - no HTTP proxying.
 """
 
+import asyncio
 import logging
 import json
 import io
@@ -18,7 +19,7 @@ from .user_creator import UserCreatorManager
 
 # Import business logic functions
 from lamb.evaluaitor import rubric_service
-from lamb.evaluaitor.ai_generator import generate_rubric_ai
+from lamb.evaluaitor.ai_generator import AIRubricGenerator, generate_rubric_ai, modify_rubric_ai
 from lamb.auth_context import AuthContext, get_auth_context
 
 # Initialize security context for dependency injection
@@ -569,6 +570,33 @@ async def export_rubric_markdown(
 
 # AI Integration Endpoints
 
+async def _run_unless_disconnected(request: Request, coro) -> Optional[Dict[str, Any]]:
+    """
+    Await an AI generation, cancelling it if the client disconnects first.
+
+    Returns None when the client went away (the LLM call has been cancelled).
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=0.5)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.info("Client disconnected, cancelling AI rubric generation")
+                return None
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+async def _ai_request_body(request: Request) -> Dict[str, Any]:
+    """Parse a JSON body, or form fields for older clients."""
+    if request.headers.get("content-type", "").startswith("application/json"):
+        return await request.json()
+    return dict(await request.form())
+
+
 @router.post("/ai-generate")
 async def ai_generate_rubric(request: Request, auth: AuthContext = Depends(get_auth_context)):
     """
@@ -608,13 +636,15 @@ async def ai_generate_rubric(request: Request, auth: AuthContext = Depends(get_a
         if not prompt:
             raise HTTPException(status_code=400, detail="Prompt is required")
 
-        # Call AI generator directly
-        result = generate_rubric_ai(
+        # Call AI generator; cancelled if the client disconnects
+        result = await _run_unless_disconnected(request, generate_rubric_ai(
             user_prompt=prompt,
             user_email=creator_user['email'],
             language=language,
             model=model
-        )
+        ))
+        if result is None:
+            return Response(status_code=499)
 
         return result
 
@@ -625,18 +655,68 @@ async def ai_generate_rubric(request: Request, auth: AuthContext = Depends(get_a
         raise HTTPException(status_code=500, detail=f"Failed to generate rubric with AI: {str(e)}")
 
 
+@router.post("/ai-generate/stream")
+async def ai_generate_rubric_stream(request: Request, auth: AuthContext = Depends(get_auth_context)):
+    """
+    Generate a rubric using AI, streaming the partial rubric JSON (SSE)
+
+    POST /creator/rubrics/ai-generate/stream
+
+    Request body: same as /ai-generate
+
+    Response: text/event-stream with
+        {"delta": "..."}              chunks of the model output as it arrives
+        {"status": "validating"}      model finished; parsing and validating
+        {"done": true, "result": {}}  same body as /ai-generate
+    followed by [DONE]. Closing the connection cancels the LLM call.
+    """
+    body = await request.json()
+    prompt = body.get('prompt')
+    if not prompt:
+        raise HTTPException(status_code=400, detail="Prompt is required")
+
+    try:
+        generator = AIRubricGenerator(auth.user['email'])
+    except Exception as e:
+        logger.error(f"Error creating AI generator: {e}")
+        raise HTTPException(status_code=500, detail=f"Configuration error: {str(e)}")
+
+    async def events():
+        async for event in generator.generate_rubric_stream(
+            prompt, body.get('language', 'en'), body.get('model')
+        ):
+            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post("/{rubric_id}/ai-modify")
 async def ai_modify_rubric(
     rubric_id: str,
-    prompt: str = Form(..., min_length=10, max_length=1000),
+    request: Request,
     creator_user: Dict[str, Any] = Depends(get_current_creator_user)
 ):
     """
-    Modify an existing rubric using AI
+    Modify an existing rubric using AI (preview only, does not save)
 
     POST /creator/rubrics/{rubric_id}/ai-modify
+
+    Request body (JSON, or form fields):
+        {
+            "prompt": "What to change",
+            "language": "en" (optional),
+            "model": "gpt-4o-mini" (optional override)
+        }
+
+    Response: same as /ai-generate, with the complete modified rubric
     """
     try:
+        body = await _ai_request_body(request)
+        prompt = (body.get('prompt') or '').strip()
+        if not 10 <= len(prompt) <= 1000:
+            raise HTTPException(status_code=400, detail="Prompt must be between 10 and 1000 characters")
+
         # Get existing rubric
         rubric = rubric_service.get_rubric_logic(
             rubric_id=rubric_id,
@@ -646,18 +726,21 @@ async def ai_modify_rubric(
         if not rubric:
             raise HTTPException(status_code=404, detail="Rubric not found or access denied")
 
-        # Import AI modifier
-        from lamb.evaluaitor.ai_generator import modify_rubric_ai
-        
-        # Modify rubric with AI
-        result = modify_rubric_ai(
-            rubric_id=rubric_id,
+        # Modify rubric with AI; cancelled if the client disconnects
+        result = await _run_unless_disconnected(request, modify_rubric_ai(
+            rubric_data=rubric['rubric_data'],
             modification_prompt=prompt,
-            user_email=creator_user['email']
-        )
+            user_email=creator_user['email'],
+            language=body.get('language', 'en'),
+            model=body.get('model')
+        ))
+        if result is None:
+            return Response(status_code=499)
 
         return result
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -0,0 +1,116 @@
+"""
+Shared, pooled httpx clients for backend-to-service calls.
+
+KBServerManager and LibraryManagerClient used to open a fresh
+``httpx.AsyncClient()`` per call, so every request to the KB server or the
+Library Manager paid a new TCP (and TLS) handshake. This module keeps one
+long-lived client per named upstream. httpx pools keep-alive connections per
+origin inside each client, so organizations pointing at different KB servers
+still get their own connections, reused across requests.
+
+Clients are created lazily on first use and closed from the application
+``lifespan`` (see ``backend/main.py``). HTTP/2 is negotiated when the optional
+``h2`` package is installed and the upstream offers it over TLS.
+
+Usage:
+    async with http_clients.session("kb_server") as client:
+        response = await client.get(url, headers=headers)
+"""
+
+import importlib.util
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+import config as app_config
+from lamb.logging_config import get_logger
+
+logger = get_logger(__name__, component="API")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientPool:
+    """Registry of long-lived ``httpx.AsyncClient`` instances keyed by upstream name."""
+
+    def __init__(self, max_connections: Optional[int] = None,
+                 max_keepalive_connections: Optional[int] = None,
+                 keepalive_expiry: Optional[float] = None,
+                 http2: Optional[bool] = None):
+        self.max_connections = max_connections if max_connections is not None \
+            else app_config.HTTP_POOL_MAX_CONNECTIONS
+        self.max_keepalive_connections = max_keepalive_connections if max_keepalive_connections is not None \
+            else app_config.HTTP_POOL_MAX_KEEPALIVE
+        self.keepalive_expiry = keepalive_expiry if keepalive_expiry is not None \
+            else app_config.HTTP_POOL_KEEPALIVE_EXPIRY
+        wanted_http2 = http2 if http2 is not None else app_config.HTTP_POOL_HTTP2
+        self.http2 = wanted_http2 and HTTP2_AVAILABLE
+        self._timeouts: Dict[str, float] = {
+            "kb_server": app_config.KB_SERVER_HTTP_TIMEOUT,
+            "library_manager": app_config.LIBRARY_MANAGER_HTTP_TIMEOUT,
+        }
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get(self, name: str, timeout: Optional[float] = None) -> httpx.AsyncClient:
+        """
+        Get (or lazily create) the shared client for an upstream
+
+        Args:
+            name: Upstream name, e.g. ``"kb_server"`` or ``"library_manager"``
+            timeout: Default timeout for a newly created client; individual
+                requests can still pass ``timeout=``
+
+        Returns:
+            httpx.AsyncClient: long-lived client; do not close it
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=timeout if timeout is not None else self._timeouts.get(name, 5.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self.http2,
+            )
+            self._clients[name] = client
+            logger.info(
+                f"Created pooled HTTP client '{name}' "
+                f"(max_connections={self.max_connections}, "
+                f"keepalive={self.max_keepalive_connections}, http2={self.http2})"
+            )
+        return client
+
+    @asynccontextmanager
+    async def session(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Drop-in for ``async with httpx.AsyncClient() as client`` that keeps the client open."""
+        yield self.get(name)
+
+    def stats(self) -> Dict[str, Any]:
+        """Open connection counts per upstream (best effort, for diagnostics)."""
+        result = {}
+        for name, client in self._clients.items():
+            pool = getattr(client._transport, "_pool", None)
+            connections = getattr(pool, "connections", []) if pool is not None else []
+            result[name] = {
+                "closed": client.is_closed,
+                "connections": len(connections),
+                "idle": sum(1 for conn in connections if conn.is_idle()),
+            }
+        return result
+
+    async def aclose(self):
+        """Close every client (called from the app lifespan)."""
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing pooled HTTP client '{name}': {e}")
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled HTTP client(s)")
+
+
+http_clients = HTTPClientPool()
@@ -1,3 +1,4 @@
+import asyncio
 import httpx
 import os
 import logging
@@ -8,8 +9,10 @@ from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from fastapi import HTTPException
 from .knowledgebase_classes import KnowledgeBaseCreate, KnowledgeBaseUpdate
+from .http_client_pool import http_clients
 from utils.name_sanitizer import sanitize_name
 from lamb.logging_config import get_logger
+import config as app_config
 
 # Load environment variables early so we can read module-specific env vars
 load_dotenv()
@@ -28,6 +31,11 @@ if not LAMB_KB_SERVER_TOKEN:
 # Check if KB server is configured
 KB_SERVER_CONFIGURED = LAMB_KB_SERVER is not None and LAMB_KB_SERVER.strip() != ''
 
+# KB server URLs that answered the batch lookup with 404/405/422 (older versions)
+_KB_BATCH_UNSUPPORTED = set()
+# Max IDs per POST /collections/batch (KB server limit)
+KB_BATCH_MAX_IDS = 500
+
 
 class KBServerManager:
     """Class to manage interactions with the Knowledge Base server"""
@@ -123,9 +131,9 @@ class KBServerManager:
             return False
             
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with http_clients.session("kb_server") as client:
                 headers = self._get_auth_headers(kb_token) if kb_token else None
-                response = await client.get(f"{kb_server_url}/health", headers=headers)
+                response = await client.get(f"{kb_server_url}/health", headers=headers, timeout=5.0)
                 if response.status_code == 200:
                     return True
                 else:
@@ -174,118 +182,56 @@ class KBServerManager:
         # Step 1: Fetch user's owned KBs from KB Server (for auto-registration)
         owned_kbs = await self._fetch_owned_kbs_from_kb_server(creator_user)
         
-        # Step 2: Auto-register missing KBs
+        # Step 2: Auto-register missing KBs (one transaction, existing entries ignored)
+        to_register = []
         for kb in owned_kbs:
             kb_id = str(kb.get('id', ''))
             kb_name = kb.get('name', '')
             if kb_id and kb_name:
-                if not db_manager.get_kb_registry_entry(kb_id):
-                    logger.info(f"Auto-registering KB {kb_id} ('{kb_name}') on first access")
-                    # Try to preserve original creation date from KB server if available
-                    creation_date = None
-                    if 'creation_date' in kb:
-                        # KB server might return ISO format date string
-                        try:
-                            from datetime import datetime
-                            if isinstance(kb['creation_date'], str):
-                                # Parse ISO format: "2025-10-20T14:07:40.163492"
-                                dt = datetime.fromisoformat(kb['creation_date'].replace('Z', '+00:00'))
-                                creation_date = int(dt.timestamp())
-                            elif isinstance(kb['creation_date'], (int, float)):
-                                # Already a timestamp
-                                creation_date = int(kb['creation_date'])
-                        except Exception as e:
-                            logger.warning(f"Could not parse creation_date from KB server: {e}")
-                            creation_date = None
-                    
-                    db_manager.register_kb(
-                        kb_id=kb_id,
-                        kb_name=kb_name,
-                        owner_user_id=user_id,
-                        organization_id=org_id,
-                        is_shared=False,
-                        metadata={'original_creation_date': creation_date} if creation_date else None
-                    )
-                    # If we have a creation date from KB server, update the registry entry
-                    if creation_date:
-                        # Update the created_at timestamp to match KB server's creation date
-                        db_manager.update_kb_registry_created_at(kb_id, creation_date)
-                        logger.info(f"Updated created_at for KB {kb_id} to match KB server creation date")
+                # Try to preserve original creation date from KB server if available
+                to_register.append({
+                    'kb_id': kb_id,
+                    'kb_name': kb_name,
+                    'created_at': self._parse_creation_date(kb.get('creation_date')),
+                })
+        db_manager.register_kbs_bulk(user_id, org_id, to_register)
         
         # Step 3: Get owned KB registry entries only
         kb_registry_entries = db_manager.get_owned_kbs(user_id, org_id)
         
         logger.info(f"Found {len(kb_registry_entries)} owned KB registry entries for user {user_id}")
         
-        # Step 4: Fetch KB details from KB Server for each registry entry
+        # Step 4: Fetch KB details from KB Server for all registry entries at once
         # Handle stale entries gracefully (lazy cleanup)
+        details = await self._fetch_kb_details(
+            kb_server_url, kb_token, [entry.get('kb_id') for entry in kb_registry_entries]
+        )
         owned_kbs_list = []
-        async with httpx.AsyncClient() as client:
-            for entry in kb_registry_entries:
-                kb_id = entry.get('kb_id')
-                if not kb_id:
-                    continue
-                    
-                try:
-                    response = await client.get(
-                        f"{kb_server_url}/collections/{kb_id}",
-                        headers=self._get_auth_headers(kb_token)
-                    )
-                    
-                    if response.status_code == 200:
-                        kb_data = response.json()
-                        
-                        # CRITICAL FIX: Use the kb_id from LAMB registry, not from KB server
-                        # The KB server may return a different ID format (UUID vs integer)
-                        # We must use the LAMB registry ID for consistency with RAG_collections
-                        kb_data['id'] = kb_id
-                        
-                        # Enhance with LAMB metadata - all owned KBs
-                        kb_data['is_owner'] = True
-                        kb_data['is_shared'] = entry.get('is_shared', False)
-                        kb_data['can_modify'] = True
-                        kb_data['shared_by'] = None
-                        # Use created_at from registry (LAMB database) instead of KB server
-                        # If not in registry, fallback to current time
-                        registry_created_at = entry.get('created_at')
-                        if registry_created_at:
-                            kb_data['created_at'] = registry_created_at
-                        elif 'creation_date' in kb_data:
-                            # Fallback: try to parse KB server's creation_date
-                            try:
-                                from datetime import datetime as dt
-                                creation_date = kb_data.get('creation_date')
-                                if isinstance(creation_date, str):
-                                    dt_obj = dt.fromisoformat(creation_date.replace('Z', '+00:00'))
-                                    kb_data['created_at'] = int(dt_obj.timestamp())
-                                else:
-                                    kb_data['created_at'] = int(time.time())
-                            except:
-                                kb_data['created_at'] = int(time.time())
-                        else:
-                            kb_data['created_at'] = int(time.time())
-                        kb_data['updated_at'] = entry.get('updated_at', int(time.time()))
-                        
-                        owned_kbs_list.append(kb_data)
-                        logger.info(f"Fetched owned KB {kb_id}: is_shared={kb_data['is_shared']}")
-                        
-                    elif response.status_code == 404:
-                        # Stale entry - KB deleted from KB Server
-                        logger.warning(f"Stale registry entry: KB {kb_id} not found in KB Server, removing from registry")
-                        db_manager.delete_kb_registry_entry(kb_id)
-                    else:
-                        logger.warning(f"KB Server returned {response.status_code} for KB {kb_id}, skipping")
-                        
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        # Stale entry cleanup
-                        logger.warning(f"Stale registry entry detected: KB {kb_id} not found")
-                        db_manager.delete_kb_registry_entry(kb_id)
-                    else:
-                        logger.warning(f"HTTP error fetching KB {kb_id}: {e}")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch KB {kb_id} from KB Server: {e}")
-                    continue
+        for entry in kb_registry_entries:
+            kb_id = entry.get('kb_id')
+            if not kb_id or kb_id not in details:
+                continue
+            kb_data = details[kb_id]
+            if kb_data is None:
+                # Stale entry - KB deleted from KB Server
+                logger.warning(f"Stale registry entry: KB {kb_id} not found in KB Server, removing from registry")
+                db_manager.delete_kb_registry_entry(kb_id)
+                continue
+            
+            # CRITICAL FIX: Use the kb_id from LAMB registry, not from KB server
+            # The KB server may return a different ID format (UUID vs integer)
+            # We must use the LAMB registry ID for consistency with RAG_collections
+            kb_data['id'] = kb_id
+            
+            # Enhance with LAMB metadata - all owned KBs
+            kb_data['is_owner'] = True
+            kb_data['is_shared'] = entry.get('is_shared', False)
+            kb_data['can_modify'] = True
+            kb_data['shared_by'] = None
+            self._apply_registry_timestamps(kb_data, entry)
+            
+            owned_kbs_list.append(kb_data)
+            logger.info(f"Fetched owned KB {kb_id}: is_shared={kb_data['is_shared']}")
         
         logger.info(f"Returning {len(owned_kbs_list)} owned KBs to user {user_id}")
         return owned_kbs_list
@@ -317,79 +263,152 @@ class KBServerManager:
         
         logger.info(f"Found {len(kb_registry_entries)} shared KB registry entries for user {user_id}")
         
-        # Fetch KB details from KB Server for each registry entry
+        # Fetch KB details from KB Server for all registry entries at once
         # Handle stale entries gracefully (lazy cleanup)
+        details = await self._fetch_kb_details(
+            kb_server_url, kb_token, [entry.get('kb_id') for entry in kb_registry_entries]
+        )
         shared_kbs_list = []
-        async with httpx.AsyncClient() as client:
-            for entry in kb_registry_entries:
-                kb_id = entry.get('kb_id')
-                if not kb_id:
-                    continue
-                    
-                try:
-                    response = await client.get(
-                        f"{kb_server_url}/collections/{kb_id}",
-                        headers=self._get_auth_headers(kb_token)
-                    )
-                    
-                    if response.status_code == 200:
-                        kb_data = response.json()
-                        
-                        # CRITICAL FIX: Use the kb_id from LAMB registry, not from KB server
-                        # The KB server may return a different ID format (UUID vs integer)
-                        # We must use the LAMB registry ID for consistency with RAG_collections
-                        kb_data['id'] = kb_id
-                        
-                        # Enhance with LAMB metadata - all shared KBs
-                        kb_data['is_owner'] = False
-                        kb_data['is_shared'] = True
-                        kb_data['can_modify'] = False
-                        kb_data['shared_by'] = entry.get('owner_name') or entry.get('owner_email', 'Unknown')
-                        # Use created_at from registry (LAMB database) instead of KB server
-                        # If not in registry, fallback to current time
-                        registry_created_at = entry.get('created_at')
-                        if registry_created_at:
-                            kb_data['created_at'] = registry_created_at
-                        elif 'creation_date' in kb_data:
-                            # Fallback: try to parse KB server's creation_date
-                            try:
-                                from datetime import datetime as dt
-                                creation_date = kb_data.get('creation_date')
-                                if isinstance(creation_date, str):
-                                    dt_obj = dt.fromisoformat(creation_date.replace('Z', '+00:00'))
-                                    kb_data['created_at'] = int(dt_obj.timestamp())
-                                else:
-                                    kb_data['created_at'] = int(time.time())
-                            except:
-                                kb_data['created_at'] = int(time.time())
-                        else:
-                            kb_data['created_at'] = int(time.time())
-                        kb_data['updated_at'] = entry.get('updated_at', int(time.time()))
-                        
-                        shared_kbs_list.append(kb_data)
-                        logger.info(f"Fetched shared KB {kb_id}: shared_by={kb_data['shared_by']}")
-                        
-                    elif response.status_code == 404:
-                        # Stale entry - KB deleted from KB Server
-                        logger.warning(f"Stale registry entry: KB {kb_id} not found in KB Server, removing from registry")
-                        db_manager.delete_kb_registry_entry(kb_id)
-                    else:
-                        logger.warning(f"KB Server returned {response.status_code} for KB {kb_id}, skipping")
-                        
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        # Stale entry cleanup
-                        logger.warning(f"Stale registry entry detected: KB {kb_id} not found")
-                        db_manager.delete_kb_registry_entry(kb_id)
-                    else:
-                        logger.warning(f"HTTP error fetching KB {kb_id}: {e}")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch KB {kb_id} from KB Server: {e}")
-                    continue
+        for entry in kb_registry_entries:
+            kb_id = entry.get('kb_id')
+            if not kb_id or kb_id not in details:
+                continue
+            kb_data = details[kb_id]
+            if kb_data is None:
+                # Stale entry - KB deleted from KB Server
+                logger.warning(f"Stale registry entry: KB {kb_id} not found in KB Server, removing from registry")
+                db_manager.delete_kb_registry_entry(kb_id)
+                continue
+            
+            # CRITICAL FIX: Use the kb_id from LAMB registry, not from KB server
+            # The KB server may return a different ID format (UUID vs integer)
+            # We must use the LAMB registry ID for consistency with RAG_collections
+            kb_data['id'] = kb_id
+            
+            # Enhance with LAMB metadata - all shared KBs
+            kb_data['is_owner'] = False
+            kb_data['is_shared'] = True
+            kb_data['can_modify'] = False
+            kb_data['shared_by'] = entry.get('owner_name') or entry.get('owner_email', 'Unknown')
+            self._apply_registry_timestamps(kb_data, entry)
+            
+            shared_kbs_list.append(kb_data)
+            logger.info(f"Fetched shared KB {kb_id}: shared_by={kb_data['shared_by']}")
         
         logger.info(f"Returning {len(shared_kbs_list)} shared KBs to user {user_id}")
         return shared_kbs_list
     
+    @staticmethod
+    def _upload_file_part(file: Any) -> tuple:
+        """Multipart tuple that streams an UploadFile's spooled file (httpx reads it in chunks)."""
+        file.file.seek(0)
+        return (file.filename, file.file, file.content_type or 'application/octet-stream')
+    
+    @staticmethod
+    def _upload_file_size(file: Any) -> int:
+        """Size of an UploadFile without reading it into memory."""
+        if getattr(file, 'size', None) is not None:
+            return file.size
+        position = file.file.tell()
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+        file.file.seek(position)
+        return size
+    
+    @staticmethod
+    def _parse_creation_date(creation_date: Any) -> Optional[int]:
+        """Convert a KB Server creation_date (ISO string or timestamp) to epoch seconds."""
+        if creation_date is None:
+            return None
+        try:
+            if isinstance(creation_date, str):
+                # Parse ISO format: "2025-10-20T14:07:40.163492"
+                dt = datetime.datetime.fromisoformat(creation_date.replace('Z', '+00:00'))
+                return int(dt.timestamp())
+            if isinstance(creation_date, (int, float)):
+                # Already a timestamp
+                return int(creation_date)
+        except Exception as e:
+            logger.warning(f"Could not parse creation_date from KB server: {e}")
+        return None
+    
+    def _apply_registry_timestamps(self, kb_data: Dict[str, Any], entry: Dict[str, Any]):
+        """Use created_at/updated_at from the LAMB registry, falling back to the KB server's creation_date."""
+        registry_created_at = entry.get('created_at')
+        if registry_created_at:
+            kb_data['created_at'] = registry_created_at
+        else:
+            kb_data['created_at'] = self._parse_creation_date(kb_data.get('creation_date')) or int(time.time())
+        kb_data['updated_at'] = entry.get('updated_at', int(time.time()))
+    
+    async def _fetch_kb_details(self, kb_server_url: str, kb_token: str,
+                                kb_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch collection details for many KBs.
+        
+        Uses the KB Server's POST /collections/batch endpoint when available and
+        falls back to concurrent GET /collections/{id} calls (bounded by
+        KB_DETAIL_FETCH_CONCURRENCY) for older KB servers.
+        
+        Args:
+            kb_server_url: KB server base URL
+            kb_token: KB server token
+            kb_ids: Registry KB IDs
+            
+        Returns:
+            Dict mapping kb_id to its collection data, or to None when the KB
+            no longer exists. IDs that could not be fetched are omitted.
+        """
+        kb_ids = [kb_id for kb_id in dict.fromkeys(kb_ids) if kb_id]
+        if not kb_ids:
+            return {}
+        headers = self._get_auth_headers(kb_token)
+        
+        async with http_clients.session("kb_server") as client:
+            numeric_ids = {kb_id: int(kb_id) for kb_id in kb_ids if str(kb_id).isdigit()}
+            if len(numeric_ids) == len(kb_ids) and kb_server_url not in _KB_BATCH_UNSUPPORTED:
+                try:
+                    by_id = {}
+                    ids = list(numeric_ids.values())
+                    for offset in range(0, len(ids), KB_BATCH_MAX_IDS):
+                        response = await client.post(
+                            f"{kb_server_url}/collections/batch",
+                            headers=headers,
+                            json={"ids": ids[offset:offset + KB_BATCH_MAX_IDS]}
+                        )
+                        if response.status_code != 200:
+                            break
+                        by_id.update({item.get('id'): item for item in response.json().get('items', [])})
+                    else:
+                        return {kb_id: by_id.get(numeric) for kb_id, numeric in numeric_ids.items()}
+                    if response.status_code in (404, 405, 422):
+                        # Older KB server without the batch endpoint
+                        logger.info(f"KB server {kb_server_url} has no batch endpoint, using per-KB requests")
+                        _KB_BATCH_UNSUPPORTED.add(kb_server_url)
+                    else:
+                        logger.warning(f"KB server batch lookup returned {response.status_code}, using per-KB requests")
+                except httpx.RequestError as e:
+                    logger.warning(f"KB server batch lookup failed: {e}, using per-KB requests")
+            
+            semaphore = asyncio.Semaphore(max(1, app_config.KB_DETAIL_FETCH_CONCURRENCY))
+            
+            async def fetch_one(kb_id: str):
+                async with semaphore:
+                    try:
+                        response = await client.get(f"{kb_server_url}/collections/{kb_id}", headers=headers)
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch KB {kb_id} from KB Server: {e}")
+                        return kb_id, False, None
+                if response.status_code == 200:
+                    return kb_id, True, response.json()
+                if response.status_code == 404:
+                    return kb_id, True, None
+                logger.warning(f"KB Server returned {response.status_code} for KB {kb_id}, skipping")
+                return kb_id, False, None
+            
+            results = await asyncio.gather(*(fetch_one(kb_id) for kb_id in kb_ids))
+        return {kb_id: data for kb_id, ok, data in results if ok}
+    
     async def _fetch_owned_kbs_from_kb_server(self, creator_user: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Helper: Fetch user's owned KBs from KB Server using owner parameter.
@@ -412,7 +431,7 @@ class KBServerManager:
         kb_server_collections_url = f"{kb_server_url}/collections"
         logger.info(f"Requesting user's owned collections from KB server at {kb_server_collections_url}")
         
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("kb_server") as client:
             try:
                 response = await client.get(
                     kb_server_collections_url, 
@@ -493,7 +512,7 @@ class KBServerManager:
         kb_data.name = sanitized_name
    
         # Create collection in KB server
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("kb_server") as client:
             kb_server_collections_url = f"{kb_server_url}/collections"
             logger.info(f"Creating collection in KB server at {kb_server_collections_url}: {sanitized_name}")
             
@@ -635,7 +654,7 @@ class KBServerManager:
         
         logger.info(f"Getting knowledge base details for ID: {kb_id} from KB server")
         
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("kb_server") as client:
             # Request collection details
             kb_server_collection_url = f"{kb_server_url}/collections/{kb_id}"
             logger.info(f"Requesting collection from KB server at {kb_server_collection_url}")
@@ -786,7 +805,7 @@ class KBServerManager:
         logger.info(f"Updating knowledge base {kb_id} via KB server")
         
         # Connect to KB server and update the collection
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("kb_server") as client:
             kb_server_collection_url = f"{kb_server_url}/collections/{kb_id}"
             logger.info(f"Connecting to KB server at: {kb_server_collection_url} to update collection")
             
@@ -938,7 +957,7 @@ class KBServerManager:
         headers = self._get_auth_headers(kb_token)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 # 1. Retrieve collection to verify existence & ownership
                 logger.info(f"Verifying ownership before hard delete: {collection_url}")
                 get_resp = await client.get(collection_url, headers=headers)
@@ -1032,7 +1051,7 @@ class KBServerManager:
         kb_server_collection_url = f"{kb_server_url}/collections/{kb_id}"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 # First check if the user has access to this collection
                 logger.info(f"Checking collection access at KB server: {kb_server_collection_url}")
                 
@@ -1157,7 +1176,7 @@ class KBServerManager:
         logger.info(f"Checking collection access at KB server: {kb_server_collection_url}")
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 # First verify collection exists and user has access
                 headers = self._get_auth_headers(kb_token)
                 
@@ -1197,26 +1216,28 @@ class KBServerManager:
                 collection_name = collection_data.get('name', '')
                 logger.info(f"Found knowledge base for upload: {collection_name}")
                 
-                # Process and upload files to KB server
-                uploaded_files = []
-                
                 # Ensure we have the owner ID as string in the collection data
                 if 'owner' in collection_data and collection_data['owner'] != str(creator_user.get('id')):
                     logger.info("Correcting owner field in collection data for KB server")
                     collection_data['owner'] = str(creator_user.get('id'))
                 
-                for file in files:
+                # Make sure headers are defined before use
+                upload_headers = self._get_auth_headers(kb_token)  # No Content-Type for multipart/form-data
+                # Use ingest-file endpoint instead of upload for proper file registration
+                # This endpoint combines upload, processing and registering in one operation
+                ingest_url = f"{kb_server_url}/collections/{str(kb_id)}/ingest-file"
+                logger.info(f"Ingesting {len(files)} file(s) to collection ID: {kb_id} via {ingest_url}")
+                
+                semaphore = asyncio.Semaphore(max(1, app_config.KB_UPLOAD_CONCURRENCY))
+                
+                async def upload_one(file) -> Dict[str, Any]:
                     try:
-                        # Prepare the file data
-                        content = await file.read()
-                        file.file.seek(0)  # Reset file pointer for future read
-                        
                         logger.info(f"Uploading file {file.filename} to KB server for collection {kb_id}")
                         
-                        # Create multipart/form-data for file upload
-                        upload_files = {
-                            'file': (file.filename, content, file.content_type or 'application/octet-stream')
-                        }
+                        # Create multipart/form-data for file upload; the spooled file is
+                        # streamed to the KB server in chunks instead of read into memory
+                        upload_files = {'file': self._upload_file_part(file)}
+                        size = self._upload_file_size(file)
                         
                         # Add collection_id and plugin parameters for file processing
                         form_data = {
@@ -1227,42 +1248,20 @@ class KBServerManager:
                             'chunk_overlap': '20',
                             'owner': str(creator_user.get('id'))  # Explicitly include owner as string
                         }
-                        logger.info(f"Including explicit collection_id={kb_id} and plugin params in form data")
-                        
-                        # Use ingest-file endpoint instead of upload for proper file registration
-                        # This endpoint combines upload, processing and registering in one operation
-                        ingest_url = f"{kb_server_url}/collections/{str(kb_id)}/ingest-file"
-                        
-                        # Add detailed debug logging
-                        logger.info(f"Ingesting file to collection ID: {kb_id}")
-                        logger.info(f"Ingest URL: {ingest_url}")
-                        
-                        # Make sure headers are defined before use
-                        upload_headers = self._get_auth_headers(kb_token)  # No Content-Type for multipart/form-data
+                        logger.debug(
+                            f"Equivalent curl command:\ncurl -X POST '{ingest_url}' -F 'file=@{file.filename}' "
+                            + " ".join([f"-F '{k}={v}'" for k, v in form_data.items()])
+                        )
                         
-                        # --- Construct and log equivalent curl command ---
-                        curl_headers = " ".join([f"-H '{k}: {v}'" for k, v in upload_headers.items()])
-                        # Represent file part - NOTE: This assumes the file exists at a path, which isn't true here.
-                        # We only have content. Representing with filename as placeholder.
-                        file_part_key = list(upload_files.keys())[0] # Should be 'file'
-                        file_name_for_curl = upload_files[file_part_key][0]
-                        curl_file_part = f"-F '{file_part_key}=@{file_name_for_curl}' # NOTE: File content sent, not path"
-                        # Represent other form data parts
-                        curl_form_parts = " ".join([f"-F '{k}={v}'" for k, v in form_data.items()])
-
-                        equivalent_curl = f"curl -X POST '{ingest_url}' {curl_headers} {curl_file_part} {curl_form_parts}"
-                        logger.info(f"Equivalent curl command:\n{equivalent_curl}")
-                        # --- End curl command logging ---
-
                         # Use a much longer timeout for the ingestion request to prevent timeouts
-                        # Create a new client with extended timeout for just this request
-                        async with httpx.AsyncClient(timeout=300.0) as ingestion_client:  # 5 minutes timeout
-                            logger.info(f"Sending ingestion request with extended timeout (300s)")
-                            ingest_response = await ingestion_client.post(
+                        # (per-request override on the pooled client)
+                        async with semaphore:
+                            ingest_response = await client.post(
                                 ingest_url, 
                                 headers=upload_headers, 
                                 files=upload_files,
-                                data=form_data  # Include the form data with collection_id and plugin params
+                                data=form_data,  # Include the form data with collection_id and plugin params
+                                timeout=300.0  # 5 minutes timeout
                             )
                         
                         if ingest_response.status_code == 200 or ingest_response.status_code == 201:
@@ -1271,31 +1270,30 @@ class KBServerManager:
                             logger.info(f"File {file.filename} ingested successfully to KB server with ID {file_data.get('id')}")
                             logger.info(f"Response data: {file_data}")
                             
-                            # Add to list of successfully uploaded files
-                            uploaded_files.append({
+                            return {
                                 "id": str(file_data.get('id')),
                                 "filename": file.filename,
-                                "size": len(content),
+                                "size": size,
                                 "content_type": file.content_type or 'application/octet-stream'
-                            })
-                        else:
-                            # Handle upload error
-                            logger.error(f"KB server returned error status during file ingestion: {ingest_response.status_code}")
-                            error_detail = "Unknown error"
-                            try:
-                                error_data = ingest_response.json()
-                                error_detail = error_data.get('detail', str(error_data))
-                            except Exception:
-                                error_detail = ingest_response.text or "Unknown error"
-                            
-                            raise HTTPException(
-                                status_code=ingest_response.status_code,
-                                detail=f"KB server file ingestion error: {error_detail}"
-                            )
+                            }
+                        
+                        # Handle upload error
+                        logger.error(f"KB server returned error status during file ingestion: {ingest_response.status_code}")
+                        error_detail = "Unknown error"
+                        try:
+                            error_data = ingest_response.json()
+                            error_detail = error_data.get('detail', str(error_data))
+                        except Exception:
+                            error_detail = ingest_response.text or "Unknown error"
+                        
+                        raise HTTPException(
+                            status_code=ingest_response.status_code,
+                            detail=f"KB server file ingestion error: {error_detail}"
+                        )
                             
-                    except HTTPException as he:
-                        # Re-raise HTTP exceptions
-                        raise he
+                    except (HTTPException, httpx.RequestError):
+                        # Re-raise HTTP exceptions; connection errors are mapped to 503 below
+                        raise
                     except Exception as e:
                         error_msg = f"Error processing file {file.filename}: {str(e)}"
                         logger.error(error_msg)
@@ -1304,6 +1302,13 @@ class KBServerManager:
                             detail=error_msg
                         )
                 
+                # Upload files concurrently (bounded by KB_UPLOAD_CONCURRENCY)
+                results = await asyncio.gather(*(upload_one(file) for file in files), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                uploaded_files = list(results)
+                
                 return {
                     "message": f"Successfully uploaded {len(uploaded_files)} files to knowledge base",
                     "knowledge_base_id": kb_id,
@@ -1340,7 +1345,7 @@ class KBServerManager:
         logger.info(f"Checking collection access at KB server: {kb_server_collection_url}")
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 # First verify collection exists and user has access
                 headers = self._get_auth_headers(kb_token)
                 
@@ -1468,7 +1473,7 @@ class KBServerManager:
         jobs_url = f"{kb_server_url}/collections/{kb_id}/ingestion-jobs"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 response = await client.get(
                     jobs_url,
                     headers=self._get_auth_headers(kb_token),
@@ -1518,7 +1523,7 @@ class KBServerManager:
         job_url = f"{kb_server_url}/collections/{kb_id}/ingestion-jobs/{job_id}"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 response = await client.get(
                     job_url,
                     headers=self._get_auth_headers(kb_token)
@@ -1544,6 +1549,54 @@ class KBServerManager:
             logger.error(f"Error connecting to KB server: {e}")
             raise HTTPException(status_code=503, detail=f"Unable to connect to KB server: {e}")
     
+    async def open_ingestion_job_events(
+        self,
+        kb_id: str,
+        job_id: int,
+        creator_user: Dict[str, Any]
+    ) -> httpx.Response:
+        """
+        Open the KB server's server-sent event stream for an ingestion job.
+        
+        The stream is idle between changes (with periodic keep-alives), so
+        only the connect timeout is bounded.
+        
+        Args:
+            kb_id: Knowledge base ID
+            job_id: Ingestion job ID
+            creator_user: Authenticated user information
+            
+        Returns:
+            Open httpx.Response in streaming mode; the caller iterates
+            ``aiter_raw()`` and must ``await response.aclose()``
+        """
+        kb_config = self._get_kb_config_for_user(creator_user)
+        job_url = f"{kb_config['url']}/collections/{kb_id}/ingestion-jobs/{job_id}/events"
+        
+        client = http_clients.get("kb_server")
+        request = client.build_request(
+            "GET", job_url,
+            headers=self._get_auth_headers(kb_config['token']),
+            timeout=httpx.Timeout(10.0, read=None)
+        )
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.RequestError as e:
+            logger.error(f"Error connecting to KB server: {e}")
+            raise HTTPException(status_code=503, detail=f"Unable to connect to KB server: {e}")
+        
+        if response.status_code == 200:
+            return response
+        await response.aread()
+        await response.aclose()
+        if response.status_code == 404:
+            raise HTTPException(status_code=404, detail="Ingestion job not found")
+        error_detail = self._extract_error_detail(response)
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"KB server error: {error_detail}"
+        )
+    
     async def get_ingestion_status_summary(
         self,
         kb_id: str,
@@ -1568,7 +1621,7 @@ class KBServerManager:
         status_url = f"{kb_server_url}/collections/{kb_id}/ingestion-status"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 response = await client.get(
                     status_url,
                     headers=self._get_auth_headers(kb_token)
@@ -1624,7 +1677,7 @@ class KBServerManager:
             body["new_params"] = override_params
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 response = await client.post(
                     retry_url,
                     headers=self._get_content_type_headers(kb_token),
@@ -1678,7 +1731,7 @@ class KBServerManager:
         cancel_url = f"{kb_server_url}/collections/{kb_id}/ingestion-jobs/{job_id}/cancel"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 response = await client.post(
                     cancel_url,
                     headers=self._get_auth_headers(kb_token)
@@ -1732,7 +1785,7 @@ class KBServerManager:
         plugins_url = f"{self.global_kb_server_url}/ingestion/plugins"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 headers = self._get_auth_headers(self.global_kb_server_token)
                 
                 response = await client.get(plugins_url, headers=headers)
@@ -1786,7 +1839,7 @@ class KBServerManager:
         kb_server_collection_url = f"{kb_server_url}/collections/{kb_id}"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("kb_server") as client:
                 # Verify collection exists and user has access
                 headers = self._get_auth_headers(kb_token)
                 
@@ -1823,14 +1876,10 @@ class KBServerManager:
                         detail="You don't have permission to upload files to this knowledge base"
                     )
                 
-                # Prepare the file data
-                content = await file.read()
-                file.file.seek(0)  # Reset file pointer for future read
-                
-                # Create multipart/form-data for file upload
-                upload_files = {
-                    'file': (file.filename, content, file.content_type or 'application/octet-stream')
-                }
+                # Create multipart/form-data for file upload; the spooled file is
+                # streamed to the KB server in chunks instead of read into memory
+                upload_files = {'file': self._upload_file_part(file)}
+                size = self._upload_file_size(file)
                 
                 logger.info(f"Using plugin {plugin_name} with parameters: {plugin_params}")
                 
@@ -1887,7 +1936,8 @@ class KBServerManager:
                     ingest_url,
                     headers=upload_headers,
                     files=upload_files,
-                    data=form_data
+                    data=form_data,
+                    timeout=300.0  # large uploads stream for a while
                 )
                 
                 if ingest_response.status_code in [200, 201]:
@@ -1910,7 +1960,7 @@ class KBServerManager:
                         "file": {
                             "id": str(ingest_data.get('id', ingest_data.get('file_registry_id', 'unknown'))),
                             "filename": file.filename,
-                            "size": len(content),
+                            "size": size,
                             "content_type": file.content_type or 'application/octet-stream',
                             "plugin_used": plugin_name
                         },
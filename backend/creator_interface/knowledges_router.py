@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Request, HTTPException, UploadFile, File, Depends, BackgroundTasks, Form
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import httpx
 import os
@@ -2351,6 +2352,61 @@ async def get_ingestion_job_status(
         raise HTTPException(status_code=500, detail=f"Error getting ingestion job status: {str(e)}")
 
 
+@router.get(
+    "/kb/{kb_id}/ingestion-jobs/{job_id}/events",
+    tags=["Knowledge Base Management", "Ingestion Status", "kb-server-connection"],
+    summary="Stream Ingestion Job Status",
+    description="""Stream status changes of an ingestion job as server-sent events instead of polling.
+
+Each `status` event carries the same body as the job status endpoint. The stream closes
+once the job is completed, failed, cancelled or deleted.
+
+Example:
+```
+event: status
+data: {"id": 5, "status": "processing", "progress": {"current": 67, "total": 150, ...}}
+```
+    """,
+    dependencies=[Depends(security)],
+    responses={
+        200: {"description": "text/event-stream of job status events"},
+        401: {"model": ErrorResponseDetail, "description": "Authentication failed"},
+        404: {"model": ErrorResponseDetail, "description": "Job or KB not found"},
+        503: {"model": ErrorResponseDetail, "description": "KB server offline"}
+    }
+)
+async def stream_ingestion_job_status(
+    kb_id: str,
+    job_id: int,
+    request: Request
+):
+    """Relay the KB server's event stream for an ingestion job"""
+    creator_user = await authenticate_creator_user(request)
+    
+    can_access, access_type = db_manager.user_can_access_kb(kb_id, creator_user['id'])
+    if not can_access:
+        raise HTTPException(status_code=404, detail="Knowledge Base not found")
+    
+    response = await kb_server_manager.open_ingestion_job_events(
+        kb_id=kb_id,
+        job_id=job_id,
+        creator_user=creator_user
+    )
+    
+    async def relay():
+        try:
+            async for chunk in response.aiter_raw():
+                yield chunk
+        finally:
+            await response.aclose()
+    
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get(
     "/kb/{kb_id}/ingestion-status",
     response_model=Union[IngestionStatusSummary, KnowledgeBaseServerOfflineResponse],
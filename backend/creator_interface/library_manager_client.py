@@ -1,20 +1,22 @@
 """HTTP client for the Library Manager microservice.
 
 Follows the same pattern as ``kb_server_manager.py``: resolves org-specific
-config, uses async httpx, and maps Library Manager responses to LAMB's
+config, uses the shared pooled httpx client, and maps Library Manager responses to LAMB's
 enriched format.
 """
 
 import json
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, Tuple, Union
 
 import httpx
 from fastapi import HTTPException, UploadFile
 
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
 
+from .http_client_pool import http_clients
+
 logger = logging.getLogger(__name__)
 
 LAMB_LIBRARY_SERVER = os.getenv("LAMB_LIBRARY_SERVER", "")
@@ -104,7 +106,7 @@ class LibraryManagerClient:
         url = f"{config['url'].rstrip('/')}{path}"
         headers = self._headers(config["token"])
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
+            async with http_clients.session("library_manager") as client:
                 response = await client.request(method, url, headers=headers, **kwargs)
                 if response.is_success:
                     if not response.content:
@@ -126,42 +128,53 @@ class LibraryManagerClient:
                 detail="Unable to connect to Library Manager",
             )
 
-    async def _fetch_bytes(self, method: str, path: str,
-                           config: Dict[str, str], **kwargs) -> httpx.Response:
-        """Make a request and return the full response with body read.
+    async def _open_stream(self, method: str, path: str, config: Dict[str, str],
+                           headers: Dict[str, str] = None,
+                           passthrough_statuses: Tuple[int, ...] = (),
+                           **kwargs) -> httpx.Response:
+        """Send a request and return the response without reading its body.
 
-        Used for export/proxy where we need the raw bytes. The httpx client
-        is properly closed via context manager after reading.
+        Used for export and permalink content so large bodies are relayed
+        chunk by chunk. The caller iterates ``response.aiter_raw()`` and must
+        ``await response.aclose()`` to release the pooled connection.
 
         Args:
             method: HTTP method.
-            path: URL path.
+            path: URL path (appended to server URL).
             config: Resolved config dict.
-            **kwargs: Passed to httpx request.
+            headers: Extra request headers to forward.
+            passthrough_statuses: Non-2xx statuses returned instead of raised.
+            **kwargs: Passed to ``client.build_request``.
 
         Returns:
-            httpx.Response with body already read.
+            Open httpx.Response in streaming mode.
 
         Raises:
-            HTTPException: On non-2xx or connection error.
+            HTTPException: On other non-2xx responses or connection errors.
         """
         url = f"{config['url'].rstrip('/')}{path}"
-        headers = self._headers(config["token"])
+        client = http_clients.get("library_manager")
+        kwargs.setdefault("timeout", 300.0)
+        request = client.build_request(
+            method, url,
+            headers={**(headers or {}), **self._headers(config["token"])},
+            **kwargs,
+        )
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                response = await client.request(method, url, headers=headers, **kwargs)
-                if not response.is_success:
-                    raise HTTPException(
-                        status_code=response.status_code,
-                        detail="Library Manager request failed",
-                    )
-                return response
+            response = await client.send(request, stream=True)
         except httpx.RequestError as exc:
             logger.error(f"Library Manager connection error: {exc}")
             raise HTTPException(
                 status_code=503,
                 detail="Unable to connect to Library Manager",
             )
+        if response.is_success or response.status_code in passthrough_statuses:
+            return response
+        await response.aclose()
+        raise HTTPException(
+            status_code=response.status_code,
+            detail="Library Manager request failed",
+        )
 
     # ------------------------------------------------------------------
     # Library CRUD
@@ -258,6 +271,16 @@ class LibraryManagerClient:
         return await self._request("GET", f"/libraries/{library_id}/items",
                                    config, params=params)
 
+    async def search_library(self, library_id: str, query: str, limit: int = 20,
+                             offset: int = 0,
+                             creator_user: Dict[str, Any] = None) -> Dict:
+        """Full-text search a library's content (ranked hits with snippets)."""
+        config = self._get_library_config(creator_user)
+        return await self._request(
+            "GET", f"/libraries/{library_id}/search", config,
+            params={"q": query, "limit": limit, "offset": offset},
+        )
+
     async def get_item(self, library_id: str, item_id: str,
                        creator_user: Dict[str, Any] = None) -> Dict:
         """Get details of a single library item."""
@@ -270,6 +293,22 @@ class LibraryManagerClient:
         config = self._get_library_config(creator_user)
         return await self._request("GET", f"/libraries/{library_id}/items/{item_id}/status", config)
 
+    async def stream_item_events(self, library_id: str, item_id: str,
+                                 creator_user: Dict[str, Any] = None) -> httpx.Response:
+        """Open an item's server-sent status event stream.
+
+        The stream stays idle between changes (with periodic keep-alives),
+        so only the connect timeout is bounded.
+
+        Returns:
+            Open httpx.Response; see ``_open_stream`` for the caller contract.
+        """
+        config = self._get_library_config(creator_user)
+        return await self._open_stream(
+            "GET", f"/libraries/{library_id}/items/{item_id}/events", config,
+            timeout=httpx.Timeout(10.0, read=None),
+        )
+
     async def delete_item(self, library_id: str, item_id: str,
                           creator_user: Dict[str, Any] = None) -> Dict:
         """Delete an item from a library."""
@@ -309,43 +348,68 @@ class LibraryManagerClient:
 
     async def export_library(self, library_id: str,
                              creator_user: Dict[str, Any] = None) -> httpx.Response:
-        """Export a library as a ZIP archive."""
+        """Open a streamed ZIP export of a library.
+
+        Returns:
+            Open httpx.Response; see ``_open_stream`` for the caller contract.
+        """
         config = self._get_library_config(creator_user)
-        return await self._fetch_bytes("GET", f"/libraries/{library_id}/export", config)
+        return await self._open_stream("GET", f"/libraries/{library_id}/export", config)
 
-    async def import_library_zip(self, organization_id: int, zip_data: bytes,
+    async def import_library_zip(self, organization_id: int,
+                                 zip_file: Union[BinaryIO, bytes],
                                  creator_user: Dict[str, Any] = None) -> Dict:
-        """Import a library from a ZIP archive."""
+        """Import a library from a ZIP archive.
+
+        Args:
+            organization_id: Target organization.
+            zip_file: Open binary file (streamed in chunks, e.g. an upload's
+                spooled temp file) or raw bytes.
+            creator_user: LAMB user dict.
+        """
         config = self._get_library_config(creator_user)
-        files = {"file": ("library.zip", zip_data, "application/zip")}
+        if hasattr(zip_file, "seek"):
+            zip_file.seek(0)
+        files = {"file": ("library.zip", zip_file, "application/zip")}
         return await self._request(
             "POST", "/libraries/import",
             config, files=files,
             params={"organization_id": str(organization_id)},
+            timeout=300.0,
         )
 
     # ------------------------------------------------------------------
     # Permalink proxy
     # ------------------------------------------------------------------
 
-    async def proxy_content(self, library_id: str, item_id: str, subpath: str,
-                            creator_user: Dict[str, Any] = None) -> httpx.Response:
-        """Proxy a permalink content request to the Library Manager.
+    async def stream_content(self, library_id: str, item_id: str, subpath: str,
+                             creator_user: Dict[str, Any] = None,
+                             headers: Dict[str, str] = None) -> httpx.Response:
+        """Open a streaming permalink content request to the Library Manager.
+
+        The body is not read: the caller iterates ``response.aiter_raw()``
+        and must ``await response.aclose()``.
+        Successful, partial (206), not-modified (304) and range-not-satisfiable
+        (416) responses are returned as-is so the caller can pass them through.
 
         Args:
             library_id: Library UUID.
             item_id: Content item UUID.
-            subpath: Remaining path after the item ID (e.g. ``content/full.md``).
+            subpath: Remaining path after the item ID.
             creator_user: LAMB user dict.
+            headers: Extra request headers to forward (``Range``, ``If-None-Match``...).
 
         Returns:
-            httpx.Response with body already read.
+            Open httpx.Response in streaming mode.
 
         Raises:
-            HTTPException: If subpath contains path traversal sequences.
+            HTTPException: On path traversal, other upstream errors, or connection errors.
         """
         if ".." in subpath or subpath.startswith("/"):
             raise HTTPException(status_code=400, detail="Invalid content path")
         config = self._get_library_config(creator_user)
-        path = f"/libraries/{library_id}/items/{item_id}/{subpath}"
-        return await self._fetch_bytes("GET", path, config)
+        return await self._open_stream(
+            "GET", f"/libraries/{library_id}/items/{item_id}/{subpath}", config,
+            headers=headers, passthrough_statuses=(304, 416),
+        )
+
@@ -4,14 +4,18 @@ Each endpoint: authenticate -> check ACL -> resolve org config -> call Library
 Manager -> update LAMB DB -> audit log -> return response.
 """
 
+import json
 import logging
+import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+import config as app_config
+
 from lamb.auth_context import AuthContext, get_auth_context
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
 from lamb.database_manager import LambDatabaseManager
@@ -97,9 +101,10 @@ async def import_library(
 ):
     """Import a library from a ZIP file."""
     org_id = auth.organization.get("id")
-    zip_data = await file.read()
 
-    result = await _client.import_library_zip(org_id, zip_data, creator_user=auth.user)
+    # Forward the spooled upload file; it is streamed to the Library Manager
+    # in chunks rather than read into memory.
+    result = await _client.import_library_zip(org_id, file.file, creator_user=auth.user)
 
     new_lib_id = result.get("library_id")
     if new_lib_id:
@@ -240,6 +245,7 @@ async def delete_library(
             raise
 
     _db.delete_library(library_id)
+    _invalidate_permalink_acl(library_id)
     _audit(auth, "library.delete", "library", library_id)
     return {"message": f"Library {library_id} deleted."}
 
@@ -253,6 +259,7 @@ async def toggle_sharing(
     """Enable or disable organization-wide sharing."""
     auth.require_library_access(library_id, level="owner")
     _db.toggle_library_sharing(library_id, body.is_shared)
+    _invalidate_permalink_acl(library_id)
     action = "library.share" if body.is_shared else "library.unshare"
     _audit(auth, action, "library", library_id)
     state = "shared with organization" if body.is_shared else "private"
@@ -424,6 +431,24 @@ async def list_items(
     return await _client.get_items(library_id, creator_user=auth.user, **params)
 
 
+@router.get("/{library_id}/search")
+async def search_library(
+    library_id: str,
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Full-text search across a library's items.
+
+    Results carry a snippet, the page number (when the item has pages) and
+    the item's permalink.
+    """
+    auth.require_library_access(library_id, level="any")
+    return await _client.search_library(
+        library_id, q, limit=limit, offset=offset, creator_user=auth.user)
+
+
 @router.get("/{library_id}/items/{item_id}")
 async def get_item(
     library_id: str,
@@ -460,6 +485,56 @@ async def get_item_status(
     return result
 
 
+@router.get("/{library_id}/items/{item_id}/events")
+async def stream_item_events(
+    library_id: str,
+    item_id: str,
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Relay an item's status changes as server-sent events.
+
+    Replaces polling ``/status``: the Library Manager pushes each change and
+    closes the stream once the item is ready or failed. The final status is
+    synced to LAMB's copy of the item like ``/status`` does.
+    """
+    auth.require_library_access(library_id, level="any")
+    response = await _client.stream_item_events(library_id, item_id, creator_user=auth.user)
+    return StreamingResponse(
+        _relay_item_events(response, item_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Item statuses the library manager stores; the event stream may also send
+# a synthetic "deleted" marker, which is relayed but never persisted.
+_LIBRARY_ITEM_STATUSES = {"pending", "processing", "ready", "failed"}
+
+
+async def _relay_item_events(response, item_id: str):
+    """Relay an item event stream, recording the last status seen."""
+    buffer = ""
+    last_status = None
+    try:
+        async for chunk in response.aiter_text():
+            yield chunk
+            buffer += chunk
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                if line.startswith("data: "):
+                    try:
+                        status = json.loads(line[len("data: "):]).get("status")
+                    except ValueError:
+                        continue
+                    if status in _LIBRARY_ITEM_STATUSES:
+                        last_status = status
+    finally:
+        await response.aclose()
+        lamb_item = _db.get_library_item(item_id)
+        if last_status and lamb_item and lamb_item.get("status") != last_status:
+            _db.update_library_item_status(item_id, last_status)
+
+
 @router.delete("/{library_id}/items/{item_id}")
 async def delete_item(
     library_id: str,
@@ -507,21 +582,33 @@ async def update_import_config(
 # ------------------------------------------------------------------
 
 
+async def _relay_body(response):
+    """Yield an open upstream response's raw bytes, always releasing it.
+
+    The ``finally`` also runs when the client disconnects mid-download.
+    """
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
 @router.get("/{library_id}/export")
 async def export_library(
     library_id: str,
     auth: AuthContext = Depends(get_auth_context),
 ):
-    """Export a library as a ZIP file."""
+    """Export a library as a ZIP file (streamed from the Library Manager)."""
     auth.require_library_access(library_id, level="any")
-    response = await _client.export_library(library_id, creator_user=auth.user)
 
     entry = _db.get_library(library_id)
     name = entry.get("name", "library") if entry else "library"
     safe_name = "".join(c if c.isalnum() or c in " -_." else "_" for c in name)
 
-    return Response(
-        content=response.content,
+    response = await _client.export_library(library_id, creator_user=auth.user)
+    return StreamingResponse(
+        _relay_body(response),
         media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{safe_name}.zip"'},
     )
@@ -533,16 +620,31 @@ async def export_library(
 
 permalink_proxy_router = APIRouter()
 
+# Request headers forwarded to the Library Manager so it can answer with
+# 206/304/416, and response headers passed back to the browser.
+_PERMALINK_FORWARD_REQUEST_HEADERS = (
+    "range", "if-range", "if-none-match", "if-modified-since", "accept-encoding",
+)
+_PERMALINK_FORWARD_RESPONSE_HEADERS = (
+    "content-type", "content-length", "content-range", "content-encoding",
+    "content-disposition", "accept-ranges", "etag", "last-modified", "cache-control",
+)
 
-@permalink_proxy_router.get("/docs/{org_id}/{library_id}/{item_id}/{subpath:path}")
-async def permalink_proxy(
-    org_id: str,
-    library_id: str,
-    item_id: str,
-    subpath: str,
-    auth: AuthContext = Depends(get_auth_context),
-):
-    """Proxy permalink requests to the Library Manager with ACL enforcement."""
+# (user_id, org_id, library_id) -> expiry of a positive ACL decision. Paging
+# through a PDF issues many range requests; this avoids re-running the
+# library ACL queries for each one.
+_permalink_acl_cache: Dict[Tuple[Any, Any, str], float] = {}
+_PERMALINK_ACL_CACHE_MAX = 10000
+
+
+def _invalidate_permalink_acl(library_id: str):
+    """Drop cached permalink ACL decisions for a library (sharing/deletion changed)."""
+    for key in [k for k in _permalink_acl_cache if k[2] == library_id]:
+        _permalink_acl_cache.pop(key, None)
+
+
+def _check_permalink_access(auth: AuthContext, org_id: str, library_id: str):
+    """Raise 404 unless the user may read ``library_id`` in ``org_id`` (cached)."""
     user_org_id = auth.organization.get("id")
     try:
         if int(org_id) != user_org_id:
@@ -550,21 +652,63 @@ async def permalink_proxy(
     except (ValueError, TypeError):
         raise HTTPException(status_code=404, detail="Not found")
 
+    key = (auth.user.get("id"), user_org_id, library_id)
+    now = time.monotonic()
+    expires = _permalink_acl_cache.get(key)
+    if expires is not None and expires > now:
+        return
+
     auth.require_library_access(library_id, level="any")
 
     entry = _db.get_library(library_id)
     if not entry or entry["organization_id"] != int(org_id):
         raise HTTPException(status_code=404, detail="Not found")
 
-    response = await _client.proxy_content(
+    if len(_permalink_acl_cache) >= _PERMALINK_ACL_CACHE_MAX:
+        _permalink_acl_cache.clear()
+    _permalink_acl_cache[key] = now + app_config.PERMALINK_ACL_CACHE_TTL
+
+
+@permalink_proxy_router.get("/docs/{org_id}/{library_id}/{item_id}/{subpath:path}")
+async def permalink_proxy(
+    org_id: str,
+    library_id: str,
+    item_id: str,
+    subpath: str,
+    request: Request,
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Proxy permalink requests to the Library Manager with ACL enforcement.
+
+    The upstream body is streamed through without buffering. Range and
+    conditional headers are forwarded, so 206 partial content and 304 Not
+    Modified responses from the Library Manager reach the browser.
+    """
+    _check_permalink_access(auth, org_id, library_id)
+
+    forward_headers = {
+        name: request.headers[name]
+        for name in _PERMALINK_FORWARD_REQUEST_HEADERS
+        if name in request.headers
+    }
+    # The raw upstream bytes are passed through, so never let httpx negotiate
+    # an encoding the browser did not ask for.
+    forward_headers.setdefault("accept-encoding", "identity")
+
+    response = await _client.stream_content(
         library_id=library_id,
         item_id=item_id,
         subpath=subpath,
         creator_user=auth.user,
+        headers=forward_headers,
     )
 
-    content_type = response.headers.get("content-type", "application/octet-stream")
-    return Response(
-        content=response.content,
-        media_type=content_type,
-    )
+    headers = {
+        name: response.headers[name]
+        for name in _PERMALINK_FORWARD_RESPONSE_HEADERS
+        if name in response.headers
+    }
+    headers.setdefault("cache-control", "private, no-cache")
+
+    return StreamingResponse(_relay_body(response), status_code=response.status_code,
+                             headers=headers)
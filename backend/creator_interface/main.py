@@ -482,6 +482,7 @@ Example Error Response:
     responses={
         200: {"model": LoginSuccessResponse, "description": "Login successful"},
         400: {"model": LoginErrorResponse, "description": "Login failed"},
+        503: {"model": LoginErrorResponse, "description": "Too many concurrent logins; retry after the Retry-After delay"},
     },
 )
 async def login(email: str = Form(...), password: str = Form(...)):
@@ -489,6 +490,14 @@ async def login(email: str = Form(...), password: str = Form(...)):
     user_creator = UserCreatorManager()
     result = await user_creator.verify_user(email, password)
 
+    if result.get("retry_after"):
+        # Password hashing pool saturated (login burst): ask the client to retry
+        return JSONResponse(
+            status_code=503,
+            content={"success": False, "error": result["error"]},
+            headers={"Retry-After": str(result["retry_after"])},
+        )
+
     if result["success"]:
         return {
             "success": True,
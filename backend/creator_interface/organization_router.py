@@ -3,19 +3,22 @@ Organization management router for creator interface
 Provides admin endpoints to manage organizations through the creator interface
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Request, File, UploadFile
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, Request, File, UploadFile
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
+import functools
 import httpx
 import json
 import time
+import uuid
 from datetime import datetime
 from lamb.auth_context import AuthContext, get_auth_context, require_admin, _build_auth_context
 import config
 from lamb.database_manager import LambDatabaseManager
 from lamb.logging_config import get_logger
 from lamb.owi_bridge.owi_users import OwiUserManager
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher
 from lamb.services import OrganizationService
 from schemas import BulkImportRequest, BulkUserActionRequest
 
@@ -1716,8 +1719,12 @@ Example Success Response:
     """,
     dependencies=[Depends(security)]
 )
-async def get_organization_dashboard(request: Request, org: Optional[str] = None):
-    """Get organization admin dashboard information"""
+async def get_organization_dashboard(request: Request, org: Optional[str] = None, refresh: bool = False):
+    """Get organization admin dashboard information
+
+    Provider status comes from the background-refreshed cache; pass
+    ``refresh=true`` to re-check the providers now.
+    """
     try:
         # If org parameter is provided, get organization by slug
         target_org_id = None
@@ -1741,10 +1748,10 @@ async def get_organization_dashboard(request: Request, org: Optional[str] = None
         config = organization.get('config', {})
         features = config.get('features', {})
         
-        # Check API status
-        from .api_status_checker import check_organization_api_status
+        # Check API status (cached, see provider_catalog_service)
+        from lamb.services.provider_catalog_service import provider_catalog_service
         try:
-            api_status = await check_organization_api_status(config)
+            api_status = await provider_catalog_service.get_api_status(org_id, config, refresh=refresh)
         except Exception as e:
             logger.error(f"Error checking API status: {e}")
             api_status = {
@@ -1932,14 +1939,21 @@ async def create_organization_user(request: Request, user_data: OrgAdminUserCrea
         admin_info = await verify_organization_admin_access(request, target_org_id)
         org_id = admin_info['organization_id']
         
-        # Create user with organization assignment
-        user_id = db_manager.create_creator_user(
-            user_email=user_data.email,
-            user_name=user_data.name,
-            password=user_data.password,
-            organization_id=org_id,
-            user_type=user_data.user_type
-        )
+        # Create user with organization assignment (bcrypt runs on the hashing pool)
+        try:
+            user_id = await get_password_hasher().run_sync(
+                functools.partial(
+                    db_manager.create_creator_user,
+                    user_email=user_data.email,
+                    user_name=user_data.name,
+                    password=user_data.password,
+                    organization_id=org_id,
+                    user_type=user_data.user_type
+                )
+            )
+        except PasswordHashingBusy as e:
+            raise HTTPException(status_code=503, detail=str(e),
+                                headers={"Retry-After": str(e.retry_after)})
         
         if not user_id:
             raise HTTPException(status_code=400, detail="Failed to create user")
@@ -2195,7 +2209,9 @@ async def delete_organization_user(request: Request, user_id: int, org: Optional
     }
     ```
     
-    Maximum 500 users per file, maximum file size 5MB.
+    Maximum BULK_IMPORT_JOB_MAX_USERS users per file (default 5000; files
+    over 500 users must be imported with `/bulk-import/jobs`), maximum file
+    size 5MB.
     
 Example Request:
 ```bash
@@ -2358,6 +2374,150 @@ async def execute_bulk_user_import(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/org-admin/users/bulk-import/jobs",
+    tags=["Organization Admin - Bulk Operations"],
+    summary="Start Bulk User Import Job",
+    status_code=202,
+    description="""Start a bulk user import in the background and return a job ID.
+
+    Takes the same body as `/bulk-import/execute`, with up to
+    BULK_IMPORT_JOB_MAX_USERS users (default 5000) instead of 500. Rows are
+    created in batches; poll `/bulk-import/jobs/{job_id}` for progress and
+    per-row results. A job interrupted by a restart is reported as `failed`.
+
+Example Request:
+```bash
+curl -X POST 'http://localhost:8000/creator/admin/org-admin/users/bulk-import/jobs' \\
+-H 'Authorization: Bearer <org_admin_token>' \\
+-H 'Content-Type: application/json' \\
+-d '{"users": [{"email": "user1@example.com", "name": "User One"}]}'
+```
+
+Example Response:
+```json
+{"job_id": "5f0c...", "status": "pending", "total": 1}
+```
+    """,
+    dependencies=[Depends(security)]
+)
+async def start_bulk_user_import_job(
+    request: Request,
+    import_data: BulkImportRequest,
+    background_tasks: BackgroundTasks,
+    org: Optional[str] = None
+):
+    """Start a background bulk user creation job"""
+    from .bulk_operations import run_bulk_import_job
+
+    try:
+        # If org parameter is provided, get organization by slug
+        target_org_id = None
+        if org:
+            target_organization = db_manager.get_organization_by_slug(org)
+            if not target_organization:
+                raise HTTPException(status_code=404, detail=f"Organization '{org}' not found")
+            target_org_id = target_organization['id']
+
+        admin_info = await verify_organization_admin_access(request, target_org_id)
+        org_id = admin_info['organization_id']
+
+        if not import_data.users:
+            raise HTTPException(status_code=400, detail="No users provided")
+
+        if len(import_data.users) > config.BULK_IMPORT_JOB_MAX_USERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Maximum {config.BULK_IMPORT_JOB_MAX_USERS} users per import job"
+            )
+
+        job_id = uuid.uuid4().hex
+        if not db_manager.create_bulk_import_job(
+            job_id=job_id,
+            organization_id=org_id,
+            admin_user_id=admin_info['user_id'],
+            admin_email=admin_info['user_email'],
+            total_count=len(import_data.users),
+            filename=import_data.filename
+        ):
+            raise HTTPException(status_code=500, detail="Failed to create bulk import job")
+
+        background_tasks.add_task(
+            run_bulk_import_job,
+            job_id=job_id,
+            organization_id=org_id,
+            admin_user_id=admin_info['user_id'],
+            admin_email=admin_info['user_email'],
+            users=[user.model_dump() for user in import_data.users],
+            filename=import_data.filename
+        )
+
+        logger.info(
+            f"Bulk import job {job_id} started by {admin_info['user_email']}: "
+            f"{len(import_data.users)} users"
+        )
+
+        return {"job_id": job_id, "status": "pending", "total": len(import_data.users)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error starting bulk import job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/org-admin/users/bulk-import/jobs/{job_id}",
+    tags=["Organization Admin - Bulk Operations"],
+    summary="Get Bulk User Import Job Progress",
+    description="""Get the status, counters and per-row results of a bulk import job.
+
+    Results are returned in import order starting at `offset`; pass the
+    returned `next_offset` on the next poll to receive only new rows.
+
+Example Request:
+```bash
+curl -X GET 'http://localhost:8000/creator/admin/org-admin/users/bulk-import/jobs/<job_id>?offset=0' \\
+-H 'Authorization: Bearer <org_admin_token>'
+```
+    """,
+    dependencies=[Depends(security)]
+)
+async def get_bulk_user_import_job(
+    request: Request,
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=500),
+    org: Optional[str] = None
+):
+    """Get bulk user creation job progress"""
+    try:
+        # If org parameter is provided, get organization by slug
+        target_org_id = None
+        if org:
+            target_organization = db_manager.get_organization_by_slug(org)
+            if not target_organization:
+                raise HTTPException(status_code=404, detail=f"Organization '{org}' not found")
+            target_org_id = target_organization['id']
+
+        admin_info = await verify_organization_admin_access(request, target_org_id)
+
+        db_manager.fail_stale_bulk_import_jobs(config.BULK_IMPORT_JOB_STALE_SECONDS, job_id=job_id)
+        job = db_manager.get_bulk_import_job(
+            job_id, admin_info['organization_id'], offset=offset, limit=limit
+        )
+        if not job:
+            raise HTTPException(status_code=404, detail="Bulk import job not found")
+
+        return job
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting bulk import job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get(
     "/org-admin/users/bulk-import/template",
     tags=["Organization Admin - Bulk Operations"],
@@ -2738,7 +2898,7 @@ async def update_signup_settings(request: Request, settings: OrgAdminSignupSetti
     description="Get current API configuration for the organization",
     dependencies=[Depends(security)]
 )
-async def get_api_settings(request: Request, org: Optional[str] = None):
+async def get_api_settings(request: Request, org: Optional[str] = None, refresh: bool = False):
     """Get organization API settings"""
     try:
         # If org parameter is provided, get organization by slug
@@ -2758,9 +2918,11 @@ async def get_api_settings(request: Request, org: Optional[str] = None):
         providers = default_setup.get('providers', {})
         
         # Get API status to show available models
-        from .api_status_checker import check_organization_api_status
+        from lamb.services.provider_catalog_service import provider_catalog_service
         try:
-            api_status = await check_organization_api_status(config)
+            api_status = await provider_catalog_service.get_api_status(
+                organization['id'], config, refresh=refresh
+            )
         except Exception as e:
             logger.error(f"Error checking API status for settings: {e}")
             api_status = {"providers": {}}
@@ -4746,6 +4908,8 @@ async def update_lti_activity(activity_id: int, request: Request, auth: AuthCont
 
         if updates:
             _db.update_lti_activity(activity_id, **updates)
+            from lamb.lti_activity_manager import invalidate_activity_cache
+            invalidate_activity_cache(activity['resource_link_id'])
 
         return {"success": True, "activity_id": activity_id}
     except HTTPException:
@@ -5,6 +5,7 @@ import config
 from lamb.database_manager import LambDatabaseManager
 from lamb.services import CreatorUserService
 from lamb.owi_bridge.owi_users import OwiUserManager
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher
 from lamb.logging_config import get_logger
 
 logger = get_logger(__name__, component="API")
@@ -24,6 +25,10 @@ class UserCreatorManager:
             raise ValueError(
                 "LAMB_BACKEND_HOST and API_KEY environment variables are required")
 
+    @staticmethod
+    def _busy_result(exc: PasswordHashingBusy) -> Dict[str, Any]:
+        return {"success": False, "error": str(exc), "data": None, "retry_after": exc.retry_after}
+
     async def update_user_password(self, email: str, new_password: str) -> Dict[str, Any]:
         """
         Update an existing user's password using OWI user manager directly
@@ -38,6 +43,14 @@ class UserCreatorManager:
         Note:
             LTI creator users cannot have their password changed.
         """
+        # bcrypt runs on the hashing pool; the DB work runs off the event loop
+        try:
+            return await get_password_hasher().run_sync(
+                self._update_user_password, email, new_password)
+        except PasswordHashingBusy as e:
+            return self._busy_result(e)
+
+    def _update_user_password(self, email: str, new_password: str) -> Dict[str, Any]:
         try:
             # Check if user is an LTI creator user (password changes not allowed)
             db_manager = LambDatabaseManager()
@@ -77,6 +90,8 @@ class UserCreatorManager:
                 "error": None
             }
                     
+        except PasswordHashingBusy:
+            raise
         except Exception as e:
             import traceback
             logger.error(f"Error updating password: {e}")
@@ -98,6 +113,14 @@ class UserCreatorManager:
         Returns:
             Dict[str, Any]: Response containing success status and error information if any
         """
+        try:
+            return await get_password_hasher().run_sync(
+                self._create_user, email, name, password, role, organization_id, user_type)
+        except PasswordHashingBusy as e:
+            return self._busy_result(e)
+
+    def _create_user(self, email: str, name: str, password: str, role: str,
+                     organization_id: Optional[int], user_type: str) -> Dict[str, Any]:
         try:
             # Create the creator user using service layer
             user_id = self.creator_user_service.create_user(
@@ -127,6 +150,8 @@ class UserCreatorManager:
 
             return {"success": True, "error": None, "user_id": user_id}
             
+        except PasswordHashingBusy:
+            raise
         except ValueError as e:
             logger.error(f"Error during user creation: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -142,6 +167,12 @@ class UserCreatorManager:
         If the user is the admin (as defined in OWI system) but not yet a creator user,
         they will be automatically added as a creator user.
         """
+        try:
+            return await get_password_hasher().run_sync(self._verify_user, email, password)
+        except PasswordHashingBusy as e:
+            return self._busy_result(e)
+
+    def _verify_user(self, email: str, password: str) -> Dict[str, Any]:
         try:
             # Try to verify using the service
             user_info = self.creator_user_service.verify_user(email, password)
@@ -210,6 +241,8 @@ class UserCreatorManager:
             else:
                 return {"success": False, "error": "Invalid credentials", "data": None}
         
+        except PasswordHashingBusy:
+            raise
         except ValueError as e:
             # Account disabled
             logger.error(f"ValueError during login: {str(e)}")
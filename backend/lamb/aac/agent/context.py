@@ -0,0 +1,117 @@
+"""Context compaction for the AAC agent loop.
+
+Every model call resends the system prompt and the whole conversation, and
+tool results (assistant configs, rubric exports, docs pages, test runs) are
+by far its largest part. Once the estimated size passes a token budget, the
+oldest tool results are cut down to a short head, oldest first, until the
+context fits again. The most recent tool results are never touched, so the
+model always sees what it just asked for in full.
+
+Compaction works on a copy: the stored conversation (shown in the UI and
+persisted with the session) keeps the full results.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from lamb.logging_config import get_logger
+
+logger = get_logger(__name__, component="AAC")
+
+# Rough characters per token when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+# Fixed per-message overhead (role, separators) in the chat format
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+_encoding: Any = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    """Load the tiktoken encoding once; None if tiktoken is not usable."""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.info(f"tiktoken unavailable, estimating tokens from length: {e}")
+            _encoding = None
+    return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a string."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def _message_tokens(message: dict) -> int:
+    tokens = _MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.get("content") or "")
+    if message.get("tool_calls"):
+        tokens += estimate_tokens(json.dumps(message["tool_calls"], ensure_ascii=False))
+    return tokens
+
+
+def estimate_messages_tokens(messages: list[dict]) -> int:
+    """Estimate the token count of a chat messages array."""
+    return sum(_message_tokens(m) for m in messages)
+
+
+def compact_messages(
+    messages: list[dict],
+    token_budget: int,
+    keep_recent_tool_results: int = 4,
+    truncated_chars: int = 400,
+) -> list[dict]:
+    """Return messages that fit token_budget by truncating old tool results.
+
+    Args:
+        messages: Chat messages (system prompt + conversation). Not modified.
+        token_budget: Target size; 0 or less disables compaction.
+        keep_recent_tool_results: Newest tool results that are always kept whole.
+        truncated_chars: Characters kept from the start of a compacted result.
+
+    Returns:
+        The original list if it already fits, otherwise a copy in which the
+        oldest tool results were shortened until it fits (or none are left).
+    """
+    if token_budget <= 0:
+        return messages
+    total = estimate_messages_tokens(messages)
+    if total <= token_budget:
+        return messages
+
+    tool_indexes = [i for i, m in enumerate(messages) if m.get("role") == "tool"]
+    if keep_recent_tool_results > 0:
+        tool_indexes = tool_indexes[:-keep_recent_tool_results]
+
+    compacted = list(messages)
+    count = 0
+    for i in tool_indexes:
+        if total <= token_budget:
+            break
+        content = compacted[i].get("content") or ""
+        if len(content) <= truncated_chars:
+            continue
+        short = (
+            f"{content[:truncated_chars]}\n"
+            f"[... {len(content) - truncated_chars} characters of this earlier tool result "
+            f"were removed to save context. Run the command again if you need them.]"
+        )
+        before = _message_tokens(compacted[i])
+        compacted[i] = {**compacted[i], "content": short}
+        total -= before - _message_tokens(compacted[i])
+        count += 1
+
+    if count:
+        logger.info(f"Compacted {count} old tool results; context now ~{total} tokens "
+                    f"(budget {token_budget})")
+    return compacted
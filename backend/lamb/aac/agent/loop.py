@@ -4,10 +4,12 @@ The loop:
 1. Check for pending action from previous turn — if user approved, execute it
 2. User sends message
 3. Build context: system prompt + conversation history + user message
+   (old tool results are truncated once the context passes its token budget)
 4. Call LLM with tool definitions
 5. If LLM returns tool calls:
    a. For each tool call, check authorization policy
-   b. "auto" → execute immediately
+   b. "auto" → execute immediately (independent read-only calls from the
+      same turn run concurrently, up to tool_concurrency at a time)
    c. "ask" → queue action, return description to LLM, STOP loop after LLM responds
    d. "never" → return error to LLM
 6. If LLM returns text → return to user
@@ -15,6 +17,7 @@ The loop:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -22,6 +25,8 @@ from typing import Any, AsyncIterator
 
 from openai import AsyncOpenAI
 
+import config
+from lamb.aac.agent.context import compact_messages
 from lamb.aac.authorization import ActionAuthorizer, classify_user_confirmation
 from lamb.aac.liteshell.shell import LiteShell, CommandContext
 from lamb.aac.session_logger import SessionLogger
@@ -195,6 +200,20 @@ _TOOL_LABELS = {
 }
 
 
+# Read-only commands with no ordering dependency between them: when the model
+# asks for several of these in one turn they run concurrently. Anything else
+# (writes, chat, test runs, skill loads, session rename) runs alone, in order.
+_CONCURRENT_SAFE_ACTIONS = frozenset({
+    "assistant.list", "assistant.list-shared", "assistant.list-published",
+    "assistant.get", "assistant.config", "assistant.debug",
+    "rubric.list", "rubric.list-public", "rubric.get", "rubric.export",
+    "kb.list", "kb.get",
+    "template.list", "template.get",
+    "help", "skill.list", "docs.index", "docs.read",
+    "test.scenarios", "test.runs", "test.run-detail",
+})
+
+
 def _parse_action_key(cmd: str) -> str:
     """Extract action key (e.g., 'assistant.get') from a command string."""
     tokens = cmd.strip().split()
@@ -347,6 +366,9 @@ class AgentLoop:
         conversation: Full conversation history.
         session_logger: Optional JSONL logger.
         pending_action: Queued write command awaiting user confirmation.
+        tool_concurrency: Max concurrent read-only tool calls from one turn.
+        context_token_budget: Context size above which old tool results are
+            truncated before calling the LLM (0 disables compaction).
     """
     shell: LiteShell
     llm_client: AsyncOpenAI
@@ -359,6 +381,8 @@ class AgentLoop:
     pending_action: dict | None = None
     tool_audit: list[dict] = field(default_factory=list)
     session_id: str = ""  # current AAC session ID (for self-referencing commands like session.rename)
+    tool_concurrency: int = field(default_factory=lambda: config.AAC_TOOL_CONCURRENCY)
+    context_token_budget: int = field(default_factory=lambda: config.AAC_CONTEXT_TOKEN_BUDGET)
 
     def load_skills(self, skills_dir: Path | str) -> None:
         """Append skill files (.md) to the system prompt."""
@@ -395,7 +419,7 @@ class AgentLoop:
         tool_rounds = 0
 
         while True:
-            messages = [{"role": "system", "content": self.system_prompt}] + self.conversation
+            messages = self._build_messages()
 
             response = await self.llm_client.chat.completions.create(
                 model=self.model,
@@ -425,19 +449,13 @@ class AgentLoop:
                     ],
                 })
 
-                # Process each tool call
-                should_stop = False
-                for tc in message.tool_calls:
-                    result = await self._execute_tool(tc)
-                    logger.info(f"Tool: {tc.function.arguments} → {result.get('success', '?')}")
-                    self.conversation.append({
-                        "role": "tool",
-                        "tool_call_id": tc.id,
-                        "content": json.dumps(result, default=str, ensure_ascii=False),
-                    })
-                    # If we queued a pending action, stop after LLM responds
-                    if result.get("awaiting_user_confirmation"):
-                        should_stop = True
+                # Process the tool calls (independent reads run concurrently)
+                results: dict[str, dict] = {}
+                async for event, tc, result in self._execute_tool_calls(message.tool_calls):
+                    if event == "done":
+                        logger.info(f"Tool: {tc.function.arguments} → {result.get('success', '?')}")
+                        results[tc.id] = result
+                should_stop = self._append_tool_results(message.tool_calls, results)
 
                 if tool_rounds >= self.max_tool_rounds:
                     self.conversation.append({
@@ -448,7 +466,7 @@ class AgentLoop:
                 if should_stop:
                     # Let LLM produce one more response explaining the pending action,
                     # then stop the loop
-                    messages = [{"role": "system", "content": self.system_prompt}] + self.conversation
+                    messages = self._build_messages()
                     final = await self.llm_client.chat.completions.create(
                         model=self.model,
                         messages=messages,
@@ -495,7 +513,7 @@ class AgentLoop:
         while True:
             yield {"status": "thinking"}
 
-            messages = [{"role": "system", "content": self.system_prompt}] + self.conversation
+            messages = self._build_messages()
             response = await self.llm_client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -518,24 +536,18 @@ class AgentLoop:
                     ],
                 })
 
-                should_stop = False
-                for tc in message.tool_calls:
-                    # Emit status before executing
+                results: dict[str, dict] = {}
+                async for event, tc, result in self._execute_tool_calls(message.tool_calls):
                     cmd = _describe_tool_call(tc)
-                    yield {"status": "tool", "command": cmd}
-
-                    result = await self._execute_tool(tc)
+                    if event == "start":
+                        # Emit status before executing
+                        yield {"status": "tool", "command": cmd}
+                        continue
                     ok = result.get("success", False)
                     logger.info(f"Tool: {tc.function.arguments} → {ok}")
-
                     yield {"status": "tool_done", "command": cmd, "success": ok}
-
-                    self.conversation.append({
-                        "role": "tool", "tool_call_id": tc.id,
-                        "content": json.dumps(result, default=str, ensure_ascii=False),
-                    })
-                    if result.get("awaiting_user_confirmation"):
-                        should_stop = True
+                    results[tc.id] = result
+                should_stop = self._append_tool_results(message.tool_calls, results)
 
                 if tool_rounds >= self.max_tool_rounds:
                     self.conversation.append({
@@ -545,7 +557,7 @@ class AgentLoop:
 
                 if should_stop:
                     yield {"status": "responding"}
-                    messages = [{"role": "system", "content": self.system_prompt}] + self.conversation
+                    messages = self._build_messages()
                     full_text = ""
                     stream = await self.llm_client.chat.completions.create(
                         model=self.model, messages=messages, stream=True,
@@ -564,7 +576,7 @@ class AgentLoop:
 
             # No tool calls — stream the final text response
             yield {"status": "responding"}
-            messages = [{"role": "system", "content": self.system_prompt}] + self.conversation
+            messages = self._build_messages()
             full_text = ""
             stream = await self.llm_client.chat.completions.create(
                 model=self.model, messages=messages, stream=True,
@@ -579,6 +591,77 @@ class AgentLoop:
                 self.session_logger.log_agent_response(full_text)
             return
 
+    def _build_messages(self) -> list[dict]:
+        """System prompt + conversation, compacted to the context token budget."""
+        messages = [{"role": "system", "content": self.system_prompt}] + self.conversation
+        return compact_messages(
+            messages,
+            self.context_token_budget,
+            keep_recent_tool_results=config.AAC_COMPACT_KEEP_RECENT_RESULTS,
+            truncated_chars=config.AAC_COMPACT_RESULT_CHARS,
+        )
+
+    def _runs_concurrently(self, tool_call: Any) -> bool:
+        """True if the call is an auto-approved read with no ordering needs."""
+        try:
+            command = json.loads(tool_call.function.arguments).get("command", "")
+        except (json.JSONDecodeError, AttributeError):
+            return False
+        action_key = self.authorizer.resolve_action_key(command) if command else None
+        return action_key in _CONCURRENT_SAFE_ACTIONS and self.authorizer.check(action_key) == "auto"
+
+    async def _execute_tool_calls(self, tool_calls: list[Any]) -> AsyncIterator[tuple[str, Any, dict | None]]:
+        """Execute one turn's tool calls, yielding ("start"|"done", call, result).
+
+        Consecutive concurrency-safe calls run together, at most
+        tool_concurrency at a time, and report "done" as they finish. Other
+        calls run one at a time in the order the model asked for them.
+        """
+        groups: list[list[Any]] = []
+        for tc in tool_calls:
+            if self._runs_concurrently(tc) and groups and self._runs_concurrently(groups[-1][0]):
+                groups[-1].append(tc)
+            else:
+                groups.append([tc])
+
+        semaphore = asyncio.Semaphore(max(1, self.tool_concurrency))
+
+        async def run(tc: Any) -> tuple[Any, dict]:
+            async with semaphore:
+                return tc, await self._execute_tool(tc)
+
+        for group in groups:
+            if len(group) == 1:
+                yield "start", group[0], None
+                yield "done", group[0], await self._execute_tool(group[0])
+                continue
+
+            for tc in group:
+                yield "start", tc, None
+            tasks = [asyncio.create_task(run(tc)) for tc in group]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    tc, result = await next_done
+                    yield "done", tc, result
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    def _append_tool_results(self, tool_calls: list[Any], results: dict[str, dict]) -> bool:
+        """Append tool results in call order; True if an action awaits confirmation."""
+        should_stop = False
+        for tc in tool_calls:
+            result = results[tc.id]
+            self.conversation.append({
+                "role": "tool",
+                "tool_call_id": tc.id,
+                "content": json.dumps(result, default=str, ensure_ascii=False),
+            })
+            # If we queued a pending action, stop after LLM responds
+            if result.get("awaiting_user_confirmation"):
+                should_stop = True
+        return should_stop
+
     async def _execute_tool(self, tool_call: Any) -> dict:
         """Execute a tool call, checking authorization policy."""
         try:
@@ -236,6 +236,8 @@ async def send_message(
         pending_action=agent.pending_action,
         skill_info=skill_info,
         tool_audit=agent.tool_audit,
+        base_message_count=session["message_count"],
+        base_audit_count=session["audit_count"],
     )
 
     stats = agent.get_stats()
@@ -293,6 +295,8 @@ async def send_message_stream(
             pending_action=agent.pending_action,
             skill_info=skill_info,
             tool_audit=agent.tool_audit,
+            base_message_count=session["message_count"],
+            base_audit_count=session["audit_count"],
         )
         stats = agent.get_stats()
         if agent.session_logger:
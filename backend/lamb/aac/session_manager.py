@@ -2,6 +2,13 @@
 
 Sessions track the conversation between a user and the AAC agent,
 along with the assistant being designed and any test results.
+
+Storage is append-only: every conversation message and tool audit entry is
+one row in ``aac_session_events`` keyed by (session_id, seq), and the
+``conversation`` column of ``aac_sessions`` holds only a small state envelope
+(pending action, skill info, counters). Saving a turn inserts the new rows
+instead of rewriting the whole history; the conversation is rebuilt from
+the events when a session is read.
 """
 
 from __future__ import annotations
@@ -17,12 +24,23 @@ from lamb.logging_config import get_logger
 logger = get_logger(__name__, component="AAC")
 
 
+_EMPTY_STATE = {
+    "storage": "events", "pending_action": None, "skill_info": None, "next_seq": 0,
+    "message_count": 0, "audit_count": 0, "turn_count": 0, "tool_errors": 0,
+}
+
+
+def _is_event_envelope(raw: Any) -> bool:
+    return isinstance(raw, dict) and raw.get("storage") == "events"
+
+
 class AACSessionManager:
     """Manage AAC design sessions."""
 
     def __init__(self):
         self.db = LambDatabaseManager()
         self._table = f"{self.db.table_prefix}aac_sessions"
+        self._events_table = f"{self.db.table_prefix}aac_session_events"
 
     def create_session(
         self,
@@ -40,8 +58,9 @@ class AACSessionManager:
             cursor.execute(
                 f"""INSERT INTO {self._table}
                    (id, assistant_id, user_email, organization_id, status, conversation, title, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, 'active', '[]', ?, ?, ?)""",
-                (session_id, assistant_id, user_email, organization_id, title, now, now),
+                   VALUES (?, ?, ?, ?, 'active', ?, ?, ?, ?)""",
+                (session_id, assistant_id, user_email, organization_id,
+                 json.dumps(_EMPTY_STATE), title, now, now),
             )
             conn.commit()
         finally:
@@ -55,7 +74,12 @@ class AACSessionManager:
         }
 
     def get_session(self, session_id: str, user_email: str) -> Optional[dict]:
-        """Get a session by ID (scoped to user)."""
+        """Get a session by ID (scoped to user).
+
+        The conversation and tool audit are rebuilt from the session events.
+        ``message_count`` and ``audit_count`` record how much history was
+        read; pass them back to ``update_conversation`` as the base counts.
+        """
         conn = self.db.get_connection()
         try:
             cursor = conn.cursor()
@@ -68,9 +92,13 @@ class AACSessionManager:
                 return None
             columns = [desc[0] for desc in cursor.description]
             session = dict(zip(columns, row))
-            raw = json.loads(session.get("conversation", "[]"))
-            # Support both old format (plain list) and new format (envelope)
-            if isinstance(raw, dict) and "messages" in raw:
+            raw = json.loads(session.get("conversation") or "[]")
+            if _is_event_envelope(raw):
+                session["pending_action"] = raw.get("pending_action")
+                session["skill_info"] = raw.get("skill_info")
+                session["conversation"], session["tool_audit"] = self._load_events(cursor, session_id)
+            # Sessions not yet moved to events (old plain list or envelope)
+            elif isinstance(raw, dict) and "messages" in raw:
                 session["conversation"] = raw["messages"]
                 session["pending_action"] = raw.get("pending_action")
                 session["skill_info"] = raw.get("skill_info")
@@ -80,10 +108,24 @@ class AACSessionManager:
                 session["pending_action"] = None
                 session["skill_info"] = None
                 session["tool_audit"] = []
+            session["message_count"] = len(session["conversation"])
+            session["audit_count"] = len(session["tool_audit"])
             return session
         finally:
             conn.close()
 
+    def _load_events(self, cursor, session_id: str) -> tuple[list[dict], list[dict]]:
+        """Rebuild (conversation, tool_audit) from a session's events."""
+        cursor.execute(
+            f"SELECT kind, payload FROM {self._events_table} WHERE session_id = ? ORDER BY seq",
+            (session_id,),
+        )
+        messages: list[dict] = []
+        audit: list[dict] = []
+        for kind, payload in cursor.fetchall():
+            (messages if kind == "message" else audit).append(json.loads(payload))
+        return messages, audit
+
     def list_sessions(self, user_email: str) -> list[dict]:
         """List all sessions for a user with tool stats."""
         conn = self.db.get_connection()
@@ -106,16 +148,23 @@ class AACSessionManager:
                 skill_id = None
                 try:
                     raw = json.loads(s.get("conversation") or "[]")
-                    if isinstance(raw, dict):
-                        messages = raw.get("messages", [])
-                        audit = raw.get("tool_audit", [])
-                        skill_info = raw.get("skill_info") or {}
-                        skill_id = skill_info.get("skill_id")
-                        tool_calls = len(audit)
-                        tool_errors = sum(1 for e in audit if not e.get("success"))
+                    if _is_event_envelope(raw):
+                        # Counters are kept in the envelope; no events are read
+                        turn_count = raw.get("turn_count", 0)
+                        tool_calls = raw.get("audit_count", 0)
+                        tool_errors = raw.get("tool_errors", 0)
+                        skill_id = (raw.get("skill_info") or {}).get("skill_id")
                     else:
-                        messages = raw
-                    turn_count = sum(1 for m in messages if m.get("role") == "user")
+                        if isinstance(raw, dict):
+                            messages = raw.get("messages", [])
+                            audit = raw.get("tool_audit", [])
+                            skill_info = raw.get("skill_info") or {}
+                            skill_id = skill_info.get("skill_id")
+                            tool_calls = len(audit)
+                            tool_errors = sum(1 for e in audit if not e.get("success"))
+                        else:
+                            messages = raw
+                        turn_count = sum(1 for m in messages if m.get("role") == "user")
                 except Exception:
                     pass
                 s.pop("conversation", None)  # don't send full conversation in list
@@ -137,24 +186,81 @@ class AACSessionManager:
         pending_action: Optional[dict] = None,
         skill_info: Optional[dict] = None,
         tool_audit: Optional[list] = None,
+        base_message_count: Optional[int] = None,
+        base_audit_count: Optional[int] = None,
     ) -> None:
-        """Update the conversation history and all session state.
+        """Save the conversation history and all session state.
 
-        All state is serialized into the conversation JSON envelope so it
-        survives across stateless request boundaries.
+        Messages and audit entries past the base counts (what the caller
+        read with ``get_session``; the stored counts if not given) are
+        appended as new events; pending action and skill info go into the
+        state envelope so they survive across stateless request boundaries.
+        If another save landed since the caller's read, the caller's new
+        entries are appended after it instead of overwriting or skipping
+        its events. If the history is shorter than the base (it was reset),
+        the session's events are rewritten.
         """
         now = datetime.utcnow().isoformat()
-        stored = {
-            "messages": conversation,
-            "pending_action": pending_action,
-            "skill_info": skill_info,
-            "tool_audit": tool_audit or [],
-        }
+        tool_audit = tool_audit or []
         conn = self.db.get_connection()
         try:
             cursor = conn.cursor()
+            # Take the write lock before reading the counters so two workers
+            # saving the same session cannot both append at the same seq
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                f"SELECT conversation FROM {self._table} WHERE id = ? AND user_email = ?",
+                (session_id, user_email),
+            )
+            row = cursor.fetchone()
+            if not row:
+                conn.rollback()
+                return
+            state = json.loads(row[0] or "[]")
+            stored_messages = state.get("message_count", 0) if _is_event_envelope(state) else 0
+            stored_audit = state.get("audit_count", 0) if _is_event_envelope(state) else 0
+            base_messages = stored_messages if base_message_count is None else base_message_count
+            base_audit = stored_audit if base_audit_count is None else base_audit_count
+            if (
+                not _is_event_envelope(state)
+                or base_messages > len(conversation)
+                or base_audit > len(tool_audit)
+                or base_messages > stored_messages
+                or base_audit > stored_audit
+            ):
+                cursor.execute(f"DELETE FROM {self._events_table} WHERE session_id = ?", (session_id,))
+                state = dict(_EMPTY_STATE)
+                base_messages = base_audit = 0
+            elif (base_messages, base_audit) != (stored_messages, stored_audit):
+                # Another save of this session committed after the caller's
+                # read: rebase the caller's new entries onto it
+                logger.warning(
+                    f"Session {session_id} changed since it was read "
+                    f"({base_messages} -> {stored_messages} messages); appending this turn after it"
+                )
+
+            new_messages = conversation[base_messages:]
+            new_audit = tool_audit[base_audit:]
+            events = [("message", m) for m in new_messages] + [("audit", e) for e in new_audit]
+            seq = state["next_seq"]
+            cursor.executemany(
+                f"""INSERT INTO {self._events_table} (session_id, seq, kind, payload, created_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [(session_id, seq + i, kind, json.dumps(payload, default=str, ensure_ascii=False), now)
+                 for i, (kind, payload) in enumerate(events)],
+            )
+
+            state.update({
+                "pending_action": pending_action,
+                "skill_info": skill_info,
+                "next_seq": seq + len(events),
+                "message_count": state["message_count"] + len(new_messages),
+                "audit_count": state["audit_count"] + len(new_audit),
+                "turn_count": state["turn_count"] + sum(1 for m in new_messages if m.get("role") == "user"),
+                "tool_errors": state["tool_errors"] + sum(1 for e in new_audit if not e.get("success")),
+            })
             update_fields = "conversation = ?, updated_at = ?"
-            params: list[Any] = [json.dumps(stored, default=str, ensure_ascii=False), now]
+            params: list[Any] = [json.dumps(state, default=str, ensure_ascii=False), now]
             if assistant_id is not None:
                 update_fields += ", assistant_id = ?"
                 params.append(assistant_id)
@@ -164,6 +270,9 @@ class AACSessionManager:
                 params,
             )
             conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
         finally:
             conn.close()
 
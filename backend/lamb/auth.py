@@ -7,28 +7,18 @@ bridge for hash compatibility during the migration period.
 """
 
 import os
-import warnings
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import jwt
-from passlib.context import CryptContext
 
 from lamb.logging_config import get_logger
-
-# Suppress the specific passlib warning about bcrypt version
-warnings.filterwarnings("ignore", message=".*error reading bcrypt version.*")
+# Password hashing — shared with owi_users.py for hash compatibility. The
+# bcrypt work runs on a bounded worker pool, off the event loop.
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher, pwd_context  # noqa: F401
 
 logger = get_logger(__name__, component="AUTH")
 
-# Password hashing — same config as owi_users.py for hash compatibility
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__ident="2b",
-    bcrypt__rounds=12,
-)
-
 # Default token lifetime
 DEFAULT_TOKEN_EXPIRY = timedelta(days=7)
 
@@ -49,19 +39,34 @@ def _get_jwt_secret() -> str:
 
 
 def hash_password(password: str) -> str:
-    """Hash a plaintext password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a plaintext password using bcrypt (blocks the calling thread).
+
+    Raises:
+        PasswordHashingBusy: if the hashing pool is saturated.
+    """
+    return get_password_hasher().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against a bcrypt hash."""
+    """Verify a plaintext password against a bcrypt hash (blocks the calling thread).
+
+    Raises:
+        PasswordHashingBusy: if the hashing pool is saturated.
+    """
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        return get_password_hasher().verify(plain_password, hashed_password)
+    except PasswordHashingBusy:
+        raise
     except Exception as e:
         logger.error(f"Password verification error: {e}")
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """Async variant of ``hash_password`` that never blocks the event loop."""
+    return await get_password_hasher().hash_async(password)
+
+
 def create_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a signed JWT.
@@ -7,6 +7,7 @@ import asyncio
 import aiohttp # Import aiohttp
 import config as app_config
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
+from lamb.completions.llm_scheduler import scheduled_llm_call
 from lamb.logging_config import get_logger
 from utils.langsmith_config import traceable_llm_call, add_trace_metadata, is_tracing_enabled
 
@@ -114,6 +115,7 @@ def format_messages_for_ollama(messages: list) -> list:
     ]
 
 @traceable_llm_call(name="ollama_completion", run_type="llm", tags=["ollama", "lamb"])
+@scheduled_llm_call("ollama")
 async def llm_connect(messages: list, stream: bool = False, body: Dict[str, Any] = None, llm: str = None, assistant_owner: Optional[str] = None, use_small_fast_model: bool = False): # Make async
     """
     Ollama connector that returns OpenAI-compatible responses
@@ -7,11 +7,13 @@ import os
 import re
 import base64
 # import openai
-from openai import AsyncOpenAI, APIError, APIConnectionError, RateLimitError, AuthenticationError
+from openai import AsyncOpenAI, APIError, APIConnectionError, APIStatusError, RateLimitError, AuthenticationError
 from httpx import Timeout, Limits
 import config as app_config
-from lamb.logging_config import get_logger
+from lamb.logging_config import get_logger, LazyJSON
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
+from lamb.completions.llm_scheduler import scheduled_llm_call
+from lamb.completions.provider_health import provider_health
 from utils.langsmith_config import traceable_llm_call, add_trace_metadata, is_tracing_enabled
 
 logger = get_logger(__name__, component="API")
@@ -55,6 +57,20 @@ def _get_openai_client(api_key: str, base_url: str = None) -> AsyncOpenAI:
         )
     return _openai_clients[key]
 
+def _is_provider_fault(error: Exception) -> bool:
+    """Whether an API error says the provider (not the request) is unhealthy.
+
+    Connection errors, timeouts, rate limiting and 5xx responses count against
+    the provider's circuit; 4xx errors such as bad requests or invalid keys
+    mean the endpoint answered and do not.
+    """
+    if isinstance(error, (APIConnectionError, RateLimitError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500
+    return isinstance(error, APIError)
+
+
 def get_available_llms(assistant_owner: Optional[str] = None):
     """
     Return list of available LLMs for this connector
@@ -284,6 +300,7 @@ def validate_image_urls(messages: List[Dict[str, Any]]) -> List[str]:
     return errors
 
 @traceable_llm_call(name="openai_completion", run_type="llm", tags=["openai", "lamb"])
+@scheduled_llm_call("openai")
 async def llm_connect(messages: list, stream: bool = False, body: Dict[str, Any] = None, llm: str = None, assistant_owner: Optional[str] = None, use_small_fast_model: bool = False):
     """
 Connects to the specified Large Language Model (LLM) using the OpenAI API.
@@ -506,7 +523,7 @@ Returns:
 
     if has_images:
         multimodal_logger.info("=== MULTIMODAL REQUEST DETECTED ===")
-        multimodal_logger.debug(f"Messages structure: {json.dumps(messages, indent=2)}")
+        multimodal_logger.debug("Messages structure: %s", LazyJSON(messages, indent=2))
 
         # Validate image URLs
         validation_errors = validate_image_urls(messages)
@@ -595,14 +612,39 @@ Returns:
             ValueError: With comprehensive error message if all attempts fail
         """
         current_model = params_to_use["model"]
-        
+        health_key = provider_health.key("openai", base_url, current_model)
+
+        # While the circuit for this model is open, skip the doomed call (and
+        # its timeout) and go straight to the organization's fallback model.
+        if not provider_health.allow_request(health_key):
+            if attempt_fallback and org_default_for_fallback and current_model != org_default_for_fallback:
+                logger.warning(f"Circuit open for model '{current_model}', routing directly to fallback '{org_default_for_fallback}'")
+                fallback_params = params_to_use.copy()
+                fallback_params["model"] = org_default_for_fallback
+                return await _make_api_call_with_fallback(fallback_params, attempt_fallback=False)
+
+            raise ValueError(
+                f"OpenAI API failure for organization '{org_name}':\n"
+                f"  • Model '{current_model}' is temporarily unavailable after repeated provider errors\n"
+                f"  • No healthy fallback model available\n"
+                f"Please try again in a few moments."
+            )
+
+        started = time.monotonic()
         try:
             logger.debug(f"Attempting API call with model: {current_model}")
-            return await client.chat.completions.create(**params_to_use)
+            result = await client.chat.completions.create(**params_to_use)
+            provider_health.record_success(health_key, time.monotonic() - started)
+            return result
         
         except (APIError, APIConnectionError, RateLimitError, AuthenticationError) as e:
             error_type = type(e).__name__
             error_msg = str(e)
+
+            if _is_provider_fault(e):
+                provider_health.record_failure(health_key, time.monotonic() - started, f"[{error_type}] {error_msg}")
+            else:
+                provider_health.record_success(health_key, time.monotonic() - started)
             
             # Log the failure
             logger.error(f"OpenAI API error with model '{current_model}': [{error_type}] {error_msg}")
@@ -659,9 +701,16 @@ Returns:
         
         except Exception as e:
             # Catch any other unexpected errors
+            provider_health.record_failure(health_key, time.monotonic() - started, f"[{type(e).__name__}] {e}")
             logger.error(f"Unexpected error during OpenAI API call: {type(e).__name__}: {str(e)}", exc_info=True)
             raise ValueError(f"Unexpected error calling OpenAI API with model '{current_model}': {str(e)}")
 
+        except BaseException:
+            # Cancelled (client disconnect, scheduler timeout): not a provider
+            # outcome, but a half-open probe must not keep its slot forever
+            provider_health.release_probe(health_key)
+            raise
+
     # --- Helper function for ORIGINAL stream generation --- (moved inside llm_connect)
     async def _generate_original_stream():
         response_id = None
@@ -0,0 +1,598 @@
+"""
+Per-organization fair-share admission control for upstream LLM calls.
+
+All organizations share the same provider clients (see ``_get_openai_client``
+and ``_get_ollama_session``), so without admission control a single tenant
+running a bulk test suite or a large LTI session can exhaust provider rate
+limits and connection pools for everybody else.
+
+The scheduler sits in front of the connectors and enforces, per request:
+
+- a global concurrency cap per provider endpoint ``(provider, base_url)``
+- a per-organization concurrency cap (across providers and per provider)
+- per-organization token-rate budgets (tokens per minute, token bucket)
+- a bounded per-organization queue; when it is full, or the token budget is
+  exhausted, the request is rejected immediately with a ``Retry-After`` hint
+
+Queued requests are dispatched with weighted fair queuing: each organization
+carries a virtual clock that advances by ``1 / weight`` per admitted request
+and the waiting organization with the smallest clock goes next.
+
+``snapshot()`` reports per-organization slots, queue depth, rejections and
+queue wait; ``render_metrics()`` serves the same numbers on ``/metrics``.
+
+Configuration lives in the organization config under ``llm_scheduler``::
+
+    {
+        "llm_scheduler": {
+            "weight": 1,
+            "max_concurrent": 20,
+            "max_queue": 100,
+            "max_queue_wait": 30,
+            "tokens_per_minute": 0,          # 0 = unlimited
+            "providers": {
+                "openai": {"max_concurrent": 10, "tokens_per_minute": 200000}
+            }
+        }
+    }
+
+Missing keys fall back to the ``LLM_SCHEDULER_*`` environment defaults in
+``config.py``. Each worker reuses an organization's resolved limits for
+``LLM_SCHEDULER_CONFIG_CACHE_TTL`` seconds.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+import config as app_config
+from lamb.logging_config import get_logger
+
+logger = get_logger(__name__, component="API")
+
+
+class LLMSchedulerRejected(Exception):
+    """Raised when a request cannot be admitted; maps to HTTP 429."""
+
+    def __init__(self, message: str, retry_after: float, reason: str):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = max(1, int(math.ceil(retry_after)))
+        self.reason = reason
+
+
+def scheduler_rejection_response(exc: LLMSchedulerRejected,
+                                 headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    """Build the OpenAI-style 429 response for a rejected request."""
+    response_headers = dict(headers or {})
+    response_headers["Retry-After"] = str(exc.retry_after)
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": {
+                "message": exc.message,
+                "type": "rate_limit_exceeded",
+                "code": exc.reason,
+            }
+        },
+        headers=response_headers,
+    )
+
+
+@dataclass
+class SchedulerLimits:
+    """Effective limits for one organization talking to one provider."""
+
+    weight: float = 1.0
+    max_concurrent: int = 0
+    max_queue: int = 0
+    max_queue_wait: float = 30.0
+    tokens_per_minute: int = 0
+    provider_max_concurrent: int = 0
+    provider_tokens_per_minute: int = 0
+
+    @classmethod
+    def from_org_config(cls, scheduler_config: Dict[str, Any], provider: str) -> "SchedulerLimits":
+        scheduler_config = scheduler_config or {}
+        provider_config = (scheduler_config.get("providers") or {}).get(provider, {}) or {}
+        return cls(
+            weight=max(float(scheduler_config.get("weight", 1) or 1), 0.01),
+            max_concurrent=int(scheduler_config.get(
+                "max_concurrent", app_config.LLM_SCHEDULER_ORG_MAX_CONCURRENT)),
+            max_queue=int(scheduler_config.get(
+                "max_queue", app_config.LLM_SCHEDULER_ORG_MAX_QUEUE)),
+            max_queue_wait=float(scheduler_config.get(
+                "max_queue_wait", app_config.LLM_SCHEDULER_MAX_QUEUE_WAIT)),
+            tokens_per_minute=int(scheduler_config.get(
+                "tokens_per_minute", app_config.LLM_SCHEDULER_ORG_TOKENS_PER_MINUTE)),
+            provider_max_concurrent=int(provider_config.get("max_concurrent", 0)),
+            provider_tokens_per_minute=int(provider_config.get("tokens_per_minute", 0)),
+        )
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at ``tokens_per_minute / 60`` per second.
+
+    The balance may go negative when actual usage exceeds the estimate charged
+    at admission; new requests are rejected until it recovers.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def resize(self, tokens_per_minute: int):
+        if float(tokens_per_minute) != self.capacity:
+            self._refill()
+            self.capacity = float(tokens_per_minute)
+            self.rate = tokens_per_minute / 60.0
+            self.tokens = min(self.tokens, self.capacity)
+
+    def seconds_until_available(self) -> float:
+        self._refill()
+        if self.tokens > 0:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def charge(self, tokens: float):
+        self._refill()
+        self.tokens -= tokens
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    provider: str
+    endpoint: Tuple[str, str]
+    limits: SchedulerLimits
+    enqueued_at: float
+
+
+@dataclass
+class _OrgState:
+    active: int = 0
+    active_by_provider: Dict[str, int] = field(default_factory=dict)
+    waiters: deque = field(default_factory=deque)
+    vtime: float = 0.0
+    buckets: Dict[Optional[str], _TokenBucket] = field(default_factory=dict)
+    admitted: int = 0
+    rejected_queue_full: int = 0
+    rejected_rate_limited: int = 0
+    rejected_queue_timeout: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+
+
+class SchedulerTicket:
+    """Admission granted to one LLM call. Must be released exactly once."""
+
+    def __init__(self, scheduler: "LLMScheduler", org_key: str, provider: str,
+                 endpoint: Tuple[str, str], estimated_tokens: int, queue_wait: float):
+        self._scheduler = scheduler
+        self.org_key = org_key
+        self.provider = provider
+        self.endpoint = endpoint
+        self.estimated_tokens = estimated_tokens
+        self.queue_wait = queue_wait
+        self._released = False
+
+    def release(self, tokens_used: Optional[int] = None):
+        if self._released:
+            return
+        self._released = True
+        self._scheduler._release(self, tokens_used)
+
+    def wrap_stream(self, generator, usage_out: Optional[dict] = None) -> "_TicketStream":
+        """Iterate ``generator`` and release the ticket when it finishes."""
+        return _TicketStream(self, generator, usage_out)
+
+    def attach(self, result: Any) -> Any:
+        """Tie the ticket's lifetime to a connector result.
+
+        Streaming results (an async generator, optionally paired with a usage
+        dict) hold the slot until the stream is consumed; complete responses
+        release it immediately, charging the reported usage.
+        """
+        if isinstance(result, tuple) and len(result) == 2 and inspect.isasyncgen(result[0]):
+            generator, usage_out = result
+            return self.wrap_stream(generator, usage_out), usage_out
+        if inspect.isasyncgen(result):
+            return self.wrap_stream(result)
+
+        tokens_used = None
+        if isinstance(result, dict):
+            total = (result.get("usage") or {}).get("total_tokens")
+            if isinstance(total, int) and total >= 0:
+                tokens_used = total
+        self.release(tokens_used)
+        return result
+
+
+class _TicketStream:
+    """Async iterator over a connector stream that holds a scheduler ticket.
+
+    The ticket is released when the stream ends, fails or is closed. A plain
+    async generator would only release in its ``finally``, which never runs
+    if iteration never starts (the client disconnects before the body, or an
+    error occurs between the connector call and the response); this object
+    also gives the slot back when it is garbage-collected unconsumed.
+    """
+
+    def __init__(self, ticket: SchedulerTicket, generator, usage_out: Optional[dict]):
+        self._ticket = ticket
+        self._generator = generator
+        self._usage_out = usage_out
+        self._loop = asyncio.get_running_loop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self._generator.__anext__()
+        except BaseException:
+            # StopAsyncIteration, a connector error or cancellation
+            self._release()
+            raise
+
+    async def aclose(self):
+        self._release()
+        await self._generator.aclose()
+
+    def _release(self):
+        tokens_used = None
+        if self._usage_out and self._usage_out.get("total_tokens") is not None:
+            tokens_used = self._usage_out["total_tokens"]
+        self._ticket.release(tokens_used)
+
+    def __del__(self):
+        if self._ticket._released:
+            return
+        # May run from any point of the loop (or another thread): let the
+        # loop do the release between callbacks
+        try:
+            self._loop.call_soon_threadsafe(self._ticket.release)
+        except RuntimeError:  # loop closed; nobody is waiting for the slot
+            pass
+
+
+class LLMScheduler:
+    """Weighted fair-share admission controller shared by all connectors."""
+
+    def __init__(self, provider_max_concurrent: Optional[int] = None):
+        self.provider_max_concurrent = (
+            provider_max_concurrent
+            if provider_max_concurrent is not None
+            else app_config.LLM_SCHEDULER_PROVIDER_MAX_CONCURRENT
+        )
+        self._orgs: Dict[str, _OrgState] = {}
+        self._endpoint_active: Dict[Tuple[str, str], int] = {}
+        self._virtual_time = 0.0
+
+    # -- public API ---------------------------------------------------------
+
+    async def acquire(self, org_key: str, provider: str, base_url: Optional[str],
+                      limits: SchedulerLimits, estimated_tokens: int = 0) -> SchedulerTicket:
+        """Wait for a slot for ``org_key`` on ``provider``.
+
+        Raises:
+            LLMSchedulerRejected: if the org's queue is full, its token budget
+                is exhausted, or the request waited longer than ``max_queue_wait``.
+        """
+        org = self._orgs.setdefault(org_key, _OrgState())
+        endpoint = (provider, base_url or "")
+
+        self._check_token_budget(org, org_key, provider, limits)
+
+        waiter = None
+        if not org.waiters and self._can_admit(org, provider, endpoint, limits):
+            self._admit(org, provider, endpoint, limits)
+            queue_wait = 0.0
+        else:
+            if limits.max_queue > 0 and len(org.waiters) >= limits.max_queue:
+                org.rejected_queue_full += 1
+                logger.warning(
+                    f"LLM scheduler: queue full for org {org_key} "
+                    f"({len(org.waiters)} waiting, provider={provider})"
+                )
+                raise LLMSchedulerRejected(
+                    "Too many requests are queued for your organization. Please retry shortly.",
+                    retry_after=self._estimate_retry_after(org, limits),
+                    reason="org_queue_full",
+                )
+
+            waiter = _Waiter(
+                future=asyncio.get_running_loop().create_future(),
+                provider=provider,
+                endpoint=endpoint,
+                limits=limits,
+                enqueued_at=time.monotonic(),
+            )
+            org.waiters.append(waiter)
+            try:
+                timeout = limits.max_queue_wait if limits.max_queue_wait > 0 else None
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+            except asyncio.TimeoutError:
+                self._abandon(org, waiter)
+                org.rejected_queue_timeout += 1
+                raise LLMSchedulerRejected(
+                    "Timed out waiting for an LLM slot. Please retry shortly.",
+                    retry_after=self._estimate_retry_after(org, limits),
+                    reason="org_queue_timeout",
+                )
+            except asyncio.CancelledError:
+                self._abandon(org, waiter)
+                raise
+            queue_wait = time.monotonic() - waiter.enqueued_at
+
+        org.queue_wait_total += queue_wait
+        org.queue_wait_max = max(org.queue_wait_max, queue_wait)
+
+        if estimated_tokens:
+            for bucket in self._buckets_for(org, provider, limits):
+                bucket.charge(estimated_tokens)
+
+        if queue_wait > 1:
+            logger.info(f"LLM scheduler: org {org_key} waited {queue_wait:.2f}s for {provider}")
+
+        return SchedulerTicket(self, org_key, provider, endpoint, estimated_tokens, queue_wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current occupancy and queue-time metrics, keyed by organization."""
+        orgs = {}
+        for org_key, org in self._orgs.items():
+            finished = org.admitted
+            orgs[org_key] = {
+                "active": org.active,
+                "active_by_provider": dict(org.active_by_provider),
+                "queued": len(org.waiters),
+                "admitted": org.admitted,
+                "rejected_queue_full": org.rejected_queue_full,
+                "rejected_rate_limited": org.rejected_rate_limited,
+                "rejected_queue_timeout": org.rejected_queue_timeout,
+                "queue_wait_total": org.queue_wait_total,
+                "queue_wait_avg": (org.queue_wait_total / finished) if finished else 0.0,
+                "queue_wait_max": org.queue_wait_max,
+            }
+        return {
+            "provider_max_concurrent": self.provider_max_concurrent,
+            "endpoints": {f"{p}|{u}": n for (p, u), n in self._endpoint_active.items()},
+            "organizations": orgs,
+        }
+
+    def render_metrics(self) -> str:
+        """``snapshot()`` in the Prometheus text format, served on ``/metrics``."""
+        snap = self.snapshot()
+        orgs = snap["organizations"]
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"])
+            lines.extend(f"{name}{{{labels}}} {value}" for labels, value in samples)
+
+        def org_label(org_key):
+            return 'org="{}"'.format(org_key.replace("\\", "\\\\").replace('"', '\\"'))
+
+        family("lamb_llm_scheduler_active", "gauge", "LLM calls holding a slot.",
+               [(org_label(k), o["active"]) for k, o in orgs.items()])
+        family("lamb_llm_scheduler_queued", "gauge", "LLM calls waiting for a slot.",
+               [(org_label(k), o["queued"]) for k, o in orgs.items()])
+        family("lamb_llm_scheduler_admitted_total", "counter", "LLM calls admitted.",
+               [(org_label(k), o["admitted"]) for k, o in orgs.items()])
+        family("lamb_llm_scheduler_rejected_total", "counter", "LLM calls rejected with 429.",
+               [(f'{org_label(k)},reason="{reason}"', o[f"rejected_{reason}"])
+                for k, o in orgs.items()
+                for reason in ("queue_full", "rate_limited", "queue_timeout")])
+        lines.extend(["# HELP lamb_llm_scheduler_queue_wait_seconds Time admitted LLM calls waited for a slot.",
+                      "# TYPE lamb_llm_scheduler_queue_wait_seconds summary"])
+        for k, o in orgs.items():
+            lines.append(f"lamb_llm_scheduler_queue_wait_seconds_sum{{{org_label(k)}}} "
+                         f"{o['queue_wait_total']:.6f}")
+            lines.append(f"lamb_llm_scheduler_queue_wait_seconds_count{{{org_label(k)}}} {o['admitted']}")
+        family("lamb_llm_scheduler_queue_wait_max_seconds", "gauge",
+               "Longest wait for a slot since start.",
+               [(org_label(k), f"{o['queue_wait_max']:.6f}") for k, o in orgs.items()])
+        return "\n".join(lines) + "\n"
+
+    # -- internals ----------------------------------------------------------
+
+    def _buckets_for(self, org: _OrgState, provider: str, limits: SchedulerLimits):
+        buckets = []
+        for scope, tpm in ((None, limits.tokens_per_minute),
+                           (provider, limits.provider_tokens_per_minute)):
+            if tpm and tpm > 0:
+                bucket = org.buckets.get(scope)
+                if bucket is None:
+                    bucket = org.buckets[scope] = _TokenBucket(tpm)
+                else:
+                    bucket.resize(tpm)
+                buckets.append(bucket)
+        return buckets
+
+    def _check_token_budget(self, org: _OrgState, org_key: str, provider: str,
+                            limits: SchedulerLimits):
+        wait = max((b.seconds_until_available() for b in self._buckets_for(org, provider, limits)),
+                   default=0.0)
+        if wait > 0:
+            org.rejected_rate_limited += 1
+            logger.warning(f"LLM scheduler: token budget exhausted for org {org_key} ({provider})")
+            raise LLMSchedulerRejected(
+                "Your organization's LLM token budget is exhausted. Please retry shortly.",
+                retry_after=wait,
+                reason="org_token_budget_exceeded",
+            )
+
+    def _can_admit(self, org: _OrgState, provider: str, endpoint: Tuple[str, str],
+                   limits: SchedulerLimits) -> bool:
+        if self.provider_max_concurrent > 0 and \
+                self._endpoint_active.get(endpoint, 0) >= self.provider_max_concurrent:
+            return False
+        if limits.max_concurrent > 0 and org.active >= limits.max_concurrent:
+            return False
+        if limits.provider_max_concurrent > 0 and \
+                org.active_by_provider.get(provider, 0) >= limits.provider_max_concurrent:
+            return False
+        return True
+
+    def _admit(self, org: _OrgState, provider: str, endpoint: Tuple[str, str],
+               limits: SchedulerLimits):
+        org.active += 1
+        org.active_by_provider[provider] = org.active_by_provider.get(provider, 0) + 1
+        org.admitted += 1
+        self._endpoint_active[endpoint] = self._endpoint_active.get(endpoint, 0) + 1
+        # Start-time fair queuing: an idle org re-enters at the current virtual
+        # time so it cannot bank credit while it was not sending requests.
+        org.vtime = max(org.vtime, self._virtual_time) + 1.0 / limits.weight
+
+    def _release(self, ticket: SchedulerTicket, tokens_used: Optional[int]):
+        org = self._orgs.get(ticket.org_key)
+        if org is not None:
+            org.active = max(0, org.active - 1)
+            org.active_by_provider[ticket.provider] = max(
+                0, org.active_by_provider.get(ticket.provider, 0) - 1)
+            if tokens_used is not None and ticket.estimated_tokens is not None:
+                delta = tokens_used - ticket.estimated_tokens
+                if delta:
+                    for scope, bucket in org.buckets.items():
+                        if scope is None or scope == ticket.provider:
+                            bucket.charge(delta)
+        self._endpoint_active[ticket.endpoint] = max(
+            0, self._endpoint_active.get(ticket.endpoint, 0) - 1)
+        self._dispatch()
+
+    def _abandon(self, org: _OrgState, waiter: _Waiter):
+        """Drop a waiter that timed out or was cancelled."""
+        if waiter.future.done() and not waiter.future.cancelled():
+            # Admitted in the same tick it gave up: hand the slot back.
+            org.active = max(0, org.active - 1)
+            org.active_by_provider[waiter.provider] = max(
+                0, org.active_by_provider.get(waiter.provider, 0) - 1)
+            self._endpoint_active[waiter.endpoint] = max(
+                0, self._endpoint_active.get(waiter.endpoint, 0) - 1)
+            self._dispatch()
+            return
+        try:
+            org.waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not waiter.future.done():
+            waiter.future.cancel()
+
+    def _dispatch(self):
+        """Admit queued requests in weighted-fair order while capacity allows."""
+        while True:
+            candidates = [
+                (org.vtime, org_key, org)
+                for org_key, org in self._orgs.items()
+                if org.waiters
+                and self._can_admit(org, org.waiters[0].provider,
+                                    org.waiters[0].endpoint, org.waiters[0].limits)
+            ]
+            if not candidates:
+                return
+            vtime, _, org = min(candidates, key=lambda c: (c[0], c[1]))
+            waiter = org.waiters.popleft()
+            if waiter.future.done():
+                continue
+            self._virtual_time = max(self._virtual_time, vtime)
+            self._admit(org, waiter.provider, waiter.endpoint, waiter.limits)
+            waiter.future.set_result(True)
+
+    def _estimate_retry_after(self, org: _OrgState, limits: SchedulerLimits) -> float:
+        avg_wait = (org.queue_wait_total / org.admitted) if org.admitted else 0.0
+        return max(app_config.LLM_SCHEDULER_RETRY_AFTER, avg_wait)
+
+
+llm_scheduler = LLMScheduler()
+
+
+def estimate_prompt_tokens(messages: list, body: Optional[Dict[str, Any]] = None) -> int:
+    """Cheap token estimate (~4 characters per token) plus the requested output."""
+    try:
+        chars = len(json.dumps(messages, ensure_ascii=False, default=str))
+    except (TypeError, ValueError):
+        chars = 0
+    max_tokens = 0
+    if body:
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or 0
+    return chars // 4 + int(max_tokens or 0)
+
+
+# (assistant_owner, provider) -> (expires_at, (org_key, base_url, limits))
+_limits_cache: Dict[Tuple[str, str], Tuple[float, Tuple[str, Optional[str], SchedulerLimits]]] = {}
+_LIMITS_CACHE_MAX = 4096
+
+
+def _resolve_org_limits(assistant_owner: Optional[str], provider: str):
+    """Return ``(org_key, base_url, limits)`` for the assistant owner.
+
+    Resolved limits are reused for LLM_SCHEDULER_CONFIG_CACHE_TTL seconds, so
+    a busy organization does not rebuild its config resolver (several DB
+    queries) on every call.
+    """
+    if not assistant_owner:
+        return "env", None, SchedulerLimits.from_org_config({}, provider)
+    now = time.monotonic()
+    cache_key = (assistant_owner, provider)
+    cached = _limits_cache.get(cache_key)
+    if cached and cached[0] > now:
+        return cached[1]
+    try:
+        from lamb.completions.org_config_resolver import OrganizationConfigResolver
+        resolver = OrganizationConfigResolver(assistant_owner)
+        org_key = str(resolver.organization.get("id"))
+        base_url = resolver.get_provider_config(provider).get("base_url")
+        resolved = org_key, base_url, SchedulerLimits.from_org_config(
+            resolver.get_scheduler_config(), provider)
+        if app_config.LLM_SCHEDULER_CONFIG_CACHE_TTL > 0:
+            if len(_limits_cache) >= _LIMITS_CACHE_MAX:
+                _limits_cache.clear()
+            _limits_cache[cache_key] = (now + app_config.LLM_SCHEDULER_CONFIG_CACHE_TTL, resolved)
+        return resolved
+    except Exception as e:
+        logger.warning(f"LLM scheduler: could not resolve org for {assistant_owner}: {e}")
+        return f"owner:{assistant_owner}", None, SchedulerLimits.from_org_config({}, provider)
+
+
+def scheduled_llm_call(provider: str):
+    """Decorator that routes a connector's ``llm_connect`` through the scheduler."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(messages: list, stream: bool = False, body: Dict[str, Any] = None,
+                          llm: str = None, assistant_owner: Optional[str] = None, **kwargs):
+            if not app_config.LLM_SCHEDULER_ENABLED:
+                return await func(messages, stream=stream, body=body, llm=llm,
+                                  assistant_owner=assistant_owner, **kwargs)
+
+            org_key, base_url, limits = _resolve_org_limits(assistant_owner, provider)
+            ticket = await llm_scheduler.acquire(
+                org_key, provider, base_url, limits,
+                estimated_tokens=estimate_prompt_tokens(messages, body),
+            )
+            try:
+                result = await func(messages, stream=stream, body=body, llm=llm,
+                                    assistant_owner=assistant_owner, **kwargs)
+            except BaseException:
+                ticket.release()
+                raise
+            return ticket.attach(result)
+
+        return wrapper
+
+    return decorator
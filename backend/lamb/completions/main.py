@@ -11,6 +11,9 @@ import json
 from lamb.logging_config import get_logger
 from lamb.auth_context import AuthContext, get_optional_auth_context
 from lamb.completions.task_routing import maybe_route_non_streaming_task
+from lamb.completions.llm_scheduler import LLMSchedulerRejected, scheduler_rejection_response
+from lamb.completions.stage_metrics import StageTimer
+from lamb.services.provider_catalog_service import provider_catalog_service
 from utils.langsmith_config import traceable_llm_call, add_trace_metadata, is_tracing_enabled
 import traceback
 import asyncio
@@ -24,6 +27,7 @@ db_manager = LambDatabaseManager()
 
 @router.get("/list")
 async def list_processors_and_connectors(
+    refresh: bool = False,
     auth: Optional[AuthContext] = Depends(get_optional_auth_context)
 ):
     """
@@ -34,15 +38,34 @@ async def list_processors_and_connectors(
     - Connector metadata (description, capabilities)
     - Model metadata (display_name, description, capabilities, forced_capabilities)
     - Backward compatible: available_llms still returns list of model IDs
+
+    Model catalogs are served from a cache refreshed in the background
+    (``last_refreshed`` is the epoch time of the snapshot); pass
+    ``refresh=true`` to query the providers now.
     """
-    pps = load_plugins('pps')
-    connectors = load_plugins('connectors')
-    rag_processors = load_plugins('rag')
-    
     # Determine assistant_owner (user email) from AuthContext for organization-aware model lists
     assistant_owner = auth.user['email'] if auth else None
     if assistant_owner:
         logger.info(f"Fetching capabilities for user: {assistant_owner}")
+
+    return await provider_catalog_service.get_connector_catalog(
+        org_id=auth.organization.get('id') if auth else None,
+        assistant_owner=assistant_owner,
+        org_config=auth.organization.get('config', {}) if auth else None,
+        refresh=refresh,
+    )
+
+
+async def build_connector_catalog(assistant_owner: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Query every connector for its models and metadata.
+
+    This hits the providers live (OpenAI/Ollama model listings); endpoints
+    should go through ``provider_catalog_service`` instead of calling it directly.
+    """
+    pps = load_plugins('pps')
+    connectors = load_plugins('connectors')
+    rag_processors = load_plugins('rag')
     
     # Get available LLMs for each connector (organization-aware if assistant_owner is set)
     connector_info = {}
@@ -125,13 +148,14 @@ async def create_completion(
     Retrieves the assistant from the database and applies the default prompt processor and connector.
     Returns a format compatible with OpenAI API.
     """
+    timer = StageTimer()
     try:
         logger.info("Starting completion request")
         logger.debug(f"Parameters: assistant={assistant}")
         logger.info(f"Starting completion request: assistant={assistant}")
         # Use helper functions to structure the process:
         assistant_details = get_assistant_details(assistant)
-        logger.debug(f"Assistant details: {assistant_details}")
+        logger.debug("Assistant details: %s", assistant_details)
         
         # Add trace metadata for the assistant
         if is_tracing_enabled():
@@ -140,15 +164,17 @@ async def create_completion(
             add_trace_metadata("assistant_owner", assistant_details.owner)
         
         plugin_config = parse_plugin_config(assistant_details)
-        logger.debug(f"Plugin config: {plugin_config}")
+        logger.debug("Plugin config: %s", plugin_config)
 
         connector = plugin_config["connector"]
         llm = plugin_config["llm"]
         provider = _provider_for_connector(connector)
+        timer.mark("assistant_lookup")
 
         # Quota pre-check (skipped for ollama — free LLMs)
         if connector != "ollama":
             _check_quota(assistant, assistant_details)
+            timer.mark("quota_check")
         
         # Add trace metadata for plugins
         if is_tracing_enabled():
@@ -161,16 +187,21 @@ async def create_completion(
             request=request,
             assistant_owner=assistant_details.owner,
         )
+        timer.mark("task_routing")
         if task_response is not None:
             logger.info("Returning routed task response without RAG")
+            timer.finish()
             return task_response
         
         pps, connectors, rag_processors = load_and_validate_plugins(plugin_config)
-        logger.debug(f"Plugins loaded: {pps}, {connectors}, {rag_processors}")
+        timer.mark("plugin_load")
+        logger.debug("Plugins loaded: %s, %s, %s", pps, connectors, rag_processors)
         rag_context = await get_rag_context(request, rag_processors, plugin_config["rag_processor"], assistant_details)
-        logger.debug(f"RAG context: {rag_context}")
+        timer.mark("rag")
+        logger.debug("RAG context: %s", rag_context)
         messages = process_completion_request(request, assistant_details, plugin_config, rag_context, pps)
-        logger.debug(f"Messages: {messages}")
+        connector_started = timer.mark("prompt_processing")
+        logger.debug("Messages: %s", messages)
         stream = request.get("stream", False)
         logger.debug(f"Stream mode: {stream}")
         logger.info("Getting completion from LLM")
@@ -183,33 +214,46 @@ async def create_completion(
                 llm=plugin_config["llm"],
                 assistant_owner=assistant_details.owner,
             )
+            timer.mark("connector")
             logger.debug("Returning streaming response")
-            if connector == "ollama":
-                # Ollama is free — no usage tracking needed
-                return StreamingResponse(
-                    llm_response[0] if isinstance(llm_response, tuple) else llm_response,
-                    media_type="text/event-stream"
-                )
-            
             if isinstance(llm_response, tuple):
                 generator, usage_out = llm_response
             else:
                 generator, usage_out = llm_response, None
+            if connector == "ollama":
+                # Ollama is free — no usage tracking needed
+                usage_out = None
             
             async def _tracked_stream():
-                async for chunk in generator:
-                    yield chunk
-                # Stream finished — fire-and-forget usage log
-                if usage_out and provider:
-                    db_manager.log_token_usage(
-                        assistant_id=assistant,
-                        org_id=assistant_details.organization_id,
-                        model_name=llm,
-                        provider=provider,
-                        usage_data=usage_out
-                    )
-
-            return StreamingResponse(_tracked_stream(), media_type="text/event-stream")
+                outcome = "cancelled"
+                try:
+                    first = True
+                    async for chunk in generator:
+                        if first:
+                            first = False
+                            timer.observe("time_to_first_token", timer.mark("first_token") - connector_started)
+                        yield chunk
+                    timer.mark("stream")
+                    # Stream finished — fire-and-forget usage log
+                    if usage_out and provider:
+                        db_manager.log_token_usage(
+                            assistant_id=assistant,
+                            org_id=assistant_details.organization_id,
+                            model_name=llm,
+                            provider=provider,
+                            usage_data=usage_out
+                        )
+                        timer.mark("usage_logging")
+                    outcome = "ok"
+                except Exception:
+                    # Connector failed mid-stream; a disconnect stays "cancelled"
+                    outcome = "error"
+                    raise
+                finally:
+                    timer.finish(outcome)
+
+            return StreamingResponse(_tracked_stream(), media_type="text/event-stream",
+                                     headers=timer.add_header({}))
         else:
             logger.debug("Returning direct response")
             result = await connectors[connector](
@@ -219,6 +263,7 @@ async def create_completion(
                 llm=llm, 
                 assistant_owner=assistant_details.owner
             )
+            timer.mark("connector")
             
             if connector != "ollama" and isinstance(result, dict) and result.get("usage") and provider:
                 db_manager.log_token_usage(
@@ -228,9 +273,16 @@ async def create_completion(
                     provider=provider,
                     usage_data=result["usage"]
                 )
+                timer.mark("usage_logging")
+            timer.finish()
             return result
+    except LLMSchedulerRejected as e:
+        logger.warning(f"Completion rejected by LLM scheduler: {e.reason}")
+        timer.finish("rejected")
+        return scheduler_rejection_response(e)
     except Exception as e:
         logger.error(f"Error in create_completion: {str(e)}", exc_info=True)
+        timer.finish("error")
         logger.debug(f"Error in create_completion: {str(e)}")
         stream = request.get("stream", False)
         logger.debug(f"Stream mode: {stream}")
@@ -463,11 +515,12 @@ async def run_lamb_assistant(
     Returns a format compatible with OpenAI API, including headers.
     Assumes the connector (like openai.py) returns OpenAI-compatible output.
     """
-    final_headers = headers if headers is not None else {}
+    final_headers = dict(headers) if headers is not None else {}
+    timer = StageTimer()
 
     try:
         assistant_details = get_assistant_details(assistant)
-        logger.debug(f"Run assistant, details: {assistant_details}")
+        logger.debug("Run assistant, details: %s", assistant_details)
         plugin_config = parse_plugin_config(assistant_details)
 
         # Debug bypass: override connector to show what the LLM would see.
@@ -480,21 +533,27 @@ async def run_lamb_assistant(
 
         connector = plugin_config["connector"]
         provider = _provider_for_connector(connector)
+        timer.mark("assistant_lookup")
 
         task_response = await maybe_route_non_streaming_task(
             request=request,
             assistant_owner=assistant_details.owner,
         )
+        timer.mark("task_routing")
         if task_response is not None:
             logger.info("Returning routed task response without RAG")
+            timer.finish()
             return Response(
                 content=json.dumps(task_response, indent=2),
                 media_type="application/json",
-                headers=final_headers
+                headers=timer.add_header(final_headers)
             )
         pps, connectors, rag_processors = load_and_validate_plugins(plugin_config)
+        timer.mark("plugin_load")
         rag_context = await get_rag_context(request, rag_processors, plugin_config["rag_processor"], assistant_details)
+        timer.mark("rag")
         messages = process_completion_request(request, assistant_details, plugin_config, rag_context, pps)
+        connector_started = timer.mark("prompt_processing")
         stream = request.get("stream", False)
         llm = plugin_config.get("llm") # Get LLM from config
 
@@ -512,6 +571,7 @@ async def run_lamb_assistant(
             llm=llm,
             assistant_owner=assistant_details.owner
         )
+        timer.mark("connector")
 
         if stream:
             # Tracked connectors return (generator, usage_out); others return the generator directly
@@ -521,17 +581,32 @@ async def run_lamb_assistant(
                 generator, usage_out = llm_response, None
 
             async def _tracked_stream():
-                async for chunk in generator:
-                    yield chunk
-                # Log usage when stream completes for tracked connectors
-                if connector != "ollama" and usage_out and provider and assistant_details.organization_id is not None:
-                    db_manager.log_token_usage(
-                        assistant_id=assistant,
-                        org_id=assistant_details.organization_id,
-                        model_name=llm,
-                        provider=provider,
-                        usage_data=usage_out
-                    )
+                outcome = "cancelled"
+                try:
+                    first = True
+                    async for chunk in generator:
+                        if first:
+                            first = False
+                            timer.observe("time_to_first_token", timer.mark("first_token") - connector_started)
+                        yield chunk
+                    timer.mark("stream")
+                    # Log usage when stream completes for tracked connectors
+                    if connector != "ollama" and usage_out and provider and assistant_details.organization_id is not None:
+                        db_manager.log_token_usage(
+                            assistant_id=assistant,
+                            org_id=assistant_details.organization_id,
+                            model_name=llm,
+                            provider=provider,
+                            usage_data=usage_out
+                        )
+                        timer.mark("usage_logging")
+                    outcome = "ok"
+                except Exception:
+                    # Connector failed mid-stream; a disconnect stays "cancelled"
+                    outcome = "error"
+                    raise
+                finally:
+                    timer.finish(outcome)
 
             # The openai.py connector returns an async generator yielding SSE strings
             # Wrap this directly in StreamingResponse
@@ -539,7 +614,7 @@ async def run_lamb_assistant(
             return StreamingResponse(
                 _tracked_stream(),
                 media_type="text/event-stream",
-                headers=final_headers
+                headers=timer.add_header(final_headers)
             )
         else:
             # The openai.py connector returns a dictionary (result of model_dump())
@@ -558,19 +633,28 @@ async def run_lamb_assistant(
                     provider=provider,
                     usage_data=llm_response["usage"]
                 )
+                timer.mark("usage_logging")
 
+            timer.finish()
             return Response(
                 content=json.dumps(llm_response, indent=2), # Ensure pretty printing if desired
                 media_type="application/json",
-                headers=final_headers
+                headers=timer.add_header(final_headers)
             )
 
+    except LLMSchedulerRejected as e:
+        # Tenant over its fair share: fail fast so the client can back off
+        logger.warning(f"run_lamb_assistant rejected by LLM scheduler: {e.reason}")
+        timer.finish("rejected")
+        return scheduler_rejection_response(e, headers=final_headers)
     except HTTPException as http_exc:
         # Re-raise known HTTP exceptions from helpers or connector
         logger.warning(f"HTTPException caught in run_lamb_assistant: {http_exc.status_code} - {http_exc.detail}")
+        timer.finish("error")
         raise http_exc
     except Exception as e:
         logger.error(f"Error in run_lamb_assistant: {str(e)}", exc_info=True)
+        timer.finish("error")
         stream = request.get("stream", False) # Check stream flag again for error response
         error_detail = {
              "error": {
@@ -154,6 +154,15 @@ class OrganizationConfigResolver:
 
         return {}
 
+    def get_scheduler_config(self) -> Dict[str, Any]:
+        """Get the LLM scheduler limits (``llm_scheduler``) for this organization.
+
+        Returns an empty dict when not configured; the scheduler then applies
+        the ``LLM_SCHEDULER_*`` environment defaults.
+        """
+        org_config = self.organization.get('config', {})
+        return org_config.get("llm_scheduler", {}) or {}
+
     def get_feature_flag(self, feature: str) -> bool:
         """Get feature flag value"""
         org_config = self.organization.get('config', {})
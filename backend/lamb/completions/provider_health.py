@@ -0,0 +1,228 @@
+"""
+Provider health tracking and circuit breaking for LLM connectors.
+
+The OpenAI connector only falls back to the organization's default model after
+the primary call has failed, which during an outage means every request pays
+the full client timeout (plus the client's own retries) before falling back.
+
+This module keeps a shared, in-process health record per
+``(provider, base_url, model)``: a rolling window of call outcomes and
+latencies, and a circuit breaker on top of it.
+
+- **closed**: calls flow normally; outcomes are recorded.
+- **open**: the error rate over the window crossed the threshold (or too many
+  consecutive failures). Calls are refused immediately so the connector can
+  route straight to the fallback model.
+- **half_open**: after ``cooldown`` seconds a single probe call is let through;
+  success closes the circuit, failure re-opens it. A probe that ends with
+  neither (cancelled by a client disconnect or a scheduler timeout) hands its
+  slot back through ``release_probe``, and a probe slot held for longer than
+  the cooldown is treated as abandoned.
+
+The state is also surfaced on the org-admin dashboard through
+``creator_interface/api_status_checker.py``.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import config as app_config
+from lamb.logging_config import get_logger
+
+logger = get_logger(__name__, component="API")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+HealthKey = Tuple[str, str, str]
+
+
+@dataclass
+class _ProviderHealth:
+    samples: deque = field(default_factory=deque)  # (timestamp, ok, latency)
+    state: str = CLOSED
+    opened_at: float = 0.0
+    consecutive_failures: int = 0
+    probe_in_flight: bool = False
+    probe_started_at: float = 0.0
+    last_error: Optional[str] = None
+    last_error_at: Optional[float] = None
+    total_calls: int = 0
+    total_failures: int = 0
+
+
+class ProviderHealthTracker:
+    """Rolling error-rate/latency tracker with a half-open circuit breaker."""
+
+    def __init__(self, window_seconds: Optional[float] = None,
+                 min_requests: Optional[int] = None,
+                 error_threshold: Optional[float] = None,
+                 consecutive_failures: Optional[int] = None,
+                 cooldown_seconds: Optional[float] = None):
+        self.window_seconds = window_seconds if window_seconds is not None \
+            else app_config.LLM_CIRCUIT_WINDOW_SECONDS
+        self.min_requests = min_requests if min_requests is not None \
+            else app_config.LLM_CIRCUIT_MIN_REQUESTS
+        self.error_threshold = error_threshold if error_threshold is not None \
+            else app_config.LLM_CIRCUIT_ERROR_THRESHOLD
+        self.consecutive_failures = consecutive_failures if consecutive_failures is not None \
+            else app_config.LLM_CIRCUIT_CONSECUTIVE_FAILURES
+        self.cooldown_seconds = cooldown_seconds if cooldown_seconds is not None \
+            else app_config.LLM_CIRCUIT_COOLDOWN_SECONDS
+        self._health: Dict[HealthKey, _ProviderHealth] = {}
+        # Connectors run on the event loop, but the dashboard may read from a
+        # worker thread; keep updates atomic.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(provider: str, base_url: Optional[str], model: str) -> HealthKey:
+        return (provider, (base_url or "").rstrip("/"), model or "")
+
+    def allow_request(self, key: HealthKey) -> bool:
+        """Return True if a call to ``key`` may be attempted now."""
+        with self._lock:
+            health = self._health.get(key)
+            if health is None or health.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if health.state == OPEN:
+                if now - health.opened_at < self.cooldown_seconds:
+                    return False
+                health.state = HALF_OPEN
+                health.probe_in_flight = False
+                logger.info(f"Circuit half-open for {key}, allowing a probe request")
+            # HALF_OPEN: only one probe at a time, unless the last one was
+            # abandoned without reporting back
+            if health.probe_in_flight and now - health.probe_started_at < self.cooldown_seconds:
+                return False
+            health.probe_in_flight = True
+            health.probe_started_at = now
+            return True
+
+    def release_probe(self, key: HealthKey):
+        """Give back the half-open probe slot of a call that never completed.
+
+        Used when the call is cancelled; the outcome is unknown, so no sample
+        is recorded and the next request may probe instead.
+        """
+        with self._lock:
+            health = self._health.get(key)
+            if health is not None and health.state == HALF_OPEN:
+                health.probe_in_flight = False
+
+    def record_success(self, key: HealthKey, latency: float):
+        with self._lock:
+            health = self._health.setdefault(key, _ProviderHealth())
+            self._add_sample(health, True, latency)
+            health.consecutive_failures = 0
+            if health.state != CLOSED:
+                logger.info(f"Circuit closed for {key} after successful probe")
+            health.state = CLOSED
+            health.probe_in_flight = False
+
+    def record_failure(self, key: HealthKey, latency: float, error: Optional[str] = None):
+        with self._lock:
+            health = self._health.setdefault(key, _ProviderHealth())
+            self._add_sample(health, False, latency)
+            health.consecutive_failures += 1
+            health.total_failures += 1
+            health.last_error = (error or "")[:300] or None
+            health.last_error_at = time.time()
+
+            if health.state == HALF_OPEN:
+                self._open(key, health, "probe failed")
+                return
+
+            if health.state == CLOSED:
+                calls = len(health.samples)
+                failures = sum(1 for _, ok, _ in health.samples if not ok)
+                if health.consecutive_failures >= self.consecutive_failures:
+                    self._open(key, health, f"{health.consecutive_failures} consecutive failures")
+                elif calls >= self.min_requests and failures / calls >= self.error_threshold:
+                    self._open(key, health, f"error rate {failures}/{calls}")
+
+    def state(self, key: HealthKey) -> str:
+        with self._lock:
+            health = self._health.get(key)
+            if health is None:
+                return CLOSED
+            if health.state == OPEN and time.monotonic() - health.opened_at >= self.cooldown_seconds:
+                return HALF_OPEN
+            return health.state
+
+    def snapshot(self, provider: Optional[str] = None,
+                 base_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Health records, optionally filtered by provider and base URL."""
+        base_url = (base_url or "").rstrip("/") if base_url is not None else None
+        entries = []
+        with self._lock:
+            items = list(self._health.items())
+        for key, health in items:
+            key_provider, key_base_url, model = key
+            if provider is not None and key_provider != provider:
+                continue
+            if base_url is not None and key_base_url != base_url:
+                continue
+            with self._lock:
+                self._prune(health, time.monotonic())
+                samples = list(health.samples)
+            latencies = sorted(latency for _, ok, latency in samples if ok)
+            failures = sum(1 for _, ok, _ in samples if not ok)
+            entries.append({
+                "provider": key_provider,
+                "base_url": key_base_url,
+                "model": model,
+                "state": self.state(key),
+                "window_seconds": self.window_seconds,
+                "window_calls": len(samples),
+                "window_errors": failures,
+                "error_rate": round(failures / len(samples), 3) if samples else 0.0,
+                "latency_p50": _percentile(latencies, 0.5),
+                "latency_p95": _percentile(latencies, 0.95),
+                "consecutive_failures": health.consecutive_failures,
+                "total_calls": health.total_calls,
+                "total_failures": health.total_failures,
+                "last_error": health.last_error,
+                "last_error_at": health.last_error_at,
+            })
+        return entries
+
+    def reset(self):
+        with self._lock:
+            self._health.clear()
+
+    # -- internals ----------------------------------------------------------
+
+    def _add_sample(self, health: _ProviderHealth, ok: bool, latency: float):
+        now = time.monotonic()
+        health.samples.append((now, ok, latency))
+        health.total_calls += 1
+        self._prune(health, now)
+
+    def _prune(self, health: _ProviderHealth, now: float):
+        cutoff = now - self.window_seconds
+        while health.samples and health.samples[0][0] < cutoff:
+            health.samples.popleft()
+
+    def _open(self, key: HealthKey, health: _ProviderHealth, reason: str):
+        health.state = OPEN
+        health.opened_at = time.monotonic()
+        health.probe_in_flight = False
+        logger.warning(
+            f"Circuit opened for {key}: {reason}; "
+            f"routing around it for {self.cooldown_seconds:.0f}s"
+        )
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 3)
+
+
+provider_health = ProviderHealthTracker()
@@ -4,7 +4,7 @@ import requests
 from typing import Dict, Any, List
 from lamb.lamb_classes import Assistant
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
-from lamb.logging_config import get_logger
+from lamb.logging_config import get_logger, LazyJSON
 
 logger = get_logger(__name__, component="RAG")
 
@@ -155,7 +155,7 @@ async def rag_processor(messages: List[Dict[str, Any]], assistant: Assistant = N
     logger.debug("=== MESSAGES ===")
     try:
         logger.debug(f"Messages count: {len(messages)}")
-        logger.debug(f"Messages content: {json.dumps(messages, indent=2)}")
+        logger.debug("Messages content: %s", LazyJSON(messages, indent=2))
     except Exception as e:
         logger.debug(f"Error logging messages: {str(e)}")
         logger.debug(f"Messages type: {type(messages)}")
@@ -179,7 +179,7 @@ async def rag_processor(messages: List[Dict[str, Any]], assistant: Assistant = N
                     assistant_dict[key] = str(value)
     
     # Log the assistant dictionary
-    logger.debug(f"Assistant Dictionary: {json.dumps(assistant_dict, indent=2)}")
+    logger.debug("Assistant Dictionary: %s", LazyJSON(assistant_dict, indent=2))
 
     # Generate optimal query from full conversation context
     logger.info("Analyzing conversation context for optimal query generation...")
@@ -304,7 +304,7 @@ async def rag_processor(messages: List[Dict[str, Any]], assistant: Assistant = N
             
             print(f"URL: {url}")
             print(f"Query plugin: {query_plugin} (hierarchical parent-child)")
-            print(f"Payload: {json.dumps(payload, indent=2)}")
+            logger.debug("Payload: %s", LazyJSON(payload, indent=2))
             
             try:
                 # Make the request to the KB server
@@ -317,7 +317,7 @@ async def rag_processor(messages: List[Dict[str, Any]], assistant: Assistant = N
                     raw_response = response.json()
                     # Print the entire raw response
                     print(f"Response Summary: {len(raw_response.get('results', raw_response.get('documents', [])))} documents returned")
-                    print(f"Raw Response:\n{json.dumps(raw_response, indent=2)}")
+                    logger.debug("Raw Response:\n%s", LazyJSON(raw_response, indent=2))
                     
                     # Store the response
                     all_responses[collection_id] = {
@@ -4,7 +4,7 @@ import requests
 from typing import Dict, Any, List, Optional
 from lamb.lamb_classes import Assistant
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
-from lamb.logging_config import get_logger
+from lamb.logging_config import get_logger, LazyJSON
 
 logger = get_logger(__name__, component="RAG")
 
@@ -25,7 +25,7 @@ def rag_processor(
     logger.debug("=== MESSAGES ===")
     try:
         logger.debug(f"Messages count: {len(messages)}")
-        logger.debug(f"Messages content: {json.dumps(messages, indent=2)}")
+        logger.debug("Messages content: %s", LazyJSON(messages, indent=2))
     except Exception as e:
         logger.debug(f"Error logging messages: {str(e)}")
         logger.debug(f"Messages type: {type(messages)}")
@@ -49,8 +49,7 @@ def rag_processor(
                     assistant_dict[key] = str(value)
 
     # Log the assistant dictionary
-    logger.debug(
-        f"Assistant Dictionary: {json.dumps(assistant_dict, indent=2)}")
+    logger.debug("Assistant Dictionary: %s", LazyJSON(assistant_dict, indent=2))
     # Extract the last user message
     last_user_message = ""
     for msg in reversed(messages):
@@ -168,7 +167,7 @@ def rag_processor(
             url = f"{KB_SERVER_URL}/collections/{collection_id}/query"
 
             logger.debug(f"URL: {url}")
-            logger.debug(f"Payload: {json.dumps(payload, indent=2)}")
+            logger.debug("Payload: %s", LazyJSON(payload, indent=2))
 
             try:
                 # Make the request to the KB server
@@ -182,8 +181,7 @@ def rag_processor(
                     # Log the response summary
                     logger.debug(
                         f"Response Summary: {len(raw_response.get('results', raw_response.get('documents', [])))} documents returned")
-                    logger.debug(
-                        f"Raw Response: {json.dumps(raw_response, indent=2)}")
+                    logger.debug("Raw Response: %s", LazyJSON(raw_response, indent=2))
 
                     # Store the response
                     all_responses[collection_id] = {
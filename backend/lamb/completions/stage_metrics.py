@@ -0,0 +1,172 @@
+"""
+Per-stage latency metrics for the completion pipeline.
+
+``run_lamb_assistant`` (and the ``create_completion`` route) mark the end of
+each pipeline stage on a :class:`StageTimer`. A stage lasts from the
+previous mark to its own, so the stages of one request add up to ``total``:
+
+- ``assistant_lookup``: load the assistant and parse its plugin config
+- ``quota_check``: assistant quota pre-check (``create_completion`` only)
+- ``task_routing``: small-fast-model task routing
+- ``plugin_load``: plugin lookup
+- ``rag``: the assistant's RAG processor
+- ``prompt_processing``: the prompt processor
+- ``connector``: the connector call; for streams, until it hands back its generator
+- ``first_token``: streams only, from then until the first chunk
+- ``stream``: streams only, the rest of the stream
+- ``usage_logging``: the token usage write
+
+``time_to_first_token`` (connector call to first streamed chunk) is recorded
+on top of the stages.
+
+Every stage feeds a shared histogram, exported in the Prometheus text format
+on ``/metrics``. Responses also get a ``Server-Timing`` header with the
+stages measured before the response was built (for streams, up to the
+connector call).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import config as app_config
+
+# Upper bounds in seconds; local stages take milliseconds, LLM calls seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class StageMetrics:
+    """Shared histograms of stage durations plus a request outcome counter."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, _Histogram] = {}
+        self._outcomes: Dict[str, int] = {}
+        # Sync RAG processors and the /metrics reader may run off the event
+        # loop; keep updates atomic.
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[index] += 1
+            histogram.sum += seconds
+            histogram.count += 1
+
+    def count_request(self, outcome: str) -> None:
+        with self._lock:
+            self._outcomes[outcome] = self._outcomes.get(outcome, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Counts and sums per stage, and requests per outcome."""
+        with self._lock:
+            return {
+                "stages": {stage: {"count": h.count, "sum": h.sum}
+                           for stage, h in self._histograms.items()},
+                "requests": dict(self._outcomes),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._outcomes.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            histograms = {stage: (list(h.counts), h.sum, h.count)
+                          for stage, h in self._histograms.items()}
+            outcomes = dict(self._outcomes)
+
+        lines: List[str] = [
+            "# HELP lamb_completion_stage_seconds Time spent in each completion pipeline stage.",
+            "# TYPE lamb_completion_stage_seconds histogram",
+        ]
+        for stage in sorted(histograms):
+            counts, total, count = histograms[stage]
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'lamb_completion_stage_seconds_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'lamb_completion_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {count}')
+            lines.append(f'lamb_completion_stage_seconds_sum{{stage="{stage}"}} {total:.6f}')
+            lines.append(f'lamb_completion_stage_seconds_count{{stage="{stage}"}} {count}')
+
+        lines += [
+            "# HELP lamb_completion_requests_total Completion requests by outcome.",
+            "# TYPE lamb_completion_requests_total counter",
+        ]
+        for outcome in sorted(outcomes):
+            lines.append(f'lamb_completion_requests_total{{outcome="{outcome}"}} {outcomes[outcome]}')
+        return "\n".join(lines) + "\n"
+
+
+stage_metrics = StageMetrics()
+
+
+class StageTimer:
+    """
+    Stage timings of one completion request.
+
+    ``mark(stage)`` closes the stage that started at the previous mark;
+    ``finish(outcome)`` records the total once, however the request ended.
+    """
+
+    __slots__ = ("stages", "_started", "_last", "_finished", "_metrics")
+
+    def __init__(self, metrics: Optional[StageMetrics] = None):
+        self._metrics = (metrics or stage_metrics) if app_config.COMPLETION_METRICS_ENABLED else None
+        self._started = self._last = time.perf_counter()
+        self._finished = False
+        self.stages: Dict[str, float] = {}
+
+    def mark(self, stage: str) -> float:
+        now = time.perf_counter()
+        seconds = now - self._last
+        self._last = now
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        if self._metrics is not None:
+            self._metrics.observe(stage, seconds)
+        return now
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration that is not one of the sequential stages."""
+        self.stages[name] = seconds
+        if self._metrics is not None:
+            self._metrics.observe(name, seconds)
+
+    def finish(self, outcome: str = "ok") -> None:
+        if self._finished:
+            return
+        self._finished = True
+        total = time.perf_counter() - self._started
+        self.stages["total"] = total
+        if self._metrics is not None:
+            self._metrics.observe("total", total)
+            self._metrics.count_request(outcome)
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. ``rag;dur=35.1, connector;dur=812.4``."""
+        return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.stages.items())
+
+    def add_header(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """Add the Server-Timing header to response headers when enabled."""
+        if app_config.COMPLETION_SERVER_TIMING and self.stages:
+            headers["Server-Timing"] = self.server_timing()
+        return headers
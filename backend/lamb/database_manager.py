@@ -15,6 +15,7 @@ When working with this code:
 3. Always set deprecated fields to empty strings
 """
 
+import functools
 import sqlite3
 import os
 from .lamb_classes import Assistant, LTIUser, Organization, OrganizationRole
@@ -23,6 +24,7 @@ import time
 from typing import Optional, List, Dict, Any, Tuple
 from dotenv import load_dotenv
 from .owi_bridge.owi_users import OwiUserManager
+from .password_hasher import PasswordHashingBusy
 import jwt
 import config
 from lamb.logging_config import get_logger
@@ -32,7 +34,26 @@ from lamb.logging_config import get_logger
 logger = get_logger(__name__, component="DB")
 
 
+def _changes_assistant_list(method):
+    """Bump LambDatabaseManager.assistant_list_version after ``method`` runs.
+
+    /v1/models is served from a cache keyed on this version, so every write that
+    can change the set of published assistants or their capabilities must be
+    decorated.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            LambDatabaseManager.assistant_list_version += 1
+    return wrapper
+
+
 class LambDatabaseManager:
+    # Incremented on assistant create/update/delete/publish (see _changes_assistant_list)
+    assistant_list_version = 0
+
     # Class-level flag: initialize_system_organization (which calls sync_system_org_with_env)
     # must only run once per process lifetime. Many parts of the codebase instantiate
     # LambDatabaseManager() per-request; running sync on every instantiation would
@@ -1511,6 +1532,126 @@ class LambDatabaseManager:
                 connection.commit()
                 logger.info("Migration 16 complete")
 
+                # Migration 17: Bulk import jobs (progress shared by all workers)
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.table_prefix}bulk_import_jobs (
+                        id TEXT PRIMARY KEY,
+                        organization_id INTEGER NOT NULL,
+                        admin_user_id INTEGER,
+                        admin_email TEXT NOT NULL,
+                        filename TEXT,
+                        status TEXT NOT NULL DEFAULT 'pending' CHECK(status IN ('pending', 'running', 'completed', 'failed')),
+                        total_count INTEGER NOT NULL,
+                        processed_count INTEGER NOT NULL DEFAULT 0,
+                        created_count INTEGER NOT NULL DEFAULT 0,
+                        failed_count INTEGER NOT NULL DEFAULT 0,
+                        skipped_count INTEGER NOT NULL DEFAULT 0,
+                        error TEXT,
+                        log_id INTEGER,
+                        created_at INTEGER NOT NULL,
+                        updated_at INTEGER NOT NULL,
+                        finished_at INTEGER,
+                        FOREIGN KEY (organization_id) REFERENCES {self.table_prefix}organizations(id) ON DELETE CASCADE
+                    )
+                """)
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_prefix}bulk_import_jobs_org ON {self.table_prefix}bulk_import_jobs(organization_id, created_at)")
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.table_prefix}bulk_import_job_results (
+                        job_id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
+                        result TEXT NOT NULL,
+                        PRIMARY KEY (job_id, seq),
+                        FOREIGN KEY (job_id) REFERENCES {self.table_prefix}bulk_import_jobs(id) ON DELETE CASCADE
+                    )
+                """)
+                connection.commit()
+
+                # Migration 18: Append-only AAC session events. Messages and tool
+                # audit entries are stored one row each; aac_sessions.conversation
+                # keeps only a small state envelope with counters.
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.table_prefix}aac_session_events (
+                        session_id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
+                        kind TEXT NOT NULL CHECK(kind IN ('message', 'audit')),
+                        payload TEXT NOT NULL,
+                        created_at TIMESTAMP,
+                        PRIMARY KEY (session_id, seq),
+                        FOREIGN KEY (session_id) REFERENCES {self.table_prefix}aac_sessions(id) ON DELETE CASCADE
+                    )
+                """)
+                cursor.execute(f"SELECT id, conversation, updated_at FROM {self.table_prefix}aac_sessions")
+                legacy_sessions = []
+                for session_id, stored, updated_at in cursor.fetchall():
+                    try:
+                        raw = json.loads(stored or "[]")
+                    except (TypeError, ValueError):
+                        raw = []
+                    if isinstance(raw, dict) and raw.get("storage") == "events":
+                        continue
+                    legacy_sessions.append((session_id, raw, updated_at))
+                if legacy_sessions:
+                    logger.info(f"Migration 18: Moving {len(legacy_sessions)} AAC sessions to append-only events")
+                for session_id, raw, updated_at in legacy_sessions:
+                    if isinstance(raw, dict):
+                        messages = raw.get("messages") or []
+                        audit = raw.get("tool_audit") or []
+                    else:
+                        messages, audit = raw, []
+                        raw = {}
+                    events = [("message", m) for m in messages] + [("audit", e) for e in audit]
+                    cursor.executemany(
+                        f"""INSERT OR REPLACE INTO {self.table_prefix}aac_session_events
+                           (session_id, seq, kind, payload, created_at) VALUES (?, ?, ?, ?, ?)""",
+                        [(session_id, seq, kind, json.dumps(payload, default=str, ensure_ascii=False), updated_at)
+                         for seq, (kind, payload) in enumerate(events)],
+                    )
+                    envelope = {
+                        "storage": "events",
+                        "pending_action": raw.get("pending_action"),
+                        "skill_info": raw.get("skill_info"),
+                        "next_seq": len(events),
+                        "message_count": len(messages),
+                        "audit_count": len(audit),
+                        "turn_count": sum(1 for m in messages if isinstance(m, dict) and m.get("role") == "user"),
+                        "tool_errors": sum(1 for e in audit if isinstance(e, dict) and not e.get("success")),
+                    }
+                    cursor.execute(
+                        f"UPDATE {self.table_prefix}aac_sessions SET conversation = ? WHERE id = ?",
+                        (json.dumps(envelope, default=str, ensure_ascii=False), session_id),
+                    )
+                connection.commit()
+
+                # Migration 19: Rubric list metadata. Subject, grade level and a
+                # criteria summary are copied out of rubric_data on every write so
+                # rubric lists can filter and page on indexed columns without
+                # reading or parsing the rubric body.
+                cursor.execute(f"PRAGMA table_info({self.table_prefix}rubrics)")
+                rubric_cols = {row[1] for row in cursor.fetchall()}
+                if rubric_cols and 'subject' not in rubric_cols:
+                    logger.info("Migration 19: Adding rubric metadata columns")
+                    cursor.execute(f"ALTER TABLE {self.table_prefix}rubrics ADD COLUMN subject TEXT NOT NULL DEFAULT ''")
+                    cursor.execute(f"ALTER TABLE {self.table_prefix}rubrics ADD COLUMN grade_level TEXT NOT NULL DEFAULT ''")
+                    cursor.execute(f"ALTER TABLE {self.table_prefix}rubrics ADD COLUMN criteria_count INTEGER NOT NULL DEFAULT 0")
+                    cursor.execute(f"ALTER TABLE {self.table_prefix}rubrics ADD COLUMN max_score REAL")
+                    cursor.execute(f"""
+                        UPDATE {self.table_prefix}rubrics SET
+                            subject = COALESCE(JSON_EXTRACT(rubric_data, '$.metadata.subject'), ''),
+                            grade_level = COALESCE(JSON_EXTRACT(rubric_data, '$.metadata.gradeLevel'), ''),
+                            criteria_count = COALESCE(JSON_ARRAY_LENGTH(rubric_data, '$.criteria'), 0),
+                            max_score = JSON_EXTRACT(rubric_data, '$.maxScore')
+                        WHERE JSON_VALID(rubric_data)
+                    """)
+                    logger.info(f"Migration 19: Backfilled metadata for {cursor.rowcount} rubrics")
+                if rubric_cols:
+                    # Listing indexes carry the filter columns, so a page is
+                    # selected from the index alone
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{self.table_prefix}rubrics_owner_list ON {self.table_prefix}rubrics(owner_email, updated_at, subject, grade_level)")
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{self.table_prefix}rubrics_public_list ON {self.table_prefix}rubrics(organization_id, is_public, is_showcase, updated_at, subject, grade_level)")
+                connection.commit()
+
         except sqlite3.Error as e:
             logger.error(f"Migration error: {e}")
         finally:
@@ -2039,6 +2180,7 @@ class LambDatabaseManager:
         """Update organization configuration"""
         return self.update_organization(org_id, config=config)
 
+    @_changes_assistant_list
     def delete_organization(self, org_id: int) -> bool:
         """Delete an organization (cannot delete system organization)"""
         connection = self.get_connection()
@@ -3485,7 +3627,8 @@ class LambDatabaseManager:
                         f"Creator user {user_email} already exists")
                     return None
 
-            # Hash password locally (LAMB is source of truth)
+            # Hash password locally (LAMB is source of truth); the OWI mirror
+            # reuses the same hash instead of running bcrypt a second time
             from lamb.auth import hash_password
             local_hash = hash_password(password)
 
@@ -3500,7 +3643,8 @@ class LambDatabaseManager:
                         name=user_name,
                         email=user_email,
                         password=password,
-                        role="user"
+                        role="user",
+                        password_hash=local_hash
                     )
                     if not owi_user:
                         logger.warning(f"Failed to create OWI mirror user for {user_email} (non-fatal)")
@@ -3533,6 +3677,8 @@ class LambDatabaseManager:
                     f"Creator user {user_email} created successfully with id: {new_user_id}")
                 return new_user_id
 
+        except PasswordHashingBusy:
+            raise
         except Exception as e:
             logger.error(f"Error creating creator user: {e}")
             return None
@@ -3541,6 +3687,98 @@ class LambDatabaseManager:
                 connection.close()
                 logger.debug("Database connection closed")
 
+    def get_creator_user_ids_by_emails(self, emails: List[str]) -> Dict[str, int]:
+        """
+        Look up creator user IDs for many emails in one query
+
+        Args:
+            emails: Emails to look up
+
+        Returns:
+            Dict mapping each existing email to its user ID
+        """
+        if not emails:
+            return {}
+
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return {}
+
+        try:
+            with connection:
+                found = {}
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(emails), 500):
+                    chunk = emails[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = connection.execute(
+                        f"""SELECT user_email, id FROM {self.table_prefix}Creator_users
+                            WHERE user_email IN ({placeholders})""",
+                        chunk
+                    )
+                    found.update({row[0]: row[1] for row in cursor.fetchall()})
+                return found
+
+        except sqlite3.Error as e:
+            logger.error(f"Error looking up creator users by email: {e}")
+            return {}
+        finally:
+            if connection:
+                connection.close()
+
+    def create_creator_users_batch(self, organization_id: int, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many creator users in a single transaction
+
+        Passwords must already be hashed (see ``lamb.password_hasher``). A row
+        that violates a constraint (e.g. an email created concurrently) fails
+        on its own; the rest of the batch is still committed.
+
+        Args:
+            organization_id: Organization for all users
+            users: Dicts with email, name, user_type, enabled and password_hash
+
+        Returns:
+            List aligned with ``users`` of {"user_id": int | None, "error": str | None}
+        """
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return [{"user_id": None, "error": "Database unavailable"} for _ in users]
+
+        outcomes = []
+        try:
+            with connection:
+                cursor = connection.cursor()
+                now = int(time.time())
+                for user in users:
+                    try:
+                        cursor.execute(f"""
+                            INSERT INTO {self.table_prefix}Creator_users
+                            (organization_id, user_email, user_name, user_type, user_config,
+                             password_hash, role, enabled, created_at, updated_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """, (organization_id, user['email'], user['name'],
+                              user.get('user_type', 'creator'), "{}", user['password_hash'],
+                              "user", 1 if user.get('enabled', True) else 0, now, now))
+                        outcomes.append({"user_id": cursor.lastrowid, "error": None})
+                    except sqlite3.IntegrityError as e:
+                        logger.warning(f"Could not create creator user {user['email']}: {e}")
+                        message = "User already exists" if "UNIQUE" in str(e) else str(e)
+                        outcomes.append({"user_id": None, "error": message})
+
+            created = sum(1 for outcome in outcomes if outcome["user_id"])
+            logger.info(f"Created {created} of {len(users)} creator users in organization {organization_id}")
+            return outcomes
+
+        except sqlite3.Error as e:
+            logger.error(f"Error creating creator users batch: {e}")
+            return [{"user_id": None, "error": f"Database error: {e}"} for _ in users]
+        finally:
+            if connection:
+                connection.close()
+
     def delete_creator_user(self, user_id: int) -> bool:
         """
         Delete a creator user from the LAMB database
@@ -4169,6 +4407,272 @@ class LambDatabaseManager:
             if connection:
                 connection.close()
 
+    def create_bulk_import_job(
+        self,
+        job_id: str,
+        organization_id: int,
+        admin_user_id: int,
+        admin_email: str,
+        total_count: int,
+        filename: Optional[str] = None
+    ) -> bool:
+        """
+        Register a background bulk import job
+
+        Args:
+            job_id: Unique job identifier
+            organization_id: Organization the users are imported into
+            admin_user_id: ID of the admin running the import
+            admin_email: Email of the admin
+            total_count: Number of rows in the import
+            filename: Name of the imported file (optional)
+
+        Returns:
+            True if the job was stored, False otherwise
+        """
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return False
+
+        try:
+            with connection:
+                current_time = int(time.time())
+                connection.execute(
+                    f"""INSERT INTO {self.table_prefix}bulk_import_jobs
+                        (id, organization_id, admin_user_id, admin_email, filename,
+                         total_count, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (job_id, organization_id, admin_user_id, admin_email, filename,
+                     total_count, current_time, current_time)
+                )
+                return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error creating bulk import job: {e}")
+            return False
+        finally:
+            if connection:
+                connection.close()
+
+    def append_bulk_import_job_results(self, job_id: str, results: List[Dict[str, Any]]) -> bool:
+        """
+        Record a batch of per-row results and advance the job's counters
+
+        Args:
+            job_id: Job identifier
+            results: Row results in import order ({email, name, status, user_id, message})
+
+        Returns:
+            True if the batch was stored, False otherwise
+        """
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return False
+
+        counts = {status: sum(1 for r in results if r['status'] == status)
+                  for status in ('success', 'failed', 'skipped')}
+
+        try:
+            with connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    f"SELECT processed_count FROM {self.table_prefix}bulk_import_jobs WHERE id = ?",
+                    (job_id,)
+                )
+                row = cursor.fetchone()
+                if not row:
+                    logger.warning(f"Bulk import job {job_id} not found")
+                    return False
+
+                start = row[0]
+                cursor.executemany(
+                    f"""INSERT INTO {self.table_prefix}bulk_import_job_results (job_id, seq, result)
+                        VALUES (?, ?, ?)""",
+                    [(job_id, start + i, json.dumps(result)) for i, result in enumerate(results)]
+                )
+                cursor.execute(
+                    f"""UPDATE {self.table_prefix}bulk_import_jobs
+                        SET status = 'running',
+                            processed_count = processed_count + ?,
+                            created_count = created_count + ?,
+                            failed_count = failed_count + ?,
+                            skipped_count = skipped_count + ?,
+                            updated_at = ?
+                        WHERE id = ?""",
+                    (len(results), counts['success'], counts['failed'], counts['skipped'],
+                     int(time.time()), job_id)
+                )
+                return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error recording bulk import job results: {e}")
+            return False
+        finally:
+            if connection:
+                connection.close()
+
+    def finish_bulk_import_job(
+        self,
+        job_id: str,
+        status: str,
+        error: Optional[str] = None,
+        log_id: Optional[int] = None
+    ) -> bool:
+        """
+        Mark a bulk import job as completed or failed
+
+        Args:
+            job_id: Job identifier
+            status: 'completed' or 'failed'
+            error: Error message for failed jobs
+            log_id: ID of the bulk_import_logs entry for the operation
+
+        Returns:
+            True if the job was updated, False otherwise
+        """
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return False
+
+        try:
+            with connection:
+                current_time = int(time.time())
+                cursor = connection.execute(
+                    f"""UPDATE {self.table_prefix}bulk_import_jobs
+                        SET status = ?, error = ?, log_id = ?, updated_at = ?, finished_at = ?
+                        WHERE id = ?""",
+                    (status, error, log_id, current_time, current_time, job_id)
+                )
+                return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
+            logger.error(f"Error finishing bulk import job: {e}")
+            return False
+        finally:
+            if connection:
+                connection.close()
+
+    def fail_stale_bulk_import_jobs(self, stale_seconds: int, job_id: Optional[str] = None) -> int:
+        """
+        Mark unfinished bulk import jobs without recent progress as failed
+
+        A job runs inside the worker that accepted it, so one left in
+        'pending' or 'running' by a restart or a crashed worker never
+        finishes. Live jobs report after every batch and are not touched.
+
+        Args:
+            stale_seconds: Seconds without progress after which a job is abandoned
+            job_id: Only check this job (optional)
+
+        Returns:
+            Number of jobs marked as failed
+        """
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return 0
+
+        try:
+            with connection:
+                current_time = int(time.time())
+                query = f"""UPDATE {self.table_prefix}bulk_import_jobs
+                            SET status = 'failed', error = ?, updated_at = ?, finished_at = ?
+                            WHERE status IN ('pending', 'running') AND updated_at < ?"""
+                params = ["Interrupted before completion (server restart or worker exit)",
+                          current_time, current_time, current_time - stale_seconds]
+                if job_id is not None:
+                    query += " AND id = ?"
+                    params.append(job_id)
+                cursor = connection.execute(query, params)
+                return cursor.rowcount
+
+        except sqlite3.Error as e:
+            logger.error(f"Error failing stale bulk import jobs: {e}")
+            return 0
+        finally:
+            if connection:
+                connection.close()
+
+    def get_bulk_import_job(
+        self,
+        job_id: str,
+        organization_id: int,
+        offset: int = 0,
+        limit: int = 500
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a bulk import job's progress and a page of its row results
+
+        Args:
+            job_id: Job identifier
+            organization_id: Organization the job must belong to
+            offset: Index of the first row result to return
+            limit: Maximum number of row results to return
+
+        Returns:
+            Job dict with a ``results`` list, or None if not found
+        """
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Failed to get database connection")
+            return None
+
+        try:
+            with connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    f"""SELECT id, organization_id, admin_email, filename, status, total_count,
+                               processed_count, created_count, failed_count, skipped_count,
+                               error, log_id, created_at, updated_at, finished_at
+                        FROM {self.table_prefix}bulk_import_jobs
+                        WHERE id = ? AND organization_id = ?""",
+                    (job_id, organization_id)
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return None
+
+                cursor.execute(
+                    f"""SELECT result FROM {self.table_prefix}bulk_import_job_results
+                        WHERE job_id = ? AND seq >= ?
+                        ORDER BY seq LIMIT ?""",
+                    (job_id, offset, limit)
+                )
+                results = [json.loads(r[0]) for r in cursor.fetchall()]
+
+                return {
+                    'job_id': row[0],
+                    'organization_id': row[1],
+                    'admin_email': row[2],
+                    'filename': row[3],
+                    'status': row[4],
+                    'summary': {
+                        'total': row[5],
+                        'processed': row[6],
+                        'created': row[7],
+                        'failed': row[8],
+                        'skipped': row[9]
+                    },
+                    'error': row[10],
+                    'log_id': row[11],
+                    'created_at': row[12],
+                    'updated_at': row[13],
+                    'finished_at': row[14],
+                    'offset': offset,
+                    'next_offset': offset + len(results),
+                    'results': results
+                }
+
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving bulk import job: {e}")
+            return None
+        finally:
+            if connection:
+                connection.close()
+
     def create_lti_user(self, lti_user: LTIUser):
         connection = self.get_connection()
         if connection:
@@ -4351,6 +4855,7 @@ class LambDatabaseManager:
             logger.error(f"Error in filter_models: {str(e)}")
             raise
 
+    @_changes_assistant_list
     def add_assistant(self, assistant: Assistant):
         """
         Add a new assistant to the database.
@@ -4924,7 +5429,7 @@ class LambDatabaseManager:
             connection.close()
 
     def get_list_of_assitants_id_and_name(self):
-        """Get list of assistants providing only id, name, owner, api_callback, and published status"""
+        """Get list of assistants providing only id, name, owner, api_callback, published status and created_at"""
         connection = self.get_connection()
         if not connection:
             return []
@@ -4940,7 +5445,8 @@ class LambDatabaseManager:
                         CASE 
                             WHEN p.oauth_consumer_name IS NOT NULL AND p.oauth_consumer_name != 'null' THEN 1 
                             ELSE 0 
-                        END as published
+                        END as published,
+                        a.created_at
                     FROM {assistants_table} a
                     LEFT JOIN {published_table} p ON a.id = p.assistant_id
                 """)
@@ -4951,7 +5457,8 @@ class LambDatabaseManager:
                         'name': row[1],
                         'owner': row[2],
                         'api_callback': row[3],
-                        'published': bool(row[4])
+                        'published': bool(row[4]),
+                        'created_at': row[5]
                     })
                 return assistants_list
         except sqlite3.Error as e:
@@ -5091,6 +5598,7 @@ class LambDatabaseManager:
         finally:
             connection.close()
 
+    @_changes_assistant_list
     def delete_assistant(self, assistant_id, owner):
         connection = self.get_connection()
         if connection:
@@ -5162,6 +5670,7 @@ class LambDatabaseManager:
                 connection.close()
         return []
 
+    @_changes_assistant_list
     def publish_assistant(self, assistant_id: int, assistant_name: str, assistant_owner: str,
                           group_id: str, group_name: str, oauth_consumer_name: Optional[str]) -> bool:  # Allow None for oauth_consumer_name
         """Publish an assistant. Uses INSERT OR REPLACE based on assistant_id primary key."""
@@ -5194,6 +5703,7 @@ class LambDatabaseManager:
                 connection.close()
         return False
 
+    @_changes_assistant_list
     def update_assistant_publication(self, assistant_id: int, group_id: str,
                                      group_name: str, oauth_consumer_name: Optional[str]) -> bool:
         """Update the publication record for an already-published assistant (#397).
@@ -5247,6 +5757,7 @@ class LambDatabaseManager:
                 connection.close()
         return []
 
+    @_changes_assistant_list
     def unpublish_assistant(self, assistant_id: int) -> bool:
         """Remove the publication record for an assistant"""
         connection = self.get_connection()
@@ -5766,6 +6277,7 @@ class LambDatabaseManager:
 
     # ==================== End LTI Creator Methods ====================
 
+    @_changes_assistant_list
     def update_assistant_quota(self, assistant_id: int, enabled: bool, cost_limit_usd, alert_thresholds=None) -> bool:
         """Patch only the quota key inside the assistant's api_callback JSON, and update the alerts table.
 
@@ -5842,6 +6354,7 @@ class LambDatabaseManager:
             logger.error(f"Error updating quota for assistant {assistant_id}: {e}")
             return False
 
+    @_changes_assistant_list
     def update_assistant(self, assistant_id: int, assistant: Assistant) -> bool:
         """
         Update an existing assistant in the database.
@@ -6666,6 +7179,56 @@ class LambDatabaseManager:
         finally:
             connection.close()
 
+    def register_kbs_bulk(self, owner_user_id: int, organization_id: int,
+                          kbs: List[Dict[str, Any]]) -> int:
+        """
+        Register several KBs for one owner in a single transaction.
+        Used by auto-registration; KBs already in the registry are left untouched.
+
+        Args:
+            owner_user_id: Creator user ID
+            organization_id: Organization ID
+            kbs: List of dicts with 'kb_id', 'kb_name' and optional
+                'created_at' (original creation timestamp from the KB Server)
+
+        Returns:
+            Number of KBs newly registered
+        """
+        if not kbs:
+            return 0
+        connection = self.get_connection()
+        if not connection:
+            logger.error("Could not establish database connection")
+            return 0
+
+        try:
+            with connection:
+                cursor = connection.cursor()
+                current_time = int(time.time())
+                rows = []
+                for kb in kbs:
+                    created_at = kb.get('created_at')
+                    metadata = {'original_creation_date': created_at} if created_at else {}
+                    rows.append((kb['kb_id'], kb['kb_name'], owner_user_id, organization_id, False,
+                                 json.dumps(metadata), created_at or current_time, current_time))
+                before = connection.total_changes
+                cursor.executemany(f"""
+                    INSERT OR IGNORE INTO {self.table_prefix}kb_registry 
+                    (kb_id, kb_name, owner_user_id, organization_id, is_shared, metadata, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                inserted = connection.total_changes - before
+                if inserted:
+                    logger.info(
+                        f"Auto-registered {inserted} KB(s) for user {owner_user_id} in one transaction")
+                return inserted
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error bulk-registering KBs: {e}")
+            return 0
+        finally:
+            connection.close()
+
     def get_kb_registry_entry(self, kb_id: str) -> Optional[Dict[str, Any]]:
         """
         Get KB registry entry with owner info.
@@ -2,16 +2,21 @@
 AI Rubric Generator with JSON Recovery Strategies
 
 Generates educational rubrics using LLM with robust JSON extraction and validation.
+
+All LLM calls are async (shared AsyncOpenAI client of the OpenAI connector)
+and bounded by RUBRIC_AI_TIMEOUT, so a generation never blocks the event
+loop and is cancelled with the request that started it.
 """
 
+import asyncio
 import json
 import re
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime
-from openai import OpenAI
 import os
 
+import config
 from .prompt_loader import get_rubric_generation_prompt
 from .rubric_validator import RubricValidator
 from lamb.completions.org_config_resolver import OrganizationConfigResolver
@@ -41,19 +46,19 @@ class AIRubricGenerator:
             raise ValueError("OpenAI configuration not found for organization")
         
         self.api_key = openai_config.get("api_key")
-        import config
         self.base_url = openai_config.get("base_url") or config.OPENAI_BASE_URL
         self.default_model = openai_config.get("default_model") or config.OPENAI_MODEL
         
         if not self.api_key:
             raise ValueError("OpenAI API key not configured for organization")
         
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        from lamb.completions.connectors.openai import _get_openai_client
+        self.client = _get_openai_client(self.api_key, self.base_url)
         
         logger.info(f"AI Rubric Generator initialized for {user_email} with model {self.default_model}")
     
     
-    def generate_rubric(
+    async def generate_rubric(
         self,
         user_prompt: str,
         language: str = 'en',
@@ -82,11 +87,7 @@ class AIRubricGenerator:
         final_prompt = get_rubric_generation_prompt(user_prompt, language)
         
         if not final_prompt:
-            return {
-                "success": False,
-                "error": f"Could not load prompt template for language '{language}'",
-                "allow_manual_edit": False
-            }
+            return self._template_error(language)
         
         # Use specified model or default
         model_to_use = model or self.default_model
@@ -96,57 +97,160 @@ class AIRubricGenerator:
         
         try:
             # Call LLM (Strategy 1 - Initial attempt)
-            response = self._call_llm(final_prompt, model_to_use)
-            
-            # Strategy A: Try to extract and parse JSON
-            rubric_data, explanation = self._extract_json_strategy_a(response)
-            
-            if rubric_data:
-                # Validate rubric structure (rubricId not required for AI-generated rubrics)
-                is_valid, error_msg = RubricValidator.validate_rubric_structure(rubric_data, require_rubric_id=False)
-                
-                if is_valid:
-                    # Success! Generate markdown and return
-                    markdown = self._generate_markdown(rubric_data)
-                    
-                    return {
-                        "success": True,
-                        "rubric": rubric_data,
-                        "markdown": markdown,
-                        "explanation": explanation or "Rubric generated successfully",
-                        "prompt_used": final_prompt
-                    }
-                else:
-                    logger.warning(f"Initial JSON extraction succeeded but validation failed: {error_msg}")
-                    # Fall through to Strategy D
-            
-            # Strategy D: Retry with stricter instructions
-            logger.info("Strategy A failed, attempting Strategy D (retry with strict JSON)")
-            retry_result = self._retry_with_strict_json(user_prompt, response, model_to_use, language)
-            
-            if retry_result["success"]:
-                return retry_result
-            
-            # Strategy E: Return for manual editing
-            logger.warning("All strategies failed, returning for manual edit")
+            response = await self._call_llm(final_prompt, model_to_use)
+            return await self._result_from_response(response, user_prompt, final_prompt, model_to_use, language)
+        except asyncio.TimeoutError:
+            return self._timeout_error()
+        except Exception as e:
+            logger.error(f"Error generating rubric: {e}")
             return {
                 "success": False,
-                "error": "Could not parse valid rubric from LLM response",
-                "raw_response": response,
-                "allow_manual_edit": True,
-                "prompt_used": final_prompt
+                "error": f"Error calling LLM: {str(e)}",
+                "allow_manual_edit": False
             }
+    
+    
+    async def modify_rubric(
+        self,
+        rubric_data: Dict[str, Any],
+        modification_prompt: str,
+        language: str = 'en',
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Modify an existing rubric according to natural language instructions.
+        
+        The current rubric JSON and the instructions are sent through the
+        generation prompt, so the result is parsed, validated and recovered
+        exactly like a generated rubric.
+        
+        Args:
+            rubric_data: Current rubric JSON
+            modification_prompt: What to change
+            language: Language code (en, es, eu, ca)
+            model: Optional specific model (defaults to org default)
             
+        Returns:
+            Same dictionary as generate_rubric
+        """
+        request = build_modification_request(rubric_data, modification_prompt)
+        return await self.generate_rubric(request, language, model)
+    
+    
+    async def generate_rubric_stream(
+        self,
+        user_prompt: str,
+        language: str = 'en',
+        model: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a rubric, streaming the model output as it arrives.
+        
+        Yields:
+            {"delta": str} for each chunk of the (partial) rubric JSON,
+            {"status": "validating"} once the model has finished, and a final
+            {"done": True, "result": {...}} with the same dictionary as
+            generate_rubric.
+        """
+        final_prompt = get_rubric_generation_prompt(user_prompt, language)
+        if not final_prompt:
+            yield {"done": True, "result": self._template_error(language)}
+            return
+        
+        model_to_use = model or self.default_model
+        logger.info(f"Streaming rubric generation with model {model_to_use}, language {language}")
+        
+        chunks = []
+        try:
+            async for delta in self._stream_llm(final_prompt, model_to_use):
+                chunks.append(delta)
+                yield {"delta": delta}
+            yield {"status": "validating"}
+            result = await self._result_from_response(
+                "".join(chunks), user_prompt, final_prompt, model_to_use, language)
+        except asyncio.TimeoutError:
+            result = self._timeout_error()
         except Exception as e:
-            logger.error(f"Error generating rubric: {e}")
-            return {
+            logger.error(f"Error streaming rubric generation: {e}")
+            result = {
                 "success": False,
                 "error": f"Error calling LLM: {str(e)}",
                 "allow_manual_edit": False
             }
+        yield {"done": True, "result": result}
     
     
-    def _call_llm(self, prompt: str, model: str, temperature: float = 0.7) -> str:
+    async def _result_from_response(
+        self,
+        response: str,
+        user_prompt: str,
+        final_prompt: str,
+        model: str,
+        language: str
+    ) -> Dict[str, Any]:
+        """
+        Turn an LLM response into a generation result (Strategies A, D, E).
+        """
+        # Strategy A: Try to extract and parse JSON
+        rubric_data, explanation = self._extract_json_strategy_a(response)
+        
+        if rubric_data:
+            # Validate rubric structure (rubricId not required for AI-generated rubrics)
+            is_valid, error_msg = RubricValidator.validate_rubric_structure(rubric_data, require_rubric_id=False)
+            
+            if is_valid:
+                # Success! Generate markdown and return
+                markdown = self._generate_markdown(rubric_data)
+                
+                return {
+                    "success": True,
+                    "rubric": rubric_data,
+                    "markdown": markdown,
+                    "explanation": explanation or "Rubric generated successfully",
+                    "prompt_used": final_prompt
+                }
+            else:
+                logger.warning(f"Initial JSON extraction succeeded but validation failed: {error_msg}")
+                # Fall through to Strategy D
+        
+        # Strategy D: Retry with stricter instructions
+        logger.info("Strategy A failed, attempting Strategy D (retry with strict JSON)")
+        retry_result = await self._retry_with_strict_json(user_prompt, response, model, language)
+        
+        if retry_result["success"]:
+            return retry_result
+        
+        # Strategy E: Return for manual editing
+        logger.warning("All strategies failed, returning for manual edit")
+        return {
+            "success": False,
+            "error": "Could not parse valid rubric from LLM response",
+            "raw_response": response,
+            "allow_manual_edit": True,
+            "prompt_used": final_prompt
+        }
+    
+    
+    @staticmethod
+    def _template_error(language: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": f"Could not load prompt template for language '{language}'",
+            "allow_manual_edit": False
+        }
+    
+    
+    @staticmethod
+    def _timeout_error() -> Dict[str, Any]:
+        logger.error(f"Rubric generation timed out after {config.RUBRIC_AI_TIMEOUT}s")
+        return {
+            "success": False,
+            "error": f"The LLM did not finish within {config.RUBRIC_AI_TIMEOUT:g} seconds",
+            "allow_manual_edit": False
+        }
+    
+    
+    async def _call_llm(self, prompt: str, model: str, temperature: float = 0.7) -> str:
         """
         Call LLM with the prompt.
         
@@ -157,27 +261,72 @@ class AIRubricGenerator:
             
         Returns:
             Raw text response from LLM
+            
+        Raises:
+            asyncio.TimeoutError: If the call takes longer than RUBRIC_AI_TIMEOUT
         """
         try:
-            completion = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=4000  # Generous limit for complete rubric
+            completion = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=temperature,
+                    max_tokens=4000  # Generous limit for complete rubric
+                ),
+                timeout=config.RUBRIC_AI_TIMEOUT,
             )
             
-            response_text = completion.choices[0].message.content
+            response_text = completion.choices[0].message.content or ""
             logger.debug(f"LLM response length: {len(response_text)} characters")
             
             return response_text
             
+        except asyncio.TimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Error calling OpenAI API: {e}")
             raise
     
     
+    async def _stream_llm(self, prompt: str, model: str, temperature: float = 0.7) -> AsyncIterator[str]:
+        """
+        Stream the LLM response as text chunks.
+        
+        Raises:
+            asyncio.TimeoutError: If the stream is not complete within RUBRIC_AI_TIMEOUT
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.RUBRIC_AI_TIMEOUT
+        stream = await asyncio.wait_for(
+            self.client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=4000,
+                stream=True,
+            ),
+            timeout=config.RUBRIC_AI_TIMEOUT,
+        )
+        chunks = stream.__aiter__()
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    return
+                delta = chunk.choices[0].delta if chunk.choices else None
+                if delta and delta.content:
+                    yield delta.content
+        finally:
+            # Closes the HTTP response when the client went away or timed out
+            await stream.close()
+    
+    
     def _extract_json_strategy_a(self, llm_response: str) -> Tuple[Optional[Dict], Optional[str]]:
         """
         Strategy A: Extract JSON from markdown code blocks or raw JSON.
@@ -265,7 +414,7 @@ class AIRubricGenerator:
         return None, None
     
     
-    def _retry_with_strict_json(
+    async def _retry_with_strict_json(
         self,
         original_prompt: str,
         failed_response: str,
@@ -290,7 +439,7 @@ class AIRubricGenerator:
         logger.info("Retrying with strict JSON formatting instructions")
         
         try:
-            retry_response = self._call_llm(strict_prompt, model, temperature=0.3)  # Lower temp for more deterministic
+            retry_response = await self._call_llm(strict_prompt, model, temperature=0.3)  # Lower temp for more deterministic
             
             # Try to extract JSON again
             rubric_data, explanation = self._extract_json_strategy_a(retry_response)
@@ -642,7 +791,19 @@ Respond with ONLY the JSON object for the user's request. No markdown, no explan
             }
 
 
-def generate_rubric_ai(
+def build_modification_request(rubric_data: Dict[str, Any], modification_prompt: str) -> str:
+    """
+    Build the generation request for modifying an existing rubric.
+    """
+    current = json.dumps(rubric_data, ensure_ascii=False, indent=2)
+    return (
+        f"Modify the following existing rubric. Apply these changes: {modification_prompt}\n\n"
+        f"Keep everything that the changes do not affect, and return the complete modified rubric.\n\n"
+        f"Current rubric:\n```json\n{current}\n```"
+    )
+
+
+async def generate_rubric_ai(
     user_prompt: str,
     user_email: str,
     language: str = 'en',
@@ -662,12 +823,43 @@ def generate_rubric_ai(
     """
     try:
         generator = AIRubricGenerator(user_email)
-        return generator.generate_rubric(user_prompt, language, model)
     except Exception as e:
         logger.error(f"Error creating AI generator: {e}")
-        return {
-            "success": False,
-            "error": f"Configuration error: {str(e)}",
-            "allow_manual_edit": False
-        }
+        return _configuration_error(e)
+    return await generator.generate_rubric(user_prompt, language, model)
+
+
+async def modify_rubric_ai(
+    rubric_data: Dict[str, Any],
+    modification_prompt: str,
+    user_email: str,
+    language: str = 'en',
+    model: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Convenience function to modify a rubric using AI.
+    
+    Args:
+        rubric_data: Current rubric JSON
+        modification_prompt: User's description of the changes
+        user_email: User's email (for org config)
+        language: Language code (en, es, eu, ca)
+        model: Optional specific model override
+        
+    Returns:
+        Generation result dictionary
+    """
+    try:
+        generator = AIRubricGenerator(user_email)
+    except Exception as e:
+        logger.error(f"Error creating AI generator: {e}")
+        return _configuration_error(e)
+    return await generator.modify_rubric(rubric_data, modification_prompt, language, model)
+
 
+def _configuration_error(error: Exception) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": f"Configuration error: {str(error)}",
+        "allow_manual_edit": False
+    }
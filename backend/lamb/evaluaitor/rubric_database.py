@@ -12,6 +12,50 @@ from datetime import datetime
 
 from ..database_manager import LambDatabaseManager
 
+# Columns returned by rubric listings: everything except the rubric body
+LIST_COLUMNS = (
+    "id", "rubric_id", "organization_id", "owner_email", "title", "description",
+    "subject", "grade_level", "criteria_count", "max_score",
+    "is_public", "is_showcase", "parent_rubric_id", "created_at", "updated_at",
+)
+
+
+def _list_metadata(rubric_data: dict) -> tuple:
+    """
+    Values kept in the rubric list columns, taken from the rubric JSON
+
+    Returns:
+        Tuple of (subject, grade_level, criteria_count, max_score)
+    """
+    metadata = rubric_data.get('metadata') or {}
+    criteria = rubric_data.get('criteria')
+    max_score = rubric_data.get('maxScore')
+    return (
+        str(metadata.get('subject') or ''),
+        str(metadata.get('gradeLevel') or ''),
+        len(criteria) if isinstance(criteria, list) else 0,
+        max_score if isinstance(max_score, (int, float)) else None,
+    )
+
+
+def _filter_conditions(filters: dict) -> tuple[list, list]:
+    """WHERE conditions and parameters for the listing filters"""
+    conditions, params = [], []
+
+    if filters.get('subject'):
+        conditions.append("r.subject LIKE ?")
+        params.append(f"%{filters['subject']}%")
+
+    if filters.get('grade_level'):
+        conditions.append("r.grade_level LIKE ?")
+        params.append(f"%{filters['grade_level']}%")
+
+    if filters.get('search'):
+        conditions.append("(r.title LIKE ? OR r.description LIKE ?)")
+        params.extend([f"%{filters['search']}%"] * 2)
+
+    return conditions, params
+
 
 class RubricDatabaseManager:
     """Database manager for rubric operations"""
@@ -47,6 +91,7 @@ class RubricDatabaseManager:
                 # Prepare data
                 title = rubric_data.get('title', 'Untitled Rubric')
                 description = rubric_data.get('description', '')
+                subject, grade_level, criteria_count, max_score = _list_metadata(rubric_data)
                 rubric_data_json = json.dumps(rubric_data)
                 created_at = int(datetime.now().timestamp())
                 updated_at = created_at
@@ -55,10 +100,12 @@ class RubricDatabaseManager:
                 cursor.execute(f"""
                     INSERT INTO {self.db_manager.table_prefix}rubrics (
                         rubric_id, organization_id, owner_email, title, description,
+                        subject, grade_level, criteria_count, max_score,
                         rubric_data, is_public, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     rubric_id, organization_id, owner_email, title, description,
+                    subject, grade_level, criteria_count, max_score,
                     rubric_data_json, is_public, created_at, updated_at
                 ))
 
@@ -69,6 +116,10 @@ class RubricDatabaseManager:
                     'owner_email': owner_email,
                     'title': title,
                     'description': description,
+                    'subject': subject,
+                    'grade_level': grade_level,
+                    'criteria_count': criteria_count,
+                    'max_score': max_score,
                     'rubric_data': rubric_data,
                     'is_public': is_public,
                     'is_showcase': False,
@@ -153,14 +204,17 @@ class RubricDatabaseManager:
         """
         Get rubrics owned by a specific user
 
+        List rows carry the indexed metadata columns but not the rubric body;
+        use get_rubric_by_id for the full rubric.
+
         Args:
             owner_email: Owner's email
             limit: Maximum number of results
             offset: Pagination offset
-            filters: Optional filters (subject, grade_level, etc.)
+            filters: Optional filters (subject, grade_level, search, is_public)
 
         Returns:
-            List of rubric records
+            List of rubric list rows
         """
         if filters is None:
             filters = {}
@@ -177,40 +231,17 @@ class RubricDatabaseManager:
                 where_conditions = ["r.owner_email = ?"]
                 params = [owner_email]
 
-                if filters.get('subject'):
-                    where_conditions.append("JSON_EXTRACT(r.rubric_data, '$.metadata.subject') LIKE ?")
-                    params.append(f"%{filters['subject']}%")
-
-                if filters.get('grade_level'):
-                    where_conditions.append("JSON_EXTRACT(r.rubric_data, '$.metadata.gradeLevel') LIKE ?")
-                    params.append(f"%{filters['grade_level']}%")
+                conditions, filter_params = _filter_conditions(filters)
+                where_conditions += conditions
+                params += filter_params
 
                 if filters.get('is_public') is not None:
                     where_conditions.append("r.is_public = ?")
                     params.append(filters['is_public'])
 
-                where_clause = " AND ".join(where_conditions)
-
-                query = f"""
-                    SELECT r.*, o.slug as organization_slug
-                    FROM {self.db_manager.table_prefix}rubrics r
-                    JOIN {self.db_manager.table_prefix}organizations o ON r.organization_id = o.id
-                    WHERE {where_clause}
-                    ORDER BY r.updated_at DESC
-                    LIMIT ? OFFSET ?
-                """
                 params.extend([limit, offset])
-
-                cursor.execute(query, params)
-
-                rubrics = []
-                for row in cursor.fetchall():
-                    columns = [desc[0] for desc in cursor.description]
-                    rubric_dict = dict(zip(columns, row))
-                    rubric_dict['rubric_data'] = json.loads(rubric_dict['rubric_data'])
-                    rubrics.append(rubric_dict)
-
-                return rubrics
+                return self._list_page(
+                    cursor, " AND ".join(where_conditions), "r.updated_at DESC", params)
 
         except sqlite3.Error as e:
             logging.error(f"Error getting rubrics for {owner_email}: {e}")
@@ -227,11 +258,11 @@ class RubricDatabaseManager:
             organization_id: User's organization ID
             limit: Maximum number of results
             offset: Pagination offset
-            filters: Optional filters
+            filters: Optional filters (subject, grade_level, search)
             include_system_org: Whether to include system organization rubrics
 
         Returns:
-            List of public rubric records from user's org and system org
+            List of public rubric list rows from user's org and system org
         """
         if filters is None:
             filters = {}
@@ -244,67 +275,97 @@ class RubricDatabaseManager:
             with connection:
                 cursor = connection.cursor()
 
-                # Build organization filter - include user's org and optionally system org
-                params = []
-                
-                if include_system_org:
-                    # First get system organization ID in a separate query
-                    system_cursor = connection.cursor()
-                    system_cursor.execute(f"""
-                        SELECT id FROM {self.db_manager.table_prefix}organizations 
-                        WHERE slug = 'lamb' AND is_system = 1
-                    """)
-                    system_org_result = system_cursor.fetchone()
-                    system_org_id = system_org_result[0] if system_org_result else None
-                    
-                    if system_org_id and system_org_id != organization_id:
-                        where_conditions = ["(r.organization_id = ? OR r.organization_id = ?)", "r.is_public = 1"]
-                        params = [organization_id, system_org_id]
-                    else:
-                        where_conditions = ["r.organization_id = ?", "r.is_public = 1"]
-                        params = [organization_id]
-                else:
-                    where_conditions = ["r.organization_id = ?", "r.is_public = 1"]
-                    params = [organization_id]
+                where_clause, params = self._public_conditions(
+                    cursor, organization_id, filters, include_system_org)
+                params.extend([limit, offset])
+                return self._list_page(
+                    cursor, where_clause, "r.is_showcase DESC, r.updated_at DESC", params)
 
-                if filters.get('subject'):
-                    where_conditions.append("JSON_EXTRACT(r.rubric_data, '$.metadata.subject') LIKE ?")
-                    params.append(f"%{filters['subject']}%")
+        except sqlite3.Error as e:
+            logging.error(f"Error getting public rubrics for org {organization_id}: {e}")
+            return []
+        finally:
+            if connection:
+                connection.close()
 
-                if filters.get('grade_level'):
-                    where_conditions.append("JSON_EXTRACT(r.rubric_data, '$.metadata.gradeLevel') LIKE ?")
-                    params.append(f"%{filters['grade_level']}%")
+    def count_public_rubrics(self, organization_id: int, filters: dict = None, include_system_org: bool = True) -> int:
+        """
+        Count public rubrics matching the same filters as get_public_rubrics
 
-                where_clause = " AND ".join(where_conditions)
+        Args:
+            organization_id: User's organization ID
+            filters: Optional filters
+            include_system_org: Whether to include system organization rubrics
 
-                query = f"""
-                    SELECT r.*, o.slug as organization_slug
-                    FROM {self.db_manager.table_prefix}rubrics r
-                    JOIN {self.db_manager.table_prefix}organizations o ON r.organization_id = o.id
-                    WHERE {where_clause}
-                    ORDER BY r.is_showcase DESC, r.updated_at DESC
-                    LIMIT ? OFFSET ?
-                """
-                params.extend([limit, offset])
+        Returns:
+            Count of rubrics
+        """
+        connection = self.db_manager.get_connection()
+        if not connection:
+            return 0
 
-                cursor.execute(query, params)
+        try:
+            with connection:
+                cursor = connection.cursor()
 
-                rubrics = []
-                for row in cursor.fetchall():
-                    columns = [desc[0] for desc in cursor.description]
-                    rubric_dict = dict(zip(columns, row))
-                    rubric_dict['rubric_data'] = json.loads(rubric_dict['rubric_data'])
-                    rubrics.append(rubric_dict)
+                where_clause, params = self._public_conditions(
+                    cursor, organization_id, filters or {}, include_system_org)
+                cursor.execute(f"""
+                    SELECT COUNT(*) FROM {self.db_manager.table_prefix}rubrics r
+                    WHERE {where_clause}
+                """, params)
 
-                return rubrics
+                return cursor.fetchone()[0]
 
         except sqlite3.Error as e:
-            logging.error(f"Error getting public rubrics for org {organization_id}: {e}")
-            return []
+            logging.error(f"Error counting public rubrics for org {organization_id}: {e}")
+            return 0
         finally:
             if connection:
                 connection.close()
 
+    def _public_conditions(self, cursor, organization_id: int, filters: dict, include_system_org: bool) -> tuple[str, list]:
+        """WHERE clause and parameters for public rubrics of an organization"""
+        org_ids = [organization_id]
+
+        if include_system_org:
+            cursor.execute(f"""
+                SELECT id FROM {self.db_manager.table_prefix}organizations
+                WHERE slug = 'lamb' AND is_system = 1
+            """)
+            system_org_result = cursor.fetchone()
+            if system_org_result and system_org_result[0] != organization_id:
+                org_ids.append(system_org_result[0])
+
+        where_conditions = [f"r.organization_id IN ({', '.join('?' * len(org_ids))})", "r.is_public = 1"]
+        conditions, filter_params = _filter_conditions(filters)
+        return " AND ".join(where_conditions + conditions), org_ids + filter_params
+
+    def _list_page(self, cursor, where_clause: str, order_by: str, params: list) -> list[dict]:
+        """
+        Run a listing query and return lightweight rows.
+
+        The page of ids is selected first, so filtering and ordering read only
+        the listing indexes; the rubric body is never loaded.
+        """
+        prefix = self.db_manager.table_prefix
+        columns = ", ".join(f"r.{column}" for column in LIST_COLUMNS)
+        cursor.execute(f"""
+            SELECT {columns}, o.slug as organization_slug
+            FROM {prefix}rubrics r
+            JOIN {prefix}organizations o ON r.organization_id = o.id
+            WHERE r.id IN (
+                SELECT r.id FROM {prefix}rubrics r
+                WHERE {where_clause}
+                ORDER BY {order_by}
+                LIMIT ? OFFSET ?
+            )
+            ORDER BY {order_by}, r.id DESC
+        """, params)
+
+        names = [desc[0] for desc in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
     def get_showcase_rubrics(self, organization_id: int) -> list[dict]:
         """
         Get showcase rubrics for an organization
@@ -379,14 +440,17 @@ class RubricDatabaseManager:
                 # Update rubric
                 title = rubric_data.get('title', 'Untitled Rubric')
                 description = rubric_data.get('description', '')
+                subject, grade_level, criteria_count, max_score = _list_metadata(rubric_data)
                 rubric_data_json = json.dumps(rubric_data)
                 updated_at = int(datetime.now().timestamp())
 
                 cursor.execute(f"""
                     UPDATE {self.db_manager.table_prefix}rubrics
-                    SET title = ?, description = ?, rubric_data = ?, updated_at = ?
+                    SET title = ?, description = ?, subject = ?, grade_level = ?,
+                        criteria_count = ?, max_score = ?, rubric_data = ?, updated_at = ?
                     WHERE rubric_id = ? AND owner_email = ?
-                """, (title, description, rubric_data_json, updated_at, rubric_id, owner_email))
+                """, (title, description, subject, grade_level, criteria_count, max_score,
+                      rubric_data_json, updated_at, rubric_id, owner_email))
 
                 if cursor.rowcount == 0:
                     raise Exception("Rubric update failed")
@@ -567,25 +631,21 @@ class RubricDatabaseManager:
                 cursor = connection.cursor()
 
                 # Build query with filters
-                where_conditions = ["owner_email = ?"]
+                where_conditions = ["r.owner_email = ?"]
                 params = [owner_email]
 
-                if filters.get('subject'):
-                    where_conditions.append("JSON_EXTRACT(rubric_data, '$.metadata.subject') LIKE ?")
-                    params.append(f"%{filters['subject']}%")
-
-                if filters.get('grade_level'):
-                    where_conditions.append("JSON_EXTRACT(rubric_data, '$.metadata.gradeLevel') LIKE ?")
-                    params.append(f"%{filters['grade_level']}%")
+                conditions, filter_params = _filter_conditions(filters)
+                where_conditions += conditions
+                params += filter_params
 
                 if filters.get('is_public') is not None:
-                    where_conditions.append("is_public = ?")
+                    where_conditions.append("r.is_public = ?")
                     params.append(filters['is_public'])
 
                 where_clause = " AND ".join(where_conditions)
 
                 cursor.execute(f"""
-                    SELECT COUNT(*) FROM {self.db_manager.table_prefix}rubrics
+                    SELECT COUNT(*) FROM {self.db_manager.table_prefix}rubrics r
                     WHERE {where_clause}
                 """, params)
 
@@ -275,6 +275,8 @@ def list_rubrics_logic(
             filters['subject'] = subject
         if grade_level:
             filters['grade_level'] = grade_level
+        if search:
+            filters['search'] = search
 
         # Get rubrics
         rubrics = db_manager.get_rubrics_by_owner(
@@ -286,14 +288,6 @@ def list_rubrics_logic(
         
         logger.info(f"Found {len(rubrics)} rubrics for {user_email}")
 
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            rubrics = [
-                r for r in rubrics
-                if search_lower in r['title'].lower() or search_lower in r['description'].lower()
-            ]
-
         # Get total count
         total = db_manager.count_rubrics(user_email, filters)
 
@@ -340,6 +334,8 @@ def list_public_rubrics_logic(
             filters['subject'] = subject
         if grade_level:
             filters['grade_level'] = grade_level
+        if search:
+            filters['search'] = search
 
         # Get public rubrics (includes user's org + system org)
         rubrics = db_manager.get_public_rubrics(
@@ -350,16 +346,8 @@ def list_public_rubrics_logic(
             include_system_org=True
         )
 
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            rubrics = [
-                r for r in rubrics
-                if search_lower in r['title'].lower() or search_lower in r['description'].lower()
-            ]
-
         # Get total count
-        total = len(rubrics)  # Since we're filtering after, count actual results
+        total = db_manager.count_public_rubrics(organization_id, filters, include_system_org=True)
 
         return {
             "rubrics": rubrics,
@@ -1,5 +1,6 @@
 import os
 import sys
+import json
 import logging
 
 
@@ -46,3 +47,28 @@ def get_logger(name: str, component: str = "MAIN") -> logging.Logger:
     level = SRC_LOG_LEVELS.get(component, GLOBAL_LOG_LEVEL)
     logger.setLevel(level)
     return logger
+
+
+class LazyJSON:
+    """Serialize a value for a log message only if the record is emitted.
+
+    Use with %-style arguments so disabled debug logs cost nothing:
+    ``logger.debug("Payload: %s", LazyJSON(payload, indent=2))``.
+    ``max_chars`` truncates the rendered text.
+    """
+
+    __slots__ = ("value", "max_chars", "kwargs")
+
+    def __init__(self, value, max_chars: int | None = None, **kwargs):
+        self.value = value
+        self.max_chars = max_chars
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        try:
+            text = json.dumps(self.value, **self.kwargs)
+        except (TypeError, ValueError):
+            text = repr(self.value)
+        if self.max_chars is not None and len(text) > self.max_chars:
+            text = text[:self.max_chars] + "..."
+        return text
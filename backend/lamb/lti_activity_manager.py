@@ -9,7 +9,6 @@ activity configuration, and student launch.
 import os
 import re
 import time
-import secrets
 import hmac
 import hashlib
 import base64
@@ -21,10 +20,25 @@ from lamb.owi_bridge.owi_users import OwiUserManager
 from lamb.owi_bridge.owi_group import OwiGroupManager
 from lamb.owi_bridge.owi_model import OWIModel
 from lamb.owi_bridge.owi_database import OwiDatabaseManager
+from lamb.owi_bridge.owi_group_batcher import get_group_membership_batcher
+from lamb.password_hasher import unusable_password_hash
 from lamb.logging_config import get_logger
+import config
 
 logger = get_logger(__name__, component="LTI_ACTIVITY")
 
+# resource_link_id -> (expires_at, activity); active activities only
+_activity_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_ACTIVITY_CACHE_MAX = 10000
+
+
+def invalidate_activity_cache(resource_link_id: Optional[str] = None) -> None:
+    """Drop a cached activity (or all of them) after it changes in this worker."""
+    if resource_link_id is None:
+        _activity_cache.clear()
+    else:
+        _activity_cache.pop(resource_link_id, None)
+
 
 class LtiActivityManager:
     """Manages the unified LTI activity lifecycle."""
@@ -196,6 +210,31 @@ class LtiActivityManager:
                 result[org_id].extend(assistants)
         return result
 
+    # =========================================================================
+    # Activity Resolution
+    # =========================================================================
+
+    def resolve_activity(self, resource_link_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an activity by resource_link_id, reusing recent active lookups.
+        During a launch storm every student hits the same activity; an active
+        activity is cached for LTI_ACTIVITY_CACHE_TTL seconds (other workers
+        see a disable/reconfigure after at most that long).
+        """
+        now = time.monotonic()
+        cached = _activity_cache.get(resource_link_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        activity = self.db_manager.get_lti_activity_by_resource_link(resource_link_id)
+        if activity and activity['status'] == 'active' and config.LTI_ACTIVITY_CACHE_TTL > 0:
+            if len(_activity_cache) >= _ACTIVITY_CACHE_MAX:
+                _activity_cache.clear()
+            _activity_cache[resource_link_id] = (now + config.LTI_ACTIVITY_CACHE_TTL, activity)
+        else:
+            _activity_cache.pop(resource_link_id, None)
+        return activity
+
     # =========================================================================
     # Activity Configuration
     # =========================================================================
@@ -276,6 +315,7 @@ class LtiActivityManager:
         # Store assistant links
         self.db_manager.add_assistants_to_activity(activity_id, assistant_ids)
 
+        invalidate_activity_cache(resource_link_id)
         return self.db_manager.get_lti_activity_by_resource_link(resource_link_id)
 
     def reconfigure_activity(
@@ -315,6 +355,7 @@ class LtiActivityManager:
             self.db_manager.add_assistants_to_activity(activity_id, list(to_add))
 
         self.db_manager.update_lti_activity(activity_id, status='active')
+        invalidate_activity_cache(activity['resource_link_id'])
         return True
 
     # =========================================================================
@@ -344,7 +385,7 @@ class LtiActivityManager:
         Handle a student (or instructor-as-user) launch into a configured activity.
         1. Generate synthetic email
         2. Get/create OWI user
-        3. Add to activity's OWI group
+        3. Add to activity's OWI group (batched with concurrent launches)
         4. Record in lti_activity_users
         5. Get auth token
         Returns the OWI auth token or None on failure.
@@ -356,11 +397,14 @@ class LtiActivityManager:
         owi_user = self.owi_user_manager.get_user_by_email(email)
         if not owi_user:
             logger.info(f"Creating new OWI user for {email}")
+            # Header-trust signin never uses this password (#411), so skip
+            # hashing a throwaway one per student
             owi_user = self.owi_user_manager.create_user(
                 name=display_name,
                 email=email,
-                password=secrets.token_urlsafe(32),  # Random; header-trust signin, not this password (#411)
-                role="user"
+                password="",
+                role="user",
+                password_hash=unusable_password_hash()
             )
             if not owi_user:
                 logger.error(f"Failed to create OWI user for {email}")
@@ -370,12 +414,11 @@ class LtiActivityManager:
         owi_user_id = owi_user.get('id', '') if owi_user else ''
 
         # Add to activity's OWI group
-        add_result = self.owi_group_manager.add_user_to_group_by_email(
-            group_id=activity['owi_group_id'],
-            user_email=email
-        )
-        if add_result.get("status") == "error" and "already a member" not in add_result.get("error", "").lower():
-            logger.warning(f"Could not add {email} to group: {add_result.get('error')}")
+        try:
+            if not get_group_membership_batcher().add(activity['owi_group_id'], owi_user_id):
+                logger.warning(f"Could not add {email} to group {activity['owi_group_id']}")
+        except Exception as e:
+            logger.warning(f"Could not add {email} to group {activity['owi_group_id']}: {e}")
 
         # Record in LAMB DB (also updates access tracking)
         self.db_manager.create_lti_activity_user(
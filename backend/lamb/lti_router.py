@@ -11,12 +11,14 @@ Endpoint: POST /lamb/v1/lti/launch
 """
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse
 from fastapi.templating import Jinja2Templates
 from lamb import auth as lamb_auth
 from lamb.lti_activity_manager import LtiActivityManager
 from lamb.database_manager import LambDatabaseManager
 from lamb.owi_bridge.owi_users import OwiUserManager
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher
 from lamb.logging_config import get_logger
 import os
 import json
@@ -139,7 +141,7 @@ async def lti_launch(request: Request):
         logger.info(f"LTI launch: resource_link={resource_link_id}, user={username}, roles={roles}")
 
         # Check if activity is already configured
-        activity = db_manager.get_lti_activity_by_resource_link(resource_link_id)
+        activity = manager.resolve_activity(resource_link_id)
 
         if activity and activity['status'] == 'active':
             public_base = manager.get_public_base_url(request)
@@ -165,7 +167,10 @@ async def lti_launch(request: Request):
             # ── CONFIGURED: Student flow ──
             # Student identity comes from the LMS (name, email if provided).
             # LMS instructors control what identity data is passed via LTI privacy settings.
-            owi_token = manager.handle_student_launch(
+            # Blocking DB/OWI work runs in a thread so a launch storm does
+            # not stall the event loop
+            owi_token = await run_in_threadpool(
+                manager.handle_student_launch,
                 activity=activity,
                 username=username,
                 display_name=display_name,
@@ -403,8 +408,16 @@ async def lti_link_account_submit(request: Request):
                 "error": "Please enter your email and password.",
             })
 
-        # Verify credentials
-        creator_user = manager.verify_creator_credentials(email, password)
+        # Verify credentials; the bcrypt check runs on the hashing pool
+        try:
+            creator_user = await get_password_hasher().run_sync(
+                manager.verify_creator_credentials, email, password)
+        except PasswordHashingBusy as e:
+            return templates.TemplateResponse("lti_link_account.html", {
+                "request": request,
+                "token": token,
+                "error": "The server is busy. Please try again in a few seconds.",
+            }, status_code=503, headers={"Retry-After": str(e.retry_after)})
         if not creator_user:
             return templates.TemplateResponse("lti_link_account.html", {
                 "request": request,
@@ -685,7 +698,8 @@ async def lti_enter_chat(request: Request, resource_link_id: str = "", token: st
     display_name = data.get("display_name", "Instructor")
     lms_user_id = data.get("lms_user_id")
 
-    owi_token = manager.handle_student_launch(
+    owi_token = await run_in_threadpool(
+        manager.handle_student_launch,
         activity=activity,
         username=username,
         display_name=display_name,
@@ -297,6 +297,70 @@ class OwiGroupManager:
                 "error": f"Unexpected error: {str(e)}"
             }
 
+    def is_group_member(self, group_id: str, user_id: str) -> bool:
+        """Check whether a user is in a group, reading only the member list"""
+        try:
+            result = self.db.execute_query('SELECT user_ids FROM "group" WHERE id = ?',
+                                           (group_id,), fetch_one=True)
+            return bool(result and result[0] and user_id in json.loads(result[0]))
+        except (json.JSONDecodeError, TypeError) as e:
+            logging.error(f"Error in is_group_member: {e}")
+            return False
+
+    def add_user_ids_to_group(self, group_id: str, user_ids: List[str]) -> Optional[List[str]]:
+        """
+        Add several users to a group in one atomic read-modify-write
+
+        The write lock is taken before the member list is read (BEGIN
+        IMMEDIATE), so concurrent additions from other threads or workers
+        cannot overwrite each other.
+
+        Args:
+            group_id (str): ID of the group
+            user_ids (List[str]): IDs of the users to add (members are ignored)
+
+        Returns:
+            Optional[List[str]]: The group's full member list, or None on failure
+        """
+        conn = self.db.get_connection()
+        if not conn:
+            return None
+
+        try:
+            conn.isolation_level = None
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute('SELECT user_ids FROM "group" WHERE id = ?', (group_id,))
+            row = cursor.fetchone()
+            if not row:
+                cursor.execute("ROLLBACK")
+                logging.error(f"Group with id {group_id} not found")
+                return None
+
+            try:
+                members = json.loads(row[0]) if row[0] else []
+            except (json.JSONDecodeError, TypeError):
+                members = []
+
+            known = set(members)
+            added = [uid for uid in dict.fromkeys(user_ids) if uid not in known]
+            if added:
+                members.extend(added)
+                cursor.execute(
+                    'UPDATE "group" SET user_ids = ?, updated_at = ? WHERE id = ?',
+                    (json.dumps(members), int(time.time()), group_id)
+                )
+            cursor.execute("COMMIT")
+            return members
+
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logging.error(f"Error in add_user_ids_to_group: {e}")
+            return None
+        finally:
+            conn.close()
+
     def remove_user_from_group(self, group_id: str, user_id: str) -> bool:
         """Remove a user from a group"""
         try:
@@ -0,0 +1,133 @@
+"""
+Coalesced OWI group membership writes.
+
+An OWI group stores its members as one JSON array, so every "add user to
+group" rewrites the whole row. When hundreds of students launch the same LTI
+activity at once, those rewrites serialize on the SQLite write lock (and,
+done as separate read/modify/write steps, can overwrite each other).
+
+``GroupMembershipBatcher`` funnels additions through one writer thread per
+process: requests that arrive within ``window`` seconds of each other are
+merged into a single atomic write per group, and each caller waits until the
+write that contains its addition has committed, so a student is a member
+before being redirected to OWI. Returning students are found with a
+read-only lookup of the group row and skip the write entirely. Membership is
+not cached, so a removal (from any worker) takes effect on the next launch.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from lamb.logging_config import get_logger
+
+logger = get_logger(__name__, component="OWI")
+
+
+class GroupMembershipBatcher:
+    """Merges concurrent group additions into one write per group."""
+
+    def __init__(self, group_manager_factory: Callable, window: float = 0.05):
+        self._group_manager_factory = group_manager_factory
+        self.window = window
+        self._reset()
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending: Dict[str, Dict[str, List[Future]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._writes = 0
+        self._requests = 0
+
+    def is_member(self, group_id: str, user_id: str) -> bool:
+        """True if ``user_id`` is in the group (read only, no write lock)."""
+        return self._group_manager_factory().is_group_member(group_id, user_id)
+
+    def add(self, group_id: str, user_id: str, timeout: float = 10.0) -> bool:
+        """
+        Add a user to a group, waiting for the batched write to commit.
+
+        Returns:
+            bool: True once the user is a member, False if the write failed
+        """
+        if self.is_member(group_id, user_id):
+            return True
+
+        future: Future = Future()
+        with self._lock:
+            self._requests += 1
+            self._pending.setdefault(group_id, {}).setdefault(user_id, []).append(future)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="owi-group-writer", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return future.result(timeout=timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "writes": self._writes,
+                "pending": sum(len(users) for users in self._pending.values()),
+            }
+
+    def _run(self) -> None:
+        group_manager = self._group_manager_factory()
+        while True:
+            self._wakeup.wait()
+            # Let concurrent launches join this write
+            time.sleep(self.window)
+            with self._lock:
+                self._wakeup.clear()
+                batch, self._pending = self._pending, {}
+            for group_id, waiters in batch.items():
+                self._flush(group_manager, group_id, waiters)
+
+    def _flush(self, group_manager, group_id: str, waiters: Dict[str, List[Future]]) -> None:
+        try:
+            members = group_manager.add_user_ids_to_group(group_id, list(waiters))
+        except Exception as e:
+            logger.error(f"Batched group write failed for {group_id}: {e}")
+            members = None
+
+        with self._lock:
+            self._writes += 1
+        if members is None:
+            logger.warning(f"Could not add {len(waiters)} users to group {group_id}")
+        for futures in waiters.values():
+            for future in futures:
+                future.set_result(members is not None)
+
+
+_batcher: Optional[GroupMembershipBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def _after_fork_in_child() -> None:
+    global _batcher_lock
+    _batcher_lock = threading.Lock()
+    if _batcher is not None:
+        # The writer thread does not survive fork; start over in the child
+        _batcher._reset()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def get_group_membership_batcher() -> GroupMembershipBatcher:
+    """Return the process-wide batcher, configured from ``config.py``."""
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                import config
+                from .owi_group import OwiGroupManager
+                _batcher = GroupMembershipBatcher(
+                    OwiGroupManager,
+                    window=config.LTI_GROUP_BATCH_WINDOW_MS / 1000,
+                )
+    return _batcher
@@ -1,10 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, JSONResponse
 from typing import List, Dict, Any
 from .owi_database import OwiDatabaseManager
 from .owi_users import OwiUserManager
 from .owi_group import OwiGroupManager
 from config import API_KEY
+from lamb.auth import hash_password_async
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher
+import functools
 import logging
 from fastapi.templating import Jinja2Templates
 import os
@@ -36,6 +40,14 @@ templates.env.loader.searchpath = [
     os.path.abspath("lamb/lti/templates")
 ]
 
+def _busy_response(exc: PasswordHashingBusy) -> HTTPException:
+    """503 with Retry-After for a saturated password hashing pool"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 def verify_api_key(request: Request):
     """Verify Bearer token authentication"""
     
@@ -138,12 +150,15 @@ async def create_user(request: Request, _=Depends(verify_api_key)):
         # Optional role field
         role = data.get('role', 'user')
         
-        # Create user
-        user = user_manager.create_user(
+        # Hash on the pool, then create the user off the event loop
+        password_hash = await hash_password_async(data['password'])
+        user = await run_in_threadpool(
+            user_manager.create_user,
             name=data['name'],
             email=data['email'],
             password=data['password'],
-            role=role
+            role=role,
+            password_hash=password_hash
         )
         
         if user:
@@ -158,6 +173,8 @@ async def create_user(request: Request, _=Depends(verify_api_key)):
             
     except HTTPException:
         raise
+    except PasswordHashingBusy as e:
+        raise _busy_response(e)
     except Exception as e:
         logging.error(f"Error in create_user endpoint: {e}")
         raise HTTPException(
@@ -177,7 +194,7 @@ async def verify_user(request: Request, _=Depends(verify_api_key)):
         # we call this to make sure the admin user exists
         # if it doesn't, we create it with the default password on the .env file
         # this is a bit of a hack, but it's a quick way to make sure the admin user exists
-        admin_token = user_manager.get_admin_user_token()
+        admin_token = await run_in_threadpool(user_manager.get_admin_user_token)
         
         data = await request.json()
         logging.info(f"Verify user request: {data}")
@@ -189,15 +206,14 @@ async def verify_user(request: Request, _=Depends(verify_api_key)):
             )
         
         # Check if user exists in database before verification
-        user_exists = db_manager.get_user_by_email(data['email'])
-        
-        
+        user_exists = await run_in_threadpool(db_manager.get_user_by_email, data['email'])
 
-        # Verify credentials
-        user = user_manager.verify_user(
+        # Verify credentials; the bcrypt check runs on the hashing pool
+        user = await get_password_hasher().run_sync(functools.partial(
+            user_manager.verify_user,
             email=data['email'],
             password=data['password']
-        )
+        ))
         
         if user:
             # Remove sensitive information before returning
@@ -217,6 +233,8 @@ async def verify_user(request: Request, _=Depends(verify_api_key)):
             
     except HTTPException:
         raise
+    except PasswordHashingBusy as e:
+        raise _busy_response(e)
     except Exception as e:
         logging.error(f"Error in verify_user endpoint: {e}")
         raise HTTPException(
@@ -659,17 +677,20 @@ async def update_user_password(request: Request, _=Depends(verify_api_key)):
                 )
         
         # Get user to verify existence
-        user = user_manager.get_user_by_email(data['email'])
+        user = await run_in_threadpool(user_manager.get_user_by_email, data['email'])
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with email {data['email']} not found"
             )
             
-        # Update password
-        success = user_manager.update_user_password(
+        # Hash on the pool, then update the password off the event loop
+        password_hash = await hash_password_async(data['new_password'])
+        success = await run_in_threadpool(
+            user_manager.update_user_password,
             email=data['email'],
-            new_password=data['new_password']
+            new_password=data['new_password'],
+            password_hash=password_hash
         )
         
         if success:
@@ -682,6 +703,8 @@ async def update_user_password(request: Request, _=Depends(verify_api_key)):
             
     except HTTPException:
         raise
+    except PasswordHashingBusy as e:
+        raise _busy_response(e)
     except Exception as e:
         logging.error(f"Error in update_user_password endpoint: {e}")
         logging.error(traceback.format_exc())
@@ -708,17 +731,20 @@ async def update_user_password_post(request: Request, _=Depends(verify_api_key))
                 )
         
         # Get user to verify existence
-        user = user_manager.get_user_by_email(data['email'])
+        user = await run_in_threadpool(user_manager.get_user_by_email, data['email'])
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with email {data['email']} not found"
             )
             
-        # Update password
-        success = user_manager.update_user_password(
+        # Hash on the pool, then update the password off the event loop
+        password_hash = await hash_password_async(data['new_password'])
+        success = await run_in_threadpool(
+            user_manager.update_user_password,
             email=data['email'],
-            new_password=data['new_password']
+            new_password=data['new_password'],
+            password_hash=password_hash
         )
         
         if success:
@@ -731,6 +757,8 @@ async def update_user_password_post(request: Request, _=Depends(verify_api_key))
             
     except HTTPException:
         raise
+    except PasswordHashingBusy as e:
+        raise _busy_response(e)
     except Exception as e:
         logging.error(f"Error in update_user_password_post endpoint: {e}")
         logging.error(traceback.format_exc())
@@ -3,7 +3,6 @@ import json
 import sqlite3
 import fcntl
 import tempfile
-from passlib.context import CryptContext
 from typing import Optional, Dict
 import time
 from .owi_database import OwiDatabaseManager
@@ -12,6 +11,8 @@ import os
 import warnings
 import config
 from lamb.logging_config import get_logger
+# Same bcrypt settings as LAMB; hashing runs on the shared bounded worker pool
+from lamb.password_hasher import PasswordHashingBusy, get_password_hasher, pwd_context  # noqa: F401
 
 # Suppress the specific passlib warning about bcrypt version
 warnings.filterwarnings("ignore", message=".*error reading bcrypt version.*")
@@ -22,17 +23,6 @@ PIPELINES_HOST = config.LAMB_WEB_HOST
 # Set up logger for OWI users
 logger = get_logger(__name__, component="OWI")
 
-# Password hashing configuration
-# Using bcrypt with settings that work with newer bcrypt 4.x versions
-# The warning occurs because passlib tries to detect bcrypt version in a way
-# that's incompatible with bcrypt 4.x, but the functionality still works correctly
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__ident="2b",
-    bcrypt__rounds=12
-)
-
 
 class UserCreationLock:
     """
@@ -99,7 +89,8 @@ class OwiUserManager:
         # this will ensure that the admin user is created
         self.admin_token = self.get_admin_user_token()
 
-    def create_user(self, name: str, email: str, password: str, role: str = "user") -> Optional[Dict]:
+    def create_user(self, name: str, email: str, password: str, role: str = "user",
+                    password_hash: Optional[str] = None) -> Optional[Dict]:
         """
         Create a new user with authentication.
         
@@ -111,6 +102,8 @@ class OwiUserManager:
             email (str): User's email
             password (str): User's password
             role (str): User's role (default: "user")
+            password_hash (str): bcrypt hash of ``password`` if the caller
+                already computed one (LAMB and OWI share the hash format)
 
         Returns:
             Optional[Dict]: Created user data or None if creation fails
@@ -126,7 +119,7 @@ class OwiUserManager:
 
                 # Generate user ID and hash password
                 user_id = str(uuid.uuid4())
-                hashed_password = pwd_context.hash(password)
+                hashed_password = password_hash or get_password_hasher().hash(password)
                 current_time = int(time.time())
 
                 profile_image_url = f"{PIPELINES_HOST}/static/img/lamb_icon.png"
@@ -199,6 +192,74 @@ class OwiUserManager:
             logger.error(f"Unexpected error in create_user: {e}")
             return None
 
+    def create_users_batch(self, users: list, role: str = "user") -> int:
+        """
+        Create many users with pre-computed password hashes in one transaction.
+
+        The write lock is taken up front (BEGIN IMMEDIATE), so the existence
+        check and the inserts are atomic with respect to other workers and no
+        per-email file lock is needed. Emails that already exist are left
+        untouched.
+
+        Args:
+            users (list): Dicts with name, email and password_hash
+            role (str): Role for every created user (default: "user")
+
+        Returns:
+            int: Number of users created
+        """
+        if not users:
+            return 0
+
+        conn = self.db.get_connection()
+        if not conn:
+            return 0
+
+        try:
+            conn.isolation_level = None
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+
+            emails = [user['email'] for user in users]
+            placeholders = ",".join("?" * len(emails))
+            cursor.execute(f"SELECT email FROM user WHERE email IN ({placeholders})", emails)
+            existing = {row[0] for row in cursor.fetchall()}
+
+            current_time = int(time.time())
+            profile_image_url = f"{PIPELINES_HOST}/static/img/lamb_icon.png"
+            settings = json.dumps({"ui": {"showUpdateToast": False, "showChangelog": False}})
+            user_rows, auth_rows = [], []
+            for user in users:
+                if user['email'] in existing:
+                    continue
+                existing.add(user['email'])
+                user_id = str(uuid.uuid4())
+                user_rows.append((user_id, user['name'], user['email'], role, profile_image_url,
+                                  settings, current_time, current_time, current_time))
+                auth_rows.append((user_id, user['email'], user['password_hash'], 1))
+
+            cursor.executemany("""
+                INSERT INTO user (id, name, email, role, profile_image_url, settings,
+                                created_at, updated_at, last_active_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, user_rows)
+            cursor.executemany("""
+                INSERT INTO auth (id, email, password, active)
+                VALUES (?, ?, ?, ?)
+            """, auth_rows)
+            cursor.execute("COMMIT")
+
+            logger.info(f"Created {len(user_rows)} users in batch ({len(users) - len(user_rows)} already existed)")
+            return len(user_rows)
+
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Error creating users batch: {e}")
+            return 0
+        finally:
+            conn.close()
+
     def get_login_url(self, email: str, name: str) -> str:
         token = self.get_auth_token(email, name)
         # Return a public URL suitable for clients, even if the backend uses an internal host for service-to-service calls
@@ -276,7 +337,7 @@ class OwiUserManager:
                 return None
 
             # Verify password
-            verification_result = pwd_context.verify(password, hashed_password)
+            verification_result = get_password_hasher().verify(password, hashed_password)
 
             if not verification_result:
                 return None
@@ -286,6 +347,8 @@ class OwiUserManager:
 
             return user_data
 
+        except PasswordHashingBusy:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error in verify_user: {e}")
             return None
@@ -320,13 +383,16 @@ class OwiUserManager:
             logger.error(f"Error getting user by email: {e}")
             return None
 
-    def update_user_password(self, email: str, new_password: str) -> bool:
+    def update_user_password(self, email: str, new_password: str,
+                             password_hash: Optional[str] = None) -> bool:
         """
         Update a user's password in the authentication database
 
         Args:
             email (str): User's email
             new_password (str): New password to set
+            password_hash (str): bcrypt hash of ``new_password`` if the caller
+                already computed one
 
         Returns:
             bool: True if password was updated successfully, False otherwise
@@ -339,7 +405,7 @@ class OwiUserManager:
                 return False
 
             # Hash the new password
-            hashed_password = pwd_context.hash(new_password)
+            hashed_password = password_hash or get_password_hasher().hash(new_password)
 
             # Update the password in the auth table
             query = "UPDATE auth SET password = ? WHERE email = ?"
@@ -0,0 +1,303 @@
+"""
+Bounded worker pool for bcrypt password hashing.
+
+A 12-round bcrypt hash or verify costs a few hundred milliseconds of CPU.
+Run inline in a request handler it stalls the event loop for every other
+request, so a burst of logins at the start of a class froze the whole
+server. Every LAMB hash/verify path (``lamb.auth`` and the OWI user mirror
+in ``lamb.owi_bridge.owi_users``) goes through this pool instead:
+
+- the bcrypt work runs in ``PASSWORD_HASH_WORKERS`` worker processes
+  (``PASSWORD_HASH_POOL=thread`` switches to threads), so at most that many
+  cores are spent on hashing no matter how many logins arrive
+- admission control: at most ``PASSWORD_HASH_MAX_PENDING`` operations may be
+  queued or running; beyond that callers get ``PasswordHashingBusy``, which
+  the login endpoints turn into a 503 with ``Retry-After``
+- ``stats()`` reports queue depth, in-flight work, rejections and latency;
+  ``render_metrics()`` serves the same numbers on ``/metrics``
+
+The sync helpers block only the calling thread. Async handlers either use
+the ``*_async`` variants or run a whole sync credential flow (DB lookups plus
+hashing) through ``run_sync``, which uses its own small thread limiter so a
+login burst cannot exhaust the threadpool shared by every sync endpoint.
+"""
+
+import asyncio
+import functools
+import os
+import secrets
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+import anyio
+from passlib.context import CryptContext
+
+# Suppress the specific passlib warning about bcrypt version
+warnings.filterwarnings("ignore", message=".*error reading bcrypt version.*")
+
+# Shared by LAMB and the OWI mirror so hashes stay interchangeable
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__ident="2b",
+    bcrypt__rounds=12,
+)
+
+
+# Worker-side functions (must be importable by the spawned pool processes)
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the hashing pool is saturated; maps to HTTP 503."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Too many concurrent password operations, please retry shortly")
+        self.retry_after = retry_after
+
+
+class PasswordHasher:
+    """Runs bcrypt operations on a bounded executor with admission control."""
+
+    def __init__(self, workers: int, max_pending: int, use_processes: bool = True,
+                 retry_after: int = 2):
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self.use_processes = use_processes
+        self.retry_after = retry_after
+        self._executor = None
+        self._thread_limiters = weakref.WeakKeyDictionary()  # event loop -> limiter
+        self._lock = threading.Lock()
+        self._flows = 0
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    # ── executor ──────────────────────────────────────────────────────────
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._build_executor()
+            return self._executor
+
+    def _build_executor(self):
+        import multiprocessing
+        # Daemonic processes (e.g. multiprocessing.Pool workers) cannot have children
+        if self.use_processes and multiprocessing.current_process().daemon:
+            self.use_processes = False
+        if self.use_processes:
+            try:
+                # spawn: forking a process that runs an event loop and other
+                # threads is unsafe; workers only need this small module
+                return ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, NotImplementedError, ValueError):
+                self.use_processes = False
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+
+    def _reset_executor(self, broken) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False)
+
+    def _forget_executor(self) -> None:
+        """Drop the parent's pool in a forked child; the child builds its own."""
+        self._lock = threading.Lock()
+        self._executor = None
+        self._thread_limiters = weakref.WeakKeyDictionary()
+        self._flows = 0
+        self._pending = 0
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (it is recreated on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ── admission control ─────────────────────────────────────────────────
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue ``fn(*args)`` on the pool, or raise ``PasswordHashingBusy``."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHashingBusy(self.retry_after)
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+        started = time.monotonic()
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); start a fresh pool once
+                self._reset_executor(executor)
+                future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._finish(started, completed=False)
+            raise
+        future.add_done_callback(lambda _f: self._finish(started))
+        return future
+
+    def _finish(self, started: float, completed: bool = True) -> None:
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            self._pending -= 1
+            if completed:
+                self._completed += 1
+                self._total_ms += elapsed_ms
+                self._max_ms = max(self._max_ms, elapsed_ms)
+
+    # ── operations ────────────────────────────────────────────────────────
+
+    async def run_sync(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a sync credential flow ``fn(*args)`` in a worker thread.
+
+        At most ``2 * workers`` flows hold a thread at once (they spend most
+        of their time waiting on the pool); others wait without a thread.
+        More than ``max_pending`` concurrent flows are rejected.
+        """
+        with self._lock:
+            if self._flows >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHashingBusy(self.retry_after)
+            self._flows += 1
+        try:
+            loop = asyncio.get_running_loop()
+            limiter = self._thread_limiters.get(loop)
+            if limiter is None:
+                limiter = self._thread_limiters[loop] = anyio.CapacityLimiter(self.workers * 2)
+            return await anyio.to_thread.run_sync(functools.partial(fn, *args), limiter=limiter)
+        finally:
+            with self._lock:
+                self._flows -= 1
+
+    def hash(self, password: str) -> str:
+        return self.submit(_hash, password).result()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self.submit(_verify, plain_password, hashed_password).result()
+
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(self.submit(_hash, password))
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(self.submit(_verify, plain_password, hashed_password))
+
+    # ── metrics ───────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        """Point-in-time pool metrics."""
+        with self._lock:
+            return {
+                "pool": "process" if self.use_processes else "thread",
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "credential_flows": self._flows,
+                "pending": self._pending,
+                "queue_depth": max(0, self._pending - self.workers),
+                "peak_pending": self._peak_pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._total_ms / self._completed, 1) if self._completed else 0.0,
+                "max_ms": round(self._max_ms, 1),
+            }
+
+    def render_metrics(self) -> str:
+        """``stats()`` in the Prometheus text format, served on ``/metrics``."""
+        stats = self.stats()
+        with self._lock:
+            total_seconds = self._total_ms / 1000
+        metrics = [
+            ("lamb_password_hash_workers", "gauge", "Hashing pool workers.", stats["workers"]),
+            ("lamb_password_hash_max_pending", "gauge",
+             "Operations admitted (queued or running) before rejecting.", stats["max_pending"]),
+            ("lamb_password_hash_pending", "gauge", "Operations queued or running.", stats["pending"]),
+            ("lamb_password_hash_queue_depth", "gauge",
+             "Operations waiting for a free worker.", stats["queue_depth"]),
+            ("lamb_password_hash_peak_pending", "gauge",
+             "Highest pending count since start.", stats["peak_pending"]),
+            ("lamb_password_hash_credential_flows", "gauge",
+             "Login/signup flows in progress.", stats["credential_flows"]),
+            ("lamb_password_hash_rejected_total", "counter",
+             "Operations rejected with 503 because the pool was full.", stats["rejected"]),
+        ]
+        lines = []
+        for name, kind, help_text, value in metrics:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+        lines += [
+            "# HELP lamb_password_hash_seconds Time from submission to completion of hash/verify operations.",
+            "# TYPE lamb_password_hash_seconds summary",
+            f"lamb_password_hash_seconds_sum {total_seconds:.6f}",
+            f"lamb_password_hash_seconds_count {stats['completed']}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+_hasher: Optional[PasswordHasher] = None
+_hasher_lock = threading.Lock()
+
+
+def _after_fork_in_child() -> None:
+    global _hasher_lock
+    _hasher_lock = threading.Lock()
+    if _hasher is not None:
+        _hasher._forget_executor()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+_unusable_hash: Optional[str] = None
+_unusable_hash_lock = threading.Lock()
+
+
+def unusable_password_hash() -> str:
+    """bcrypt hash of a random secret nobody knows, computed once per process.
+
+    For accounts that never sign in with a password (e.g. LTI students, who
+    use header-trust signin): storing this instead of hashing a fresh random
+    password costs no bcrypt work per account and is equally unguessable.
+    """
+    global _unusable_hash
+    if _unusable_hash is None:
+        with _unusable_hash_lock:
+            if _unusable_hash is None:
+                _unusable_hash = get_password_hasher().hash(secrets.token_urlsafe(32))
+    return _unusable_hash
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide hasher, configured from ``config.py``."""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                import config
+                _hasher = PasswordHasher(
+                    workers=config.PASSWORD_HASH_WORKERS,
+                    max_pending=config.PASSWORD_HASH_MAX_PENDING,
+                    use_processes=config.PASSWORD_HASH_POOL != "thread",
+                    retry_after=config.PASSWORD_HASH_RETRY_AFTER,
+                )
+    return _hasher
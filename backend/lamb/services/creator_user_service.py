@@ -9,6 +9,7 @@ import logging
 from typing import Any, Dict, List, Optional
 from lamb.database_manager import LambDatabaseManager
 from lamb.owi_bridge.owi_users import OwiUserManager
+from lamb.password_hasher import PasswordHashingBusy
 from lamb.logging_config import get_logger
 
 logger = get_logger(__name__, component="SERVICE")
@@ -67,6 +68,8 @@ class CreatorUserService:
             logger.info(f"Created creator user {email} with ID {user_id}")
             return user_id
             
+        except PasswordHashingBusy:
+            raise
         except Exception as e:
             logger.error(f"Error creating creator user {email}: {str(e)}")
             raise ValueError(f"Failed to create user: {str(e)}")
@@ -168,7 +171,7 @@ class CreatorUserService:
                 "auth_provider": user.get("auth_provider", "password")
             }
 
-        except ValueError:
+        except (ValueError, PasswordHashingBusy):
             raise
         except Exception as e:
             logger.error(f"Error verifying creator user {email}: {str(e)}")
@@ -0,0 +1,241 @@
+"""
+Provider Catalog Service
+Background-refreshed cache of per-organization provider status and model catalogs.
+
+This service layer is used by:
+- /creator/admin/org-admin/dashboard and /org-admin/settings/api
+  (via creator_interface/organization_router.py)
+- /lamb/v1/completions/list (via lamb/completions/main.py)
+
+Both endpoints used to query OpenAI/Ollama live on every page load, so their
+latency was that of the slowest provider (up to its timeout). Results are now
+kept per organization and refreshed on an interval by a task started from the
+application ``lifespan``. Each cached entry is tied to a fingerprint of the
+organization config, so changing API keys or model lists is picked up on the
+next request instead of waiting for the refresh loop.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import config as app_config
+from lamb.database_manager import LambDatabaseManager
+from lamb.logging_config import get_logger
+
+logger = get_logger(__name__, component="SERVICE")
+
+
+def _fingerprint(org_config: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of the parts of an org config that affect provider results."""
+    if not org_config:
+        return ""
+    relevant = {
+        "setups": org_config.get("setups", {}),
+    }
+    raw = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ProviderCatalogService:
+    """Service for cached provider status and model catalog lookups"""
+
+    def __init__(self):
+        self.db_manager = LambDatabaseManager()
+        # org_id -> {"result", "fingerprint", "refreshed_at"}
+        self._status_cache: Dict[Any, Dict[str, Any]] = {}
+        # org_id (None for anonymous) -> {"result", "fingerprint", "refreshed_at", "owner"}
+        self._catalog_cache: Dict[Any, Dict[str, Any]] = {}
+        # In-flight refreshes, so a cold cache is filled once per key
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Provider status (org-admin dashboard / API settings)
+    # ------------------------------------------------------------------
+
+    async def get_api_status(self, org_id: int, org_config: Dict[str, Any],
+                             refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the provider status for an organization
+
+        Args:
+            org_id: Organization ID
+            org_config: Organization config dict (used to detect stale entries)
+            refresh: Force a live check instead of using the cache
+
+        Returns:
+            Dict: ``check_organization_api_status`` result plus ``last_refreshed``
+        """
+        fingerprint = _fingerprint(org_config)
+        entry = self._status_cache.get(org_id)
+        if refresh or not entry or entry["fingerprint"] != fingerprint:
+            entry = await self._single_flight(
+                ("status", org_id),
+                lambda: self._refresh_status(org_id, org_config),
+            )
+        return self._with_timestamp(entry)
+
+    async def _refresh_status(self, org_id: int, org_config: Dict[str, Any]) -> Dict[str, Any]:
+        from creator_interface.api_status_checker import check_organization_api_status
+
+        try:
+            result = await check_organization_api_status(org_config)
+        except Exception as e:
+            logger.error(f"Error checking API status for org {org_id}: {e}")
+            result = {
+                "overall_status": "error",
+                "providers": {},
+                "summary": {"configured_count": 0, "working_count": 0, "total_models": 0}
+            }
+        entry = {
+            "result": result,
+            "fingerprint": _fingerprint(org_config),
+            "refreshed_at": time.time(),
+        }
+        self._status_cache[org_id] = entry
+        return entry
+
+    # ------------------------------------------------------------------
+    # Connector model catalogs (/completions/list)
+    # ------------------------------------------------------------------
+
+    async def get_connector_catalog(self, org_id: Optional[int], assistant_owner: Optional[str],
+                                    org_config: Optional[Dict[str, Any]] = None,
+                                    refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get processors, connectors and their models for an organization
+
+        Args:
+            org_id: Organization ID of the caller (None when unauthenticated)
+            assistant_owner: Caller's email, used by connectors to resolve org config
+            org_config: Organization config dict (used to detect stale entries)
+            refresh: Force a live listing instead of using the cache
+
+        Returns:
+            Dict: the ``/completions/list`` payload plus ``last_refreshed``
+        """
+        key = org_id if assistant_owner else None
+        fingerprint = _fingerprint(org_config)
+        entry = self._catalog_cache.get(key)
+        if refresh or not entry or entry["fingerprint"] != fingerprint:
+            entry = await self._single_flight(
+                ("catalog", key),
+                lambda: self._refresh_catalog(key, assistant_owner, fingerprint),
+            )
+        return self._with_timestamp(entry)
+
+    async def _refresh_catalog(self, key: Optional[int], assistant_owner: Optional[str],
+                               fingerprint: str) -> Dict[str, Any]:
+        from lamb.completions.main import build_connector_catalog
+
+        result = await build_connector_catalog(assistant_owner=assistant_owner)
+        entry = {
+            "result": result,
+            "fingerprint": fingerprint,
+            "refreshed_at": time.time(),
+            "owner": assistant_owner,
+        }
+        self._catalog_cache[key] = entry
+        return entry
+
+    # ------------------------------------------------------------------
+    # Background refresh
+    # ------------------------------------------------------------------
+
+    async def refresh_all(self):
+        """Refresh provider status for all active orgs and every cached catalog."""
+        organizations = self.db_manager.list_organizations(status="active")
+        semaphore = asyncio.Semaphore(max(1, app_config.PROVIDER_STATUS_REFRESH_CONCURRENCY))
+
+        async def _bounded(factory: Callable[[], Awaitable[Any]]):
+            async with semaphore:
+                try:
+                    await factory()
+                except Exception as e:
+                    logger.error(f"Provider catalog refresh failed: {e}")
+
+        jobs = []
+        for org in organizations:
+            org_config = org.get("config") or {}
+            if not isinstance(org_config, dict):
+                continue
+            jobs.append(_bounded(
+                lambda org=org, org_config=org_config: self._single_flight(
+                    ("status", org["id"]), lambda: self._refresh_status(org["id"], org_config))
+            ))
+
+        configs_by_id = {org["id"]: org.get("config") or {} for org in organizations}
+        for key, entry in list(self._catalog_cache.items()):
+            fingerprint = _fingerprint(configs_by_id.get(key)) if key is not None else ""
+            jobs.append(_bounded(
+                lambda key=key, entry=entry, fingerprint=fingerprint: self._single_flight(
+                    ("catalog", key),
+                    lambda: self._refresh_catalog(key, entry.get("owner"), fingerprint))
+            ))
+
+        started = time.monotonic()
+        await asyncio.gather(*jobs)
+        logger.info(
+            f"Provider catalog refresh: {len(organizations)} orgs, "
+            f"{len(self._catalog_cache)} catalogs in {time.monotonic() - started:.1f}s"
+        )
+
+    def start_refresh_loop(self):
+        """Start the periodic refresh task (called from the app lifespan)."""
+        if self._refresh_task is not None:
+            logger.warning("Provider catalog refresh loop already running")
+            return
+
+        interval = app_config.PROVIDER_STATUS_REFRESH_INTERVAL
+
+        async def refresh_loop():
+            logger.info(f"Provider catalog refresh loop started (every {interval}s)")
+            while True:
+                try:
+                    await self.refresh_all()
+                    await asyncio.sleep(interval)
+                except asyncio.CancelledError:
+                    logger.info("Provider catalog refresh loop cancelled")
+                    break
+                except Exception as e:
+                    logger.error(f"Error in provider catalog refresh loop: {e}")
+                    await asyncio.sleep(interval)
+
+        self._refresh_task = asyncio.create_task(refresh_loop(), name="provider_catalog_refresh")
+
+    async def stop_refresh_loop(self):
+        """Stop the periodic refresh task."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+            logger.info("Provider catalog refresh loop stopped")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    async def _single_flight(self, key: tuple, factory: Callable[[], Awaitable[Dict[str, Any]]]):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, key=key: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _with_timestamp(entry: Dict[str, Any]) -> Dict[str, Any]:
+        # Callers decorate the result (e.g. enabled_models); keep the cache pristine
+        result = copy.deepcopy(entry["result"])
+        result["last_refreshed"] = entry["refreshed_at"]
+        return result
+
+
+provider_catalog_service = ProviderCatalogService()
@@ -5,7 +5,10 @@ Mounted at /creator/assistant/{assistant_id}/tests/
 
 from __future__ import annotations
 
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from lamb.auth_context import AuthContext, get_auth_context
 from lamb.services.test_service import TestService
@@ -127,7 +130,8 @@ async def run_tests(
 
     Body (optional):
         {"scenario_id": "uuid"}  — run a specific scenario
-        {}                       — run all scenarios
+        {}                       — run all scenarios (concurrently)
+        {"use_cache": true}      — reuse results for unchanged assistant + scenario
     """
     auth.require_assistant_access(assistant_id, level="owner")
     body = await request.json() if request.headers.get("content-type", "").startswith("application/json") else {}
@@ -149,10 +153,57 @@ async def run_tests(
         )
         return result
     else:
-        results = await svc.run_all_scenarios(assistant_id, auth.user["email"], debug_bypass=debug_bypass)
+        results = await svc.run_all_scenarios(
+            assistant_id, auth.user["email"],
+            debug_bypass=debug_bypass, use_cache=body.get("use_cache", False),
+        )
         return {"runs": results, "count": len(results)}
 
 
+@router.post("/assistant/{assistant_id}/tests/run/stream")
+async def run_tests_stream(
+    assistant_id: int,
+    request: Request,
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Run all test scenarios and stream each result as it finishes (SSE).
+
+    Body (optional): {"debug_bypass": bool, "use_cache": bool}
+    Response: text/event-stream with one event per scenario
+    {"index", "scenario_id", "title", "run" | "error"}, then a summary
+    {"done": true, "count", "errors", "cached"} and [DONE].
+    """
+    auth.require_assistant_access(assistant_id, level="owner")
+    body = await request.json() if request.headers.get("content-type", "").startswith("application/json") else {}
+
+    svc = TestService()
+    runs = svc.iter_scenario_runs(
+        assistant_id, auth.user["email"],
+        debug_bypass=body.get("debug_bypass", False), use_cache=body.get("use_cache", False),
+    )
+
+    async def generate():
+        count = errors = cached = 0
+        try:
+            async for index, scenario, result in runs:
+                count += 1
+                event = {"index": index, "scenario_id": scenario["id"], "title": scenario["title"]}
+                if "error" in result:
+                    errors += 1
+                    event["error"] = result["error"]
+                else:
+                    cached += 1 if result.get("cached") else 0
+                    event["run"] = result
+                yield f"data: {json.dumps(event, default=str, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            logger.error(f"Test suite stream failed for assistant {assistant_id}: {e}")
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        yield f"data: {json.dumps({'done': True, 'count': count, 'errors': errors, 'cached': cached})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+
 @router.get("/assistant/{assistant_id}/tests/runs")
 async def list_runs(
     assistant_id: int,
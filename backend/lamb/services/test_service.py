@@ -2,21 +2,94 @@
 
 Provides CRUD for test scenarios, execution through the real completion
 pipeline, and evaluation recording.
+
+A suite run executes its scenarios concurrently. Each organization may have
+at most TEST_RUNNER_ORG_CONCURRENCY scenario completions in flight per
+worker, so one large suite cannot fill the LLM scheduler queue of its
+organization. Results can optionally be reused from a cache keyed by the
+assistant's configuration and the scenario's messages.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
+import config
 from lamb.database_manager import LambDatabaseManager
 from lamb.logging_config import get_logger
 
 logger = get_logger(__name__, component="TEST")
 
+# Per-organization semaphores, recreated when used from a new event loop
+_org_semaphores: dict[Any, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+# (assistant_id, assistant_version, scenario_id, messages digest, debug_bypass)
+# -> (expires_at, run result)
+_response_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+
+
+def _org_semaphore(organization_id: Any) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    entry = _org_semaphores.get(organization_id)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(max(1, config.TEST_RUNNER_ORG_CONCURRENCY)))
+        _org_semaphores[organization_id] = entry
+    return entry[1]
+
+
+def assistant_version(assistant: Any) -> str:
+    """Digest of the assistant settings that shape a completion.
+
+    Any edit to the prompt, template, model/connector metadata or attached
+    knowledge bases yields a new version. Changes to the contents of a
+    knowledge base do not.
+    """
+    settings = {
+        "system_prompt": assistant.system_prompt,
+        "prompt_template": assistant.prompt_template,
+        "metadata": assistant.api_callback,
+        "RAG_Top_k": assistant.RAG_Top_k,
+        "RAG_collections": assistant.RAG_collections,
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _cache_key(assistant_id: int, version: str, scenario: dict, debug_bypass: bool) -> tuple:
+    digest = hashlib.sha256(
+        json.dumps(scenario["messages"], sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+    return (assistant_id, version, scenario["id"], digest, debug_bypass)
+
+
+def _cache_get(key: tuple) -> Optional[dict]:
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        _response_cache.pop(key, None)
+        return None
+    _response_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_put(key: tuple, result: dict) -> None:
+    if config.TEST_RUNNER_CACHE_TTL <= 0:
+        return
+    _response_cache[key] = (time.monotonic() + config.TEST_RUNNER_CACHE_TTL, result)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > config.TEST_RUNNER_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    """Drop all cached scenario results."""
+    _response_cache.clear()
+
 
 class TestService:
     """Manage test scenarios, runs, and evaluations."""
@@ -272,27 +345,77 @@ class TestService:
             "created_at": now,
         }
 
-    async def run_all_scenarios(self, assistant_id: int, user_email: str, debug_bypass: bool = False) -> list[dict]:
-        """Run all scenarios for an assistant."""
-        scenarios = self.list_scenarios(assistant_id)
+    async def run_all_scenarios(
+        self,
+        assistant_id: int,
+        user_email: str,
+        debug_bypass: bool = False,
+        use_cache: bool = False,
+    ) -> list[dict]:
+        """Run all scenarios for an assistant; results are in scenario order."""
         results = []
-        for s in scenarios:
-            try:
-                result = await self.run_scenario(
-                    assistant_id=assistant_id,
-                    scenario_id=s["id"],
-                    messages=s["messages"],
-                    user_email=user_email,
-                    debug_bypass=debug_bypass,
-                )
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "scenario_id": s["id"],
-                    "title": s["title"],
-                    "error": str(e),
-                })
-        return results
+        async for index, _scenario, result in self.iter_scenario_runs(
+            assistant_id, user_email, debug_bypass=debug_bypass, use_cache=use_cache,
+        ):
+            results.append((index, result))
+        return [result for _, result in sorted(results, key=lambda r: r[0])]
+
+    async def iter_scenario_runs(
+        self,
+        assistant_id: int,
+        user_email: str,
+        debug_bypass: bool = False,
+        use_cache: bool = False,
+    ) -> AsyncIterator[tuple[int, dict, dict]]:
+        """Run all scenarios concurrently, yielding each one as it finishes.
+
+        Yields (index, scenario, result) tuples in completion order. Failed
+        scenarios yield {"scenario_id", "title", "error"} instead of a run.
+        With use_cache, a scenario already run against the same assistant
+        version returns that run, marked "cached": True, without a new
+        completion.
+        """
+        from lamb.services.assistant_service import AssistantService
+
+        assistant = AssistantService().get_assistant_by_id(assistant_id)
+        if not assistant:
+            raise ValueError(f"Assistant {assistant_id} not found")
+        scenarios = self.list_scenarios(assistant_id)
+        version = assistant_version(assistant)
+        semaphore = _org_semaphore(assistant.organization_id)
+
+        async def run_one(index: int, scenario: dict) -> tuple[int, dict, dict]:
+            key = _cache_key(assistant_id, version, scenario, debug_bypass)
+            if use_cache:
+                cached = _cache_get(key)
+                if cached is not None:
+                    return index, scenario, {**cached, "cached": True}
+            async with semaphore:
+                try:
+                    result = await self.run_scenario(
+                        assistant_id=assistant_id,
+                        scenario_id=scenario["id"],
+                        messages=scenario["messages"],
+                        user_email=user_email,
+                        debug_bypass=debug_bypass,
+                    )
+                except Exception as e:
+                    return index, scenario, {
+                        "scenario_id": scenario["id"],
+                        "title": scenario["title"],
+                        "error": str(e),
+                    }
+            _cache_put(key, result)
+            return index, scenario, result
+
+        tasks = [asyncio.create_task(run_one(i, s)) for i, s in enumerate(scenarios)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client went away mid-suite: stop scenarios that have not finished
+            for task in tasks:
+                task.cancel()
 
     # ------------------------------------------------------------------
     # Test runs
@@ -33,19 +33,26 @@ import os
 import importlib.util
 import time
 import json
+import hashlib
 import uuid
 import sys
 import subprocess
 import traceback
 import random
+import secrets
 
-from config import API_KEY, PIPELINES_DIR
+from config import API_KEY, PIPELINES_DIR, MODELS_CACHE_TTL, COMPLETION_METRICS_ENABLED, METRICS_TOKEN, BULK_IMPORT_JOB_STALE_SECONDS
 import asyncio
 import re
 from datetime import datetime, timedelta
 from lamb.database_manager import LambDatabaseManager
 from creator_interface.main import router as creator_router, start_news_cache_refresh_loop, stop_news_cache_refresh_loop
-from lamb.logging_config import get_logger
+from lamb.logging_config import get_logger, LazyJSON
+from lamb.completions.stage_metrics import stage_metrics
+from lamb.completions.llm_scheduler import llm_scheduler
+from lamb.services.provider_catalog_service import provider_catalog_service
+from creator_interface.http_client_pool import http_clients
+from lamb.password_hasher import get_password_hasher
 
 # Set up centralized logging
 logger = get_logger(__name__, component="MAIN")
@@ -59,6 +66,20 @@ async def lifespan(app: FastAPI):
     logger.info("Starting LAMB application")
     await start_news_cache_refresh_loop()
     logger.info("News cache refresh loop started")
+    provider_catalog_service.start_refresh_loop()
+    if COMPLETION_METRICS_ENABLED and not METRICS_TOKEN:
+        logger.info("GET /metrics is disabled until METRICS_TOKEN is set")
+
+    # Bulk import jobs run in the worker that accepted them; any still
+    # unfinished and idle were cut off by the previous shutdown
+    try:
+        reaped = await run_in_threadpool(
+            LambDatabaseManager().fail_stale_bulk_import_jobs, BULK_IMPORT_JOB_STALE_SECONDS
+        )
+        if reaped:
+            logger.warning(f"Marked {reaped} interrupted bulk import job(s) as failed")
+    except Exception as e:
+        logger.error(f"Failed to reap interrupted bulk import jobs: {e}")
 
     # --- DB maintenance background tasks (asyncio-based, no external deps) ---
     try:
@@ -192,6 +213,9 @@ async def lifespan(app: FastAPI):
 
     await stop_news_cache_refresh_loop()
     logger.info("News cache refresh loop stopped")
+    await provider_catalog_service.stop_refresh_loop()
+    await http_clients.aclose()
+    get_password_hasher().shutdown()
 
 app = FastAPI(
     title="LAMB",
@@ -303,6 +327,51 @@ def _get_assistant_capabilities(assistant: dict) -> dict:
     return capabilities
 
 
+# Materialized /v1/models body, rebuilt when LambDatabaseManager.assistant_list_version
+# changes (assistant create/update/delete/publish) or after MODELS_CACHE_TTL seconds.
+_models_cache = {"version": None, "built_at": 0.0, "body": None, "etag": None}
+
+
+def _get_models_list() -> tuple:
+    """Return the cached (response_body, etag) for /v1/models, rebuilding if stale."""
+    version = LambDatabaseManager.assistant_list_version
+    now = time.monotonic()
+    if (_models_cache["body"] is not None and _models_cache["version"] == version
+            and now - _models_cache["built_at"] < MODELS_CACHE_TTL):
+        return _models_cache["body"], _models_cache["etag"]
+
+    # Only return published assistants (not deleted, not unpublished)
+    assistants = helper_get_all_assistants(filter_deleted=True, filter_unpublished=True)
+    body = {
+        "object": "list",
+        "data": [
+            {
+                "id": "lamb_assistant."+str(assistant["id"]),
+                "object": "model",
+                "created": int(assistant.get("created_at") or 0),
+                "owned_by": "lamb_v4",
+                "parent": None,
+                "capabilities": _get_assistant_capabilities(assistant)
+            }
+            for assistant in sorted(assistants, key=lambda a: a["id"])
+        ]
+    }
+    digest = hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()
+    etag = f'"{digest[:32]}"'
+    _models_cache.update(version=version, built_at=now, body=body, etag=etag)
+    return body, etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): ignore W/ prefixes
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
 @app.get("/v1/models")
 @app.get("/models")
 async def get_models(request: Request):
@@ -338,27 +407,13 @@ async def get_models(request: Request):
       ]
     }
     ```
+
+    The list is served from a cache invalidated on assistant changes. ``created``
+    is the assistant's creation time, and the response carries an ``ETag`` so
+    pollers can revalidate with ``If-None-Match`` and get ``304 Not Modified``.
     """
-  
-    # Only return published assistants (not deleted, not unpublished)
-    assistants = helper_get_all_assistants(filter_deleted=True, filter_unpublished=True)
-    
-    # Prepare response body
-    response_body = {
-        "object": "list",
-        "data": [
-            {
-                "id": "lamb_assistant."+str(assistant["id"]),
-                "object": "model",
-                "created": int(time.time()),
-                "owned_by": "lamb_v4",
-                "parent": None,
-                "capabilities": _get_assistant_capabilities(assistant)
-            }
-            for assistant in assistants
-        ]
-    }
-    
+    response_body, etag = _get_models_list()
+
     # Generate Request ID and set headers
     request_id = f"req_{uuid.uuid4()}"
     # CORSMiddleware will set the correct Access-Control-Allow-Origin header.
@@ -366,9 +421,14 @@ async def get_models(request: Request):
     # include request-specific IDs here.
     headers = {
         "X-Request-Id": request_id,
-        "OpenAI-Version": "2024-02-01"
+        "OpenAI-Version": "2024-02-01",
+        "ETag": etag,
+        "Cache-Control": "no-cache"
     }
 
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     # Return JSONResponse with body and headers
     return JSONResponse(content=response_body, headers=headers)
 
@@ -401,6 +461,28 @@ async def get_api_status():
     """
     return {"status": True}
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    """
+    Completion pipeline metrics in the Prometheus text format.
+
+    Per-stage latency histograms (``lamb_completion_stage_seconds``),
+    request outcomes (``lamb_completion_requests_total``), the password
+    hashing pool's queue depth and rejections (``lamb_password_hash_*``) and
+    per-organization LLM slots, queue depth and queue wait
+    (``lamb_llm_scheduler_*``) of this worker.
+    Requires ``Authorization: Bearer <METRICS_TOKEN>``; without a configured
+    token the endpoint is not served at all.
+    """
+    if not COMPLETION_METRICS_ENABLED or not METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled")
+    if not secrets.compare_digest(
+            request.headers.get("Authorization", ""), f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    content = (stage_metrics.render() + get_password_hasher().render_metrics()
+               + llm_scheduler.render_metrics())
+    return Response(content=content, media_type="text/plain; version=0.0.4; charset=utf-8")
+
 
 
 
@@ -738,7 +820,7 @@ async def generate_openai_chat_completion(request: Request):
                 'messages': messages,
                 'stream': stream
             }
-            multimodal_logger.debug(f"Final form_data_dict: {json.dumps(form_data_dict, indent=2)}")
+            multimodal_logger.debug("Final form_data_dict: %s", LazyJSON(form_data_dict, indent=2))
             form_data = completions_get_form_data(json.dumps(form_data_dict))
     else:
         # Standard JSON processing
@@ -820,7 +902,7 @@ async def generate_openai_chat_completion(request: Request):
         # Directly call and await run_lamb_assistant
         multimodal_logger.info(f"Calling run_lamb_assistant with assistant_id={assistant_id}")
         request_data = form_data.model_dump()
-        multimodal_logger.debug(f"Request data being sent: {json.dumps(request_data, indent=2)[:1000]}...")
+        multimodal_logger.debug("Request data being sent: %s", LazyJSON(request_data, max_chars=1000, indent=2))
 
         response = await run_lamb_assistant(
             request=request_data,
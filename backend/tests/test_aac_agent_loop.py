@@ -0,0 +1,186 @@
+"""
+Tests for the AAC agent loop: concurrent tool execution within a model turn
+and compaction of old tool results against a scripted fake LLM.
+
+Run with: pytest backend/tests/test_aac_agent_loop.py -v
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from lamb.aac.agent.context import compact_messages, estimate_messages_tokens
+from lamb.aac.agent.loop import AgentLoop
+from lamb.aac.liteshell.shell import ShellResult
+
+_run = asyncio.run
+
+
+def _tool_call(call_id, command):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name="lamb", arguments=json.dumps({"command": command})),
+    )
+
+
+def _reply(content=None, tool_calls=None):
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class ScriptedLLM:
+    """Fake AsyncOpenAI client returning scripted replies in order."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.requests.append(kwargs)
+        return self.replies.pop(0)
+
+
+class FakeShell:
+    """Liteshell stand-in: each command sleeps, then returns a payload."""
+
+    def __init__(self, delay=0.1, payload_size=10):
+        self.delay = delay
+        self.payload_size = payload_size
+        self.history = []
+        self.running = 0
+        self.max_running = 0
+        self.finished = []
+
+    async def execute(self, command):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # Later calls finish first, so completion order differs from call order
+        await asyncio.sleep(self.delay / (len(self.history) + 1))
+        self.running -= 1
+        result = ShellResult(success=True, data={"command": command, "blob": "x" * self.payload_size},
+                             command=command)
+        self.history.append(result)
+        self.finished.append(command)
+        return result
+
+
+def _agent(replies, shell, **kwargs):
+    return AgentLoop(shell=shell, llm_client=ScriptedLLM(replies), model="fake",
+                     system_prompt="system", **kwargs)
+
+
+class TestConcurrentToolCalls:
+
+    def test_reads_from_one_turn_run_concurrently_and_keep_call_order(self):
+        shell = FakeShell(delay=0.2)
+        calls = [_tool_call(f"c{i}", f"lamb assistant get {i}") for i in range(4)]
+        agent = _agent([_reply(tool_calls=calls), _reply("done")], shell, tool_concurrency=4)
+
+        started = time.perf_counter()
+        assert _run(agent.chat("inspect my assistants")) == "done"
+        elapsed = time.perf_counter() - started
+
+        assert shell.max_running == 4
+        assert elapsed < 0.35
+        tool_messages = [m for m in agent.conversation if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["c0", "c1", "c2", "c3"]
+        assert json.loads(tool_messages[2]["content"])["data"]["command"] == "lamb assistant get 2"
+
+    def test_concurrency_limit_is_respected(self):
+        shell = FakeShell(delay=0.05)
+        calls = [_tool_call(f"c{i}", f"lamb kb get {i}") for i in range(6)]
+        agent = _agent([_reply(tool_calls=calls), _reply("done")], shell, tool_concurrency=2)
+
+        _run(agent.chat("check the knowledge bases"))
+        assert shell.max_running == 2
+        assert len(shell.history) == 6
+
+    def test_side_effecting_calls_stay_sequential(self):
+        shell = FakeShell(delay=0.05)
+        calls = [
+            _tool_call("c0", 'lamb test add 1 "t" --message "hi"'),
+            _tool_call("c1", "lamb test run 1"),
+            _tool_call("c2", "lamb test runs 1"),
+        ]
+        agent = _agent([_reply(tool_calls=calls), _reply("done")], shell, tool_concurrency=4)
+
+        _run(agent.chat("add and run a test"))
+        assert shell.max_running == 1
+        assert shell.finished == [json.loads(c.function.arguments)["command"] for c in calls]
+
+    def test_write_is_queued_for_confirmation_alongside_reads(self):
+        shell = FakeShell(delay=0.01)
+        calls = [
+            _tool_call("c0", "lamb assistant get 1"),
+            _tool_call("c1", "lamb assistant get 2"),
+            _tool_call("c2", "lamb assistant delete 1"),
+        ]
+        agent = _agent([_reply(tool_calls=calls), _reply("Approve? (y)es / (n)o")], shell)
+
+        assert _run(agent.chat("delete assistant 1")).startswith("Approve?")
+        assert agent.pending_action["action_key"] == "assistant.delete"
+        assert len(shell.history) == 2
+
+    def test_stream_reports_each_tool_start_and_finish(self):
+        shell = FakeShell(delay=0.05)
+        calls = [_tool_call(f"c{i}", f"lamb rubric get r{i}") for i in range(3)]
+
+        async def final_stream():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="ok"))])
+
+        agent = _agent([_reply(tool_calls=calls), _reply("unused"), final_stream()], shell)
+
+        async def collect():
+            return [event async for event in agent.chat_stream("look at rubrics")]
+
+        events = _run(collect())
+        statuses = [e["status"] for e in events if isinstance(e, dict)]
+        assert statuses.count("tool") == 3
+        assert statuses.count("tool_done") == 3
+        assert events[-1] == "ok"
+        assert shell.max_running == 3
+
+
+class TestContextCompaction:
+
+    def test_small_context_is_sent_unchanged(self):
+        messages = [{"role": "system", "content": "s"}, {"role": "tool", "content": "x" * 100}]
+        assert compact_messages(messages, token_budget=1000) is messages
+
+    def test_oldest_tool_results_are_truncated_first(self):
+        messages = [{"role": "system", "content": "s"}]
+        for i in range(6):
+            messages.append({"role": "tool", "tool_call_id": f"c{i}", "content": f"{i}" * 4000})
+
+        compacted = compact_messages(messages, token_budget=4000,
+                                     keep_recent_tool_results=2, truncated_chars=100)
+
+        assert estimate_messages_tokens(compacted) <= 4000
+        assert len(compacted[1]["content"]) < 400
+        assert compacted[-1]["content"] == messages[-1]["content"]
+        assert compacted[-2]["content"] == messages[-2]["content"]
+        # The caller's messages are not modified
+        assert len(messages[1]["content"]) == 4000
+
+    def test_agent_sends_compacted_context_but_keeps_full_conversation(self, monkeypatch):
+        import config
+
+        monkeypatch.setattr(config, "AAC_COMPACT_KEEP_RECENT_RESULTS", 1)
+        shell = FakeShell(delay=0, payload_size=20000)
+        replies = [_reply(tool_calls=[_tool_call(f"c{i}", f"lamb docs read topic{i}")])
+                   for i in range(5)]
+        llm_replies = replies + [_reply("summary")]
+        agent = _agent(llm_replies, shell, context_token_budget=12000)
+
+        assert _run(agent.chat("read all the docs")) == "summary"
+
+        last_request = agent.llm_client.requests[-1]["messages"]
+        assert estimate_messages_tokens(last_request) <= 12000
+        tool_messages = [m for m in last_request if m["role"] == "tool"]
+        assert "removed to save context" in tool_messages[0]["content"]
+        assert len(tool_messages[-1]["content"]) > 20000
+
+        stored = [m for m in agent.conversation if m["role"] == "tool"]
+        assert all(len(m["content"]) > 20000 for m in stored)
@@ -0,0 +1,168 @@
+"""
+Tests for append-only AAC session storage and the migration of sessions
+stored as a single conversation JSON.
+
+Run with: pytest backend/tests/test_aac_session_storage.py -v
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+import config
+from lamb.database_manager import LambDatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "LAMB_DB_PATH", str(tmp_path))
+    monkeypatch.setattr(LambDatabaseManager, "_system_org_initialized", False)
+    with patch("lamb.database_manager.OwiUserManager"):
+        return LambDatabaseManager()
+
+
+@pytest.fixture
+def sessions(db_manager):
+    from lamb.aac.session_manager import AACSessionManager
+
+    with patch("lamb.aac.session_manager.LambDatabaseManager", return_value=db_manager):
+        return AACSessionManager()
+
+
+def _event_count(db_manager, session_id):
+    conn = db_manager.get_connection()
+    try:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM {db_manager.table_prefix}aac_session_events WHERE session_id = ?",
+            (session_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _turn(i):
+    return [{"role": "user", "content": f"question {i}"},
+            {"role": "assistant", "content": f"answer {i}"}]
+
+
+class TestAppendOnlySessions:
+
+    def test_turns_are_appended_and_rebuilt_in_order(self, sessions, db_manager):
+        session = sessions.create_session("a@example.com", 1, title="t")
+        conversation, audit = [], []
+        for i in range(3):
+            conversation += _turn(i)
+            audit.append({"command": f"lamb assistant get {i}", "success": i != 1})
+            sessions.update_conversation(session["id"], "a@example.com", conversation,
+                                         pending_action={"command": f"c{i}"}, tool_audit=audit)
+
+        assert _event_count(db_manager, session["id"]) == 9
+        stored = sessions.get_session(session["id"], "a@example.com")
+        assert stored["conversation"] == conversation
+        assert stored["tool_audit"] == audit
+        assert stored["pending_action"] == {"command": "c2"}
+
+        [listed] = sessions.list_sessions("a@example.com")
+        assert (listed["turn_count"], listed["tool_calls"], listed["tool_errors"]) == (3, 3, 1)
+
+    def test_saving_a_turn_does_not_rewrite_earlier_events(self, sessions, db_manager):
+        session = sessions.create_session("a@example.com", 1)
+        conversation = _turn(0)
+        sessions.update_conversation(session["id"], "a@example.com", conversation)
+
+        conn = db_manager.get_connection()
+        conn.execute(f"UPDATE {db_manager.table_prefix}aac_session_events SET created_at = 'first' "
+                     "WHERE session_id = ?", (session["id"],))
+        conn.commit()
+        conn.close()
+
+        sessions.update_conversation(session["id"], "a@example.com", conversation + _turn(1))
+        conn = db_manager.get_connection()
+        stamps = [row[0] for row in conn.execute(
+            f"SELECT created_at FROM {db_manager.table_prefix}aac_session_events "
+            "WHERE session_id = ? ORDER BY seq", (session["id"],))]
+        conn.close()
+        assert stamps[:2] == ["first", "first"]
+        assert "first" not in stamps[2:]
+
+    def test_shorter_history_rewrites_the_session(self, sessions, db_manager):
+        session = sessions.create_session("a@example.com", 1)
+        sessions.update_conversation(session["id"], "a@example.com", _turn(0) + _turn(1))
+        sessions.update_conversation(session["id"], "a@example.com", _turn(5))
+
+        assert sessions.get_session(session["id"], "a@example.com")["conversation"] == _turn(5)
+        assert _event_count(db_manager, session["id"]) == 2
+
+    def test_overlapping_saves_from_one_snapshot_keep_both_turns(self, sessions, db_manager):
+        session = sessions.create_session("a@example.com", 1)
+        sessions.update_conversation(session["id"], "a@example.com", _turn(0))
+        start = threading.Barrier(2)
+
+        def save(i):
+            # Both requests read the session before either one saves
+            read = sessions.get_session(session["id"], "a@example.com")
+            start.wait()
+            sessions.update_conversation(
+                session["id"], "a@example.com", read["conversation"] + _turn(i),
+                tool_audit=read["tool_audit"] + [{"command": f"c{i}", "success": True}],
+                base_message_count=read["message_count"], base_audit_count=read["audit_count"])
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(save, (1, 2)))
+
+        stored = sessions.get_session(session["id"], "a@example.com")
+        assert stored["conversation"][:2] == _turn(0)
+        rest = stored["conversation"][2:]
+        assert rest in (_turn(1) + _turn(2), _turn(2) + _turn(1))
+        assert sorted(e["command"] for e in stored["tool_audit"]) == ["c1", "c2"]
+        assert _event_count(db_manager, session["id"]) == 8
+
+        # A stale save after both also appends instead of skipping its turn
+        sessions.update_conversation(session["id"], "a@example.com", _turn(0) + _turn(3),
+                                     base_message_count=2, base_audit_count=0)
+        assert sessions.get_session(session["id"], "a@example.com")["conversation"][-2:] == _turn(3)
+        [listed] = sessions.list_sessions("a@example.com")
+        assert listed["turn_count"] == 4
+
+    def test_other_users_cannot_write_to_a_session(self, sessions, db_manager):
+        session = sessions.create_session("a@example.com", 1)
+        sessions.update_conversation(session["id"], "b@example.com", _turn(0))
+        assert _event_count(db_manager, session["id"]) == 0
+
+
+class TestLegacySessionMigration:
+
+    def test_single_json_sessions_are_moved_to_events(self, db_manager):
+        from lamb.aac.session_manager import AACSessionManager
+
+        table = f"{db_manager.table_prefix}aac_sessions"
+        envelope = {"messages": _turn(0) + _turn(1), "pending_action": None,
+                    "skill_info": {"skill_id": "improve"},
+                    "tool_audit": [{"command": "lamb kb list", "success": False}]}
+        conn = db_manager.get_connection()
+        conn.execute(f"INSERT INTO {table} (id, user_email, organization_id, conversation) VALUES (?, ?, ?, ?)",
+                     ("envelope", "a@example.com", 1, json.dumps(envelope)))
+        conn.execute(f"INSERT INTO {table} (id, user_email, organization_id, conversation) VALUES (?, ?, ?, ?)",
+                     ("plain", "a@example.com", 1, json.dumps(_turn(0))))
+        conn.commit()
+        conn.close()
+
+        db_manager.run_migrations()
+        # Running it again must not duplicate events
+        db_manager.run_migrations()
+
+        with patch("lamb.aac.session_manager.LambDatabaseManager", return_value=db_manager):
+            sessions = AACSessionManager()
+        migrated = sessions.get_session("envelope", "a@example.com")
+        assert migrated["conversation"] == envelope["messages"]
+        assert migrated["tool_audit"] == envelope["tool_audit"]
+        assert migrated["skill_info"] == {"skill_id": "improve"}
+        assert sessions.get_session("plain", "a@example.com")["conversation"] == _turn(0)
+        assert _event_count(db_manager, "envelope") == 5
+
+        listed = {s["id"]: s for s in sessions.list_sessions("a@example.com")}
+        assert listed["envelope"]["turn_count"] == 2
+        assert listed["envelope"]["tool_errors"] == 1
+        assert listed["envelope"]["skill_id"] == "improve"
@@ -0,0 +1,153 @@
+"""
+Tests for batched bulk user import and background job progress.
+
+Run with: pytest backend/tests/test_bulk_import.py -v
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+import config
+from lamb.database_manager import LambDatabaseManager
+from lamb.password_hasher import PasswordHasher, pwd_context
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "LAMB_DB_PATH", str(tmp_path))
+    # Seed the system organization in this fresh database
+    monkeypatch.setattr(LambDatabaseManager, "_system_org_initialized", False)
+    with patch("lamb.database_manager.OwiUserManager"):
+        return LambDatabaseManager()
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=2, max_pending=8, use_processes=False)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def owi_manager():
+    with patch("creator_interface.bulk_operations.OwiUserManager") as owi_cls:
+        yield owi_cls.return_value
+
+
+def _creator(db_manager, hasher, org_id, batch_size=2):
+    from creator_interface.bulk_operations import BulkUserCreator
+
+    with patch("creator_interface.bulk_operations.LambDatabaseManager", return_value=db_manager), \
+            patch("creator_interface.bulk_operations.get_password_hasher", return_value=hasher):
+        return BulkUserCreator(organization_id=org_id, admin_user_id=1,
+                               admin_email="admin@example.com", batch_size=batch_size)
+
+
+def _users(count):
+    return [{"email": f"student{i}@example.com", "name": f"Student {i}",
+             "user_type": "end_user", "enabled": i % 2 == 0} for i in range(count)]
+
+
+class TestBulkUserCreator:
+
+    def test_batches_keep_row_order_and_semantics(self, db_manager, hasher, owi_manager):
+        org_id = db_manager.get_organization_by_slug("lamb")["id"]
+        users = _users(5)
+        creator = _creator(db_manager, hasher, org_id)
+        _run(creator.create_users(users[:1]))  # student0 now exists
+
+        batches = []
+        result = _run(creator.create_users(users, on_batch=batches.append))
+
+        assert result["summary"] == {"total": 5, "created": 4, "failed": 0, "skipped": 1}
+        assert [r["email"] for r in result["results"]] == [u["email"] for u in users]
+        assert result["results"][0]["status"] == "skipped"
+        assert result["results"][1]["message"] == "User created successfully (disabled)"
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+        stored = db_manager.get_creator_user_by_email("student1@example.com")
+        assert stored["user_type"] == "end_user"
+        assert not stored["enabled"]
+        assert db_manager.get_creator_user_by_email("student2@example.com")["enabled"]
+
+        # The OWI mirror reuses the LAMB hashes, one call per batch
+        owi_rows = [row for call in owi_manager.create_users_batch.call_args_list for row in call.args[0]]
+        assert len(owi_rows) == 5
+        assert all(pwd_context.identify(row["password_hash"]) == "bcrypt" for row in owi_rows)
+
+    def test_constraint_violation_fails_only_that_row(self, db_manager, hasher, owi_manager):
+        org_id = db_manager.get_organization_by_slug("lamb")["id"]
+        rows = [{"email": "dup@example.com", "name": "A", "password_hash": "x", "enabled": True},
+                {"email": "dup@example.com", "name": "B", "password_hash": "x", "enabled": True},
+                {"email": "other@example.com", "name": "C", "password_hash": "x", "enabled": True}]
+
+        outcomes = db_manager.create_creator_users_batch(org_id, rows)
+
+        assert outcomes[0]["user_id"] and outcomes[2]["user_id"]
+        assert outcomes[1] == {"user_id": None, "error": "User already exists"}
+
+
+class TestBulkImportJob:
+
+    def test_job_progress_is_incremental(self, db_manager, hasher, owi_manager):
+        from creator_interface import bulk_operations
+
+        org_id = db_manager.get_organization_by_slug("lamb")["id"]
+        assert db_manager.create_bulk_import_job("job-1", org_id, 1, "admin@example.com", 5)
+
+        creator = _creator(db_manager, hasher, org_id)
+        with patch.object(bulk_operations, "LambDatabaseManager", return_value=db_manager), \
+                patch.object(bulk_operations, "BulkUserCreator", return_value=creator):
+            _run(bulk_operations.run_bulk_import_job(
+                "job-1", org_id, 1, "admin@example.com", _users(5)))
+
+        job = db_manager.get_bulk_import_job("job-1", org_id)
+        assert job["status"] == "completed"
+        assert job["summary"] == {"total": 5, "processed": 5, "created": 5, "failed": 0, "skipped": 0}
+        assert job["log_id"] is not None
+        assert len(job["results"]) == 5
+
+        tail = db_manager.get_bulk_import_job("job-1", org_id, offset=3)
+        assert [r["email"] for r in tail["results"]] == ["student3@example.com", "student4@example.com"]
+        assert tail["next_offset"] == 5
+
+        # Jobs are scoped to their organization
+        assert db_manager.get_bulk_import_job("job-1", org_id + 1) is None
+
+    def test_interrupted_jobs_are_marked_failed(self, db_manager):
+        org_id = db_manager.get_organization_by_slug("lamb")["id"]
+        assert db_manager.create_bulk_import_job("stale", org_id, 1, "admin@example.com", 2000)
+        assert db_manager.create_bulk_import_job("live", org_id, 1, "admin@example.com", 2000)
+        assert db_manager.append_bulk_import_job_results("live", [
+            {"email": "a@example.com", "name": "A", "status": "success", "user_id": 1, "message": ""}])
+
+        connection = db_manager.get_connection()
+        with connection:
+            connection.execute(
+                f"UPDATE {db_manager.table_prefix}bulk_import_jobs SET updated_at = updated_at - 3600 "
+                f"WHERE id = 'stale'")
+        connection.close()
+
+        assert db_manager.fail_stale_bulk_import_jobs(600, job_id="live") == 0
+        assert db_manager.fail_stale_bulk_import_jobs(600) == 1
+        stale = db_manager.get_bulk_import_job("stale", org_id)
+        assert stale["status"] == "failed"
+        assert "Interrupted" in stale["error"]
+        assert db_manager.get_bulk_import_job("live", org_id)["status"] == "running"
+
+    def test_validation_accepts_files_up_to_the_job_limit(self, db_manager, monkeypatch):
+        from creator_interface.bulk_operations import BulkImportValidator
+
+        monkeypatch.setattr(config, "BULK_IMPORT_JOB_MAX_USERS", 2000)
+        data = {"version": "1.0", "users": _users(600)}
+        with patch("creator_interface.bulk_operations.LambDatabaseManager", return_value=db_manager):
+            assert BulkImportValidator(1).validate_import_data(data)["error"].startswith("Too many users")
+            result = BulkImportValidator(1, max_users=config.BULK_IMPORT_JOB_MAX_USERS).validate_import_data(data)
+        assert result.get("error") is None
+        assert result["summary"]["total"] == 600
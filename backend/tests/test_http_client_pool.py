@@ -0,0 +1,79 @@
+"""
+Tests for creator_interface.http_client_pool — shared keep-alive clients.
+
+Run with: pytest backend/tests/test_http_client_pool.py -v
+"""
+
+import asyncio
+
+from creator_interface.http_client_pool import HTTPClientPool
+
+
+async def _start_counting_server():
+    """Minimal HTTP/1.1 keep-alive server that counts accepted TCP connections."""
+    stats = {"connections": 0, "requests": 0}
+
+    async def handle(reader, writer):
+        stats["connections"] += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                stats["requests"] += 1
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                             b"Content-Type: text/plain\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", stats
+
+
+class TestHTTPClientPool:
+
+    def test_load_reuses_connections(self):
+        async def scenario():
+            server, url, stats = await _start_counting_server()
+            pool = HTTPClientPool(max_connections=10, max_keepalive_connections=10,
+                                  keepalive_expiry=30, http2=False)
+
+            async def call():
+                async with pool.session("kb_server") as client:
+                    response = await client.get(f"{url}/health")
+                    assert response.text == "ok"
+
+            # 200 requests in waves of 20 concurrent calls
+            for _ in range(10):
+                await asyncio.gather(*(call() for _ in range(20)))
+
+            assert stats["requests"] == 200
+            assert stats["connections"] <= 10
+            assert pool.stats()["kb_server"]["connections"] <= 10
+
+            await pool.aclose()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(scenario())
+
+    def test_session_does_not_close_shared_client(self):
+        async def scenario():
+            pool = HTTPClientPool(http2=False)
+            async with pool.session("library_manager") as first:
+                pass
+            assert not first.is_closed
+            assert pool.get("library_manager") is first
+            assert pool.get("kb_server") is not first
+
+            await pool.aclose()
+            assert first.is_closed
+            # A closed client is replaced on next use
+            assert pool.get("library_manager") is not first
+            await pool.aclose()
+
+        asyncio.run(scenario())
@@ -0,0 +1,84 @@
+"""
+Tests for KBServerManager._fetch_kb_details — batch lookup with fan-out fallback.
+
+Run with: pytest backend/tests/test_kb_detail_fetch.py -v
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from creator_interface import kb_server_manager as kbm
+from creator_interface.http_client_pool import http_clients
+
+
+def _install_transport(handler):
+    http_clients._clients["kb_server"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _fetch(kb_ids, url):
+    async def scenario():
+        try:
+            return await kbm.KBServerManager()._fetch_kb_details(url, "token", kb_ids)
+        finally:
+            await http_clients.aclose()
+    return asyncio.run(scenario())
+
+
+class TestFetchKBDetails:
+
+    def test_uses_batch_endpoint(self):
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            ids = json.loads(request.content)["ids"]
+            items = [{"id": i, "name": f"kb{i}"} for i in ids if i != 3]
+            return httpx.Response(200, json={"items": items, "missing": [3]})
+
+        _install_transport(handler)
+        details = _fetch(["1", "2", "3"], "http://kb-batch")
+
+        assert calls == [("POST", "/collections/batch")]
+        assert details["1"]["name"] == "kb1"
+        assert details["3"] is None  # stale entry
+
+    def test_falls_back_to_concurrent_gets(self):
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            if request.url.path == "/collections/batch":
+                return httpx.Response(405)
+            kb_id = request.url.path.rsplit("/", 1)[-1]
+            if kb_id == "gone":
+                return httpx.Response(404)
+            if kb_id == "broken":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"id": kb_id, "name": kb_id})
+
+        _install_transport(handler)
+        details = _fetch(["a", "gone", "broken", "a"], "http://kb-legacy")
+
+        # Non-numeric IDs skip the batch call entirely; duplicates fetched once
+        assert ("POST", "/collections/batch") not in calls
+        assert sorted(path for _, path in calls) == [
+            "/collections/a", "/collections/broken", "/collections/gone"]
+        assert details == {"a": {"id": "a", "name": "a"}, "gone": None}
+
+    def test_remembers_servers_without_batch_endpoint(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path == "/collections/batch":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"id": 1})
+
+        _install_transport(handler)
+        _fetch(["1"], "http://kb-old")
+        _install_transport(handler)
+        _fetch(["1"], "http://kb-old")
+
+        assert calls.count("/collections/batch") == 1
@@ -0,0 +1,83 @@
+"""
+Tests for KBServerManager.upload_files_to_kb — streamed, concurrent uploads.
+
+Run with: pytest backend/tests/test_kb_upload_streaming.py -v
+"""
+
+import asyncio
+import tempfile
+
+import httpx
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from creator_interface import kb_server_manager as kbm
+from creator_interface.http_client_pool import http_clients
+
+USER = {"id": 7, "email": "t@example.com", "organization_id": 1}
+
+
+def _upload(name, payload):
+    spooled = tempfile.SpooledTemporaryFile(max_size=16)
+    spooled.write(payload)
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename=name, size=len(payload))
+
+
+def _manager(monkeypatch, handler, concurrency=2):
+    monkeypatch.setattr(kbm.app_config, "KB_UPLOAD_CONCURRENCY", concurrency)
+    http_clients._clients["kb_server"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    manager = kbm.KBServerManager()
+    monkeypatch.setattr(manager, "_get_kb_config_for_user",
+                        lambda user: {"url": "http://kb", "token": "t"})
+    return manager
+
+
+def _run(coro):
+    async def scenario():
+        try:
+            return await coro
+        finally:
+            await http_clients.aclose()
+    return asyncio.run(scenario())
+
+
+class TestUploadFilesToKB:
+
+    def test_streams_files_concurrently_with_bound(self, monkeypatch):
+        state = {"in_flight": 0, "peak": 0, "bodies": []}
+
+        async def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json={"id": 1, "name": "kb", "owner": "7"})
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            body = b"".join([chunk async for chunk in request.stream])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            state["bodies"].append(body)
+            return httpx.Response(201, json={"id": len(state["bodies"])})
+
+        manager = _manager(monkeypatch, handler, concurrency=2)
+        files = [_upload(f"f{i}.txt", f"payload-{i}".encode() * 10) for i in range(5)]
+        result = _run(manager.upload_files_to_kb("1", files, USER))
+
+        assert [f["filename"] for f in result["uploaded_files"]] == [f"f{i}.txt" for i in range(5)]
+        assert result["uploaded_files"][0]["size"] == len(b"payload-0") * 10
+        assert state["peak"] == 2
+        assert any(b"payload-3" * 10 in body for body in state["bodies"])
+
+    def test_failed_file_raises_kb_error(self, monkeypatch):
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json={"id": 1, "name": "kb", "owner": "7"})
+            if b"bad.txt" in request.read():
+                return httpx.Response(400, json={"detail": "unsupported"})
+            return httpx.Response(201, json={"id": 1})
+
+        manager = _manager(monkeypatch, handler)
+        files = [_upload("ok.txt", b"fine"), _upload("bad.txt", b"nope")]
+        with pytest.raises(HTTPException) as exc:
+            _run(manager.upload_files_to_kb("1", files, USER))
+        assert exc.value.status_code == 400
+        assert "unsupported" in exc.value.detail
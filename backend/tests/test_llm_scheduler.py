@@ -0,0 +1,222 @@
+"""
+Tests for lamb.completions.llm_scheduler — per-org fair-share admission control.
+
+Run with: pytest backend/tests/test_llm_scheduler.py -v
+"""
+
+import asyncio
+import gc
+from unittest.mock import patch
+
+import pytest
+
+import config
+from lamb.completions import llm_scheduler
+from lamb.completions.llm_scheduler import (
+    LLMScheduler,
+    LLMSchedulerRejected,
+    SchedulerLimits,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAdmission:
+
+    def test_admits_immediately_when_capacity_free(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=4)
+            ticket = await scheduler.acquire("1", "openai", "u", SchedulerLimits(max_concurrent=2))
+            assert ticket.queue_wait == 0.0
+            assert scheduler.snapshot()["organizations"]["1"]["active"] == 1
+            ticket.release()
+            ticket.release()  # idempotent
+            assert scheduler.snapshot()["organizations"]["1"]["active"] == 0
+
+        _run(scenario())
+
+    def test_queue_full_rejects_with_retry_after(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=10)
+            limits = SchedulerLimits(max_concurrent=1, max_queue=1, max_queue_wait=5)
+            held = await scheduler.acquire("1", "openai", "u", limits)
+            queued = asyncio.create_task(scheduler.acquire("1", "openai", "u", limits))
+            await asyncio.sleep(0)
+
+            with pytest.raises(LLMSchedulerRejected) as exc:
+                await scheduler.acquire("1", "openai", "u", limits)
+            assert exc.value.reason == "org_queue_full"
+            assert exc.value.retry_after >= 1
+
+            held.release()
+            (await queued).release()
+
+        _run(scenario())
+
+    def test_queue_depth_and_wait_are_exported_as_metrics(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=10)
+            limits = SchedulerLimits(max_concurrent=1, max_queue=5, max_queue_wait=5)
+            held = await scheduler.acquire("1", "openai", "u", limits)
+            queued = asyncio.create_task(scheduler.acquire("1", "openai", "u", limits))
+            await asyncio.sleep(0.02)
+
+            text = scheduler.render_metrics()
+            assert 'lamb_llm_scheduler_active{org="1"} 1' in text
+            assert 'lamb_llm_scheduler_queued{org="1"} 1' in text
+
+            held.release()
+            (await queued).release()
+            text = scheduler.render_metrics()
+            assert 'lamb_llm_scheduler_queue_wait_seconds_count{org="1"} 2' in text
+            assert 'lamb_llm_scheduler_rejected_total{org="1",reason="queue_full"} 0' in text
+            wait = float(text.split('lamb_llm_scheduler_queue_wait_seconds_sum{org="1"} ')[1].split()[0])
+            assert wait >= 0.02
+            assert "# TYPE lamb_llm_scheduler_queue_wait_seconds summary" in text
+
+        _run(scenario())
+
+    def test_queue_wait_timeout(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=10)
+            limits = SchedulerLimits(max_concurrent=1, max_queue=5, max_queue_wait=0.05)
+            held = await scheduler.acquire("1", "openai", "u", limits)
+            with pytest.raises(LLMSchedulerRejected) as exc:
+                await scheduler.acquire("1", "openai", "u", limits)
+            assert exc.value.reason == "org_queue_timeout"
+            assert scheduler.snapshot()["organizations"]["1"]["queued"] == 0
+            held.release()
+
+        _run(scenario())
+
+    def test_token_budget_exhausted(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=10)
+            limits = SchedulerLimits(tokens_per_minute=600)
+            ticket = await scheduler.acquire("1", "openai", "u", limits, estimated_tokens=100)
+            ticket.release(tokens_used=1000)
+            with pytest.raises(LLMSchedulerRejected) as exc:
+                await scheduler.acquire("1", "openai", "u", limits)
+            assert exc.value.reason == "org_token_budget_exceeded"
+            # 400-token deficit refilled at 10 tokens/s
+            assert exc.value.retry_after >= 40
+
+        _run(scenario())
+
+
+class TestFairness:
+
+    def test_busy_org_does_not_starve_other_org(self):
+        """With the endpoint saturated, slots alternate between orgs instead of FIFO."""
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=1)
+            limits = SchedulerLimits(max_concurrent=0, max_queue=0, max_queue_wait=5)
+            order = []
+
+            async def call(org):
+                ticket = await scheduler.acquire(org, "openai", "u", limits)
+                order.append(org)
+                await asyncio.sleep(0)
+                ticket.release()
+
+            first = await scheduler.acquire("bulk", "openai", "u", limits)
+            tasks = [asyncio.create_task(call("bulk")) for _ in range(4)]
+            await asyncio.sleep(0)
+            tasks += [asyncio.create_task(call("small")) for _ in range(2)]
+            await asyncio.sleep(0)
+            first.release()
+            await asyncio.gather(*tasks)
+
+            assert order.index("small") <= 1
+            assert sorted(order) == ["bulk"] * 4 + ["small"] * 2
+
+        _run(scenario())
+
+    def test_weight_gives_larger_share(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=1)
+            order = []
+
+            async def call(org, weight):
+                ticket = await scheduler.acquire(
+                    org, "openai", "u", SchedulerLimits(weight=weight, max_queue_wait=5))
+                order.append(org)
+                await asyncio.sleep(0)
+                ticket.release()
+
+            first = await scheduler.acquire("a", "openai", "u", SchedulerLimits())
+            tasks = [asyncio.create_task(call("a", 1)) for _ in range(6)]
+            tasks += [asyncio.create_task(call("b", 2)) for _ in range(6)]
+            await asyncio.sleep(0)
+            first.release()
+            await asyncio.gather(*tasks)
+
+            assert order[:6].count("b") >= 4
+
+        _run(scenario())
+
+    def test_streaming_result_holds_slot_until_consumed(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=1)
+            ticket = await scheduler.acquire("1", "openai", "u", SchedulerLimits())
+
+            async def gen():
+                yield "data: a\n\n"
+                yield "data: [DONE]\n\n"
+
+            stream, usage = ticket.attach((gen(), {"total_tokens": 5}))
+            assert scheduler.snapshot()["organizations"]["1"]["active"] == 1
+            chunks = [chunk async for chunk in stream]
+            assert chunks[-1] == "data: [DONE]\n\n"
+            assert usage == {"total_tokens": 5}
+            assert scheduler.snapshot()["organizations"]["1"]["active"] == 0
+
+        _run(scenario())
+
+    def test_unconsumed_stream_releases_its_slot(self):
+        async def scenario():
+            scheduler = LLMScheduler(provider_max_concurrent=1)
+
+            async def gen():
+                yield "data: [DONE]\n\n"
+
+            # Closed without being iterated (response never started)
+            ticket = await scheduler.acquire("1", "openai", "u", SchedulerLimits())
+            stream = ticket.attach(gen())
+            await stream.aclose()
+            assert scheduler.snapshot()["organizations"]["1"]["active"] == 0
+
+            # Dropped without being iterated or closed (client disconnected)
+            ticket = await scheduler.acquire("1", "openai", "u", SchedulerLimits())
+            stream, _ = ticket.attach((gen(), {}))
+            del stream
+            gc.collect()
+            await asyncio.sleep(0)
+            assert scheduler.snapshot()["organizations"]["1"]["active"] == 0
+
+            # The freed slot admits the next request at once
+            await asyncio.wait_for(
+                scheduler.acquire("1", "openai", "u", SchedulerLimits()), timeout=1)
+
+        _run(scenario())
+
+
+class TestOrgLimits:
+
+    def test_resolved_limits_are_cached(self, monkeypatch):
+        monkeypatch.setattr(config, "LLM_SCHEDULER_CONFIG_CACHE_TTL", 30)
+        monkeypatch.setattr(llm_scheduler, "_limits_cache", {})
+        with patch("lamb.completions.org_config_resolver.OrganizationConfigResolver") as resolver_cls:
+            resolver = resolver_cls.return_value
+            resolver.organization = {"id": 7}
+            resolver.get_provider_config.return_value = {"base_url": "https://api.example.com"}
+            resolver.get_scheduler_config.return_value = {"max_concurrent": 3}
+
+            first = llm_scheduler._resolve_org_limits("owner@example.com", "openai")
+            second = llm_scheduler._resolve_org_limits("owner@example.com", "openai")
+
+        assert resolver_cls.call_count == 1
+        assert first == second
+        assert first[0] == "7" and first[2].max_concurrent == 3
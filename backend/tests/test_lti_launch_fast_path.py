@@ -0,0 +1,119 @@
+"""
+Tests for the LTI launch fast path: coalesced OWI group writes and cached
+activity resolution.
+
+Run with: pytest backend/tests/test_lti_launch_fast_path.py -v
+"""
+
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from lamb.owi_bridge.owi_group_batcher import GroupMembershipBatcher
+
+
+@pytest.fixture
+def owi_groups(tmp_path, monkeypatch):
+    monkeypatch.setenv("OWI_PATH", str(tmp_path))
+    conn = sqlite3.connect(tmp_path / "webui.db")
+    conn.execute('CREATE TABLE "group" (id TEXT PRIMARY KEY, user_ids TEXT, updated_at INTEGER)')
+    conn.execute('INSERT INTO "group" VALUES (?, ?, ?)', ("g1", json.dumps(["owner"]), 0))
+    conn.commit()
+    conn.close()
+
+    from lamb.owi_bridge.owi_group import OwiGroupManager
+    return OwiGroupManager
+
+
+def _members(tmp_path):
+    conn = sqlite3.connect(tmp_path / "webui.db")
+    row = conn.execute('SELECT user_ids FROM "group" WHERE id = ?', ("g1",)).fetchone()
+    conn.close()
+    return json.loads(row[0])
+
+
+class TestGroupMembershipBatcher:
+
+    def test_concurrent_additions_are_coalesced_without_lost_updates(self, owi_groups, tmp_path):
+        batcher = GroupMembershipBatcher(owi_groups, window=0.05)
+        start = threading.Barrier(40)
+
+        def launch(i):
+            start.wait()
+            return batcher.add("g1", f"student{i}")
+
+        with ThreadPoolExecutor(max_workers=40) as pool:
+            assert all(pool.map(launch, range(40)))
+
+        members = _members(tmp_path)
+        assert members[0] == "owner"
+        assert sorted(members[1:]) == sorted(f"student{i}" for i in range(40))
+        stats = batcher.stats()
+        assert stats["requests"] == 40
+        assert stats["writes"] < 10
+
+    def test_returning_members_skip_the_write(self, owi_groups):
+        batcher = GroupMembershipBatcher(owi_groups, window=0)
+        assert batcher.add("g1", "student")
+        writes = batcher.stats()["writes"]
+
+        assert batcher.is_member("g1", "owner")
+        assert batcher.add("g1", "student")
+        assert batcher.stats()["writes"] == writes
+
+    def test_removed_member_is_added_back_on_next_launch(self, owi_groups, tmp_path):
+        batcher = GroupMembershipBatcher(owi_groups, window=0)
+        assert batcher.add("g1", "student")
+        # Removed outside this batcher, e.g. by another worker
+        conn = sqlite3.connect(tmp_path / "webui.db")
+        conn.execute('UPDATE "group" SET user_ids = ? WHERE id = ?', (json.dumps(["owner"]), "g1"))
+        conn.commit()
+        conn.close()
+
+        assert not batcher.is_member("g1", "student")
+        assert batcher.add("g1", "student")
+        assert "student" in _members(tmp_path)
+
+    def test_unknown_group_reports_failure(self, owi_groups):
+        batcher = GroupMembershipBatcher(owi_groups, window=0)
+        assert batcher.add("missing", "student") is False
+
+
+class TestActivityResolution:
+
+    def _manager(self):
+        from lamb import lti_activity_manager
+
+        lti_activity_manager.invalidate_activity_cache()
+        manager = lti_activity_manager.LtiActivityManager.__new__(
+            lti_activity_manager.LtiActivityManager)
+        manager.db_manager = MagicMock()
+        return manager
+
+    def test_active_activity_is_cached_until_invalidated(self):
+        from lamb.lti_activity_manager import invalidate_activity_cache
+
+        manager = self._manager()
+        manager.db_manager.get_lti_activity_by_resource_link.return_value = {
+            "id": 1, "resource_link_id": "rl", "status": "active"}
+
+        assert manager.resolve_activity("rl")["id"] == 1
+        assert manager.resolve_activity("rl")["id"] == 1
+        assert manager.db_manager.get_lti_activity_by_resource_link.call_count == 1
+
+        invalidate_activity_cache("rl")
+        manager.resolve_activity("rl")
+        assert manager.db_manager.get_lti_activity_by_resource_link.call_count == 2
+
+    def test_inactive_and_missing_activities_are_not_cached(self):
+        manager = self._manager()
+        lookup = manager.db_manager.get_lti_activity_by_resource_link
+        lookup.return_value = {"id": 1, "resource_link_id": "rl", "status": "disabled"}
+        manager.resolve_activity("rl")
+        lookup.return_value = None
+        assert manager.resolve_activity("rl") is None
+        assert lookup.call_count == 2
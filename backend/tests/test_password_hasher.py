@@ -0,0 +1,167 @@
+"""
+Tests for lamb.password_hasher — bounded bcrypt pool with admission control.
+
+Run with: pytest backend/tests/test_password_hasher.py -v
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from lamb.password_hasher import PasswordHasher, PasswordHashingBusy, pwd_context
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestHashing:
+
+    def test_thread_pool_round_trip(self):
+        hasher = PasswordHasher(workers=2, max_pending=4, use_processes=False)
+        try:
+            hashed = hasher.hash("s3cret")
+            assert hashed.startswith("$2b$12$")
+            assert hasher.verify("s3cret", hashed)
+            assert not hasher.verify("wrong", hashed)
+            assert hasher.stats()["completed"] == 3
+            assert hasher.stats()["pending"] == 0
+        finally:
+            hasher.shutdown()
+
+    def test_process_pool_hashes_are_interchangeable(self):
+        hasher = PasswordHasher(workers=1, max_pending=2, use_processes=True)
+        try:
+            hashed = _run(hasher.hash_async("s3cret"))
+            # Hashes from the pool verify with the shared context (OWI mirror)
+            assert pwd_context.verify("s3cret", hashed)
+            assert _run(hasher.verify_async("s3cret", hashed))
+        finally:
+            hasher.shutdown()
+
+
+class TestAdmission:
+
+    def test_rejects_beyond_max_pending(self):
+        hasher = PasswordHasher(workers=1, max_pending=2, use_processes=False, retry_after=3)
+        release = threading.Event()
+        try:
+            held = [hasher.submit(release.wait), hasher.submit(release.wait)]
+            stats = hasher.stats()
+            assert stats["pending"] == 2
+            assert stats["queue_depth"] == 1
+
+            with pytest.raises(PasswordHashingBusy) as exc_info:
+                hasher.submit(release.wait)
+            assert exc_info.value.retry_after == 3
+            assert hasher.stats()["rejected"] == 1
+
+            text = hasher.render_metrics()
+            assert "lamb_password_hash_queue_depth 1" in text
+            assert "lamb_password_hash_pending 2" in text
+            assert "lamb_password_hash_rejected_total 1" in text
+            assert "# TYPE lamb_password_hash_rejected_total counter" in text
+        finally:
+            release.set()
+            for future in held:
+                future.result()
+            hasher.shutdown()
+        assert hasher.stats()["pending"] == 0
+
+    def test_credential_flows_keep_event_loop_responsive(self):
+        hasher = PasswordHasher(workers=2, max_pending=50, use_processes=False)
+
+        def slow_login():
+            time.sleep(0.05)
+            return True
+
+        async def scenario():
+            lag = 0.0
+            done = asyncio.Event()
+
+            async def ticker():
+                nonlocal lag
+                while not done.is_set():
+                    started = time.monotonic()
+                    await asyncio.sleep(0.005)
+                    lag = max(lag, time.monotonic() - started - 0.005)
+
+            tick = asyncio.create_task(ticker())
+            results = await asyncio.gather(*(hasher.run_sync(slow_login) for _ in range(20)))
+            done.set()
+            await tick
+            return results, lag
+
+        try:
+            results, lag = _run(scenario())
+            assert all(results)
+            assert lag < 0.04
+            assert hasher.stats()["credential_flows"] == 0
+        finally:
+            hasher.shutdown()
+
+    def test_credential_flows_beyond_max_pending_are_rejected(self):
+        hasher = PasswordHasher(workers=1, max_pending=2, use_processes=False)
+        release = threading.Event()
+
+        async def scenario():
+            flows = [asyncio.create_task(hasher.run_sync(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            with pytest.raises(PasswordHashingBusy):
+                await hasher.run_sync(release.wait)
+            release.set()
+            await asyncio.gather(*flows)
+
+        try:
+            _run(scenario())
+        finally:
+            release.set()
+            hasher.shutdown()
+
+
+class _JsonRequest:
+    def __init__(self, data):
+        self._data = data
+
+    async def json(self):
+        return self._data
+
+
+class TestOwiRouterPasswords:
+
+    def test_create_user_hashes_on_the_pool(self):
+        from lamb.owi_bridge import owi_router
+
+        hasher = PasswordHasher(workers=1, max_pending=2, use_processes=False)
+        manager = MagicMock()
+        manager.create_user.return_value = {"id": "u1", "email": "a@example.com"}
+        try:
+            with patch("lamb.auth.get_password_hasher", return_value=hasher), \
+                    patch.object(owi_router, "user_manager", manager):
+                response = _run(owi_router.create_user(_JsonRequest(
+                    {"name": "A", "email": "a@example.com", "password": "s3cret"})))
+        finally:
+            hasher.shutdown()
+
+        assert json.loads(response.body)["data"]["id"] == "u1"
+        password_hash = manager.create_user.call_args.kwargs["password_hash"]
+        assert pwd_context.verify("s3cret", password_hash)
+
+    def test_saturated_pool_answers_503(self):
+        from lamb.owi_bridge import owi_router
+
+        hasher = MagicMock()
+        hasher.run_sync.side_effect = PasswordHashingBusy(retry_after=4)
+        with patch.object(owi_router, "get_password_hasher", return_value=hasher), \
+                patch.object(owi_router, "user_manager", MagicMock()), \
+                patch.object(owi_router, "db_manager", MagicMock()):
+            with pytest.raises(HTTPException) as exc_info:
+                _run(owi_router.verify_user(_JsonRequest({"email": "a@example.com", "password": "x"})))
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "4"}
@@ -0,0 +1,209 @@
+"""
+Tests for streamed Library Manager pass-through (permalinks, ZIP export and
+import, item status events) and the cached permalink ACL.
+
+Run with: pytest backend/tests/test_permalink_proxy.py -v
+"""
+
+import asyncio
+import tempfile
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from creator_interface import library_router
+from creator_interface.http_client_pool import http_clients
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Unread upstream body, as a real transport would return it."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class _FakeAuth:
+    def __init__(self):
+        self.user = {"id": 3, "email": "t@example.com"}
+        self.organization = {"id": 1}
+        self.checks = 0
+
+    def require_library_access(self, library_id, level="any"):
+        self.checks += 1
+        return "owner"
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = SimpleNamespace(get_library=lambda library_id: {"organization_id": 1})
+    monkeypatch.setattr(library_router, "_db", db)
+    library_router._permalink_acl_cache.clear()
+    yield db
+    library_router._permalink_acl_cache.clear()
+
+
+class TestPermalinkACLCache:
+
+    def test_repeated_requests_reuse_acl_decision(self, fake_db):
+        auth = _FakeAuth()
+        for _ in range(5):
+            library_router._check_permalink_access(auth, "1", "lib-a")
+        assert auth.checks == 1
+
+    def test_invalidation_and_org_mismatch(self, fake_db):
+        auth = _FakeAuth()
+        library_router._check_permalink_access(auth, "1", "lib-a")
+        library_router._invalidate_permalink_acl("lib-a")
+        library_router._check_permalink_access(auth, "1", "lib-a")
+        assert auth.checks == 2
+
+        with pytest.raises(HTTPException) as exc:
+            library_router._check_permalink_access(auth, "2", "lib-a")
+        assert exc.value.status_code == 404
+
+
+class TestStreamContent:
+
+    def test_forwards_range_and_streams_partial_content(self, monkeypatch):
+        seen = {}
+
+        def handler(request):
+            seen["range"] = request.headers.get("range")
+            return httpx.Response(
+                206,
+                headers={"content-range": "bytes 0-3/10", "etag": '"abc"'},
+                stream=_ChunkedStream([b"%P", b"DF"]),
+            )
+
+        http_clients._clients["library_manager"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler))
+        client = library_router._client
+        monkeypatch.setattr(client, "_get_library_config",
+                            lambda user: {"url": "http://lm", "token": "t"})
+
+        async def scenario():
+            try:
+                response = await client.stream_content(
+                    "lib", "item", "original/doc.pdf", headers={"range": "bytes=0-3"})
+                body = b"".join([chunk async for chunk in response.aiter_raw()])
+                await response.aclose()
+                return response, body
+            finally:
+                await http_clients.aclose()
+
+        response, body = asyncio.run(scenario())
+        assert seen["range"] == "bytes=0-3"
+        assert response.status_code == 206
+        assert response.headers["etag"] == '"abc"'
+        assert body == b"%PDF"
+
+    def test_rejects_path_traversal(self):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(library_router._client.stream_content("lib", "item", "../secret"))
+        assert exc.value.status_code == 400
+
+
+class TestExportImportStreaming:
+
+    def _install(self, monkeypatch, handler):
+        http_clients._clients["library_manager"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler))
+        client = library_router._client
+        monkeypatch.setattr(client, "_get_library_config",
+                            lambda user: {"url": "http://lm", "token": "t"})
+        return client
+
+    def test_export_relays_chunks_and_releases_connection(self, monkeypatch, fake_db):
+        stream = _ChunkedStream([b"PK", b"\x03\x04", b"rest"])
+        client = self._install(monkeypatch, lambda request: httpx.Response(
+            200, headers={"content-type": "application/zip"}, stream=stream))
+
+        async def scenario():
+            try:
+                response = await client.export_library("lib")
+                chunks = [c async for c in library_router._relay_body(response)]
+                return response, chunks
+            finally:
+                await http_clients.aclose()
+
+        response, chunks = asyncio.run(scenario())
+        assert chunks == [b"PK", b"\x03\x04", b"rest"]
+        assert response.is_closed
+
+    def test_import_accepts_file_object(self, monkeypatch):
+        received = {}
+
+        async def handler(request):
+            received["body"] = b"".join([chunk async for chunk in request.stream])
+            return httpx.Response(201, json={"library_id": "new"})
+
+        client = self._install(monkeypatch, handler)
+        upload = tempfile.SpooledTemporaryFile(max_size=16)
+        upload.write(b"zip-bytes" * 100)
+
+        async def scenario():
+            try:
+                return await client.import_library_zip(1, upload)
+            finally:
+                await http_clients.aclose()
+
+        assert asyncio.run(scenario()) == {"library_id": "new"}
+        assert b"zip-bytes" * 100 in received["body"]
+
+    def test_item_events_relayed_and_final_status_synced(self, monkeypatch):
+        updates = []
+        monkeypatch.setattr(library_router, "_db", SimpleNamespace(
+            get_library_item=lambda item_id: {"status": "processing"},
+            update_library_item_status=lambda item_id, status: updates.append((item_id, status)),
+        ))
+        # Frame split across chunks, as a proxy may deliver it.
+        stream = _ChunkedStream([
+            b'event: status\ndata: {"item_id": "it", "status": "processing"}\n\n',
+            b'event: status\ndata: {"item_id": "it", "st',
+            b'atus": "ready"}\n\n',
+        ])
+        client = self._install(monkeypatch, lambda request: httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=stream))
+
+        async def scenario():
+            try:
+                response = await client.stream_item_events("lib", "it")
+                body = "".join([c async for c in library_router._relay_item_events(response, "it")])
+                return response, body
+            finally:
+                await http_clients.aclose()
+
+        response, body = asyncio.run(scenario())
+        assert body.count("event: status") == 2
+        assert response.is_closed
+        assert updates == [("it", "ready")]
+
+    def test_deleted_marker_is_relayed_but_not_stored(self, monkeypatch):
+        updates = []
+        monkeypatch.setattr(library_router, "_db", SimpleNamespace(
+            get_library_item=lambda item_id: {"status": "pending"},
+            update_library_item_status=lambda item_id, status: updates.append((item_id, status)),
+        ))
+        stream = _ChunkedStream([
+            b'event: status\ndata: {"item_id": "it", "status": "processing"}\n\n',
+            b'event: status\ndata: {"item_id": "it", "status": "deleted"}\n\n',
+        ])
+        client = self._install(monkeypatch, lambda request: httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=stream))
+
+        async def scenario():
+            try:
+                response = await client.stream_item_events("lib", "it")
+                return "".join([c async for c in library_router._relay_item_events(response, "it")])
+            finally:
+                await http_clients.aclose()
+
+        body = asyncio.run(scenario())
+        assert '"status": "deleted"' in body
+        assert updates == [("it", "processing")]
@@ -0,0 +1,90 @@
+"""
+Tests for lamb.services.provider_catalog_service — cached provider status.
+
+Run with: pytest backend/tests/test_provider_catalog_service.py -v
+"""
+
+import asyncio
+
+from lamb.services.provider_catalog_service import ProviderCatalogService, _fingerprint
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _service(calls):
+    service = ProviderCatalogService()
+
+    async def fake_refresh(org_id, org_config):
+        calls.append(org_id)
+        await asyncio.sleep(0.01)
+        return _store(service, org_id, org_config)
+
+    service._refresh_status = fake_refresh
+    return service
+
+
+def _store(service, org_id, org_config):
+    entry = {
+        "result": {"overall_status": "working", "providers": {"openai": {"models": ["m"]}}},
+        "fingerprint": _fingerprint(org_config),
+        "refreshed_at": 123.0,
+    }
+    service._status_cache[org_id] = entry
+    return entry
+
+
+CONFIG = {"setups": {"default": {"providers": {"openai": {"api_key": "k"}}}}}
+
+
+class TestProviderStatusCache:
+
+    def test_second_request_served_from_cache(self):
+        calls = []
+        service = _service(calls)
+
+        async def scenario():
+            first = await service.get_api_status(1, CONFIG)
+            second = await service.get_api_status(1, CONFIG)
+            assert first == second
+            assert first["last_refreshed"] == 123.0
+
+        _run(scenario())
+        assert calls == [1]
+
+    def test_concurrent_cold_requests_refresh_once(self):
+        calls = []
+        service = _service(calls)
+
+        async def scenario():
+            await asyncio.gather(*(service.get_api_status(1, CONFIG) for _ in range(5)))
+
+        _run(scenario())
+        assert calls == [1]
+
+    def test_refresh_flag_and_config_change_bypass_cache(self):
+        calls = []
+        service = _service(calls)
+        changed = {"setups": {"default": {"providers": {"openai": {"api_key": "new"}}}}}
+
+        async def scenario():
+            await service.get_api_status(1, CONFIG)
+            await service.get_api_status(1, CONFIG, refresh=True)
+            await service.get_api_status(1, changed)
+            await service.get_api_status(1, changed)
+
+        _run(scenario())
+        assert calls == [1, 1, 1]
+
+    def test_callers_cannot_mutate_cached_result(self):
+        calls = []
+        service = _service(calls)
+
+        async def scenario():
+            status = await service.get_api_status(1, CONFIG)
+            status["providers"]["openai"]["enabled_models"] = ["x"]
+            again = await service.get_api_status(1, CONFIG)
+            assert "enabled_models" not in again["providers"]["openai"]
+
+        _run(scenario())
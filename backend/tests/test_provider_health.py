@@ -0,0 +1,155 @@
+"""
+Tests for lamb.completions.provider_health — rolling health and circuit breaker.
+
+Run with: pytest backend/tests/test_provider_health.py -v
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lamb.completions.connectors import openai as openai_connector
+from lamb.completions.provider_health import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    ProviderHealthTracker,
+    provider_health,
+)
+
+
+def _tracker(**overrides):
+    params = dict(window_seconds=60, min_requests=4, error_threshold=0.5,
+                  consecutive_failures=3, cooldown_seconds=0.05)
+    params.update(overrides)
+    return ProviderHealthTracker(**params)
+
+
+KEY = ProviderHealthTracker.key("openai", "https://api.example.com/v1/", "gpt-4o")
+
+
+class TestCircuitBreaker:
+
+    def test_key_normalizes_base_url(self):
+        assert KEY == ("openai", "https://api.example.com/v1", "gpt-4o")
+        assert ProviderHealthTracker.key("openai", None, "m") == ("openai", "", "m")
+
+    def test_opens_after_consecutive_failures(self):
+        tracker = _tracker()
+        for _ in range(3):
+            assert tracker.allow_request(KEY)
+            tracker.record_failure(KEY, 1.0, "timeout")
+        assert tracker.state(KEY) == OPEN
+        assert not tracker.allow_request(KEY)
+
+    def test_opens_on_error_rate(self):
+        tracker = _tracker(consecutive_failures=100)
+        for ok in (True, False, True, False):
+            if ok:
+                tracker.record_success(KEY, 0.2)
+            else:
+                tracker.record_failure(KEY, 0.2, "503")
+        assert tracker.state(KEY) == OPEN
+
+    def test_stays_closed_below_min_requests(self):
+        tracker = _tracker(consecutive_failures=100)
+        tracker.record_failure(KEY, 0.1)
+        tracker.record_success(KEY, 0.1)
+        assert tracker.state(KEY) == CLOSED
+
+    def test_half_open_allows_single_probe_then_closes(self):
+        tracker = _tracker()
+        for _ in range(3):
+            tracker.record_failure(KEY, 1.0)
+        time.sleep(0.06)
+        assert tracker.state(KEY) == HALF_OPEN
+        assert tracker.allow_request(KEY)
+        assert not tracker.allow_request(KEY)  # probe already in flight
+        tracker.record_success(KEY, 0.3)
+        assert tracker.state(KEY) == CLOSED
+        assert tracker.allow_request(KEY)
+
+    def test_failed_probe_reopens(self):
+        tracker = _tracker()
+        for _ in range(3):
+            tracker.record_failure(KEY, 1.0)
+        time.sleep(0.06)
+        assert tracker.allow_request(KEY)
+        tracker.record_failure(KEY, 1.0, "still down")
+        assert tracker.state(KEY) == OPEN
+        assert not tracker.allow_request(KEY)
+
+    def test_released_probe_lets_the_next_request_probe(self):
+        tracker = _tracker()
+        for _ in range(3):
+            tracker.record_failure(KEY, 1.0)
+        time.sleep(0.06)
+        assert tracker.allow_request(KEY)
+        tracker.release_probe(KEY)
+        assert tracker.state(KEY) == HALF_OPEN
+        assert tracker.allow_request(KEY)
+
+    def test_abandoned_probe_expires_after_cooldown(self):
+        tracker = _tracker()
+        for _ in range(3):
+            tracker.record_failure(KEY, 1.0)
+        time.sleep(0.06)
+        assert tracker.allow_request(KEY)
+        assert not tracker.allow_request(KEY)
+        time.sleep(0.06)
+        assert tracker.allow_request(KEY)
+
+    def test_snapshot_filters_and_reports(self):
+        tracker = _tracker()
+        tracker.record_success(KEY, 0.5)
+        tracker.record_failure(KEY, 2.0, "boom")
+        tracker.record_success(ProviderHealthTracker.key("ollama", "http://o", "llama3"), 0.1)
+
+        entries = tracker.snapshot(provider="openai", base_url="https://api.example.com/v1")
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["model"] == "gpt-4o"
+        assert entry["window_calls"] == 2
+        assert entry["error_rate"] == 0.5
+        assert entry["latency_p50"] == 0.5
+        assert entry["last_error"] == "boom"
+
+
+class TestConnectorProbe:
+
+    def test_cancelled_half_open_probe_releases_the_circuit(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_BASE_URL", "https://api.example.com/v1")
+        monkeypatch.setattr(provider_health, "cooldown_seconds", 0.05)
+        key = provider_health.key("openai", "https://api.example.com/v1", "gpt-4o")
+        provider_health.reset()
+        for _ in range(provider_health.consecutive_failures):
+            provider_health.record_failure(key, 1.0, "down")
+        time.sleep(0.06)
+
+        started = asyncio.Event()
+
+        async def hang(**kwargs):
+            started.set()
+            await asyncio.sleep(60)
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=hang)))
+
+        async def probe_and_cancel():
+            task = asyncio.create_task(openai_connector.llm_connect(
+                [{"role": "user", "content": "hi"}], llm="gpt-4o"))
+            await started.wait()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        try:
+            with patch.object(openai_connector, "_get_openai_client", return_value=client):
+                asyncio.run(probe_and_cancel())
+            assert provider_health.state(key) == HALF_OPEN
+            assert provider_health.allow_request(key)
+        finally:
+            provider_health.reset()
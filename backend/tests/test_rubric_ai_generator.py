@@ -0,0 +1,253 @@
+"""
+Tests for async rubric generation against a local fake OpenAI-compatible
+server: recovery strategies, timeouts, streaming and cancellation when the
+client disconnects.
+
+Run with: pytest backend/tests/test_rubric_ai_generator.py -v
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import AsyncOpenAI
+
+import config
+from lamb.evaluaitor import ai_generator
+from lamb.evaluaitor.ai_generator import AIRubricGenerator
+
+_run = asyncio.run
+
+RUBRIC = {
+    "title": "Essay Rubric",
+    "description": "Argumentative essay",
+    "metadata": {"createdAt": "2026-01-01T00:00:00", "modifiedAt": "2026-01-01T00:00:00"},
+    "criteria": [{
+        "id": "c1", "name": "Thesis", "description": "Clear thesis", "weight": 100,
+        "levels": [
+            {"id": "l1", "score": 4, "label": "Exemplary", "description": "Precise thesis"},
+            {"id": "l2", "score": 1, "label": "Beginning", "description": "No thesis"},
+        ],
+    }],
+    "scoringType": "points",
+    "maxScore": 4,
+}
+RUBRIC_JSON = json.dumps({"rubric": RUBRIC, "explanation": "One criterion, four points"})
+RUBRIC_REPLY = "Here is your rubric.\n```json\n" + RUBRIC_JSON + "\n```"
+
+
+class FakeOpenAIServer:
+    """Serves /v1/chat/completions from scripted replies, as JSON or SSE."""
+
+    def __init__(self, replies, delay=0.0):
+        self.replies = list(replies)
+        self.delay = delay
+        self.requests = []
+        self.closed_streams = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.requests.append(body)
+                reply = server.replies.pop(0) if len(server.replies) > 1 else server.replies[0]
+                if body.get("stream"):
+                    self._stream(reply)
+                else:
+                    time.sleep(server.delay)
+                    self._json(reply)
+
+            def _json(self, reply):
+                payload = json.dumps({
+                    "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "fake",
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": reply}}],
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, reply):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                pieces = [reply[i:i + 40] for i in range(0, len(reply), 40)]
+                try:
+                    for piece in pieces:
+                        chunk = {"id": "chatcmpl-1", "object": "chat.completion.chunk", "created": 0,
+                                 "model": "fake", "choices": [{"index": 0, "delta": {"content": piece}}]}
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                        self.wfile.flush()
+                        time.sleep(server.delay)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    server.closed_streams += 1
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_llm():
+    servers = []
+
+    def start(*replies, delay=0.0):
+        server = FakeOpenAIServer(replies, delay)
+        servers.append(server)
+        generator = AIRubricGenerator.__new__(AIRubricGenerator)
+        generator.user_email = "creator@example.com"
+        generator.default_model = "fake-model"
+        generator.client = AsyncOpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+        return server, generator
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+class TestGenerateRubric:
+
+    def test_valid_rubric_is_returned_with_markdown(self, fake_llm):
+        server, generator = fake_llm(RUBRIC_REPLY)
+        result = _run(generator.generate_rubric("An essay rubric", "en"))
+
+        assert result["success"] is True
+        assert result["rubric"] == RUBRIC
+        assert result["explanation"] == "One criterion, four points"
+        assert "Essay Rubric" in result["markdown"]
+        assert server.requests[0]["model"] == "fake-model"
+
+    def test_event_loop_keeps_running_during_generation(self, fake_llm):
+        _server, generator = fake_llm(RUBRIC_REPLY, delay=0.5)
+        ticks = []
+
+        async def heartbeat():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.05)
+
+        async def main():
+            beat = asyncio.create_task(heartbeat())
+            result = await generator.generate_rubric("An essay rubric")
+            beat.cancel()
+            return result
+
+        assert _run(main())["success"] is True
+        assert len(ticks) >= 5
+
+    def test_invalid_reply_is_retried_with_strict_json(self, fake_llm):
+        server, generator = fake_llm("I cannot produce JSON right now.", RUBRIC_JSON)
+        result = _run(generator.generate_rubric("An essay rubric"))
+
+        assert result["success"] is True
+        assert len(server.requests) == 2
+        assert server.requests[1]["temperature"] < server.requests[0]["temperature"]
+
+    def test_unparseable_replies_are_returned_for_manual_edit(self, fake_llm):
+        _server, generator = fake_llm("still not json")
+        result = _run(generator.generate_rubric("An essay rubric"))
+
+        assert result["success"] is False
+        assert result["allow_manual_edit"] is True
+        assert result["raw_response"] == "still not json"
+
+    def test_slow_llm_times_out(self, fake_llm, monkeypatch):
+        monkeypatch.setattr(config, "RUBRIC_AI_TIMEOUT", 0.2)
+        _server, generator = fake_llm(RUBRIC_REPLY, delay=1.0)
+
+        started = time.perf_counter()
+        result = _run(generator.generate_rubric("An essay rubric"))
+
+        assert time.perf_counter() - started < 0.9
+        assert result["success"] is False
+        assert "0.2 seconds" in result["error"]
+
+    def test_modification_sends_the_current_rubric(self, fake_llm, monkeypatch):
+        server, generator = fake_llm(RUBRIC_REPLY)
+        monkeypatch.setattr(ai_generator, "AIRubricGenerator", lambda email: generator)
+
+        result = _run(ai_generator.modify_rubric_ai(RUBRIC, "Add a criterion on sources", "creator@example.com"))
+
+        assert result["success"] is True
+        prompt = server.requests[0]["messages"][0]["content"]
+        assert "Add a criterion on sources" in prompt
+        assert '"Thesis"' in prompt
+
+
+class TestStreaming:
+
+    def test_stream_yields_partial_json_then_the_result(self, fake_llm):
+        _server, generator = fake_llm(RUBRIC_REPLY, delay=0.01)
+
+        async def collect():
+            return [event async for event in generator.generate_rubric_stream("An essay rubric")]
+
+        events = _run(collect())
+        deltas = [e["delta"] for e in events if "delta" in e]
+        assert len(deltas) > 1
+        assert "".join(deltas) == RUBRIC_REPLY
+        assert events[-2] == {"status": "validating"}
+        assert events[-1]["done"] is True
+        assert events[-1]["result"]["rubric"] == RUBRIC
+
+    def test_closing_the_stream_closes_the_llm_response(self, fake_llm):
+        server, generator = fake_llm(RUBRIC_REPLY * 20, delay=0.02)
+
+        async def read_two():
+            stream = generator.generate_rubric_stream("An essay rubric")
+            await stream.__anext__()
+            await stream.__anext__()
+            await stream.aclose()
+
+        _run(read_two())
+        deadline = time.perf_counter() + 2
+        while not server.closed_streams and time.perf_counter() < deadline:
+            time.sleep(0.02)
+        assert server.closed_streams == 1
+
+
+class TestCancelOnDisconnect:
+
+    def test_generation_is_cancelled_when_the_client_disconnects(self):
+        from creator_interface.evaluaitor_router import _run_unless_disconnected
+
+        class Request:
+            def __init__(self):
+                self.polls = 0
+
+            async def is_disconnected(self):
+                self.polls += 1
+                return self.polls >= 2
+
+        cancelled = []
+
+        async def slow_generation():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def main():
+            result = await _run_unless_disconnected(Request(), slow_generation())
+            await asyncio.sleep(0)
+            return result
+
+        started = time.perf_counter()
+        assert _run(main()) is None
+        assert cancelled == [True]
+        assert time.perf_counter() - started < 3
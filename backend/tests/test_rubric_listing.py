@@ -0,0 +1,137 @@
+"""
+Tests for rubric listings on the materialized metadata columns: columns kept
+in sync on write, lightweight list rows, filters, totals and the migration
+that backfills existing rubrics.
+
+Run with: pytest backend/tests/test_rubric_listing.py -v
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import config
+from lamb.database_manager import LambDatabaseManager
+from lamb.evaluaitor.rubric_database import LIST_COLUMNS, RubricDatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "LAMB_DB_PATH", str(tmp_path))
+    monkeypatch.setattr(LambDatabaseManager, "_system_org_initialized", False)
+    with patch("lamb.database_manager.OwiUserManager"):
+        return LambDatabaseManager()
+
+
+@pytest.fixture
+def rubrics(db_manager):
+    with patch("lamb.evaluaitor.rubric_database.LambDatabaseManager", return_value=db_manager):
+        return RubricDatabaseManager()
+
+
+@pytest.fixture
+def org_id(db_manager):
+    return db_manager.create_organization("school", "School")
+
+
+def _rubric(title, subject="", grade_level="", criteria=1, description=""):
+    return {
+        "title": title,
+        "description": description,
+        "metadata": {"subject": subject, "gradeLevel": grade_level},
+        "criteria": [{"id": f"c{i}", "name": f"Criterion {i}", "levels": []} for i in range(criteria)],
+        "scoringType": "points",
+        "maxScore": 10,
+    }
+
+
+class TestMetadataColumns:
+
+    def test_columns_follow_the_rubric_on_create_and_update(self, rubrics, org_id):
+        created = rubrics.create_rubric(_rubric("Essay", "Language", "Grade 9", criteria=3), "a@example.com", org_id)
+        [row] = rubrics.get_rubrics_by_owner("a@example.com")
+        assert (row["subject"], row["grade_level"], row["criteria_count"], row["max_score"]) == \
+            ("Language", "Grade 9", 3, 10)
+
+        rubrics.update_rubric(created["rubric_id"], _rubric("Essay v2", "History", "Grade 10"), "a@example.com")
+        [row] = rubrics.get_rubrics_by_owner("a@example.com")
+        assert (row["title"], row["subject"], row["grade_level"], row["criteria_count"]) == \
+            ("Essay v2", "History", "Grade 10", 1)
+
+    def test_list_rows_do_not_carry_the_rubric_body(self, rubrics, org_id):
+        rubrics.create_rubric(_rubric("Essay"), "a@example.com", org_id, is_public=True)
+
+        [own] = rubrics.get_rubrics_by_owner("a@example.com")
+        [public] = rubrics.get_public_rubrics(org_id)
+        for row in (own, public):
+            assert "rubric_data" not in row
+            assert set(row) == set(LIST_COLUMNS) | {"organization_slug"}
+
+        full = rubrics.get_rubric_by_id(own["rubric_id"], "a@example.com")
+        assert full["rubric_data"]["title"] == "Essay"
+
+
+class TestFiltering:
+
+    @pytest.fixture(autouse=True)
+    def library(self, rubrics, org_id):
+        for i in range(12):
+            subject = "Mathematics" if i % 3 == 0 else "History"
+            rubrics.create_rubric(_rubric(f"Rubric {i:02d}", subject, f"Grade {i % 4 + 7}",
+                                          description="lab report" if i % 4 == 0 else ""),
+                                  "a@example.com", org_id, is_public=i % 2 == 0)
+
+    def test_owner_filters_and_counts_match(self, rubrics):
+        maths = rubrics.get_rubrics_by_owner("a@example.com", limit=50, filters={"subject": "math"})
+        assert len(maths) == 4
+        assert {r["subject"] for r in maths} == {"Mathematics"}
+        assert rubrics.count_rubrics("a@example.com", {"subject": "math"}) == 4
+
+        graded = rubrics.get_rubrics_by_owner("a@example.com", limit=50, filters={"grade_level": "grade 7"})
+        assert {r["grade_level"] for r in graded} == {"Grade 7"}
+
+    def test_search_is_applied_before_paging(self, rubrics):
+        first = rubrics.get_rubrics_by_owner("a@example.com", limit=2, filters={"search": "lab report"})
+        second = rubrics.get_rubrics_by_owner("a@example.com", limit=2, offset=2, filters={"search": "lab report"})
+        assert len(first) == 2 and len(second) == 1
+        assert rubrics.count_rubrics("a@example.com", {"search": "lab report"}) == 3
+
+    def test_public_listing_pages_and_counts(self, rubrics, org_id, db_manager):
+        system_org = db_manager.get_organization_by_slug("lamb")
+        rubrics.create_rubric(_rubric("System template", "Mathematics"), "admin@example.com",
+                              system_org["id"], is_public=True)
+
+        page = rubrics.get_public_rubrics(org_id, limit=4)
+        rest = rubrics.get_public_rubrics(org_id, limit=4, offset=4)
+        titles = [r["title"] for r in page + rest]
+        assert len(titles) == len(set(titles)) == 7
+        assert "System template" in titles
+        assert rubrics.count_public_rubrics(org_id) == 7
+        assert rubrics.count_public_rubrics(org_id, {"subject": "math"}) == 3
+        assert rubrics.count_public_rubrics(org_id, include_system_org=False) == 6
+
+
+class TestMigration:
+
+    def test_existing_rubrics_are_backfilled(self, db_manager, rubrics, org_id):
+        table = f"{db_manager.table_prefix}rubrics"
+        conn = db_manager.get_connection()
+        conn.execute(f"DROP INDEX idx_{db_manager.table_prefix}rubrics_owner_list")
+        conn.execute(f"DROP INDEX idx_{db_manager.table_prefix}rubrics_public_list")
+        for column in ("subject", "grade_level", "criteria_count", "max_score"):
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        conn.execute(f"""INSERT INTO {table} (rubric_id, organization_id, owner_email, title, rubric_data,
+                         created_at, updated_at) VALUES (?, ?, ?, ?, ?, 1, 1)""",
+                     ("legacy-1", org_id, "a@example.com", "Legacy",
+                      json.dumps(_rubric("Legacy", "Science", "Grade 8", criteria=2))))
+        conn.commit()
+        conn.close()
+
+        db_manager.run_migrations()
+        # Running it again leaves the columns as they are
+        db_manager.run_migrations()
+
+        [row] = rubrics.get_rubrics_by_owner("a@example.com")
+        assert (row["subject"], row["grade_level"], row["criteria_count"], row["max_score"]) == \
+            ("Science", "Grade 8", 2, 10)
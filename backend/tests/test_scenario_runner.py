@@ -0,0 +1,160 @@
+"""
+Tests for the concurrent assistant test-suite runner: per-organization
+concurrency cap, result order, response cache and per-scenario streaming.
+
+Run with: pytest backend/tests/test_scenario_runner.py -v
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import config
+from lamb.services import test_service
+
+_run = asyncio.run
+
+
+def _assistant(system_prompt="Be helpful", organization_id=1):
+    return SimpleNamespace(
+        id=7, organization_id=organization_id, system_prompt=system_prompt,
+        prompt_template="{user_input}", api_callback='{"llm": "gpt-4o-mini"}',
+        RAG_Top_k=3, RAG_collections="",
+    )
+
+
+class FakeTestService(test_service.TestService):
+    """TestService with scenarios in memory and a slow fake completion."""
+
+    def __init__(self, count, delay=0.1, failing=()):
+        self.scenarios = [{"id": f"s{i}", "title": f"Scenario {i}",
+                           "messages": [{"role": "user", "content": f"q{i}"}]} for i in range(count)]
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    def list_scenarios(self, assistant_id):
+        return self.scenarios
+
+    async def run_scenario(self, assistant_id, scenario_id, messages, user_email, debug_bypass=False):
+        self.calls.append(scenario_id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # Earlier scenarios are slower, so completion order is reversed
+            index = int(scenario_id[1:])
+            await asyncio.sleep(self.delay * (1 + (len(self.scenarios) - index) / len(self.scenarios)))
+            if scenario_id in self.failing:
+                raise ValueError("Completion failed: upstream error")
+            return {"id": f"run-{scenario_id}", "scenario_id": scenario_id, "response": f"a{index}"}
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture(autouse=True)
+def runner_config(monkeypatch):
+    monkeypatch.setattr(config, "TEST_RUNNER_ORG_CONCURRENCY", 4)
+    monkeypatch.setattr(config, "TEST_RUNNER_CACHE_TTL", 60)
+    test_service.clear_response_cache()
+    test_service._org_semaphores.clear()
+    yield
+    test_service.clear_response_cache()
+
+
+@pytest.fixture
+def assistant():
+    current = _assistant()
+    with patch("lamb.services.assistant_service.AssistantService") as svc_cls:
+        svc_cls.return_value.get_assistant_by_id.side_effect = lambda _id: current
+        yield lambda **changes: current.__dict__.update(changes)
+
+
+class TestConcurrentSuite:
+
+    def test_suite_runs_concurrently_under_the_org_cap_in_scenario_order(self, assistant):
+        svc = FakeTestService(count=12, delay=0.1)
+
+        started = time.perf_counter()
+        results = _run(svc.run_all_scenarios(7, "owner@example.com"))
+        elapsed = time.perf_counter() - started
+
+        assert svc.max_running == 4
+        # 12 scenarios, 4 at a time, each at most 0.2 s
+        assert elapsed < 1.0
+        assert [r["scenario_id"] for r in results] == [f"s{i}" for i in range(12)]
+
+    def test_org_cap_is_shared_by_concurrent_suites(self, assistant):
+        first, second = FakeTestService(count=6, delay=0.05), FakeTestService(count=6, delay=0.05)
+        running = lambda: first.running + second.running
+        peak = []
+
+        async def both():
+            async def watch():
+                while True:
+                    peak.append(running())
+                    await asyncio.sleep(0.005)
+            watcher = asyncio.create_task(watch())
+            await asyncio.gather(first.run_all_scenarios(7, "a@example.com"),
+                                 second.run_all_scenarios(7, "b@example.com"))
+            watcher.cancel()
+
+        _run(both())
+        assert max(peak) == 4
+
+    def test_failures_are_reported_per_scenario(self, assistant):
+        svc = FakeTestService(count=3, delay=0.01, failing={"s1"})
+        results = _run(svc.run_all_scenarios(7, "owner@example.com"))
+        assert results[1] == {"scenario_id": "s1", "title": "Scenario 1",
+                              "error": "Completion failed: upstream error"}
+        assert results[0]["response"] == "a0"
+
+    def test_results_stream_in_completion_order(self, assistant):
+        svc = FakeTestService(count=4, delay=0.05)
+
+        async def collect():
+            return [index async for index, _scenario, _result in svc.iter_scenario_runs(7, "o@example.com")]
+
+        assert _run(collect()) == [3, 2, 1, 0]
+
+
+class TestResponseCache:
+
+    def test_cached_results_are_reused_for_the_same_assistant_version(self, assistant):
+        svc = FakeTestService(count=3, delay=0.01)
+        _run(svc.run_all_scenarios(7, "owner@example.com"))
+        svc.calls.clear()
+
+        results = _run(svc.run_all_scenarios(7, "owner@example.com", use_cache=True))
+        assert svc.calls == []
+        assert all(r["cached"] for r in results)
+
+        # Without use_cache every scenario runs again
+        _run(svc.run_all_scenarios(7, "owner@example.com"))
+        assert len(svc.calls) == 3
+
+    def test_editing_the_assistant_or_scenario_misses_the_cache(self, assistant):
+        svc = FakeTestService(count=2, delay=0.01)
+        _run(svc.run_all_scenarios(7, "owner@example.com"))
+        svc.calls.clear()
+
+        assistant(system_prompt="Answer in Spanish")
+        _run(svc.run_all_scenarios(7, "owner@example.com", use_cache=True))
+        assert sorted(svc.calls) == ["s0", "s1"]
+        svc.calls.clear()
+
+        svc.scenarios[0]["messages"] = [{"role": "user", "content": "changed"}]
+        _run(svc.run_all_scenarios(7, "owner@example.com", use_cache=True))
+        assert svc.calls == ["s0"]
+
+    def test_failed_runs_are_not_cached(self, assistant):
+        svc = FakeTestService(count=2, delay=0.01, failing={"s0"})
+        _run(svc.run_all_scenarios(7, "owner@example.com"))
+        svc.calls.clear()
+
+        _run(svc.run_all_scenarios(7, "owner@example.com", use_cache=True))
+        assert svc.calls == ["s0"]
@@ -0,0 +1,202 @@
+"""
+Tests for completion pipeline stage metrics: histogram export, per-request
+stage timing in run_lamb_assistant, Server-Timing headers and lazy debug
+serialization.
+
+Run with: pytest backend/tests/test_stage_metrics.py -v
+"""
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import config
+from lamb.completions import main as completions
+from lamb.completions.stage_metrics import StageMetrics, StageTimer, stage_metrics
+from lamb.logging_config import LazyJSON
+
+_run = asyncio.run
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    monkeypatch.setattr(config, "COMPLETION_METRICS_ENABLED", True)
+    monkeypatch.setattr(config, "COMPLETION_SERVER_TIMING", True)
+    stage_metrics.reset()
+    yield
+    stage_metrics.reset()
+
+
+class TestStageMetrics:
+
+    def test_prometheus_histogram_is_cumulative(self):
+        metrics = StageMetrics(buckets=(0.01, 0.1, 1.0))
+        for seconds in (0.005, 0.05, 0.05, 2.0):
+            metrics.observe("rag", seconds)
+        metrics.count_request("ok")
+
+        text = metrics.render()
+        assert 'lamb_completion_stage_seconds_bucket{stage="rag",le="0.01"} 1' in text
+        assert 'lamb_completion_stage_seconds_bucket{stage="rag",le="0.1"} 3' in text
+        assert 'lamb_completion_stage_seconds_bucket{stage="rag",le="1"} 3' in text
+        assert 'lamb_completion_stage_seconds_bucket{stage="rag",le="+Inf"} 4' in text
+        assert 'lamb_completion_stage_seconds_sum{stage="rag"} 2.105000' in text
+        assert 'lamb_completion_stage_seconds_count{stage="rag"} 4' in text
+        assert 'lamb_completion_requests_total{outcome="ok"} 1' in text
+        assert "# TYPE lamb_completion_stage_seconds histogram" in text
+
+    def test_stages_add_up_to_the_total(self):
+        metrics = StageMetrics()
+        timer = StageTimer(metrics)
+        timer.mark("rag")
+        timer.mark("connector")
+        timer.finish()
+        timer.finish("error")  # only the first outcome counts
+
+        assert timer.stages["total"] >= timer.stages["rag"] + timer.stages["connector"]
+        assert metrics.snapshot()["requests"] == {"ok": 1}
+        assert timer.server_timing().startswith("rag;dur=")
+
+    def test_disabled_metrics_record_nothing(self, monkeypatch):
+        monkeypatch.setattr(config, "COMPLETION_METRICS_ENABLED", False)
+        timer = StageTimer()
+        timer.mark("rag")
+        timer.finish()
+        assert stage_metrics.snapshot() == {"stages": {}, "requests": {}}
+
+
+def _pipeline(connector_result):
+    """Patch the completion pipeline around a fake connector."""
+    assistant = SimpleNamespace(id=1, owner="owner@example.com", organization_id=None)
+
+    async def rag(request, rag_processors, rag_processor, assistant_details):
+        await asyncio.sleep(0.02)
+        return None
+
+    async def connector(**kwargs):
+        return connector_result
+
+    async def no_task(**kwargs):
+        return None
+
+    return [
+        patch.object(completions, "get_assistant_details", return_value=assistant),
+        patch.object(completions, "parse_plugin_config", return_value={
+            "connector": "fake", "llm": "fake-model", "prompt_processor": "simple", "rag_processor": "fake"}),
+        patch.object(completions, "maybe_route_non_streaming_task", side_effect=no_task),
+        patch.object(completions, "load_and_validate_plugins", return_value=({}, {"fake": connector}, {})),
+        patch.object(completions, "get_rag_context", side_effect=rag),
+        patch.object(completions, "process_completion_request", return_value=[{"role": "user", "content": "hi"}]),
+    ]
+
+
+def _run_assistant(connector_result, request):
+    patches = _pipeline(connector_result)
+    for p in patches:
+        p.start()
+    try:
+        async def call():
+            response = await completions.run_lamb_assistant(request, 1, headers={"X-Request-Id": "r1"})
+            body = b""
+            if hasattr(response, "body_iterator"):
+                async for chunk in response.body_iterator:
+                    body += chunk.encode() if isinstance(chunk, str) else chunk
+            return response, body
+        return _run(call())
+    finally:
+        for p in patches:
+            p.stop()
+
+
+class TestCompletionPipeline:
+
+    def test_response_carries_server_timing_and_stages_are_recorded(self):
+        response, _ = _run_assistant({"id": "c1", "choices": []}, {"messages": []})
+
+        timing = dict(part.split(";dur=") for part in response.headers["server-timing"].split(", "))
+        assert list(timing) == ["assistant_lookup", "task_routing", "plugin_load", "rag",
+                                "prompt_processing", "connector", "total"]
+        assert float(timing["rag"]) >= 20
+        assert response.headers["x-request-id"] == "r1"
+
+        snapshot = stage_metrics.snapshot()
+        assert snapshot["requests"] == {"ok": 1}
+        assert snapshot["stages"]["rag"]["count"] == 1
+        assert snapshot["stages"]["rag"]["sum"] >= 0.02
+
+    def test_stream_records_time_to_first_token(self):
+        async def chunks():
+            await asyncio.sleep(0.03)
+            yield "data: {}\n\n"
+            yield "data: [DONE]\n\n"
+
+        response, body = _run_assistant(chunks(), {"messages": [], "stream": True})
+
+        assert body == b"data: {}\n\ndata: [DONE]\n\n"
+        assert "connector;dur=" in response.headers["server-timing"]
+        stages = stage_metrics.snapshot()["stages"]
+        assert stages["time_to_first_token"]["sum"] >= 0.03
+        assert stages["stream"]["count"] == 1
+        assert stage_metrics.snapshot()["requests"] == {"ok": 1}
+
+    def test_stream_failing_mid_way_counts_as_error(self):
+        async def chunks():
+            yield "data: {}\n\n"
+            raise RuntimeError("provider dropped the stream")
+
+        with pytest.raises(RuntimeError):
+            _run_assistant(chunks(), {"messages": [], "stream": True})
+        assert stage_metrics.snapshot()["requests"] == {"error": 1}
+
+    def test_server_timing_header_can_be_turned_off(self, monkeypatch):
+        monkeypatch.setattr(config, "COMPLETION_SERVER_TIMING", False)
+        response, _ = _run_assistant({"id": "c1", "choices": []}, {"messages": []})
+        assert "server-timing" not in response.headers
+        assert stage_metrics.snapshot()["requests"] == {"ok": 1}
+
+
+class TestMetricsEndpoint:
+
+    def _get(self, monkeypatch, token, authorization=None):
+        import main
+        from fastapi import HTTPException
+        from starlette.requests import Request
+
+        monkeypatch.setattr(main, "METRICS_TOKEN", token)
+        headers = [(b"authorization", authorization.encode())] if authorization else []
+        request = Request({"type": "http", "method": "GET", "path": "/metrics", "headers": headers})
+        try:
+            return _run(main.get_metrics(request)).status_code
+        except HTTPException as e:
+            return e.status_code
+
+    def test_metrics_are_not_served_without_a_token(self, monkeypatch):
+        assert self._get(monkeypatch, "") == 404
+        assert self._get(monkeypatch, "", "Bearer ") == 404
+
+    def test_metrics_require_the_configured_token(self, monkeypatch):
+        assert self._get(monkeypatch, "s3cret") == 401
+        assert self._get(monkeypatch, "s3cret", "Bearer wrong") == 401
+        assert self._get(monkeypatch, "s3cret", "Bearer s3cret") == 200
+
+
+class TestLazyJSON:
+
+    def test_disabled_debug_log_does_not_serialize(self):
+        class Exploding:
+            def __iter__(self):
+                raise AssertionError("serialized while debug logging is off")
+
+        logger = logging.getLogger("tests.lazy_json")
+        logger.setLevel(logging.INFO)
+        # json.dumps would iterate the value; it must never be called
+        logger.debug("Payload: %s", LazyJSON(Exploding(), indent=2))
+
+    def test_renders_json_and_truncates(self):
+        assert str(LazyJSON({"a": 1})) == json.dumps({"a": 1})
+        assert str(LazyJSON({"text": "x" * 50}, max_chars=10)) == '{"text": "...'
+        assert str(LazyJSON({1, 2})) == repr({1, 2})
@@ -262,6 +262,48 @@ export async function getItemStatus(libraryId, itemId) {
     return response.data;
 }
 
+/**
+ * Follow an item's import status over the server-sent event stream.
+ * Calls `onStatus` for every status event and resolves when the server
+ * closes the stream (the item is ready, failed or deleted). Rejects on HTTP
+ * or network errors so callers can fall back to polling getItemStatus().
+ * @param {string} libraryId
+ * @param {string} itemId
+ * @param {(status: { item_id: string, status: string, error_message?: string }) => void} onStatus
+ * @param {AbortSignal} [signal]
+ * @returns {Promise<void>}
+ */
+export async function watchItemStatus(libraryId, itemId, onStatus, signal) {
+    if (!browser) throw new Error('Browser only.');
+    const url = getApiUrl(`/libraries/${libraryId}/items/${itemId}/events`);
+    // fetch instead of EventSource: the stream needs the Authorization header.
+    const response = await fetch(url, {
+        headers: { ...authHeaders(), Accept: 'text/event-stream' },
+        signal,
+    });
+    if (!response.ok || !response.body) {
+        throw new Error(`Status stream failed (HTTP ${response.status})`);
+    }
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const frames = buffer.split('\n\n');
+        buffer = frames.pop() ?? '';
+        for (const frame of frames) {
+            const data = frame
+                .split('\n')
+                .filter((line) => line.startsWith('data: '))
+                .map((line) => line.slice('data: '.length))
+                .join('\n');
+            if (data) onStatus(JSON.parse(data));
+        }
+    }
+}
+
 /**
  * Delete an item from a library.
  * @param {string} libraryId
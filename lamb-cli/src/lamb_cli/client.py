@@ -121,6 +121,29 @@ class LambClient:
         except httpx.HTTPStatusError as exc:
             self._raise_for_status(exc.response)
 
+    def stream_events(self, path: str, **kwargs: Any) -> Iterator[tuple[str, str]]:
+        """GET a server-sent event stream and yield ``(event, data)`` pairs.
+
+        Comment lines (keep-alives) are skipped. The stream may stay idle
+        between events, so there is no read timeout.
+        """
+        kwargs.setdefault("timeout", httpx.Timeout(self._http.timeout.connect, read=None))
+        try:
+            with self._http.stream("GET", path, **kwargs) as resp:
+                self._check_status(resp)
+                event, data = "message", []
+                for line in resp.iter_lines():
+                    if not line:
+                        if data:
+                            yield event, "\n".join(data)
+                        event, data = "message", []
+                    elif line.startswith("event:"):
+                        event = line[len("event:"):].strip()
+                    elif line.startswith("data:"):
+                        data.append(line[len("data:"):].lstrip())
+        except httpx.HTTPError as exc:
+            raise NetworkError(f"Event stream interrupted: {exc}") from exc
+
     # --- Internal ---
 
     def _request(self, method: str, path: str, **kwargs: Any) -> Any:
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import sys
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 import typer
 from rich.live import Live
@@ -12,8 +13,9 @@ from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn
 from rich.text import Text
 
-from lamb_cli.client import get_client
+from lamb_cli.client import LambClient, get_client
 from lamb_cli.config import get_output_format
+from lamb_cli.errors import ApiError, NetworkError, NotFoundError
 from lamb_cli.output import format_output, print_error, print_success
 
 app = typer.Typer(help="Manage ingestion jobs.")
@@ -57,6 +59,35 @@ def _flatten_job(job: dict) -> dict:
     return flat
 
 
+def _follow_job(
+    client: LambClient, kb_id: str, job_id: str, interval: float
+) -> Iterator[dict]:
+    """Yield flattened job snapshots until the job reaches a terminal status.
+
+    Follows the server's event stream, so every change arrives as it
+    happens. Falls back to polling every ``interval`` seconds when the
+    server has no stream endpoint or the stream ends early.
+    """
+    path = f"/creator/knowledgebases/kb/{kb_id}/ingestion-jobs/{job_id}"
+    try:
+        for event, data in client.stream_events(f"{path}/events"):
+            if event != "status":
+                continue
+            flat = _flatten_job(json.loads(data))
+            yield flat
+            if flat.get("status") in TERMINAL_STATUSES:
+                return
+    except (ApiError, NetworkError, NotFoundError):
+        pass
+
+    while True:
+        flat = _flatten_job(client.get(path))
+        yield flat
+        if flat.get("status") in TERMINAL_STATUSES:
+            return
+        time.sleep(interval)
+
+
 @app.command("list")
 def list_jobs(
     kb_id: str = typer.Argument(..., help="Knowledge base ID."),
@@ -124,7 +155,10 @@ def cancel_job(
 def watch_job(
     kb_id: str = typer.Argument(..., help="Knowledge base ID."),
     job_id: str = typer.Argument(..., help="Job ID."),
-    interval: float = typer.Option(3.0, "--interval", "-i", help="Poll interval in seconds."),
+    interval: float = typer.Option(
+        3.0, "--interval", "-i",
+        help="Poll interval in seconds, used only if the server cannot stream updates.",
+    ),
 ) -> None:
     """Watch an ingestion job with live progress updates."""
     is_tty = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
@@ -148,11 +182,7 @@ def watch_job(
         task = progress.add_task("Ingestion", total=100, status="pending")
 
         with Live(progress, refresh_per_second=2):
-            while True:
-                data = client.get(
-                    f"/creator/knowledgebases/kb/{kb_id}/ingestion-jobs/{job_id}"
-                )
-                flat = _flatten_job(data)
+            for flat in _follow_job(client, kb_id, job_id, interval):
                 job_status = flat.get("status", "unknown")
                 pct = flat.get("percentage", 0)
                 if not isinstance(pct, (int, float)):
@@ -161,10 +191,6 @@ def watch_job(
                 desc = filename if filename else "Ingestion"
                 progress.update(task, completed=pct, description=desc, status=job_status)
 
-                if job_status in TERMINAL_STATUSES:
-                    break
-                time.sleep(interval)
-
     if job_status == "completed":
         print_success(f"Job {job_id} completed.")
     elif job_status == "failed":
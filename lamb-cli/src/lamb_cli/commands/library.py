@@ -59,6 +59,13 @@ ITEM_DETAIL_FIELDS = [
     ("updated_at", "Updated"),
 ]
 
+SEARCH_RESULT_COLUMNS = [
+    ("item_id", "Item ID"),
+    ("title", "Title"),
+    ("page_number", "Page"),
+    ("snippet", "Snippet"),
+]
+
 PLUGIN_COLUMNS = [
     ("name", "Name"),
     ("description", "Description"),
@@ -254,6 +261,32 @@ def get_item(
     format_output(data, ITEM_LIST_COLUMNS, fmt, detail_fields=ITEM_DETAIL_FIELDS)
 
 
+@app.command("search")
+def search_library(
+    library_id: str = typer.Argument(..., help="Library ID."),
+    query: str = typer.Argument(..., help="Search text (all words must match; word* for prefixes)."),
+    limit: int = typer.Option(20, "--limit", help="Max results."),
+    offset: int = typer.Option(0, "--offset", help="Skip count."),
+    output: str = typer.Option(None, "-o", "--output", help="Output format: table, json, plain."),
+) -> None:
+    """Full-text search across the items of a library."""
+    fmt = output or get_output_format()
+    with get_client() as client:
+        data = client.get(
+            f"/creator/libraries/{library_id}/search",
+            params={"q": query, "limit": limit, "offset": offset},
+        )
+    results = data.get("results", []) if isinstance(data, dict) else data
+
+    # Snippets mark matches with <mark> tags; drop them for terminal display
+    if fmt != "json":
+        for r in results:
+            if isinstance(r.get("snippet"), str):
+                r["snippet"] = r["snippet"].replace("<mark>", "").replace("</mark>", "")
+
+    format_output(results, SEARCH_RESULT_COLUMNS, fmt)
+
+
 @app.command("delete-item")
 def delete_item(
     library_id: str = typer.Argument(..., help="Library ID."),
@@ -44,15 +44,16 @@ RUBRIC_DETAIL_FIELDS = [
 
 
 def _enrich_rubric(r: dict) -> dict:
-    """Add computed display fields from rubric_data."""
+    """Add computed display fields from rubric_data (or the list row columns)."""
     rd = r.get("rubric_data") or {}
     meta = rd.get("metadata") or {}
     criteria = rd.get("criteria") or []
-    r["_criteria_count"] = len(criteria)
-    r["_max_score"] = rd.get("maxScore", "")
+    # List rows come without rubric_data but carry the summary columns
+    r["_criteria_count"] = len(criteria) if rd else r.get("criteria_count", 0)
+    r["_max_score"] = rd.get("maxScore", "") if rd else r.get("max_score", "")
     r["_scoring_type"] = rd.get("scoringType", "")
-    r["_subject"] = meta.get("subject", "")
-    r["_grade_level"] = meta.get("gradeLevel", "")
+    r["_subject"] = meta.get("subject", r.get("subject", ""))
+    r["_grade_level"] = meta.get("gradeLevel", r.get("grade_level", ""))
     # Build criteria summary: "Name (weight%) | Name (weight%) | ..."
     parts = []
     for c in criteria:
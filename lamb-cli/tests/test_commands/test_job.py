@@ -220,6 +220,40 @@ class TestJobWatch:
         assert result.exit_code == 0
         assert "failed" in result.output
 
+    def test_follow_consumes_event_stream(self, httpx_mock, mock_token):
+        """Updates come from the SSE stream; no status polling is needed."""
+        from lamb_cli.client import get_client
+        from lamb_cli.commands.job import _follow_job
+
+        body = (
+            ": keep-alive\n\n"
+            f"event: status\ndata: {json.dumps(SAMPLE_JOB_PROCESSING)}\n\n"
+            f"event: status\ndata: {json.dumps(SAMPLE_JOB_COMPLETED)}\n\n"
+        )
+        httpx_mock.add_response(
+            content=body.encode(), headers={"content-type": "text/event-stream"},
+        )
+        with get_client() as client:
+            updates = list(_follow_job(client, "kb-1", "job-1", interval=0))
+        assert [u["status"] for u in updates] == ["processing", "completed"]
+        assert updates[0]["percentage"] == 45
+        (req,) = httpx_mock.get_requests()
+        assert req.url.path.endswith("/ingestion-jobs/job-1/events")
+
+    @patch("lamb_cli.commands.job.time.sleep")
+    def test_follow_falls_back_to_polling(self, mock_sleep, httpx_mock, mock_token):
+        """Servers without the stream endpoint are polled instead."""
+        from lamb_cli.client import get_client
+        from lamb_cli.commands.job import _follow_job
+
+        httpx_mock.add_response(status_code=404, json={"detail": "Not Found"})
+        httpx_mock.add_response(json=SAMPLE_JOB_PROCESSING)
+        httpx_mock.add_response(json=SAMPLE_JOB_COMPLETED)
+        with get_client() as client:
+            updates = list(_follow_job(client, "kb-1", "job-1", interval=0))
+        assert [u["status"] for u in updates] == ["processing", "completed"]
+        assert mock_sleep.call_count == 1
+
 
 class TestJobStatus:
     def test_status_table(self, httpx_mock, mock_token):
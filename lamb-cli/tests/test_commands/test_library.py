@@ -0,0 +1,46 @@
+"""Tests for library commands."""
+
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+from lamb_cli.main import app
+
+runner = CliRunner()
+
+SAMPLE_SEARCH = {
+    "query": "photosynthesis",
+    "total": 1,
+    "results": [
+        {
+            "item_id": "item-1",
+            "title": "Botany",
+            "page_number": 3,
+            "snippet": "<mark>Photosynthesis</mark> converts light",
+            "score": 1.7,
+            "permalink": "/docs/1/lib-1/item-1/content/pages/page_003.md",
+        },
+    ],
+}
+
+
+class TestLibrarySearch:
+    def test_search_table(self, httpx_mock, mock_token):
+        httpx_mock.add_response(json=SAMPLE_SEARCH)
+        result = runner.invoke(app, ["library", "search", "lib-1", "photosynthesis"])
+        assert result.exit_code == 0
+        assert "Botany" in result.output
+        assert "<mark>" not in result.output
+        req = httpx_mock.get_request()
+        assert req.url.path == "/creator/libraries/lib-1/search"
+        assert req.url.params["q"] == "photosynthesis"
+
+    def test_search_json_keeps_marks(self, httpx_mock, mock_token):
+        httpx_mock.add_response(json=SAMPLE_SEARCH)
+        result = runner.invoke(app, ["library", "search", "lib-1", "photo*", "-o", "json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data[0]["snippet"].startswith("<mark>")
+        assert data[0]["page_number"] == 3
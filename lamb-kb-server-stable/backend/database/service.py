@@ -123,6 +123,22 @@ class CollectionService:
             
         return collection_dict
     
+    @staticmethod
+    def get_collections_by_ids(db: Session, collection_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get several collections by ID in a single query.
+        
+        Args:
+            db: SQLAlchemy database session
+            collection_ids: IDs of the collections to retrieve
+            
+        Returns:
+            The Collections found, as dictionaries (missing IDs are skipped)
+        """
+        if not collection_ids:
+            return []
+        collections = db.query(Collection).filter(Collection.id.in_(collection_ids)).all()
+        return [col.to_dict() for col in collections]
+    
     @staticmethod
     def get_collection_by_name(db: Session, name: str) -> Optional[Collection]:
         """Get a collection by name.
@@ -0,0 +1,144 @@
+"""
+Image Descriptions - Parallel, cached LLM descriptions for ingestion plugins.
+
+Not an ingestion plugin itself; used by ``markitdown_plus_ingest`` when
+``image_descriptions`` is ``"llm"``.
+
+- Images that need a vision call are described concurrently, at most
+  ``IMAGE_DESCRIPTION_CONCURRENCY`` (default 4) at a time.
+- Successful descriptions are stored in a SQLite cache keyed by the SHA-256
+  of the image bytes and by the model and prompt used, so re-ingesting a
+  document (or another one sharing its figures) makes no vision calls for
+  images already described. Failures are never cached.
+
+The cache lives at ``IMAGE_DESCRIPTION_CACHE_PATH`` (default
+``data/image_descriptions.db``); set it to an empty string to disable it.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+IMAGE_DESCRIPTION_CONCURRENCY = int(os.getenv("IMAGE_DESCRIPTION_CONCURRENCY", "4"))
+IMAGE_DESCRIPTION_CACHE_PATH = os.getenv(
+    "IMAGE_DESCRIPTION_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent / "data" / "image_descriptions.db"),
+)
+
+
+class DescriptionCache:
+    """Thread-safe SQLite store of image descriptions."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS image_descriptions ("
+            " key TEXT PRIMARY KEY,"
+            " description TEXT NOT NULL,"
+            " created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM image_descriptions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, description: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO image_descriptions (key, description) VALUES (?, ?)",
+                (key, description),
+            )
+            self._conn.commit()
+
+
+_cache: Optional[DescriptionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[DescriptionCache]:
+    """Return the shared description cache, or None if it is disabled or unusable."""
+    global _cache
+    if not IMAGE_DESCRIPTION_CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = DescriptionCache(Path(IMAGE_DESCRIPTION_CACHE_PATH))
+            except sqlite3.Error as e:
+                logger.warning(f"[image_descriptions] Cache unavailable, continuing without it: {e}")
+                return None
+        return _cache
+
+
+def cache_key(image: bytes, model: str, prompt: str) -> str:
+    """Cache key for an image described with a given model and prompt."""
+    variant = hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()[:16]
+    return f"{hashlib.sha256(image).hexdigest()}:{variant}"
+
+
+def describe_images(images: List[bytes],
+                    describe: Callable[[int], Optional[str]],
+                    model: str,
+                    prompt: str,
+                    cache: Optional[DescriptionCache] = None,
+                    max_workers: int = IMAGE_DESCRIPTION_CONCURRENCY) -> Tuple[List[Optional[str]], int]:
+    """
+    Describe a batch of images, calling ``describe`` only for unseen content.
+
+    Args:
+        images: Raw image bytes (used for the cache keys)
+        describe: Called from worker threads with an index into ``images``;
+                  returns the description, or None if generation failed
+        model: Model name (part of the cache key)
+        prompt: Prompt text (part of the cache key)
+        cache: Description cache, or None to disable caching
+        max_workers: Maximum number of concurrent ``describe`` calls
+
+    Returns:
+        Tuple of (descriptions aligned with ``images``, None where generation
+        failed; number of images served from the cache or from an identical
+        image in the same batch)
+    """
+    keys = [cache_key(image, model, prompt) for image in images]
+    results: List[Optional[str]] = [None] * len(images)
+    first_seen: Dict[str, int] = {}
+    pending: List[int] = []
+    for index, key in enumerate(keys):
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[index] = cached
+        elif key not in first_seen:
+            first_seen[key] = index
+            pending.append(index)
+
+    if pending:
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="describe") as pool:
+            for index, description in zip(pending, pool.map(describe, pending)):
+                results[index] = description
+                if description is not None and cache is not None:
+                    cache.put(keys[index], description)
+
+    # Identical images later in the batch reuse the first one's description
+    for index, key in enumerate(keys):
+        if results[index] is None and first_seen.get(key, index) != index:
+            results[index] = results[first_seen[key]]
+
+    described = set(pending)
+    reused = sum(1 for index, result in enumerate(results)
+                 if result is not None and index not in described)
+    return results, reused
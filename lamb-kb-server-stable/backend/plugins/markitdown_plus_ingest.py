@@ -25,6 +25,7 @@ import uuid
 import base64
 import shutil
 import logging
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -39,6 +40,7 @@ from langchain_text_splitters import (
 )
 from markitdown import MarkItDown
 from .base import IngestPlugin, PluginRegistry
+from .image_descriptions import describe_images, get_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -55,6 +57,15 @@ except ImportError:
 # URL prefix for static files
 STATIC_URL_PREFIX = os.getenv("HOME_URL", "http://localhost:9090") + "/static"
 
+# Vision model and prompt for LLM image descriptions (both part of the cache key)
+VISION_MODEL = "gpt-4o-mini"
+VISION_PROMPT = "Describe this image in one concise sentence. Be factual and descriptive."
+
+# Stands in for an image description in the markdown until the batch of
+# descriptions for the document has been generated
+_DESCRIPTION_PLACEHOLDER = "\x00IMGDESC{}\x00"
+_DESCRIPTION_PLACEHOLDER_RE = re.compile(r"\x00IMGDESC(\d+)\x00")
+
 
 class ProcessingStatsTracker:
     """Helper class to track detailed processing statistics during ingestion.
@@ -68,6 +79,7 @@ class ProcessingStatsTracker:
         self.content_length = 0
         self.images_extracted = 0
         self.images_with_llm_descriptions = 0
+        self.images_from_description_cache = 0
         self.llm_calls: List[Dict[str, Any]] = []
         self.total_llm_duration_ms = 0
         self.chunking_strategy: Optional[str] = None
@@ -81,6 +93,8 @@ class ProcessingStatsTracker:
         self.markdown_preview: Optional[str] = None
         self._stage_start: Optional[float] = None
         self._current_stage: Optional[str] = None
+        # LLM calls are recorded from parallel description threads
+        self._llm_lock = threading.Lock()
     
     def start_stage(self, stage_name: str):
         """Start timing a processing stage."""
@@ -115,10 +129,11 @@ class ProcessingStatsTracker:
         if error:
             call_detail["error"] = error
         
-        self.llm_calls.append(call_detail)
-        self.total_llm_duration_ms += duration_ms
-        if success:
-            self.images_with_llm_descriptions += 1
+        with self._llm_lock:
+            self.llm_calls.append(call_detail)
+            self.total_llm_duration_ms += duration_ms
+            if success:
+                self.images_with_llm_descriptions += 1
     
     def calculate_chunk_stats(self, chunks: List[str]):
         """Calculate statistics about the chunks."""
@@ -152,6 +167,7 @@ class ProcessingStatsTracker:
             "content_length": self.content_length,
             "images_extracted": self.images_extracted,
             "images_with_llm_descriptions": self.images_with_llm_descriptions,
+            "images_from_description_cache": self.images_from_description_cache,
             "llm_calls": self.llm_calls,
             "total_llm_duration_ms": self.total_llm_duration_ms,
             "chunking_strategy": self.chunking_strategy,
@@ -449,7 +465,9 @@ class MarkItDownPlusPlugin(IngestPlugin):
         
         markdown_parts = []
         total_images = 0
-        llm_calls_made = 0
+        # (image path, alt text) of every saved image; descriptions are
+        # generated for all of them at once after the page loop
+        pending_images: List[Tuple[Path, str]] = []
         
         for page_num in range(num_pages):
             page = doc[page_num]
@@ -512,21 +530,12 @@ class MarkItDownPlusPlugin(IngestPlugin):
                                     except:
                                         pass
                         
-                        # Generate description
-                        if image_mode == "llm" and openai_client:
-                            self.report_progress(kwargs, 1, 5, f"🤖 LLM describing image {total_images}: {img_filename}")
-                            llm_calls_made += 1
-                        
-                        description = self._generate_image_description(
-                            img_path, 
-                            f"Image from page {page_num + 1}",
-                            openai_client, 
-                            image_mode,
-                            stats_tracker
-                        )
+                        # Description is filled in once all images are extracted
+                        placeholder = _DESCRIPTION_PLACEHOLDER.format(len(pending_images))
+                        pending_images.append((img_path, f"Image from page {page_num + 1}"))
                         
                         img_url = f"{images_url_prefix}/{img_filename}"
-                        page_images.append(f"![{description}]({img_url})")
+                        page_images.append(f"![{placeholder}]({img_url})")
                         
                     except Exception as e:
                         logger.warning(f"[markitdown_plus] Failed to extract image {xref} from page {page_num + 1}: {e}")
@@ -555,10 +564,20 @@ class MarkItDownPlusPlugin(IngestPlugin):
         
         doc.close()
         
+        markdown_content = "\n".join(markdown_parts)
+        
+        # Generate all image descriptions (concurrently in LLM mode)
+        descriptions = self._describe_images(
+            pending_images, openai_client, image_mode, stats_tracker, kwargs
+        )
+        markdown_content = _DESCRIPTION_PLACEHOLDER_RE.sub(
+            lambda m: descriptions[int(m.group(1))], markdown_content
+        )
+        
         # Final progress report
         summary = f"📊 PDF extracted: {num_pages} pages, {total_images} images"
-        if llm_calls_made > 0:
-            summary += f", {llm_calls_made} LLM calls"
+        if stats_tracker and stats_tracker.llm_calls:
+            summary += f", {len(stats_tracker.llm_calls)} LLM calls"
         logger.info(f"[markitdown_plus] {summary}")
         print(f"INFO: [markitdown_plus] {summary}")
         self.report_progress(kwargs, 1, 5, summary)
@@ -567,7 +586,6 @@ class MarkItDownPlusPlugin(IngestPlugin):
         if stats_tracker:
             stats_tracker.images_extracted = total_images
         
-        markdown_content = "\n".join(markdown_parts)
         logger.info(f"[markitdown_plus] PDF extraction complete: {len(markdown_content)} chars, {total_images} images")
         
         return markdown_content, total_images
@@ -607,68 +625,134 @@ class MarkItDownPlusPlugin(IngestPlugin):
         
         # LLM mode: use OpenAI Vision
         if mode == "llm" and openai_client:
-            start_time = time.time()
-            img_filename = image_path.name
-            
-            try:
-                with open(image_path, 'rb') as f:
-                    image_data = base64.b64encode(f.read()).decode('utf-8')
-                
-                ext = image_path.suffix.lower()
-                media_types = {
-                    '.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg',
-                    '.gif': 'image/gif', '.webp': 'image/webp',
-                }
-                media_type = media_types.get(ext, 'image/png')
-                
-                response = openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": "Describe this image in one concise sentence. Be factual and descriptive."},
-                            {"type": "image_url", "image_url": {"url": f"data:{media_type};base64,{image_data}", "detail": "low"}}
-                        ]
-                    }],
-                    max_tokens=100
-                )
-                
-                description = response.choices[0].message.content.strip()
-                duration_ms = int((time.time() - start_time) * 1000)
-                
-                # Record LLM call in stats tracker
-                if stats_tracker:
-                    # Try to get token usage from response
-                    tokens_used = None
-                    if hasattr(response, 'usage') and response.usage:
-                        tokens_used = response.usage.total_tokens
-                    stats_tracker.record_llm_call(
-                        image=img_filename,
-                        duration_ms=duration_ms,
-                        success=True,
-                        tokens_used=tokens_used
-                    )
-                
-                logger.info(f"[markitdown_plus] LLM description ({duration_ms}ms): {description[:50]}...")
+            description = self._llm_image_description(
+                image_path, image_path.read_bytes(), openai_client, stats_tracker
+            )
+            if description is not None:
                 return description
-                
-            except Exception as e:
-                duration_ms = int((time.time() - start_time) * 1000)
-                
-                # Record failed LLM call
-                if stats_tracker:
-                    stats_tracker.record_llm_call(
-                        image=img_filename,
-                        duration_ms=duration_ms,
-                        success=False,
-                        error=str(e)[:100]
-                    )
-                
-                logger.warning(f"[markitdown_plus] LLM description failed: {e}")
-                return self._generate_image_description(image_path, alt_text, None, "basic", stats_tracker)
+            return self._generate_image_description(image_path, alt_text, None, "basic", stats_tracker)
         
         return alt_text or "Image from document"
     
+    def _llm_image_description(self, image_path: Path, image_bytes: bytes,
+                                openai_client: Any,
+                                stats_tracker: Optional[ProcessingStatsTracker] = None) -> Optional[str]:
+        """Describe one image with OpenAI Vision.
+        
+        Safe to call from several threads at once.
+        
+        Returns:
+            The description, or None if the call failed
+        """
+        start_time = time.time()
+        img_filename = image_path.name
+        
+        try:
+            image_data = base64.b64encode(image_bytes).decode('utf-8')
+            
+            ext = image_path.suffix.lower()
+            media_types = {
+                '.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg',
+                '.gif': 'image/gif', '.webp': 'image/webp',
+            }
+            media_type = media_types.get(ext, 'image/png')
+            
+            response = openai_client.chat.completions.create(
+                model=VISION_MODEL,
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": VISION_PROMPT},
+                        {"type": "image_url", "image_url": {"url": f"data:{media_type};base64,{image_data}", "detail": "low"}}
+                    ]
+                }],
+                max_tokens=100
+            )
+            
+            description = response.choices[0].message.content.strip()
+            duration_ms = int((time.time() - start_time) * 1000)
+            
+            # Record LLM call in stats tracker
+            if stats_tracker:
+                # Try to get token usage from response
+                tokens_used = None
+                if hasattr(response, 'usage') and response.usage:
+                    tokens_used = response.usage.total_tokens
+                stats_tracker.record_llm_call(
+                    image=img_filename,
+                    duration_ms=duration_ms,
+                    success=True,
+                    tokens_used=tokens_used
+                )
+            
+            logger.info(f"[markitdown_plus] LLM description ({duration_ms}ms): {description[:50]}...")
+            return description
+            
+        except Exception as e:
+            duration_ms = int((time.time() - start_time) * 1000)
+            
+            # Record failed LLM call
+            if stats_tracker:
+                stats_tracker.record_llm_call(
+                    image=img_filename,
+                    duration_ms=duration_ms,
+                    success=False,
+                    error=str(e)[:100]
+                )
+            
+            logger.warning(f"[markitdown_plus] LLM description failed: {e}")
+            return None
+    
+    def _describe_images(self, images: List[Tuple[Path, str]],
+                         openai_client: Optional[Any] = None,
+                         mode: str = "basic",
+                         stats_tracker: Optional[ProcessingStatsTracker] = None,
+                         kwargs: Optional[Dict] = None) -> List[str]:
+        """Generate descriptions for all images of a document.
+        
+        In LLM mode the vision calls run concurrently and go through the
+        shared description cache (see ``image_descriptions``); images whose
+        call fails get a basic description.
+        
+        Args:
+            images: (saved image path, original alt text) pairs
+            openai_client: OpenAI client for LLM descriptions
+            mode: "none", "basic", or "llm"
+            stats_tracker: Optional tracker for recording statistics
+            kwargs: Original kwargs for progress reporting
+            
+        Returns:
+            One description per image, in order
+        """
+        if mode != "llm" or not openai_client or not images:
+            return [
+                self._generate_image_description(path, alt_text, openai_client, mode, stats_tracker)
+                for path, alt_text in images
+            ]
+        
+        self.report_progress(kwargs or {}, 1, 5, f"🤖 LLM describing {len(images)} images...")
+        image_bytes = [path.read_bytes() for path, _ in images]
+        
+        def describe(index: int) -> Optional[str]:
+            return self._llm_image_description(
+                images[index][0], image_bytes[index], openai_client, stats_tracker
+            )
+        
+        descriptions, reused = describe_images(
+            image_bytes, describe, model=VISION_MODEL, prompt=VISION_PROMPT, cache=get_cache()
+        )
+        if stats_tracker:
+            stats_tracker.images_from_description_cache += reused
+            stats_tracker.images_with_llm_descriptions += reused
+        if reused:
+            logger.info(f"[markitdown_plus] {reused}/{len(images)} image descriptions reused from cache")
+        
+        return [
+            description if description is not None
+            else self._generate_image_description(path, alt_text, None, "basic", stats_tracker)
+            for (path, alt_text), description in zip(images, descriptions)
+        ]
+    
     def _extract_and_process_images(self, content: str, file_path: Path, 
                                      owner: str, collection_name: str,
                                      mode: str = "none",
@@ -693,6 +777,8 @@ class MarkItDownPlusPlugin(IngestPlugin):
         
         images_dir, images_url_prefix = self._create_images_directory(file_path, owner, collection_name)
         image_count = 0
+        # (image path, alt text) of every saved image, described after both passes
+        pending_images: List[Tuple[Path, str]] = []
         
         def replace_base64_image(match):
             nonlocal image_count
@@ -710,12 +796,11 @@ class MarkItDownPlusPlugin(IngestPlugin):
                 
                 logger.info(f"[markitdown_plus] Saved image: {img_path} ({len(decoded_data)} bytes)")
                 
-                description = self._generate_image_description(
-                    img_path, alt_text, openai_client, mode, stats_tracker
-                )
+                placeholder = _DESCRIPTION_PLACEHOLDER.format(len(pending_images))
+                pending_images.append((img_path, alt_text))
                 img_url = f"{images_url_prefix}/{img_filename}"
                 
-                return f"![{description}]({img_url})"
+                return f"![{placeholder}]({img_url})"
             except Exception as e:
                 logger.warning(f"[markitdown_plus] Failed to save image: {e}")
                 return match.group(0)
@@ -751,12 +836,11 @@ class MarkItDownPlusPlugin(IngestPlugin):
                 
                 shutil.copy2(source_path, img_path)
                 
-                description = self._generate_image_description(
-                    img_path, alt_text, openai_client, mode, stats_tracker
-                )
+                placeholder = _DESCRIPTION_PLACEHOLDER.format(len(pending_images))
+                pending_images.append((img_path, alt_text))
                 img_url = f"{images_url_prefix}/{img_filename}"
                 
-                return f"![{description}]({img_url})"
+                return f"![{placeholder}]({img_url})"
             except Exception as e:
                 logger.warning(f"[markitdown_plus] Failed to process image {img_src}: {e}")
                 return match.group(0)
@@ -764,6 +848,9 @@ class MarkItDownPlusPlugin(IngestPlugin):
         simple_image_pattern = r'!\[([^\]]*)\]\((?!data:)([^)]+)\)'
         content = re.sub(simple_image_pattern, replace_image_ref, content)
         
+        descriptions = self._describe_images(pending_images, openai_client, mode, stats_tracker)
+        content = _DESCRIPTION_PLACEHOLDER_RE.sub(lambda m: descriptions[int(m.group(1))], content)
+        
         logger.info(f"[markitdown_plus] Extracted {image_count} images")
         return content, image_count, images_url_prefix
     
@@ -6,6 +6,7 @@ from datetime import datetime
 from threading import Semaphore, Thread
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from fastapi import APIRouter, Depends, HTTPException, status, Query, File, Form, UploadFile, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 import json # Needed for ingest-file params
 from typing import List, Dict, Any # Needed for background tasks and helper
@@ -22,6 +23,8 @@ from schemas.collection import (
     CollectionResponse,
     CollectionList,
     CollectionCreateResponse,
+    CollectionBatchRequest,
+    CollectionBatchResponse,
     EmbeddingsModel,
     BulkUpdateEmbeddingsRequest,
     BulkUpdateEmbeddingsResponse
@@ -837,6 +840,45 @@ async def bulk_update_embeddings_apikey(
     return result
 
 
+# Get several collections by ID
+@router.post(
+    "/batch",
+    response_model=CollectionBatchResponse,
+    summary="Get collections by ID",
+    description="""Get details of several knowledge base collections in one call.
+    
+    IDs that do not exist are returned in `missing` instead of failing the request.
+    
+    Example:
+    ```bash
+    curl -X POST 'http://localhost:9090/collections/batch' \
+      -H 'Authorization: Bearer 0p3n-w3bu!' \
+      -H 'Content-Type: application/json' \
+      -d '{"ids": [1, 2, 3]}'
+    ```
+    """,
+    tags=["Collections"],
+    responses={
+        200: {"description": "Collections found and missing IDs"},
+        401: {"description": "Unauthorized - Invalid or missing authentication token"}
+    }
+)
+async def get_collections_batch(
+    request: CollectionBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """Get details of several knowledge base collections.
+    
+    Args:
+        request: Request body with the collection IDs
+        db: Database session
+        
+    Returns:
+        Found collections and the IDs that were not found
+    """
+    return CollectionsService.get_collections_batch(request.ids, db)
+
+
 # Get a specific collection
 @router.get(
     "/{collection_id}",
@@ -1184,8 +1226,9 @@ async def ingest_file_to_collection(
         )
     
     try:
-        # Step 1: Upload file (this step remains synchronous)
-        file_info = IngestionService.save_uploaded_file(
+        # Step 1: Upload file (chunked copy to disk, off the event loop)
+        file_info = await run_in_threadpool(
+            IngestionService.save_uploaded_file,
             file=file,
             owner=collection["owner"] if isinstance(collection, dict) else collection.owner,
             collection_name=collection_name
@@ -4,6 +4,7 @@ Ingestion Status Router - Endpoints for tracking ingestion job status.
 This module provides endpoints for:
 - Listing ingestion jobs for a collection
 - Getting detailed status of a specific job
+- Streaming a job's status changes as server-sent events
 - Getting summary statistics
 - Retrying failed jobs
 - Cancelling processing jobs
@@ -11,13 +12,15 @@ This module provides endpoints for:
 All endpoints are nested under /collections/{collection_id}/ingestion-jobs
 """
 
+import asyncio
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, asc
 
-from database.connection import get_db
+from database.connection import get_db, SessionLocal
 from database.models import Collection, FileRegistry, FileStatus
 from database.service import CollectionService
 from schemas.files import (
@@ -31,6 +34,7 @@ from schemas.files import (
     ProcessingStats
 )
 from services.ingestion import IngestionService
+from services import job_events
 from dependencies import verify_token
 
 
@@ -268,7 +272,8 @@ async def list_ingestion_jobs(
     ```
     
     **Polling Recommendation:**
-    - Poll every 1-2 seconds for active jobs
+    - Prefer the `/events` stream below, which pushes every change
+    - Otherwise poll every 1-2 seconds for active jobs
     - Stop polling when status is 'completed', 'failed', or 'cancelled'
     """,
     responses={
@@ -302,6 +307,107 @@ async def get_ingestion_job(
     return _file_registry_to_job_response(job, collection.name)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# STREAM JOB STATUS (SERVER-SENT EVENTS)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Statuses after which a job no longer changes and the stream closes.
+_TERMINAL_JOB_STATUSES = {
+    IngestionStatus.COMPLETED,
+    IngestionStatus.FAILED,
+    IngestionStatus.CANCELLED,
+    IngestionStatus.DELETED,
+}
+
+# Changes are pushed in-process; the row is still re-read when idle for this
+# long (covers writers outside this process) and doubles as a keep-alive.
+EVENTS_RECHECK_SECONDS = 15.0
+
+
+async def _iter_job_events(collection_id: int, job_id: int, collection_name: str):
+    """Yield SSE frames for a job until it reaches a terminal status."""
+    changed = job_events.subscribe(job_id)
+    last = None
+    try:
+        while True:
+            # Clear before reading so a change during the read is not lost.
+            changed.clear()
+            db = SessionLocal()
+            try:
+                job = db.query(FileRegistry).filter(
+                    FileRegistry.id == job_id,
+                    FileRegistry.collection_id == collection_id
+                ).first()
+                current = _file_registry_to_job_response(job, collection_name) if job else None
+            finally:
+                db.close()
+
+            if current is None:
+                return
+            payload = current.model_dump_json()
+            if payload != last:
+                yield f"event: status\ndata: {payload}\n\n"
+                last = payload
+            if current.status in _TERMINAL_JOB_STATUSES:
+                return
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=EVENTS_RECHECK_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+    finally:
+        job_events.unsubscribe(job_id, changed)
+
+
+@router.get(
+    "/{collection_id}/ingestion-jobs/{job_id}/events",
+    summary="Stream ingestion job status",
+    description="""
+    Stream status changes of an ingestion job as server-sent events.
+    
+    Sends a `status` event (same body as the job endpoint) immediately and
+    whenever status or progress changes, then closes the stream once the
+    job is 'completed', 'failed', 'cancelled' or 'deleted'.
+    
+    **Example:**
+    ```bash
+    curl -N 'http://localhost:9090/collections/1/ingestion-jobs/5/events' \\
+      -H 'Authorization: Bearer 0p3n-w3bu!'
+    ```
+    """,
+    responses={
+        200: {"description": "text/event-stream of job status events"},
+        404: {"description": "Collection or job not found"},
+        401: {"description": "Unauthorized"}
+    }
+)
+async def stream_ingestion_job(
+    collection_id: int,
+    job_id: int,
+    db: Session = Depends(get_db)
+):
+    """Stream status changes of a specific ingestion job."""
+    
+    collection = _get_collection_or_404(db, collection_id)
+    
+    job = db.query(FileRegistry).filter(
+        FileRegistry.id == job_id,
+        FileRegistry.collection_id == collection_id
+    ).first()
+    
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Ingestion job {job_id} not found in collection {collection_id}"
+        )
+    
+    return StreamingResponse(
+        _iter_job_events(collection_id, job_id, collection.name),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # GET STATUS SUMMARY
 # ═══════════════════════════════════════════════════════════════════════════════
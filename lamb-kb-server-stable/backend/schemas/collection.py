@@ -71,6 +71,17 @@ class CollectionList(BaseModel):
     items: List[CollectionResponse] = Field(..., description="List of collections")
 
 
+class CollectionBatchRequest(BaseModel):
+    """Schema for fetching several collections by ID in one request."""
+    ids: List[int] = Field(..., max_length=500, description="Collection IDs to retrieve")
+
+
+class CollectionBatchResponse(BaseModel):
+    """Schema for the batch collection lookup response (SAFE - no API keys exposed)."""
+    items: List[CollectionResponse] = Field(..., description="Collections found, in request order")
+    missing: List[int] = Field(default_factory=list, description="Requested IDs that do not exist")
+
+
 # Schema for the response when creating a collection (just the ID)
 class CollectionCreateResponse(BaseModel):
     """Response schema when creating a collection, returning only the ID."""
@@ -549,6 +549,30 @@ class CollectionsService:
         # SECURITY: Sanitize response to remove API keys before returning
         return CollectionsService._sanitize_collection(collection)
     
+    @staticmethod
+    def get_collections_batch(
+        collection_ids: List[int],
+        db: Session
+    ) -> Dict[str, Any]:
+        """Get details of several knowledge base collections in one call.
+        
+        Args:
+            collection_ids: IDs of the collections to retrieve
+            db: Database session
+            
+        Returns:
+            Dict with the found collections (sanitized - no API keys), in request
+            order, and the list of IDs that do not exist
+        """
+        unique_ids = list(dict.fromkeys(collection_ids))
+        found = {
+            c["id"]: c for c in DBCollectionService.get_collections_by_ids(db, unique_ids)
+        }
+        return {
+            "items": [CollectionsService._sanitize_collection(found[cid]) for cid in unique_ids if cid in found],
+            "missing": [cid for cid in unique_ids if cid not in found]
+        }
+    
     @staticmethod
     def list_files(
         collection_id: int,
@@ -22,6 +22,9 @@ from database.models import Collection, FileRegistry, FileStatus
 from database.service import CollectionService
 from plugins.base import PluginRegistry, IngestPlugin
 
+# Chunk size used when copying uploads to disk (uploads are never read whole)
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class IngestionService:
     """Service for ingesting documents into collections."""
@@ -98,13 +101,11 @@ class IngestionService:
         try:
             # Save the file
             print(f"DEBUG: [save_uploaded_file] Starting file copy operation")
+            file.file.seek(0)
             with open(file_path, "wb") as f:
-                # Read in chunks to avoid memory issues with large files
-                print(f"DEBUG: [save_uploaded_file] Reading file content")
-                content = file.file.read()
-                print(f"DEBUG: [save_uploaded_file] File content read, size: {len(content)} bytes")
-                f.write(content)
-            print(f"DEBUG: [save_uploaded_file] File saved successfully")
+                # Copy in chunks to avoid memory issues with large files
+                shutil.copyfileobj(file.file, f, length=UPLOAD_COPY_CHUNK_SIZE)
+            print(f"DEBUG: [save_uploaded_file] File saved successfully, size: {file_path.stat().st_size} bytes")
             
             # Create URL path for the file
             relative_path = file_path.relative_to(cls.STATIC_DIR)
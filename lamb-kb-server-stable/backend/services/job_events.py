@@ -0,0 +1,86 @@
+"""
+Job Events - In-process notifications for ingestion job changes.
+
+Every committed change to a ``FileRegistry`` row (status, progress, errors)
+wakes the subscribers of that job, so the ingestion job event stream
+(``GET /collections/{id}/ingestion-jobs/{job_id}/events``) can push updates
+instead of having clients poll the job endpoint.
+
+Changes are collected with SQLAlchemy session events on ``SessionLocal``,
+so the background ingestion tasks need no explicit notify calls. Ingestion
+runs in worker threads, hence subscribers are woken via
+``loop.call_soon_threadsafe``.
+"""
+
+import asyncio
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event
+
+from database.connection import SessionLocal
+from database.models import FileRegistry
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_subscribers: Dict[int, Set[asyncio.Event]] = {}
+
+_PENDING_KEY = "changed_ingestion_jobs"
+
+
+def subscribe(job_id: int) -> asyncio.Event:
+    """
+    Register interest in a job. The returned event is set on every change.
+
+    Must be called from the event loop; pair with ``unsubscribe``.
+    """
+    global _loop
+    _loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    _subscribers.setdefault(job_id, set()).add(changed)
+    return changed
+
+
+def unsubscribe(job_id: int, changed: asyncio.Event) -> None:
+    """Drop a subscription created by ``subscribe``."""
+    waiters = _subscribers.get(job_id)
+    if waiters is None:
+        return
+    waiters.discard(changed)
+    if not waiters:
+        del _subscribers[job_id]
+
+
+def publish(job_id: int) -> None:
+    """Wake every subscriber of a job (safe to call from any thread)."""
+    loop = _loop
+    if loop is None or job_id not in _subscribers or loop.is_closed():
+        return
+    loop.call_soon_threadsafe(_wake, job_id)
+
+
+def _wake(job_id: int) -> None:
+    for changed in _subscribers.get(job_id, ()):
+        changed.set()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SESSION HOOKS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_changed_jobs(session, flush_context):
+    """Remember which jobs were written; they are published on commit."""
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, FileRegistry) and obj.id is not None:
+            session.info.setdefault(_PENDING_KEY, set()).add(obj.id)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_changed_jobs(session):
+    for job_id in session.info.pop(_PENDING_KEY, ()):
+        publish(job_id)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_changed_jobs(session):
+    session.info.pop(_PENDING_KEY, None)
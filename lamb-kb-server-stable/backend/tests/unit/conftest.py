@@ -0,0 +1,13 @@
+"""
+Pytest configuration for lamb-kb-server unit tests.
+
+Unlike the e2e suite these run in-process and need no server; they import
+backend modules directly.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
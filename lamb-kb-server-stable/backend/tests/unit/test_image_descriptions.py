@@ -0,0 +1,76 @@
+"""
+Tests for concurrent, cached LLM image descriptions.
+
+Mirrors library-manager's tests for its copy of the module so the two
+implementations cannot drift apart unnoticed.
+"""
+
+import threading
+import time
+
+from plugins.image_descriptions import DescriptionCache, describe_images
+
+
+def test_descriptions_run_concurrently_and_are_cached(tmp_path):
+    """Unseen images are described in parallel; repeats and re-runs hit the cache."""
+    cache = DescriptionCache(tmp_path / "descriptions.db")
+    images = [b"image-a", b"image-b", b"image-a", b"image-c"]
+    calls = []
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def describe(index):
+        nonlocal in_flight, peak
+        with lock:
+            calls.append(index)
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return f"described {images[index].decode()}"
+
+    results, served = describe_images(
+        images, describe, model="m", prompt="p", cache=cache, max_workers=4,
+    )
+    assert results == [
+        "described image-a", "described image-b", "described image-a", "described image-c",
+    ]
+    assert sorted(calls) == [0, 1, 3]
+    assert served == 1
+    assert peak > 1
+
+    calls.clear()
+    results, served = describe_images(images, describe, model="m", prompt="p", cache=cache)
+    assert calls == []
+    assert served == 4
+
+    # A different prompt is a different cache entry
+    describe_images(images[:1], describe, model="m", prompt="other", cache=cache)
+    assert calls == [0]
+
+
+def test_one_failed_image_is_retried_and_the_rest_are_cached(tmp_path):
+    """A ``None`` result stays None, is not cached, and does not affect its siblings."""
+    cache = DescriptionCache(tmp_path / "descriptions.db")
+    images = [b"good-1", b"broken", b"good-2"]
+    calls = []
+
+    def flaky(index):
+        calls.append(index)
+        return None if images[index] == b"broken" else f"described {images[index].decode()}"
+
+    results, served = describe_images(images, flaky, model="m", prompt="p", cache=cache)
+    assert results == ["described good-1", None, "described good-2"]
+    assert served == 0
+
+    def recovered(index):
+        calls.append(index)
+        return "recovered"
+
+    calls.clear()
+    results, served = describe_images(images, recovered, model="m", prompt="p", cache=cache)
+    assert calls == [1]
+    assert results == ["described good-1", "recovered", "described good-2"]
+    assert served == 2
@@ -21,10 +21,39 @@ LAMB_API_TOKEN: str = os.getenv("LAMB_API_TOKEN", "")
 DATA_DIR: Path = Path(os.getenv("DATA_DIR", "data"))
 CONTENT_DIR: Path = DATA_DIR / "content"
 DB_PATH: Path = DATA_DIR / "library-manager.db"
+# Content-addressed store (sha256 -> file) for originals and extracted images.
+# Item directories hold hardlinks into it, so this must be on the same
+# filesystem as CONTENT_DIR for deduplication to save space.
+BLOB_DIR: Path = DATA_DIR / "blobs"
 
 # --- Task processing ---
 MAX_CONCURRENT_IMPORTS: int = int(os.getenv("MAX_CONCURRENT_IMPORTS", "3"))
 IMPORT_TASK_TIMEOUT_SECONDS: int = int(os.getenv("IMPORT_TASK_TIMEOUT_SECONDS", "600"))
+# "embedded": the API process also runs the import worker (default).
+# "external": the API only queues jobs; run one or more ``python worker_main.py``
+# processes against the same DATA_DIR to process them.
+WORKER_MODE: str = os.getenv("WORKER_MODE", "embedded").lower()
+# Seconds a claimed job stays owned by a worker without a heartbeat. Workers
+# renew the lease every third of this; expired jobs are retried elsewhere.
+JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+WORKER_POLL_INTERVAL: float = float(os.getenv("WORKER_POLL_INTERVAL", "2"))
+# URL external workers use to collect a job's API keys from the API process,
+# which is the only place keys are held (in memory, never in the database).
+API_INTERNAL_URL: str = os.getenv("API_INTERNAL_URL", f"http://127.0.0.1:{PORT}")
+# Reuse the structured output of an earlier import of the same file with the
+# same plugin and parameters instead of re-running the plugin.
+REUSE_IMPORT_RESULTS: bool = os.getenv("REUSE_IMPORT_RESULTS", "true").lower() in (
+    "1", "true", "yes",
+)
+
+# --- Image descriptions (markitdown_plus_import) ---
+# Maximum vision calls in flight per import when image_descriptions=llm.
+IMAGE_DESCRIPTION_CONCURRENCY: int = int(os.getenv("IMAGE_DESCRIPTION_CONCURRENCY", "4"))
+# SQLite cache of generated descriptions keyed by image hash, model and
+# prompt. Set to an empty string to disable caching.
+IMAGE_DESCRIPTION_CACHE_PATH: str = os.getenv(
+    "IMAGE_DESCRIPTION_CACHE_PATH", str(DATA_DIR / "image-descriptions.db")
+)
 
 # --- Plugin governance ---
 # PLUGIN_<NAME>=DISABLE|SIMPLIFIED|ADVANCED  (default: ADVANCED)
@@ -48,3 +77,4 @@ def ensure_directories() -> None:
     """Create required directories if they do not exist."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+    BLOB_DIR.mkdir(parents=True, exist_ok=True)
@@ -25,28 +25,65 @@ def _enable_sqlite_wal(dbapi_conn, _connection_record) -> None:  # noqa: ANN001
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA foreign_keys=ON")
+    # Worker processes share the database; wait for writers instead of
+    # failing immediately with "database is locked".
+    cursor.execute("PRAGMA busy_timeout=5000")
     cursor.close()
 
 
 _lock_file = None
 
 
-def init_db() -> None:
+def init_db(exclusive: bool = True) -> None:
     """Create the engine, enable SQLite optimizations, and create all tables.
 
-    Acquires an exclusive file lock on the database to prevent two instances
-    from running against the same data directory simultaneously.
+    Acquires an exclusive file lock on the database to prevent two API
+    instances from running against the same data directory simultaneously.
+    Standalone import workers (``worker_main.py``) pass ``exclusive=False``:
+    any number of them may share the data directory with the API, since jobs
+    are claimed atomically under a lease.
 
     Safe to call multiple times — tables are created only if they do not
     already exist (``CREATE TABLE IF NOT EXISTS``).
 
+    Args:
+        exclusive: Take the single-instance lock (API process).
+
     Raises:
         RuntimeError: If another instance holds the lock.
     """
-    global _engine, _SessionLocal, _lock_file
+    global _engine, _SessionLocal
 
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+    if exclusive:
+        _acquire_instance_lock()
+
+    _engine = create_engine(
+        f"sqlite:///{DB_PATH}",
+        pool_pre_ping=True,
+        connect_args={"check_same_thread": False},
+    )
+
+    event.listen(_engine, "connect", _enable_sqlite_wal)
+
+    Base.metadata.create_all(bind=_engine)
+    _add_missing_columns(_engine)
+    _create_search_index(_engine)
+
+    _SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False)
+
+    logger.info("Database initialized at %s", DB_PATH)
+
+
+def _acquire_instance_lock() -> None:
+    """Take the exclusive per-data-directory lock (held for the process lifetime).
+
+    Raises:
+        RuntimeError: If another instance holds the lock.
+    """
+    global _lock_file
+
     import fcntl  # noqa: PLC0415
 
     lock_path = DB_PATH.parent / ".lock"
@@ -59,19 +96,44 @@ def init_db() -> None:
             "Only one instance may run per data directory."
         ) from exc
 
-    _engine = create_engine(
-        f"sqlite:///{DB_PATH}",
-        pool_pre_ping=True,
-        connect_args={"check_same_thread": False},
-    )
 
-    event.listen(_engine, "connect", _enable_sqlite_wal)
+# Columns added after the first release. ``create_all`` does not alter
+# existing tables, so they are added here when missing.
+_ADDED_COLUMNS: dict[str, dict[str, str]] = {
+    "import_jobs": {
+        "lease_owner": "VARCHAR",
+        "lease_expires_at": "DATETIME",
+    },
+}
 
-    Base.metadata.create_all(bind=_engine)
 
-    _SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False)
+def _add_missing_columns(engine: Engine) -> None:
+    """Add columns from ``_ADDED_COLUMNS`` to tables created by older versions."""
+    with engine.begin() as conn:
+        for table, columns in _ADDED_COLUMNS.items():
+            existing = {
+                row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")
+            }
+            for name, ddl_type in columns.items():
+                if name not in existing:
+                    conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}")
+                    logger.info("Added column %s.%s", table, name)
 
-    logger.info("Database initialized at %s", DB_PATH)
+
+def _create_search_index(engine: Engine) -> None:
+    """Create the FTS5 full-text index over item markdown if missing.
+
+    One row per page (or one row per item without pages). ``item_id``,
+    ``library_id``, ``organization_id`` and ``page_number`` are stored but
+    not tokenized. Maintained by ``services.search_service``.
+    """
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS content_search USING fts5("
+            "item_id UNINDEXED, library_id UNINDEXED, organization_id UNINDEXED, "
+            "page_number UNINDEXED, title, body, "
+            "tokenize = 'porter unicode61 remove_diacritics 2')"
+        )
 
 
 def get_session() -> Generator[Session, None, None]:
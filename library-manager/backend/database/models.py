@@ -110,6 +110,9 @@ class ContentItem(Base):
     images = relationship(
         "ContentImage", back_populates="content_item", cascade="all, delete-orphan"
     )
+    blob_refs = relationship(
+        "ContentBlobRef", back_populates="content_item", cascade="all, delete-orphan"
+    )
 
 
 class ContentImage(Base):
@@ -129,6 +132,36 @@ class ContentImage(Base):
     content_item = relationship("ContentItem", back_populates="images")
 
 
+class ContentBlob(Base):
+    """A file in the content-addressed blob store, keyed by SHA-256.
+
+    Item directories hold hardlinks to blobs; the reference count of a blob
+    is the number of ``ContentBlobRef`` rows pointing at it.
+    """
+
+    __tablename__ = "content_blobs"
+
+    sha256 = Column(String, primary_key=True)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=_utcnow)
+
+
+class ContentBlobRef(Base):
+    """One content item file (original or extracted image) backed by a blob."""
+
+    __tablename__ = "content_blob_refs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_item_id = Column(
+        String, ForeignKey("content_items.id", ondelete="CASCADE"), nullable=False
+    )
+    sha256 = Column(String, ForeignKey("content_blobs.sha256"), nullable=False)
+    role = Column(String, nullable=False)  # 'original', 'image'
+    rel_path = Column(String, nullable=False)  # Relative to the item directory
+
+    content_item = relationship("ContentItem", back_populates="blob_refs")
+
+
 class ImportJob(Base):
     """Persistent record of an import task for the async worker queue.
 
@@ -147,8 +180,8 @@ class ImportJob(Base):
     source_type = Column(String, nullable=False)  # 'file', 'url', 'youtube'
     plugin_name = Column(String, nullable=False)
     plugin_params = Column(Text, nullable=True)  # JSON
-    # API keys are held in memory only (tasks.worker._job_api_keys dict),
-    # never persisted to this table.
+    # API keys are held in the API process's memory only
+    # (tasks.worker._job_api_keys), never persisted to this table.
 
     # Source data
     source_path = Column(String, nullable=True)  # Local file path (for file uploads)
@@ -161,6 +194,11 @@ class ImportJob(Base):
     error_message = Column(Text, nullable=True)
     attempts = Column(Integer, nullable=False, default=0)
 
+    # Lease held by the worker processing the job (see tasks/worker.py).
+    # A 'processing' job whose lease has expired is returned to the queue.
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=_utcnow)
     updated_at = Column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
@@ -173,6 +211,9 @@ Index("idx_content_items_library", ContentItem.library_id)
 Index("idx_content_items_org", ContentItem.organization_id)
 Index("idx_content_items_status", ContentItem.status)
 Index("idx_content_images_item", ContentImage.content_item_id)
+Index("idx_content_blob_refs_item", ContentBlobRef.content_item_id)
+Index("idx_content_blob_refs_sha", ContentBlobRef.sha256, ContentBlobRef.role)
 Index("idx_import_jobs_status", ImportJob.status)
 Index("idx_import_jobs_status_created", ImportJob.status, ImportJob.created_at)
 Index("idx_import_jobs_item", ImportJob.content_item_id)
+Index("idx_import_jobs_lease", ImportJob.status, ImportJob.lease_expires_at)
@@ -15,6 +15,7 @@ from database.connection import init_db
 from fastapi import FastAPI
 from routers import content, importing, libraries, system
 from routers.importing import purge_stale_uploads
+from services.search_service import backfill_index
 from tasks.worker import recover_stale_jobs, start_worker, stop_worker
 
 # --- Logging ---
@@ -42,13 +43,19 @@ async def lifespan(app: FastAPI):
     _discover_plugins()
     purge_stale_uploads()
     recover_stale_jobs()
-    await start_worker()
+    backfill_index()
+    if config.WORKER_MODE == "embedded":
+        await start_worker()
+    else:
+        logger.info("WORKER_MODE=%s — imports run in worker_main.py processes",
+                    config.WORKER_MODE)
     logger.info("Library Manager started on port %d", config.PORT)
 
     yield
 
     # Shutdown
-    await stop_worker()
+    if config.WORKER_MODE == "embedded":
+        await stop_worker()
     logger.info("Library Manager stopped")
 
 
@@ -0,0 +1,141 @@
+"""Concurrent, cached LLM image descriptions for import plugins.
+
+Vision calls dominate the import time of image-heavy documents. Uncached
+images are therefore described in parallel, at most
+``IMAGE_DESCRIPTION_CONCURRENCY`` at a time, and every successful
+description is stored in a small SQLite cache keyed by the SHA-256 of the
+image bytes plus the model and prompt that produced it. Re-importing a
+document, or importing another one with the same figures, makes no vision
+calls for images already seen. Failed descriptions are never cached.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from config import IMAGE_DESCRIPTION_CACHE_PATH, IMAGE_DESCRIPTION_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+
+class DescriptionCache:
+    """Thread-safe SQLite store of image descriptions."""
+
+    def __init__(self, path: Path) -> None:
+        """Open (and create if needed) the cache database at ``path``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS image_descriptions ("
+            " key TEXT PRIMARY KEY,"
+            " description TEXT NOT NULL,"
+            " created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached description for ``key``, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM image_descriptions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, description: str) -> None:
+        """Store ``description`` under ``key``, replacing any previous value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO image_descriptions (key, description) "
+                "VALUES (?, ?)",
+                (key, description),
+            )
+            self._conn.commit()
+
+
+_cache: DescriptionCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> DescriptionCache | None:
+    """Return the process-wide cache, or ``None`` when caching is disabled."""
+    global _cache
+    if not IMAGE_DESCRIPTION_CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = DescriptionCache(Path(IMAGE_DESCRIPTION_CACHE_PATH))
+            except sqlite3.Error:
+                logger.exception("Image description cache unavailable; continuing without it.")
+                return None
+        return _cache
+
+
+def cache_key(image: bytes, model: str, prompt: str) -> str:
+    """Build the cache key for an image described with ``model`` and ``prompt``."""
+    variant = hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()[:16]
+    return f"{hashlib.sha256(image).hexdigest()}:{variant}"
+
+
+def describe_images(
+    images: list[bytes],
+    describe: Callable[[int], str | None],
+    *,
+    model: str,
+    prompt: str,
+    cache: DescriptionCache | None = None,
+    max_workers: int = IMAGE_DESCRIPTION_CONCURRENCY,
+) -> tuple[list[str | None], int]:
+    """Describe ``images``, calling ``describe`` only for unseen content.
+
+    Identical images within ``images`` are described once.
+
+    Args:
+        images: Raw image bytes, used to build the cache keys.
+        describe: Called from worker threads with an index into ``images``;
+            returns the description, or ``None`` if generation failed.
+        model: Model name, part of the cache key.
+        prompt: Prompt text, part of the cache key.
+        cache: Description cache; ``None`` disables caching.
+        max_workers: Maximum number of concurrent ``describe`` calls.
+
+    Returns:
+        Descriptions aligned with ``images`` (``None`` where generation
+        failed) and the number of images served without a ``describe`` call.
+    """
+    keys = [cache_key(image, model, prompt) for image in images]
+    results: list[str | None] = [None] * len(images)
+    first_seen: dict[str, int] = {}
+    pending: list[int] = []
+    for index, key in enumerate(keys):
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[index] = cached
+        elif key not in first_seen:
+            first_seen[key] = index
+            pending.append(index)
+
+    if pending:
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="describe") as pool:
+            for index, description in zip(pending, pool.map(describe, pending)):
+                results[index] = description
+                if description is not None and cache is not None:
+                    cache.put(keys[index], description)
+
+    for index, key in enumerate(keys):
+        if results[index] is None and first_seen.get(key, index) != index:
+            results[index] = results[first_seen[key]]
+
+    described = set(pending)
+    served = sum(
+        1 for index, result in enumerate(results)
+        if result is not None and index not in described
+    )
+    return results, served
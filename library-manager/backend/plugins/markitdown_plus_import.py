@@ -12,6 +12,7 @@ KB Server's responsibility.
 import base64
 import logging
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -75,6 +76,7 @@ class MarkItDownPlusPlugin(LibraryImportPlugin):
         stats: dict[str, Any] = {
             "images_extracted": 0,
             "images_with_llm_descriptions": 0,
+            "image_description_cache_hits": 0,
             "llm_calls": [],
             "stage_timings": [],
         }
@@ -131,6 +133,7 @@ class MarkItDownPlusPlugin(LibraryImportPlugin):
             "image_count": len(images),
             "import_plugin": self.name,
             "image_descriptions_mode": image_mode,
+            "processing_stats": stats,
         }
 
         if kwargs.get("description"):
@@ -242,76 +245,113 @@ def _extract_images(
                 img_counter += 1
                 ext = base_image.get("ext", "png")
                 filename = f"img_{img_counter:03d}.{ext}"
-                img_data = base_image["image"]
-
-                description = _describe_image(
-                    img_data, filename, ext, mode, api_keys, stats
-                )
 
                 images.append(ExtractedImage(
                     filename=filename,
-                    data=img_data,
+                    data=base_image["image"],
                     page_number=page_num + 1,
-                    description=description,
+                    description=f"Image: {filename}" if mode in ("basic", "llm") else None,
                 ))
     finally:
         doc.close()
 
+    if mode == "llm" and images:
+        _describe_images_llm(images, api_keys, stats)
+
     return images
 
 
-def _describe_image(
-    img_data: bytes,
-    filename: str,
-    image_ext: str,
-    mode: str,
+_VISION_MODEL = "gpt-4o-mini"
+_VISION_PROMPT = (
+    "Describe this image concisely in one or two "
+    "sentences for use as alt-text in a document."
+)
+
+
+def _describe_images_llm(
+    images: list[ExtractedImage],
     api_keys: dict[str, str],
     stats: dict[str, Any],
-) -> str | None:
-    """Generate a description for an extracted image.
+) -> None:
+    """Replace the basic descriptions of ``images`` with LLM descriptions.
+
+    Images are described concurrently and through the description cache
+    (see ``plugins.image_descriptions``). Images whose description fails
+    keep their basic ``Image: <filename>`` description.
 
     Args:
-        img_data: Raw image bytes.
-        filename: Image filename for basic descriptions.
-        image_ext: Image file extension (e.g. ``"png"``, ``"jpeg"``).
-        mode: ``"basic"`` or ``"llm"``.
+        images: Extracted images, updated in place.
         api_keys: API keys dict.
         stats: Mutable stats dict.
-
-    Returns:
-        Description string, or ``None`` if unavailable.
     """
-    if mode == "basic":
-        return f"Image: {filename}"
-
-    if mode != "llm":
-        return None
-
     openai_key = api_keys.get("openai_vision")
     if not openai_key:
         logger.warning("LLM image description requested but no openai_vision key.")
-        return f"Image: {filename}"
+        return
 
     try:
         from openai import OpenAI  # noqa: PLC0415
+    except ImportError:
+        logger.warning("openai not installed — keeping basic image descriptions.")
+        return
+
+    from plugins.image_descriptions import describe_images, get_cache  # noqa: PLC0415
+
+    client = OpenAI(api_key=openai_key)
+    stats_lock = threading.Lock()
+
+    def describe(index: int) -> str | None:
+        image = images[index]
+        ext = image.filename.rsplit(".", 1)[-1]
+        description, call = _describe_image(client, image.data, image.filename, ext)
+        with stats_lock:
+            stats["llm_calls"].append(call)
+        return description
+
+    descriptions, cache_hits = describe_images(
+        [image.data for image in images],
+        describe,
+        model=_VISION_MODEL,
+        prompt=_VISION_PROMPT,
+        cache=get_cache(),
+    )
+    for image, description in zip(images, descriptions):
+        if description is not None:
+            image.description = description
+    stats["images_with_llm_descriptions"] = sum(
+        1 for description in descriptions if description is not None
+    )
+    stats["image_description_cache_hits"] = cache_hits
 
-        client = OpenAI(api_key=openai_key)
+
+def _describe_image(
+    client: Any,
+    img_data: bytes,
+    filename: str,
+    image_ext: str,
+) -> tuple[str | None, dict[str, Any]]:
+    """Generate an LLM description for one extracted image.
+
+    Args:
+        client: OpenAI client, shared by concurrent calls.
+        img_data: Raw image bytes.
+        filename: Image filename, recorded in the call statistics.
+        image_ext: Image file extension (e.g. ``"png"``, ``"jpeg"``).
+
+    Returns:
+        The description (``None`` on failure) and a ``llm_calls`` entry.
+    """
+    t0 = time.monotonic()
+    try:
         b64 = base64.b64encode(img_data).decode("utf-8")
         mime_type = _image_mime(image_ext)
 
-        t0 = time.monotonic()
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=_VISION_MODEL,
             messages=[{
                 "role": "user",
                 "content": [
-                    {
-                        "type": "text",
-                        "text": (
-                            "Describe this image concisely in one or two "
-                            "sentences for use as alt-text in a document."
-                        ),
-                    },
+                    {"type": "text", "text": _VISION_PROMPT},
                     {
                         "type": "image_url",
                         "image_url": {"url": f"data:{mime_type};base64,{b64}"},
@@ -320,29 +360,22 @@ def _describe_image(
             }],
             max_tokens=200,
         )
-        duration_ms = int((time.monotonic() - t0) * 1000)
-
         description = response.choices[0].message.content.strip()
-        stats["images_with_llm_descriptions"] = (
-            stats.get("images_with_llm_descriptions", 0) + 1
-        )
-        stats["llm_calls"].append({
+        return description, {
             "image": filename,
-            "duration_ms": duration_ms,
+            "duration_ms": int((time.monotonic() - t0) * 1000),
             "success": True,
             "tokens_used": getattr(response.usage, "total_tokens", None),
-        })
-        return description
+        }
 
     except Exception as exc:
         logger.warning("LLM image description failed for %s: %s", filename, exc)
-        stats["llm_calls"].append({
+        return None, {
             "image": filename,
-            "duration_ms": 0,
+            "duration_ms": int((time.monotonic() - t0) * 1000),
             "success": False,
             "error": str(exc)[:200],
-        })
-        return f"Image: {filename}"
+        }
 
 
 # ---------------------------------------------------------------------------
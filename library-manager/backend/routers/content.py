@@ -1,29 +1,39 @@
 """Content retrieval and management routes.
 
-Handles listing, detail, status, deletion, and content serving for
-library items. Also handles export/import of libraries.
+Handles listing, detail, status (including a server-sent event stream),
+deletion, and content serving for library items. Also handles export/import of libraries.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import mimetypes
+from email.utils import formatdate
 from pathlib import Path
+from urllib.parse import quote
+
+import anyio
 
 import markdown2
-from database.connection import get_session
+from config import WORKER_MODE, WORKER_POLL_INTERVAL
+from database.connection import get_session, get_session_direct
 from database.models import ContentItem
 from dependencies import verify_token
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
 from fastapi.responses import FileResponse, Response, StreamingResponse
 from schemas.content import (
     ContentItemListResponse,
     ContentItemStatusResponse,
     ImageListResponse,
     PageListResponse,
+    SearchResponse,
 )
-from services import content_service, export_service
+from services import content_service, export_service, search_service
 from services.library_service import get_library
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from tasks import status_events
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +83,36 @@ async def list_items(
     }
 
 
+@router.get("/{lib_id}/search", response_model=SearchResponse)
+async def search_library(
+    lib_id: str,
+    q: str = Query(..., min_length=1, max_length=500, description="Search text."),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_session),
+) -> dict:
+    """Full-text search across a library's imported content.
+
+    Args:
+        lib_id: Library UUID.
+        q: Free-text query; all words must match (``word*`` for prefixes).
+        limit: Max results.
+        offset: Skip count.
+        db: Database session.
+
+    Returns:
+        Ranked hits with snippets, page numbers, and permalinks.
+    """
+    lib = get_library(db, lib_id)
+    if lib is None:
+        raise HTTPException(status_code=404, detail="Library not found.")
+
+    try:
+        return search_service.search_library(db, lib_id, q, limit, offset)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.get("/{lib_id}/items/{item_id}")
 async def get_item(
     lib_id: str,
@@ -115,12 +155,39 @@ async def get_item_status(
     if item is None or item.library_id != lib_id:
         raise HTTPException(status_code=404, detail="Item not found.")
 
-    return {
-        "item_id": item.id,
-        "status": item.status,
-        "error_message": item.error_message,
-        "processing_stats": json.loads(item.processing_stats) if item.processing_stats else None,
-    }
+    return _item_to_status(item)
+
+
+@router.get("/{lib_id}/items/{item_id}/events")
+async def stream_item_status(
+    lib_id: str,
+    item_id: str,
+    db: Session = Depends(get_session),
+) -> StreamingResponse:
+    """Stream status changes of a content item as server-sent events.
+
+    Sends a ``status`` event (same body as ``/status``) right away and on
+    every change, and closes the stream once the item is ``ready`` or
+    ``failed`` (or ``deleted``). Clients use this instead of polling
+    ``/status``.
+
+    Args:
+        lib_id: Library UUID.
+        item_id: Content item UUID.
+        db: Database session.
+
+    Returns:
+        A ``text/event-stream`` response.
+    """
+    item = content_service.get_content_item(db, item_id)
+    if item is None or item.library_id != lib_id:
+        raise HTTPException(status_code=404, detail="Item not found.")
+
+    return StreamingResponse(
+        _iter_item_status_events(item_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.delete("/{lib_id}/items/{item_id}")
@@ -150,6 +217,7 @@ async def delete_item(
     )
     if not deleted:
         raise HTTPException(status_code=500, detail="Failed to delete item.")
+    status_events.publish(item_id)
 
     return {"message": f"Item {item_id} deleted."}
 
@@ -272,14 +340,18 @@ async def get_image(
     lib_id: str,
     item_id: str,
     image_name: str,
+    request: Request,
     db: Session = Depends(get_session),
-) -> FileResponse:
+) -> Response:
     """Serve an extracted image file.
 
+    Supports ``Range``, ``If-None-Match`` and ``If-Range`` (see ``_file_response``).
+
     Args:
         lib_id: Library UUID.
         item_id: Content item UUID.
         image_name: Image filename.
+        request: Incoming request (for conditional/range headers).
         db: Database session.
 
     Returns:
@@ -293,7 +365,7 @@ async def get_image(
     if path is None:
         raise HTTPException(status_code=404, detail="Image not found.")
 
-    return FileResponse(path)
+    return _file_response(request, path)
 
 
 @router.get("/{lib_id}/items/{item_id}/original/{filename}")
@@ -301,18 +373,23 @@ async def get_original(
     lib_id: str,
     item_id: str,
     filename: str,
+    request: Request,
     db: Session = Depends(get_session),
-) -> FileResponse:
+) -> Response:
     """Serve the original document file.
 
+    Supports ``Range``, ``If-None-Match`` and ``If-Range`` so PDF viewers and
+    video players can fetch only the parts they need (see ``_file_response``).
+
     Args:
         lib_id: Library UUID.
         item_id: Content item UUID.
         filename: Original document filename.
+        request: Incoming request (for conditional/range headers).
         db: Database session.
 
     Returns:
-        The original file.
+        The original file, a 206 partial response, or 304 Not Modified.
     """
     item = content_service.get_content_item(db, item_id)
     if item is None or item.library_id != lib_id:
@@ -322,7 +399,7 @@ async def get_original(
     if path is None:
         raise HTTPException(status_code=404, detail="Original file not found.")
 
-    return FileResponse(path, filename=filename)
+    return _file_response(request, path, filename=filename)
 
 
 @router.get("/{lib_id}/items/{item_id}/metadata")
@@ -402,7 +479,9 @@ async def export_library(
     if lib is None:
         raise HTTPException(status_code=404, detail="Library not found.")
 
-    buffer = export_service.export_library_zip(
+    # The generator is iterated in a worker thread by StreamingResponse, so
+    # large libraries are never held in memory.
+    chunks = export_service.stream_library_zip(
         db=db,
         library_id=lib_id,
         organization_id=lib.organization_id,
@@ -413,7 +492,7 @@ async def export_library(
     # Sanitize library name for Content-Disposition header.
     safe_name = lib.name.replace('"', "_").replace("\n", "_").replace("\r", "_")
     return StreamingResponse(
-        buffer,
+        chunks,
         media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{safe_name}.zip"'},
     )
@@ -465,8 +544,7 @@ async def import_library(
             Path(tmp.name).unlink(missing_ok=True)
             raise HTTPException(status_code=400, detail="Empty file.")
 
-        zip_data = Path(tmp.name).read_bytes()
-        result = export_service.import_library_zip(db, zip_data, organization_id)
+        result = export_service.import_library_zip(db, tmp.name, organization_id)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except IntegrityError:
@@ -485,6 +563,61 @@ async def import_library(
 # ---------------------------------------------------------------------------
 
 
+def _item_to_status(item: ContentItem) -> dict:
+    """Build the ``ContentItemStatusResponse`` body for an item."""
+    return {
+        "item_id": item.id,
+        "status": item.status,
+        "error_message": item.error_message,
+        "processing_stats": json.loads(item.processing_stats) if item.processing_stats else None,
+    }
+
+
+# Item statuses after which the event stream closes.
+_TERMINAL_ITEM_STATUSES = {"ready", "failed"}
+# The worker notifies the stream in-process; items finished by external
+# worker processes are only seen by re-reading the row. The idle re-read
+# doubles as a keep-alive for proxies.
+_EVENTS_RECHECK_SECONDS = WORKER_POLL_INTERVAL if WORKER_MODE == "external" else 15.0
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _iter_item_status_events(item_id: str):
+    """Yield SSE frames for an item until it reaches a terminal status."""
+    changed = status_events.subscribe(item_id)
+    last = None
+    try:
+        while True:
+            # Clear before reading so a change during the read is not lost.
+            changed.clear()
+            db = get_session_direct()
+            try:
+                item = content_service.get_content_item(db, item_id)
+                current = _item_to_status(item) if item is not None else None
+            finally:
+                db.close()
+
+            if current is None:
+                yield _sse("status", {"item_id": item_id, "status": "deleted"})
+                return
+            if current != last:
+                yield _sse("status", current)
+                last = current
+            if current["status"] in _TERMINAL_ITEM_STATUSES:
+                return
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=_EVENTS_RECHECK_SECONDS)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+    finally:
+        status_events.unsubscribe(item_id, changed)
+
+
 def _item_to_summary(item: ContentItem) -> dict:
     """Convert a ContentItem ORM object to a summary dict."""
     return {
@@ -537,3 +670,126 @@ def _format_response(text: str, fmt: str) -> Response:
         return Response(content=text, media_type="text/plain")
     # Default: markdown
     return Response(content=text, media_type="text/markdown")
+
+
+_FILE_CHUNK_SIZE = 64 * 1024
+
+
+def _file_etag(path: Path) -> str:
+    """Strong validator derived from the file's mtime and size."""
+    stat = path.stat()
+    return '"' + hashlib.md5(f"{stat.st_mtime_ns}-{stat.st_size}".encode()).hexdigest() + '"'
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive ``(start, end)``.
+
+    Args:
+        header: ``Range`` header value.
+        size: File size in bytes.
+
+    Returns:
+        ``(start, end)``, or ``None`` when the header is not a single byte
+        range (the full file is served instead).
+
+    Raises:
+        ValueError: If the range cannot be satisfied.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = (part.strip() for part in spec.strip().partition("-"))
+    if not all(part == "" or part.isdigit() for part in (first, last)) or first == last == "":
+        return None
+    if first == "":
+        suffix = int(last)
+        if suffix == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+async def _iter_file_range(path: Path, start: int, end: int):
+    """Yield ``path[start:end + 1]`` in chunks."""
+    remaining = end - start + 1
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        while remaining > 0:
+            chunk = await f.read(min(_FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _file_response(request: Request, path: Path | str, filename: str | None = None) -> Response:
+    """Serve a file with ETag validation and single-range support.
+
+    - ``If-None-Match`` matching the ETag returns 304.
+    - A single ``Range: bytes=...`` returns 206 with ``Content-Range``
+      (ignored when ``If-Range`` does not match the current ETag).
+    - An unsatisfiable range returns 416.
+
+    Args:
+        request: Incoming request.
+        path: File to serve.
+        filename: Download filename for ``Content-Disposition``.
+
+    Returns:
+        FileResponse, partial StreamingResponse, or an empty 304/416 response.
+    """
+    path = Path(path)
+    stat = path.stat()
+    size = stat.st_size
+    etag = _file_etag(path)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            media_type = mimetypes.guess_type(filename or path.name)[0] or "application/octet-stream"
+            partial_headers = {
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1),
+            }
+            if filename:
+                # Same form FileResponse uses for the full response
+                quoted = quote(filename)
+                partial_headers["Content-Disposition"] = (
+                    f"attachment; filename*=utf-8''{quoted}"
+                    if quoted != filename
+                    else f'attachment; filename="{filename}"'
+                )
+            return StreamingResponse(
+                _iter_file_range(path, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=partial_headers,
+            )
+
+    return FileResponse(path, filename=filename, headers=headers)
@@ -1,11 +1,12 @@
-"""System endpoints: health check and plugin listing."""
+"""System endpoints: health check, plugin listing and worker internals."""
 
+import config
 from database.connection import get_session_direct
 from dependencies import verify_token
 from fastapi import APIRouter, Depends
 from plugins.base import PluginRegistry
 from sqlalchemy import text
-from tasks.worker import is_worker_running
+from tasks.worker import is_worker_running, take_api_keys
 
 router = APIRouter(tags=["System"])
 
@@ -29,7 +30,9 @@ async def health() -> dict:
     except Exception:
         pass
 
-    worker_ok = is_worker_running()
+    # In external mode the API never runs a worker; worker_main.py does.
+    external = config.WORKER_MODE == "external"
+    worker_ok = external or is_worker_running()
 
     status = "ok" if (db_ok and worker_ok) else "degraded"
     return {
@@ -38,7 +41,7 @@ async def health() -> dict:
         "version": "1.0.0",
         "checks": {
             "database": "ok" if db_ok else "error",
-            "worker": "ok" if worker_ok else "error",
+            "worker": "external" if external else ("ok" if worker_ok else "error"),
         },
     }
 
@@ -51,3 +54,20 @@ async def list_plugins() -> dict:
         Dict containing the list of available plugins.
     """
     return {"plugins": PluginRegistry.list_plugins()}
+
+
+@router.post(
+    "/internal/jobs/{job_id}/api-keys",
+    dependencies=[Depends(verify_token)],
+    include_in_schema=False,
+)
+async def take_job_api_keys(job_id: str) -> dict:
+    """Hand a job's API keys to the external worker that claimed it.
+
+    Keys live only in this process's memory and are removed on first read,
+    so each job's keys are handed out at most once.
+
+    Returns:
+        Dict with the ``api_keys`` (empty if none are held for the job).
+    """
+    return {"api_keys": take_api_keys(job_id)}
@@ -128,6 +128,28 @@ class ContentItemStatusResponse(BaseModel):
     processing_stats: dict[str, Any] | None = None
 
 
+# --- Search ---
+
+
+class SearchResult(BaseModel):
+    """One matching page (or whole item, for items without pages)."""
+
+    item_id: str
+    title: str
+    page_number: int | None = None
+    snippet: str = Field(..., description="Excerpt with matches wrapped in <mark>.")
+    score: float
+    permalink: str
+
+
+class SearchResponse(BaseModel):
+    """Ranked full-text search hits within a library."""
+
+    query: str
+    total: int
+    results: list[SearchResult]
+
+
 # --- Content serving ---
 
 
@@ -0,0 +1,267 @@
+"""Content-addressed storage for original uploads and extracted images.
+
+Every stored file lives once under ``{BLOB_DIR}/{sha256[:2]}/{sha256}``.
+Item directories keep their usual layout (``original/…``,
+``content/images/…``) but the files are hardlinks to the blob, so the same
+textbook uploaded to several libraries, or a logo repeated across PDFs, is
+stored once. When hardlinks are not possible (e.g. a different filesystem)
+the blob is copied instead — correct, just not deduplicated on disk.
+
+Reference counting is done in the database: each item file backed by a blob
+has a ``ContentBlobRef`` row, and a blob is garbage-collected once no rows
+reference it. The filesystem link count is checked too, so a blob that an
+in-flight import has linked but not yet recorded is never removed.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from config import BLOB_DIR
+from database.models import ContentBlob, ContentBlobRef, ContentItem
+from sqlalchemy import exists
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def blob_path(sha256: str) -> Path:
+    """Return the on-disk path of a blob.
+
+    Args:
+        sha256: Hex SHA-256 digest.
+
+    Returns:
+        Path inside ``BLOB_DIR`` (may not exist).
+    """
+    return BLOB_DIR / sha256[:2] / sha256
+
+
+def hash_file(path: Path) -> str:
+    """Compute the hex SHA-256 of a file, reading it in chunks.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_file(src: Path, dest: Path, sha256: str | None = None) -> tuple[str, int]:
+    """Store a file in the blob store and link it at ``dest``.
+
+    Args:
+        src: Source file (left untouched).
+        dest: Path inside an item directory to create.
+        sha256: Digest of ``src`` if already known (avoids re-hashing).
+
+    Returns:
+        Tuple of (sha256, size in bytes).
+    """
+    sha256 = sha256 or hash_file(src)
+    blob = blob_path(sha256)
+    if not blob.is_file():
+        _atomic_write(blob, lambda fh: _copy_into(src, fh))
+    _link(blob, dest)
+    return sha256, blob.stat().st_size
+
+
+def store_bytes(data: bytes, dest: Path) -> tuple[str, int]:
+    """Store in-memory bytes in the blob store and link them at ``dest``.
+
+    Args:
+        data: File content.
+        dest: Path inside an item directory to create.
+
+    Returns:
+        Tuple of (sha256, size in bytes).
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+    blob = blob_path(sha256)
+    if not blob.is_file():
+        _atomic_write(blob, lambda fh: fh.write(data))
+    _link(blob, dest)
+    return sha256, len(data)
+
+
+def adopt_item_files(item_dir: Path) -> list[tuple[str, str, str, int]]:
+    """Move an item's existing original and image files into the blob store.
+
+    Used when files were written directly (e.g. extracted from an export
+    ZIP). Each file is replaced by a link to its blob.
+
+    Args:
+        item_dir: The item's content directory.
+
+    Returns:
+        List of ``(role, rel_path, sha256, size)`` for ``record_refs``.
+    """
+    refs = []
+    for role, sub_dir in (("original", item_dir / "original"),
+                          ("image", item_dir / "content" / "images")):
+        if not sub_dir.is_dir():
+            continue
+        for path in sorted(sub_dir.iterdir()):
+            if not path.is_file():
+                continue
+            sha256 = hash_file(path)
+            blob = blob_path(sha256)
+            if not blob.is_file():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(path, blob)
+                except OSError:
+                    _atomic_write(blob, lambda fh, p=path: _copy_into(p, fh))
+            _link(blob, path)
+            refs.append((role, str(path.relative_to(item_dir)), sha256, path.stat().st_size))
+    return refs
+
+
+def record_refs(
+    db: Session,
+    content_item_id: str,
+    refs: list[tuple[str, str, str, int]],
+) -> None:
+    """Register blob references for a content item (caller commits).
+
+    Args:
+        db: Database session.
+        content_item_id: Owning content item.
+        refs: ``(role, rel_path, sha256, size)`` tuples.
+    """
+    if not refs:
+        return
+    # Concurrent imports of identical bytes race on the blob row; the first
+    # insert wins and the others are no-ops.
+    blob_rows = {sha256: size for _, _, sha256, size in refs}
+    db.execute(
+        sqlite_insert(ContentBlob)
+        .values([{"sha256": sha, "size": size} for sha, size in blob_rows.items()])
+        .on_conflict_do_nothing(index_elements=["sha256"])
+    )
+    for role, rel_path, sha256, _ in refs:
+        db.add(ContentBlobRef(
+            content_item_id=content_item_id,
+            sha256=sha256,
+            role=role,
+            rel_path=rel_path,
+        ))
+
+
+def item_blob_hashes(db: Session, item_ids: list[str]) -> set[str]:
+    """Return the blob hashes referenced by the given items.
+
+    Call before deleting items, then pass the result to ``collect_garbage``.
+    """
+    if not item_ids:
+        return set()
+    rows = (
+        db.query(ContentBlobRef.sha256)
+        .filter(ContentBlobRef.content_item_id.in_(item_ids))
+        .distinct()
+        .all()
+    )
+    return {row[0] for row in rows}
+
+
+def library_blob_hashes(db: Session, library_id: str) -> set[str]:
+    """Return the blob hashes referenced by any item of a library."""
+    rows = (
+        db.query(ContentBlobRef.sha256)
+        .join(ContentItem, ContentItem.id == ContentBlobRef.content_item_id)
+        .filter(ContentItem.library_id == library_id)
+        .distinct()
+        .all()
+    )
+    return {row[0] for row in rows}
+
+
+def collect_garbage(db: Session, candidates: set[str] | None = None) -> int:
+    """Delete blobs that are no longer referenced.
+
+    Args:
+        db: Database session.
+        candidates: Hashes to check (typically those of just-deleted items);
+            ``None`` sweeps every blob.
+
+    Returns:
+        Number of blob files removed from disk.
+    """
+    unreferenced = ~exists().where(ContentBlobRef.sha256 == ContentBlob.sha256)
+    query = db.query(ContentBlob.sha256).filter(unreferenced)
+    if candidates is not None:
+        if not candidates:
+            return 0
+        query = query.filter(ContentBlob.sha256.in_(candidates))
+    orphaned = [row[0] for row in query.all()]
+    if not orphaned:
+        return 0
+
+    # Re-check inside the DELETE so a reference added since the SELECT wins.
+    db.query(ContentBlob).filter(
+        ContentBlob.sha256.in_(orphaned), unreferenced
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    removed = 0
+    for sha256 in orphaned:
+        blob = blob_path(sha256)
+        try:
+            # A link count above 1 means some item directory still holds the
+            # file (e.g. an import that has not committed its refs yet).
+            if blob.is_file() and blob.stat().st_nlink <= 1:
+                blob.unlink()
+                removed += 1
+        except OSError:
+            logger.warning("Failed to remove blob %s", sha256)
+    if removed:
+        logger.info("Garbage-collected %d unreferenced blob(s)", removed)
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _copy_into(src: Path, fh) -> None:  # noqa: ANN001
+    """Copy ``src`` into an open binary file handle."""
+    with src.open("rb") as sfh:
+        shutil.copyfileobj(sfh, fh, _HASH_CHUNK_SIZE)
+
+
+def _atomic_write(blob: Path, write) -> None:  # noqa: ANN001
+    """Create ``blob`` via a temp file + rename so readers never see partial data."""
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=blob.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            write(fh)
+        os.replace(tmp_name, blob)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _link(blob: Path, dest: Path) -> None:
+    """Make ``dest`` a hardlink to ``blob``, falling back to a copy."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.link")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(blob, tmp)
+    except OSError:
+        shutil.copy2(blob, tmp)
+    os.replace(tmp, dest)
@@ -5,6 +5,9 @@ This module handles:
 - Reading content from disk (for API retrieval endpoints)
 - Generating metadata.json with permalink URLs
 - Deleting content items from disk and database
+
+Originals and extracted images are stored through ``blob_service`` so
+identical bytes are kept once on disk.
 """
 
 import json
@@ -14,9 +17,12 @@ from pathlib import Path
 from typing import Any
 
 from config import CONTENT_DIR, PERMALINK_PREFIX
-from database.models import ContentItem
+from database.models import ContentImage, ContentItem
+from plugins.base import ExtractedImage, ImportResult, PageContent
 from sqlalchemy.orm import Session
 
+from services import blob_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +43,8 @@ def write_structured_content(
     source_ref: dict[str, Any],
     original_file_path: Path | None = None,
     original_filename: str | None = None,
+    original_sha256: str | None = None,
+    blob_refs: list[tuple[str, str, str, int]] | None = None,
 ) -> Path:
     """Write the common structured format to disk.
 
@@ -60,14 +68,21 @@ def write_structured_content(
         images: List of ExtractedImage objects.
         item_metadata: Metadata dict from the plugin.
         source_ref: Source reference dict from the plugin.
-        original_file_path: Path to the uploaded original file (copy it).
+        original_file_path: Path to the uploaded original file (linked from
+            the blob store; the source file is left in place).
         original_filename: Filename for the original document.
+        original_sha256: Digest of the original, if already computed.
+        blob_refs: If given, receives ``(role, rel_path, sha256, size)`` for
+            every file stored in the blob store, for
+            ``blob_service.record_refs``.
 
     Returns:
         The base path of the content directory.
     """
     base_dir = CONTENT_DIR / organization_id / library_id / item_id
     base_dir.mkdir(parents=True, exist_ok=True)
+    if blob_refs is None:
+        blob_refs = []
 
     permalink_base = f"{PERMALINK_PREFIX}/{organization_id}/{library_id}/{item_id}"
 
@@ -78,7 +93,8 @@ def write_structured_content(
         original_dir.mkdir(exist_ok=True)
         dest_name = _sanitize_filename(original_filename or original_file_path.name)
         dest = original_dir / dest_name
-        shutil.copy2(str(original_file_path), str(dest))
+        sha256, size = blob_service.store_file(original_file_path, dest, original_sha256)
+        blob_refs.append(("original", f"original/{dest_name}", sha256, size))
         original_permalink = f"{permalink_base}/original/{dest_name}"
 
     # --- Full markdown ---
@@ -110,7 +126,8 @@ def write_structured_content(
         for img in images:
             safe_name = _sanitize_filename(img.filename)
             img_path = images_dir / safe_name
-            img_path.write_bytes(img.data)
+            sha256, size = blob_service.store_bytes(img.data, img_path)
+            blob_refs.append(("image", f"content/images/{safe_name}", sha256, size))
             image_permalinks.append(
                 f"{permalink_base}/content/images/{safe_name}"
             )
@@ -356,6 +373,64 @@ def get_original_path(
     return path
 
 
+def load_import_result(db: Session, item: ContentItem) -> ImportResult | None:
+    """Rebuild a plugin ``ImportResult`` from an item already on disk.
+
+    Used to reuse an earlier import of the same file instead of re-running
+    the plugin. Image bytes are read from the item's (blob-linked) files.
+
+    Args:
+        db: Database session.
+        item: A ready content item.
+
+    Returns:
+        The reconstructed result, or ``None`` if the item's files are missing.
+    """
+    base = get_item_base_path(item.organization_id, item.library_id, item.id)
+    full_text = read_full_markdown(item.organization_id, item.library_id, item.id)
+    metadata = read_metadata_json(item.organization_id, item.library_id, item.id)
+    if full_text is None or metadata is None:
+        return None
+
+    pages = []
+    for name in list_pages(item.organization_id, item.library_id, item.id):
+        try:
+            page_number = int(Path(name).stem.removeprefix("page_"))
+        except ValueError:
+            continue
+        pages.append(PageContent(
+            page_number=page_number,
+            text=(base / "content" / "pages" / name).read_text(encoding="utf-8"),
+        ))
+
+    image_rows = {
+        Path(row.image_path).name: row
+        for row in db.query(ContentImage).filter(ContentImage.content_item_id == item.id)
+    }
+    images = []
+    for name in list_images(item.organization_id, item.library_id, item.id):
+        row = image_rows.get(name)
+        images.append(ExtractedImage(
+            filename=name,
+            data=(base / "content" / "images" / name).read_bytes(),
+            page_number=row.page_number if row else None,
+            description=row.llm_description if row else None,
+        ))
+
+    item_metadata = {
+        key: value for key, value in metadata.items()
+        if key not in ("item_id", "title", "permalinks", "source_ref")
+    }
+    source_ref = read_source_ref(item.organization_id, item.library_id, item.id)
+    return ImportResult(
+        full_text=full_text,
+        pages=pages,
+        images=images,
+        metadata=item_metadata,
+        source_ref=source_ref or {},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Deletion
 # ---------------------------------------------------------------------------
@@ -382,14 +457,23 @@ def delete_content_item(
     if item is None:
         return False
 
+    blob_hashes = blob_service.item_blob_hashes(db, [item_id])
+
+    # Import here to avoid circular imports at module load time.
+    from services import search_service  # noqa: PLC0415
+
     # DB first, then disk — if crash occurs between, DB is clean.
     db.delete(item)
+    search_service.remove_item(db, item_id)
     db.commit()
 
     item_dir = get_item_base_path(organization_id, library_id, item_id)
     if item_dir.exists():
         shutil.rmtree(item_dir, ignore_errors=True)
 
+    # After the item's links are gone, drop blobs nothing else references.
+    blob_service.collect_garbage(db, blob_hashes)
+
     logger.info("Deleted content item %s", item_id)
     return True
 
@@ -3,6 +3,11 @@
 Export produces a ZIP containing a manifest.json and all structured content
 directories. Import re-creates a library from such a ZIP.
 
+Both directions stream: export yields the archive chunk by chunk as it is
+written (entries use data descriptors and the manifest is written last), and
+import reads members from a ZIP on disk one at a time. Memory use does not
+grow with library size.
+
 Import does NOT re-run plugins — the structured content (markdown, images,
 metadata) is already in the ZIP. It simply stores the files and registers
 them in the database. This makes import fast and key-free.
@@ -10,31 +15,69 @@ them in the database. This makes import fast and key-free.
 
 import json
 import logging
+import shutil
 import uuid
 import zipfile
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from config import CONTENT_DIR, PERMALINK_PREFIX
 from database.models import ContentItem
 from sqlalchemy.orm import Session
 
+from services import blob_service, search_service
 from services.library_service import create_library, ensure_organization
 
 logger = logging.getLogger(__name__)
 
 
-def export_library_zip(
+# Chunk size for reading content files into the archive and for copying
+# members out of an imported archive.
+_ZIP_CHUNK_SIZE = 1024 * 1024
+
+
+class _ZipStreamBuffer:
+    """Write-only, non-seekable sink that hands written bytes to a generator.
+
+    ``zipfile`` detects that the target cannot seek and switches to data
+    descriptors, so each entry can be emitted as soon as it is compressed.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+            self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_library_zip(
     db: Session,
     library_id: str,
     organization_id: str,
     library_name: str,
     import_config: dict | None,
     exported_by: str = "",
-) -> BytesIO:
-    """Export a library and all its items as a ZIP file.
+) -> Iterator[bytes]:
+    """Export a library and all its items as a streamed ZIP archive.
+
+    Items are loaded from the database eagerly, so the returned iterator does
+    not depend on ``db`` staying open while the response is sent.
 
     Args:
         db: Database session.
@@ -45,7 +88,7 @@ def export_library_zip(
         exported_by: Email or identifier of the exporter.
 
     Returns:
-        In-memory BytesIO containing the ZIP archive.
+        Iterator of ZIP archive chunks.
     """
     items = (
         db.query(ContentItem)
@@ -55,6 +98,19 @@ def export_library_zip(
         )
         .all()
     )
+    manifest_items = [
+        {
+            "id": item.id,
+            "title": item.title,
+            "source_type": item.source_type,
+            "original_filename": item.original_filename,
+            "content_type": item.content_type,
+            "import_plugin": item.import_plugin,
+            "import_params": json.loads(item.import_params) if item.import_params else None,
+            "metadata": json.loads(item.metadata_) if item.metadata_ else None,
+        }
+        for item in items
+    ]
 
     manifest = {
         "format_version": "1.0",
@@ -63,45 +119,82 @@ def export_library_zip(
             "name": library_name,
             "import_config": import_config,
         },
-        "items": [],
+        "items": manifest_items,
         "exported_at": datetime.now(UTC).isoformat(),
         "exported_by": exported_by,
     }
 
-    buffer = BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for item in items:
-            manifest["items"].append({
-                "id": item.id,
-                "title": item.title,
-                "source_type": item.source_type,
-                "original_filename": item.original_filename,
-                "content_type": item.content_type,
-                "import_plugin": item.import_plugin,
-                "import_params": json.loads(item.import_params) if item.import_params else None,
-                "metadata": json.loads(item.metadata_) if item.metadata_ else None,
-            })
-
-            item_dir = CONTENT_DIR / organization_id / library_id / item.id
-            if item_dir.is_dir():
-                for file_path in item_dir.rglob("*"):
-                    if file_path.is_file():
-                        arcname = f"content/{item.id}/{file_path.relative_to(item_dir)}"
-                        zf.write(str(file_path), arcname)
+    return _iter_library_zip(library_id, organization_id, manifest)
+
+
+def _iter_library_zip(
+    library_id: str,
+    organization_id: str,
+    manifest: dict[str, Any],
+) -> Iterator[bytes]:
+    """Generate the ZIP archive for a prepared manifest, chunk by chunk."""
+    sink = _ZipStreamBuffer()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        for entry in manifest["items"]:
+            item_dir = CONTENT_DIR / organization_id / library_id / entry["id"]
+            if not item_dir.is_dir():
+                continue
+            for file_path in sorted(item_dir.rglob("*")):
+                if not file_path.is_file():
+                    continue
+                arcname = f"content/{entry['id']}/{file_path.relative_to(item_dir)}"
+                # from_file records the size up front so large members get
+                # ZIP64 headers even though the sink cannot seek back.
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                with file_path.open("rb") as src, zf.open(zinfo, "w") as dst:
+                    while chunk := src.read(_ZIP_CHUNK_SIZE):
+                        dst.write(chunk)
+                        if data := sink.drain():
+                            yield data
+                if data := sink.drain():
+                    yield data
 
         zf.writestr("manifest.json", json.dumps(manifest, indent=2, default=str))
 
-    buffer.seek(0)
+    # Closing the ZipFile writes the manifest entry and the central directory.
+    if data := sink.drain():
+        yield data
+
     logger.info(
         "Exported library %s: %d items, %d bytes",
-        library_id, len(items), buffer.getbuffer().nbytes,
+        library_id, len(manifest["items"]), sink.bytes_written,
     )
+
+
+def export_library_zip(
+    db: Session,
+    library_id: str,
+    organization_id: str,
+    library_name: str,
+    import_config: dict | None,
+    exported_by: str = "",
+) -> BytesIO:
+    """Export a library into an in-memory ZIP.
+
+    Prefer ``stream_library_zip`` for HTTP responses; this buffers the whole
+    archive and is only suitable for small libraries and tests.
+
+    Returns:
+        BytesIO containing the ZIP archive, positioned at the start.
+    """
+    buffer = BytesIO()
+    for chunk in stream_library_zip(
+        db, library_id, organization_id, library_name, import_config, exported_by,
+    ):
+        buffer.write(chunk)
+    buffer.seek(0)
     return buffer
 
 
 def import_library_zip(
     db: Session,
-    zip_data: bytes,
+    zip_source: str | Path | IO[bytes] | bytes,
     organization_id: str,
 ) -> dict[str, Any]:
     """Import a library from a ZIP file.
@@ -111,7 +204,8 @@ def import_library_zip(
 
     Args:
         db: Database session.
-        zip_data: Raw ZIP file bytes.
+        zip_source: Path to the ZIP on disk (preferred; members are read one
+            at a time), a seekable binary file object, or raw ZIP bytes.
         organization_id: Target organization.
 
     Returns:
@@ -122,8 +216,10 @@ def import_library_zip(
     """
     ensure_organization(db, organization_id)
 
+    if isinstance(zip_source, (bytes, bytearray)):
+        zip_source = BytesIO(zip_source)
     try:
-        zf_obj = zipfile.ZipFile(BytesIO(zip_data), "r")
+        zf_obj = zipfile.ZipFile(zip_source, "r")
     except zipfile.BadZipFile as exc:
         raise ValueError(f"Invalid ZIP file: {exc}") from exc
 
@@ -151,6 +247,17 @@ def import_library_zip(
             db, new_lib_id, organization_id, lib_name, import_config
         )
 
+        # Group member names by item once instead of scanning the whole
+        # archive for every item. A member named ``content/<id>`` has no
+        # path inside the item and is skipped like a directory entry.
+        entries_by_item: dict[str, list[zipfile.ZipInfo]] = {}
+        for zinfo in zf.infolist():
+            if zinfo.filename.startswith("content/") and not zinfo.is_dir():
+                parts = zinfo.filename.split("/", 2)
+                if len(parts) < 3 or not parts[2]:
+                    continue
+                entries_by_item.setdefault(parts[1], []).append(zinfo)
+
         items_created = 0
         for item_manifest in manifest.get("items", []):
             old_item_id = item_manifest.get("id", "")
@@ -165,16 +272,16 @@ def import_library_zip(
 
             prefix = f"content/{old_item_id}/"
             resolved_base = new_item_dir.resolve()
-            for zip_entry in zf.namelist():
-                if zip_entry.startswith(prefix) and not zip_entry.endswith("/"):
-                    relative = zip_entry[len(prefix):]
-                    target = (new_item_dir / relative).resolve()
-                    # ZIP slip guard: ensure target stays within the item dir.
-                    if not target.is_relative_to(resolved_base):
-                        logger.warning("Zip slip attempt blocked: %s", zip_entry)
-                        continue
-                    target.parent.mkdir(parents=True, exist_ok=True)
-                    target.write_bytes(zf.read(zip_entry))
+            for zinfo in entries_by_item.get(old_item_id, []):
+                relative = zinfo.filename[len(prefix):]
+                target = (new_item_dir / relative).resolve()
+                # ZIP slip guard: ensure target stays within the item dir.
+                if target == resolved_base or not target.is_relative_to(resolved_base):
+                    logger.warning("Zip slip attempt blocked: %s", zinfo.filename)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zf.open(zinfo) as src, target.open("wb") as dst:
+                    shutil.copyfileobj(src, dst, _ZIP_CHUNK_SIZE)
 
             _regenerate_metadata(new_item_dir, new_item_id, permalink_base, item_manifest)
 
@@ -212,6 +319,10 @@ def import_library_zip(
                 status="ready",
             )
             db.add(item)
+            blob_service.record_refs(
+                db, new_item_id, blob_service.adopt_item_files(new_item_dir)
+            )
+            search_service.index_item_from_disk(db, item)
             items_created += 1
 
         db.commit()
@@ -13,13 +13,13 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from config import CONTENT_DIR, PERMALINK_PREFIX
-from database.models import ContentImage, ContentItem, ImportJob
+from config import CONTENT_DIR, PERMALINK_PREFIX, REUSE_IMPORT_RESULTS
+from database.models import ContentBlobRef, ContentImage, ContentItem, ImportJob
 from plugins.base import PluginRegistry
 from sqlalchemy.orm import Session
-from tasks.worker import store_api_keys
+from tasks.worker import notify_job_queued, store_api_keys
 
-from services import content_service
+from services import blob_service, content_service, search_service
 from services.library_service import ensure_organization
 
 logger = logging.getLogger(__name__)
@@ -93,8 +93,10 @@ def queue_file_import(
         status="pending",
     )
     db.add(job)
-    db.commit()
+    # Keys must be in place before the job is visible to workers.
     store_api_keys(job_id, api_keys)
+    db.commit()
+    notify_job_queued()
 
     logger.info(
         "Queued file import: item=%s, job=%s, plugin=%s",
@@ -163,8 +165,10 @@ def queue_url_import(
         status="pending",
     )
     db.add(job)
-    db.commit()
+    # Keys must be in place before the job is visible to workers.
     store_api_keys(job_id, api_keys)
+    db.commit()
+    notify_job_queued()
 
     logger.info("Queued URL import: item=%s, job=%s, url=%s", item_id, job_id, url)
     return item_id, job_id
@@ -230,8 +234,10 @@ def queue_youtube_import(
         status="pending",
     )
     db.add(job)
-    db.commit()
+    # Keys must be in place before the job is visible to workers.
     store_api_keys(job_id, api_keys)
+    db.commit()
+    notify_job_queued()
 
     logger.info("Queued YouTube import: item=%s, job=%s", item_id, job_id)
     return item_id, job_id
@@ -251,8 +257,10 @@ def execute_import_job(
 
     This function is called by the background worker. It:
     1. Instantiates the plugin.
-    2. Runs the plugin's ``import_content`` method.
-    3. Writes the structured content to disk.
+    2. Runs the plugin's ``import_content`` method — or, for a file already
+       imported with the same plugin and parameters, reuses that output.
+    3. Writes the structured content to disk (originals and images go
+       through the blob store).
     4. Updates the ContentItem record with results.
 
     Args:
@@ -274,11 +282,30 @@ def execute_import_job(
     params = json.loads(job.plugin_params) if job.plugin_params else {}
     sanitized_params = PluginRegistry.sanitize_params(job.plugin_name, params)
 
-    result = plugin.import_content(
-        source, api_keys=api_keys, **sanitized_params
-    )
-
     original_file_path = Path(job.source_path) if job.source_path else None
+    original_sha256 = None
+    result = None
+    reused_from = None
+    if original_file_path and original_file_path.is_file():
+        original_sha256 = blob_service.hash_file(original_file_path)
+        if REUSE_IMPORT_RESULTS:
+            previous = _find_reusable_item(
+                db, job.organization_id, original_sha256, job.plugin_name,
+                sanitized_params,
+            )
+            if previous is not None:
+                result = content_service.load_import_result(db, previous)
+                if result is not None:
+                    reused_from = previous.id
+                    logger.info(
+                        "Job %s reuses the import of item %s (sha256=%s)",
+                        job.id, previous.id, original_sha256[:12],
+                    )
+
+    if result is None:
+        result = plugin.import_content(
+            source, api_keys=api_keys, **sanitized_params
+        )
     item = db.query(ContentItem).filter(ContentItem.id == job.content_item_id).first()
     if item is None:
         raise RuntimeError(f"ContentItem {job.content_item_id} not found")
@@ -291,6 +318,7 @@ def execute_import_job(
             result.metadata["original_filename"] = real_filename
 
     item_dir = CONTENT_DIR / job.organization_id / job.library_id / item.id
+    blob_refs: list[tuple[str, str, str, int]] = []
     try:
         base_path = content_service.write_structured_content(
             item_id=item.id,
@@ -304,6 +332,8 @@ def execute_import_job(
             source_ref=result.source_ref,
             original_file_path=original_file_path,
             original_filename=item.original_filename,
+            original_sha256=original_sha256,
+            blob_refs=blob_refs,
         )
     except Exception:
         if item_dir.exists():
@@ -319,6 +349,8 @@ def execute_import_job(
             page_number=img.page_number,
         )
         db.add(db_img)
+    blob_service.record_refs(db, item.id, blob_refs)
+    search_service.index_item(db, item, result.full_text, result.pages)
 
     metadata_on_disk = content_service.read_metadata_json(
         job.organization_id, job.library_id, item.id
@@ -331,7 +363,10 @@ def execute_import_job(
     item.image_count = len(result.images)
     item.metadata_ = json.dumps(metadata_on_disk) if metadata_on_disk else None
     item.source_ref = json.dumps(result.source_ref)
-    item.processing_stats = json.dumps(result.metadata.get("processing_stats"))
+    processing_stats = result.metadata.get("processing_stats")
+    if reused_from:
+        processing_stats = {**(processing_stats or {}), "reused_from_item": reused_from}
+    item.processing_stats = json.dumps(processing_stats)
     item.updated_at = datetime.now(UTC)
 
     if result.metadata.get("file_size"):
@@ -352,3 +387,47 @@ def execute_import_job(
                 logger.warning("Failed to delete temp file: %s", temp_file)
 
     logger.info("Import job %s completed: item %s is ready", job.id, item.id)
+
+
+def _find_reusable_item(
+    db: Session,
+    organization_id: str,
+    original_sha256: str,
+    plugin_name: str,
+    params: dict[str, Any],
+) -> ContentItem | None:
+    """Find a ready item imported from identical bytes with the same settings.
+
+    Only items of the same organization qualify: another organization's
+    output was produced with its own API keys, and naming its item would
+    reveal that the file exists there. The blob store stays shared.
+
+    Args:
+        db: Database session.
+        organization_id: Organization of the new job.
+        original_sha256: Digest of the uploaded file.
+        plugin_name: Import plugin of the new job.
+        params: Sanitized plugin parameters of the new job.
+
+    Returns:
+        The most recent matching ContentItem, or ``None``.
+    """
+    candidates = (
+        db.query(ContentItem)
+        .join(ContentBlobRef, ContentBlobRef.content_item_id == ContentItem.id)
+        .filter(
+            ContentBlobRef.sha256 == original_sha256,
+            ContentBlobRef.role == "original",
+            ContentItem.organization_id == organization_id,
+            ContentItem.import_plugin == plugin_name,
+            ContentItem.status == "ready",
+        )
+        .order_by(ContentItem.updated_at.desc())
+        .all()
+    )
+    for candidate in candidates:
+        stored = json.loads(candidate.import_params) if candidate.import_params else {}
+        stored = PluginRegistry.sanitize_params(plugin_name, stored)
+        if stored == params:
+            return candidate
+    return None
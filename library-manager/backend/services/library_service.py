@@ -9,6 +9,8 @@ from database.models import ContentItem, Library, Organization
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from services import blob_service, search_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -170,16 +172,20 @@ def delete_library(db: Session, library_id: str) -> bool:
         return False
 
     org_id = lib.organization_id
+    blob_hashes = blob_service.library_blob_hashes(db, library_id)
 
     # DB first, then disk — if crash occurs between, we lose files but DB is clean.
     # Cascade delete handles items and images in the database.
     db.delete(lib)
+    search_service.remove_library(db, library_id)
     db.commit()
 
     content_dir = CONTENT_DIR / org_id / library_id
     if content_dir.exists():
         shutil.rmtree(content_dir, ignore_errors=True)
 
+    blob_service.collect_garbage(db, blob_hashes)
+
     logger.info("Deleted library %s", library_id)
     return True
 
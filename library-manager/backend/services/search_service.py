@@ -0,0 +1,251 @@
+"""Full-text search over imported library content.
+
+Backed by the SQLite FTS5 table ``content_search`` (created in
+``database.connection.init_db``). Each page of an item is one row, so hits
+carry a page number and can link to the page permalink; items without a
+per-page breakdown are indexed as a single row with no page number.
+
+The index is written in the same transaction as the item it describes:
+``execute_import_job`` and ZIP import add rows, item and library deletion
+remove them.
+"""
+
+import html
+import logging
+import re
+from typing import Any
+
+from database.connection import get_session_direct
+from database.models import ContentItem
+from plugins.base import PageContent
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from services import content_service
+
+logger = logging.getLogger(__name__)
+
+# Column order of content_search; used for snippet() and bm25() weights.
+_TITLE_COLUMN = 4
+_BODY_COLUMN = 5
+# bm25 weights: unindexed columns, then title (boosted) and body.
+_BM25 = "bm25(content_search, 0.0, 0.0, 0.0, 0.0, 5.0, 1.0)"
+
+_SNIPPET_TOKENS = 16
+# snippet() marks matches with control characters; the text is HTML-escaped
+# before they become <mark> tags, so indexed markdown can't inject markup.
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+_TERM_RE = re.compile(r"(\w+)(\*?)", re.UNICODE)
+
+
+def index_item(
+    db: Session,
+    item: ContentItem,
+    full_text: str,
+    pages: list,
+) -> None:
+    """(Re)index a content item (caller commits).
+
+    Args:
+        db: Database session.
+        item: The content item (``id``, ``library_id``, ``organization_id``,
+            ``title`` are used).
+        full_text: Full markdown, indexed when there are no pages.
+        pages: ``PageContent`` objects (``page_number``, ``text``).
+    """
+    remove_item(db, item.id)
+    if pages:
+        rows = [(page.page_number, page.text) for page in pages]
+    else:
+        rows = [(None, full_text or "")]
+    db.execute(
+        text(
+            "INSERT INTO content_search "
+            "(item_id, library_id, organization_id, page_number, title, body) "
+            "VALUES (:item_id, :library_id, :organization_id, :page_number, :title, :body)"
+        ),
+        [
+            {
+                "item_id": item.id,
+                "library_id": item.library_id,
+                "organization_id": item.organization_id,
+                "page_number": page_number,
+                "title": item.title,
+                "body": body,
+            }
+            for page_number, body in rows
+        ],
+    )
+
+
+def index_item_from_disk(db: Session, item: ContentItem) -> bool:
+    """Index an item from its markdown files on disk (caller commits).
+
+    Returns:
+        ``True`` if the item had content to index.
+    """
+    full_text = content_service.read_full_markdown(
+        item.organization_id, item.library_id, item.id
+    )
+    if full_text is None:
+        return False
+    pages = []
+    for name in content_service.list_pages(item.organization_id, item.library_id, item.id):
+        page_text = content_service.read_page_markdown(
+            item.organization_id, item.library_id, item.id, name
+        )
+        match = re.search(r"(\d+)", name)
+        if page_text is not None and match:
+            pages.append(PageContent(page_number=int(match.group(1)), text=page_text))
+    index_item(db, item, full_text, pages)
+    return True
+
+
+def remove_item(db: Session, item_id: str) -> None:
+    """Drop an item's rows from the index (caller commits)."""
+    db.execute(text("DELETE FROM content_search WHERE item_id = :id"), {"id": item_id})
+
+
+def remove_library(db: Session, library_id: str) -> None:
+    """Drop every row of a library from the index (caller commits)."""
+    db.execute(
+        text("DELETE FROM content_search WHERE library_id = :id"), {"id": library_id}
+    )
+
+
+def backfill_index(db: Session | None = None) -> int:
+    """Index ready items that have no rows yet (e.g. imported before FTS).
+
+    Called once at startup (via lifespan) with its own session.
+
+    Returns:
+        Number of items indexed.
+    """
+    if db is None:
+        session = get_session_direct()
+        try:
+            return backfill_index(session)
+        finally:
+            session.close()
+
+    indexed = {
+        row[0] for row in db.execute(text("SELECT DISTINCT item_id FROM content_search"))
+    }
+    count = 0
+    for item in db.query(ContentItem).filter(ContentItem.status == "ready"):
+        if item.id in indexed:
+            continue
+        if index_item_from_disk(db, item):
+            count += 1
+    db.commit()
+    if count:
+        logger.info("Search index backfilled with %d item(s)", count)
+    return count
+
+
+def build_match_query(query: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted term (all must match), so FTS5 operators and
+    punctuation in user input cannot cause syntax errors. A trailing ``*``
+    on a word keeps prefix matching (``photo*``).
+
+    Returns:
+        MATCH expression, or ``""`` if the query has no searchable words.
+    """
+    terms = [f'"{word}"{star}' for word, star in _TERM_RE.findall(query)]
+    return " ".join(terms)
+
+
+def search_library(
+    db: Session,
+    library_id: str,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Search a library's content.
+
+    Args:
+        db: Database session.
+        library_id: Library to search.
+        query: Free-text query.
+        limit: Max hits.
+        offset: Skip count.
+
+    Returns:
+        Dict with ``query``, ``total`` and ``results`` (best match first).
+        Each result has ``item_id``, ``title``, ``page_number``, ``snippet``
+        (HTML-escaped text with matches wrapped in ``<mark>``), ``score``
+        and ``permalink``.
+
+    Raises:
+        ValueError: If the query has no searchable words.
+    """
+    match = build_match_query(query)
+    if not match:
+        raise ValueError("Search query must contain at least one word.")
+
+    params = {"match": match, "library_id": library_id}
+    total = db.execute(
+        text(
+            "SELECT count(*) FROM content_search "
+            "WHERE content_search MATCH :match AND library_id = :library_id"
+        ),
+        params,
+    ).scalar_one()
+
+    rows = db.execute(
+        text(
+            f"SELECT item_id, page_number, "
+            f"snippet(content_search, {_BODY_COLUMN}, :mark_open, :mark_close, '…', "
+            f"{_SNIPPET_TOKENS}) AS body_snippet, "
+            f"snippet(content_search, {_TITLE_COLUMN}, :mark_open, :mark_close, '…', "
+            f"{_SNIPPET_TOKENS}) AS title_snippet, "
+            f"{_BM25} AS score "
+            f"FROM content_search "
+            f"WHERE content_search MATCH :match AND library_id = :library_id "
+            f"ORDER BY score LIMIT :limit OFFSET :offset"
+        ),
+        {**params, "limit": limit, "offset": offset,
+         "mark_open": _MARK_OPEN, "mark_close": _MARK_CLOSE},
+    ).all()
+
+    items = {
+        item.id: item
+        for item in db.query(ContentItem).filter(
+            ContentItem.id.in_({row.item_id for row in rows})
+        )
+    }
+    results = []
+    for row in rows:
+        item = items.get(row.item_id)
+        if item is None:
+            continue
+        if row.page_number is not None:
+            permalink = (
+                f"{item.permalink_base}/content/pages/page_{int(row.page_number):03d}.md"
+            )
+        else:
+            permalink = f"{item.permalink_base}/content/full.md"
+        results.append({
+            "item_id": item.id,
+            "title": item.title,
+            "page_number": row.page_number,
+            # Title-only hits yield an empty body snippet; fall back to it.
+            "snippet": _render_snippet(
+                row.body_snippet if _MARK_OPEN in (row.body_snippet or "")
+                else row.title_snippet
+            ),
+            "score": -row.score,  # bm25 is lower-is-better
+            "permalink": permalink,
+        })
+
+    return {"query": query, "total": total, "results": results}
+
+
+def _render_snippet(snippet: str | None) -> str:
+    """Escape a raw FTS snippet and turn its match markers into ``<mark>``."""
+    escaped = html.escape(snippet or "", quote=False)
+    return escaped.replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
@@ -0,0 +1,51 @@
+"""In-process notifications for content item status changes.
+
+The worker publishes an item ID whenever the item's import finishes, and
+the status event stream (``GET /libraries/{id}/items/{item_id}/events``)
+waits on these notifications instead of polling the database. Publishing
+is thread-safe because jobs run in the worker's thread pool.
+
+Notifications only cross the boundaries of one process. Subscribers
+therefore still re-read the database after a timeout, which covers items
+finished by ``worker_main.py`` processes.
+"""
+
+import asyncio
+
+_loop: asyncio.AbstractEventLoop | None = None
+_subscribers: dict[str, set[asyncio.Event]] = {}
+
+
+def subscribe(item_id: str) -> asyncio.Event:
+    """Register interest in an item; the returned event is set on change.
+
+    Must be called from the event loop. Pair with ``unsubscribe``.
+    """
+    global _loop
+    _loop = asyncio.get_running_loop()
+    event = asyncio.Event()
+    _subscribers.setdefault(item_id, set()).add(event)
+    return event
+
+
+def unsubscribe(item_id: str, event: asyncio.Event) -> None:
+    """Drop a subscription created by ``subscribe``."""
+    waiters = _subscribers.get(item_id)
+    if waiters is None:
+        return
+    waiters.discard(event)
+    if not waiters:
+        del _subscribers[item_id]
+
+
+def publish(item_id: str) -> None:
+    """Wake every subscriber of ``item_id`` (safe to call from any thread)."""
+    loop = _loop
+    if loop is None or item_id not in _subscribers or loop.is_closed():
+        return
+    loop.call_soon_threadsafe(_wake, item_id)
+
+
+def _wake(item_id: str) -> None:
+    for event in _subscribers.get(item_id, ()):
+        event.set()
@@ -2,48 +2,87 @@
 
 Design:
     - Jobs are persisted to the ``import_jobs`` table so they survive restarts.
-    - An ``asyncio.Semaphore`` caps concurrent processing to
+    - A worker claims a job with a single atomic ``UPDATE … RETURNING`` and
+      holds a lease on it (``lease_owner`` / ``lease_expires_at``), renewed
+      by a heartbeat while the job runs. Several worker processes can
+      therefore share one database: by default the API process runs the
+      worker itself (``WORKER_MODE=embedded``); with ``WORKER_MODE=external``
+      the API only queues jobs and ``worker_main.py`` processes run them.
+    - Enqueueing a job wakes the worker loop immediately
+      (``notify_job_queued``); polling every ``WORKER_POLL_INTERVAL`` is only
+      the fallback for jobs queued by another process and for lease reaping.
+    - A job whose lease expired (its worker crashed or hung) is put back to
+      ``pending`` by any worker, or marked failed after ``_MAX_ATTEMPTS``.
+    - An ``asyncio.Semaphore`` caps concurrent processing per process to
       ``MAX_CONCURRENT_IMPORTS``.
-    - The worker loop polls for pending jobs every few seconds.
     - Each job is executed in a thread pool (``run_in_executor``) because
       import plugins are synchronous (file I/O, network calls, LLM APIs).
     - On completion the job row is updated; on failure the error is recorded.
-    - API keys are cleared from the job row as soon as processing starts.
+    - API keys never touch the database. The API process holds them in
+      memory; an embedded worker pops them directly, an external worker
+      collects them once over HTTP from the API process.
 """
 
 import asyncio
 import logging
 import os
+import socket
+import uuid
 from concurrent.futures import ThreadPoolExecutor
-from datetime import UTC, datetime
-
-from config import IMPORT_TASK_TIMEOUT_SECONDS, MAX_CONCURRENT_IMPORTS
+from datetime import UTC, datetime, timedelta
+
+import requests
+from config import (
+    API_INTERNAL_URL,
+    IMPORT_TASK_TIMEOUT_SECONDS,
+    JOB_LEASE_SECONDS,
+    LAMB_API_TOKEN,
+    MAX_CONCURRENT_IMPORTS,
+    WORKER_POLL_INTERVAL,
+)
 from database.connection import get_session_direct
 from database.models import ContentItem, ImportJob
+from sqlalchemy import or_, select, update
 from sqlalchemy.orm import Session
 
+from tasks import status_events
+
 logger = logging.getLogger(__name__)
 
 _semaphore: asyncio.Semaphore | None = None
 _executor: ThreadPoolExecutor | None = None
+_poll_task: asyncio.Task | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+# Set when a job is queued or a slot frees up; wakes the poll loop early.
+_wakeup: asyncio.Event | None = None
 _running = False
+# True when running in a ``worker_main.py`` process rather than the API.
+_external = False
+
+# Identifies this process as a lease owner in ``import_jobs.lease_owner``.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
 
 # In-memory store for API keys — never written to disk.
-# Maps job_id → api_keys dict. Entries are removed once the worker picks them up.
+# Maps job_id → api_keys dict. Entries are removed once a worker picks them up.
 _job_api_keys: dict[str, dict[str, str]] = {}
 
-# How often (seconds) the worker checks for new pending jobs.
-_POLL_INTERVAL = 2.0
+_MAX_ATTEMPTS = int(os.getenv("LM_MAX_JOB_ATTEMPTS", "3"))
+
+# Renew leases well before they expire so one slow heartbeat is not fatal.
+_HEARTBEAT_INTERVAL = max(1.0, JOB_LEASE_SECONDS / 3)
+
+_KEYS_FETCH_TIMEOUT = 10
 
 
 def store_api_keys(job_id: str, api_keys: dict[str, str] | None) -> None:
-    """Hold API keys in memory for a job until the worker picks it up.
+    """Hold API keys in memory for a job until a worker picks it up.
 
-    Called by import_service after committing the job to SQLite. The keys
-    live only in this dict and are popped by the worker when processing
-    starts. If the service restarts before the worker picks up the job,
-    the keys are lost and the import will run without them (plugins that
-    need keys will fail and the job will be marked failed).
+    Called by import_service before committing the job to SQLite, so a
+    worker can never claim the job before its keys are available. The keys
+    live only in this dict and are popped when processing starts. If the
+    service restarts before a worker picks up the job, the keys are lost
+    and the import will run without them (plugins that need keys will fail
+    and the job will be marked failed).
 
     Args:
         job_id: The import job ID.
@@ -53,6 +92,32 @@ def store_api_keys(job_id: str, api_keys: dict[str, str] | None) -> None:
         _job_api_keys[job_id] = api_keys
 
 
+def take_api_keys(job_id: str) -> dict[str, str]:
+    """Remove and return the API keys held for a job.
+
+    Used by the embedded worker and by the internal endpoint that hands
+    keys to external workers. Keys can be taken only once.
+
+    Args:
+        job_id: The import job ID.
+
+    Returns:
+        The API keys dict (empty if none were given or already taken).
+    """
+    return _job_api_keys.pop(job_id, {})
+
+
+def notify_job_queued() -> None:
+    """Wake the worker loop so a newly committed job is claimed right away.
+
+    Safe to call from any thread. A no-op when no worker runs in this
+    process (external mode); those workers pick the job up on their next poll.
+    """
+    loop, wakeup = _loop, _wakeup
+    if loop is not None and wakeup is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(wakeup.set)
+
+
 def is_worker_running() -> bool:
     """Check if the worker loop is active."""
     return _running
@@ -63,12 +128,129 @@ def _get_db() -> Session:
     return get_session_direct()
 
 
+def _fetch_api_keys(job_id: str) -> dict[str, str]:
+    """Get a claimed job's API keys, from memory or from the API process.
+
+    Keys are popped locally when the job was queued by this process.
+    External workers ask the API process for them instead; a failed request
+    is logged and the import proceeds without keys.
+    """
+    if job_id in _job_api_keys or not _external:
+        return take_api_keys(job_id)
+    try:
+        resp = requests.post(
+            f"{API_INTERNAL_URL.rstrip('/')}/internal/jobs/{job_id}/api-keys",
+            headers={"Authorization": f"Bearer {LAMB_API_TOKEN}"},
+            timeout=_KEYS_FETCH_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json().get("api_keys") or {}
+    except (requests.RequestException, ValueError) as exc:
+        logger.warning("Could not fetch API keys for job %s: %s", job_id, exc)
+        return {}
+
+
+# ---------------------------------------------------------------------------
+# Leases
+# ---------------------------------------------------------------------------
+
+
+def claim_next_job(db: Session, owner: str = WORKER_ID) -> str | None:
+    """Atomically claim the oldest pending job.
+
+    The subquery and the update run as one statement, so two workers
+    polling at the same time can never claim the same job.
+
+    Args:
+        db: Database session.
+        owner: Lease owner to record.
+
+    Returns:
+        The claimed job ID, or ``None`` if no job is pending.
+    """
+    now = datetime.now(UTC)
+    oldest_pending = (
+        select(ImportJob.id)
+        .where(ImportJob.status == "pending")
+        .order_by(ImportJob.created_at.asc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    job_id = db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == oldest_pending, ImportJob.status == "pending")
+        .values(
+            status="processing",
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=JOB_LEASE_SECONDS),
+            attempts=ImportJob.attempts + 1,
+            started_at=now,
+            updated_at=now,
+        )
+        .returning(ImportJob.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    db.commit()
+    return job_id
+
+
+def renew_lease(db: Session, job_id: str, owner: str = WORKER_ID) -> bool:
+    """Extend the lease of a job this worker still owns.
+
+    Returns:
+        ``False`` if the job is no longer processing under ``owner``
+        (e.g. the lease expired and another worker took it over).
+    """
+    result = db.execute(
+        update(ImportJob)
+        .where(
+            ImportJob.id == job_id,
+            ImportJob.status == "processing",
+            ImportJob.lease_owner == owner,
+        )
+        .values(lease_expires_at=datetime.now(UTC) + timedelta(seconds=JOB_LEASE_SECONDS))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount > 0
+
+
+def _holds_lease(job: ImportJob) -> bool:
+    """True if ``job`` is still processing under this worker's lease."""
+    return job.status == "processing" and job.lease_owner == WORKER_ID
+
+
+def _fail_job(db: Session, job: ImportJob, error_msg: str) -> None:
+    """Mark a job and its content item as failed and release the lease."""
+    job.status = "failed"
+    job.error_message = error_msg
+    job.completed_at = datetime.now(UTC)
+    job.lease_owner = None
+    job.lease_expires_at = None
+
+    item = (
+        db.query(ContentItem)
+        .filter(ContentItem.id == job.content_item_id)
+        .first()
+    )
+    if item:
+        item.status = "failed"
+        item.error_message = error_msg
+    db.commit()
+    status_events.publish(job.content_item_id)
+
+
+# ---------------------------------------------------------------------------
+# Job execution
+# ---------------------------------------------------------------------------
+
+
 def _process_job_sync(job_id: str) -> None:
-    """Run the import plugin for a single job (synchronous, in thread pool).
+    """Run the import plugin for a claimed job (synchronous, in thread pool).
 
     This function:
       1. Loads the job from the database.
-      2. Pops API keys from the in-memory store.
+      2. Obtains its API keys from the API process's memory.
       3. Runs the appropriate import plugin.
       4. Writes structured content to disk.
       5. Updates the ``content_items`` and ``import_jobs`` rows.
@@ -86,59 +268,78 @@ def _process_job_sync(job_id: str) -> None:
             logger.error("Job %s not found in database", job_id)
             return
 
-        api_keys = _job_api_keys.pop(job_id, {})
-
-        job.status = "processing"
-        job.started_at = datetime.now(UTC)
-        job.attempts += 1
-        db.commit()
+        api_keys = _fetch_api_keys(job_id)
 
         logger.info(
-            "Processing job %s (item=%s, plugin=%s, attempt=%d)",
+            "Processing job %s (item=%s, plugin=%s, attempt=%d, worker=%s)",
             job_id,
             job.content_item_id,
             job.plugin_name,
             job.attempts,
+            WORKER_ID,
         )
 
         execute_import_job(db, job, api_keys)
 
-        job.status = "completed"
-        job.completed_at = datetime.now(UTC)
+        # Finalize only while this worker still holds the lease; otherwise
+        # the reaper or the new owner has already moved the job on.
+        finalized = db.execute(
+            update(ImportJob)
+            .where(
+                ImportJob.id == job_id,
+                ImportJob.status == "processing",
+                ImportJob.lease_owner == WORKER_ID,
+            )
+            .values(
+                status="completed",
+                completed_at=datetime.now(UTC),
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
+        if not finalized:
+            logger.warning("Job %s finished after this worker lost its lease", job_id)
+            return
+        status_events.publish(job.content_item_id)
 
         logger.info("Job %s completed successfully", job_id)
 
     except Exception as exc:
         logger.exception("Job %s failed", job_id)
         try:
+            db.rollback()
             # Store sanitized message for API consumers; full trace goes to logs only.
             error_msg = f"Import failed: {type(exc).__name__}: {str(exc)[:500]}"
             job = db.query(ImportJob).filter(ImportJob.id == job_id).first()
-            if job:
-                job.status = "failed"
-                job.error_message = error_msg
-                job.completed_at = datetime.now(UTC)
-                db.commit()
-
-                item = (
-                    db.query(ContentItem)
-                    .filter(ContentItem.id == job.content_item_id)
-                    .first()
-                )
-                if item:
-                    item.status = "failed"
-                    item.error_message = error_msg
-                    db.commit()
+            if job and _holds_lease(job):
+                _fail_job(db, job, error_msg)
         except Exception:
             logger.exception("Failed to record error for job %s", job_id)
     finally:
         db.close()
 
 
+async def _heartbeat(job_id: str) -> None:
+    """Renew a job's lease until cancelled or the lease is lost."""
+    while True:
+        await asyncio.sleep(_HEARTBEAT_INTERVAL)
+        db = _get_db()
+        try:
+            if not renew_lease(db, job_id):
+                logger.warning("Lost lease on job %s", job_id)
+                return
+        except Exception:
+            logger.warning("Failed to renew lease on job %s", job_id, exc_info=True)
+        finally:
+            db.close()
+
+
 async def _process_job_async(job_id: str) -> None:
     """Wrap the synchronous job processor in the thread pool with a timeout."""
     loop = asyncio.get_running_loop()
+    heartbeat = asyncio.create_task(_heartbeat(job_id))
     try:
         await asyncio.wait_for(
             loop.run_in_executor(_executor, _process_job_sync, job_id),
@@ -150,60 +351,45 @@ async def _process_job_async(job_id: str) -> None:
         db = _get_db()
         try:
             job = db.query(ImportJob).filter(ImportJob.id == job_id).first()
-            if job:
-                job.status = "failed"
-                job.error_message = timeout_msg
-                job.completed_at = datetime.now(UTC)
-                db.commit()
-
-                item = (
-                    db.query(ContentItem)
-                    .filter(ContentItem.id == job.content_item_id)
-                    .first()
-                )
-                if item:
-                    item.status = "failed"
-                    item.error_message = timeout_msg
-                db.commit()
+            if job and _holds_lease(job):
+                _fail_job(db, job, timeout_msg)
         finally:
             db.close()
-
-
-_dispatched: set[str] = set()
+    finally:
+        heartbeat.cancel()
 
 
 async def _poll_loop() -> None:
-    """Continuously poll for pending jobs and dispatch them.
+    """Continuously reap expired leases and claim pending jobs.
 
-    Each pending job is dispatched as an ``asyncio.Task`` guarded by
-    the semaphore, so at most ``MAX_CONCURRENT_IMPORTS`` jobs run
-    concurrently. The ``_dispatched`` set prevents the same job from
-    being dispatched twice between poll cycles.
+    Jobs are claimed only while this process has a free slot, and each
+    claimed job runs as an ``asyncio.Task`` guarded by the semaphore, so at
+    most ``MAX_CONCURRENT_IMPORTS`` jobs run here concurrently. Other
+    worker processes claim the rest.
     """
     while _running:
-        db = _get_db()
         try:
-            pending_jobs = (
-                db.query(ImportJob)
-                .filter(ImportJob.status == "pending")
-                .order_by(ImportJob.created_at.asc())
-                .limit(MAX_CONCURRENT_IMPORTS)
-                .all()
-            )
-            job_ids = [j.id for j in pending_jobs if j.id not in _dispatched]
-        finally:
-            db.close()
-
-        for job_id in job_ids:
-            _dispatched.add(job_id)
-            try:
+            recover_stale_jobs()
+            while not _semaphore.locked():
+                db = _get_db()
+                try:
+                    job_id = claim_next_job(db)
+                finally:
+                    db.close()
+                if job_id is None:
+                    break
                 await _semaphore.acquire()
                 asyncio.create_task(_run_with_semaphore(job_id))
-            except (asyncio.CancelledError, Exception):
-                _dispatched.discard(job_id)
-                raise
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Worker poll cycle failed")
 
-        await asyncio.sleep(_POLL_INTERVAL)
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=WORKER_POLL_INTERVAL)
+        except TimeoutError:
+            pass
+        _wakeup.clear()
 
 
 async def _run_with_semaphore(job_id: str) -> None:
@@ -211,69 +397,89 @@ async def _run_with_semaphore(job_id: str) -> None:
     try:
         await _process_job_async(job_id)
     finally:
-        _dispatched.discard(job_id)
         _semaphore.release()
+        _wakeup.set()
 
 
-async def start_worker() -> None:
+async def start_worker(external: bool = False) -> None:
     """Start the background worker loop.
 
-    Called once during FastAPI ``lifespan`` startup.
+    Called once during FastAPI ``lifespan`` startup (embedded mode) or by
+    ``worker_main.py`` (external mode).
+
+    Args:
+        external: Whether this process is a standalone worker that must
+            fetch API keys from the API process.
     """
-    global _semaphore, _executor, _running
+    global _semaphore, _executor, _poll_task, _loop, _wakeup, _running, _external
 
     _semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMPORTS)
+    _loop = asyncio.get_running_loop()
+    _wakeup = asyncio.Event()
     _executor = ThreadPoolExecutor(
         max_workers=MAX_CONCURRENT_IMPORTS,
         thread_name_prefix="import-worker",
     )
+    _external = external
     _running = True
 
     logger.info(
-        "Import worker started (max_concurrent=%d, timeout=%ds)",
+        "Import worker %s started (max_concurrent=%d, timeout=%ds, lease=%ds)",
+        WORKER_ID,
         MAX_CONCURRENT_IMPORTS,
         IMPORT_TASK_TIMEOUT_SECONDS,
+        JOB_LEASE_SECONDS,
     )
 
-    asyncio.create_task(_poll_loop())
+    _poll_task = asyncio.create_task(_poll_loop())
 
 
 async def stop_worker() -> None:
     """Signal the worker loop to stop and shut down the thread pool.
 
-    Called during FastAPI ``lifespan`` shutdown.
+    Called during FastAPI ``lifespan`` shutdown. Jobs still running keep
+    their lease until it expires, after which another worker retries them.
     """
-    global _running
+    global _running, _poll_task, _loop
     _running = False
+    _loop = None
+
+    if _poll_task:
+        _poll_task.cancel()
+        _poll_task = None
 
     if _executor:
         _executor.shutdown(wait=False)
 
-    _dispatched.clear()
     logger.info("Import worker stopped")
 
 
-_MAX_ATTEMPTS = int(os.getenv("LM_MAX_JOB_ATTEMPTS", "3"))
-
-
 def recover_stale_jobs() -> None:
-    """Reset stale jobs that were left in 'processing' state after a crash.
+    """Reset jobs left in 'processing' state whose lease has expired.
 
-    Called once at startup. Jobs exceeding ``_MAX_ATTEMPTS`` are marked as
-    failed instead of being retried.
+    Called at startup and on every poll cycle, so a job whose worker
+    crashed is retried by whichever worker notices first. Jobs without a
+    lease (queued by an older version) count as expired. Jobs exceeding
+    ``_MAX_ATTEMPTS`` are marked as failed instead of being retried.
     """
     db = _get_db()
     try:
         stale = (
             db.query(ImportJob)
-            .filter(ImportJob.status == "processing")
+            .filter(
+                ImportJob.status == "processing",
+                or_(
+                    ImportJob.lease_expires_at.is_(None),
+                    ImportJob.lease_expires_at < datetime.now(UTC),
+                ),
+            )
             .all()
         )
         for job in stale:
             if job.attempts >= _MAX_ATTEMPTS:
                 error_msg = (
                     f"Exceeded max attempts ({_MAX_ATTEMPTS}) — "
-                    f"last seen processing when service restarted."
+                    f"last seen processing when its worker stopped responding."
                 )
                 job.status = "failed"
                 job.error_message = error_msg
@@ -291,8 +497,12 @@ def recover_stale_jobs() -> None:
             else:
                 job.status = "pending"
                 logger.info("Job %s reset to pending (attempt %d)", job.id, job.attempts)
+            job.lease_owner = None
+            job.lease_expires_at = None
         if stale:
             db.commit()
+            for job in stale:
+                status_events.publish(job.content_item_id)
             logger.info("Recovered %d stale jobs", len(stale))
     finally:
         db.close()
@@ -0,0 +1,46 @@
+"""Library Manager — standalone import worker entry point.
+
+Runs the import worker without the HTTP API, so import throughput can be
+scaled with extra processes or containers. Start the API with
+``WORKER_MODE=external`` and point every worker at the same ``DATA_DIR``
+(the SQLite database and content tree) and ``LAMB_API_TOKEN``:
+
+    python worker_main.py
+
+Workers claim jobs through leases in the ``import_jobs`` table and collect
+each job's API keys from the API process at ``API_INTERNAL_URL``.
+"""
+
+import asyncio
+import logging
+import signal
+
+import config
+from database.connection import init_db
+from main import _discover_plugins
+from tasks.worker import recover_stale_jobs, start_worker, stop_worker
+
+logger = logging.getLogger("worker_main")
+
+
+async def _run() -> None:
+    """Run the worker loop until SIGINT/SIGTERM."""
+    config.ensure_directories()
+    # The API process owns the instance lock; workers share the database.
+    init_db(exclusive=False)
+    _discover_plugins()
+    recover_stale_jobs()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await start_worker(external=True)
+    logger.info("Import worker process running (api=%s)", config.API_INTERNAL_URL)
+    await stop.wait()
+    await stop_worker()
+
+
+if __name__ == "__main__":
+    asyncio.run(_run())
@@ -0,0 +1,110 @@
+"""Tests for content-addressed deduplication of originals and images."""
+
+import asyncio
+import io
+import time
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+
+_POLL_TIMEOUT = 15
+
+
+async def _import_and_wait(client, lib_id, content, filename="dup.md"):
+    """Upload a markdown file and poll until the import finishes."""
+    resp = await client.post(
+        f"/libraries/{lib_id}/import/file",
+        headers=AUTH_HEADERS,
+        files={"file": (filename, io.BytesIO(content.encode()), "text/markdown")},
+        data={"plugin_name": "simple_import", "title": "Dedup Doc"},
+    )
+    item_id = resp.json()["item_id"]
+    deadline = time.monotonic() + _POLL_TIMEOUT
+    while time.monotonic() < deadline:
+        resp = await client.get(
+            f"/libraries/{lib_id}/items/{item_id}/status", headers=AUTH_HEADERS,
+        )
+        body = resp.json()
+        if body["status"] in ("ready", "failed"):
+            return item_id, body
+        await asyncio.sleep(0.3)
+    raise AssertionError("import did not finish")
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_share_blob_and_reuse_output(
+    client: AsyncClient, library: dict,
+):
+    """A second upload of the same bytes reuses the first import and its blob."""
+    from config import CONTENT_DIR  # noqa: PLC0415
+    from services import blob_service  # noqa: PLC0415
+
+    other_id = f"lib-{uuid.uuid4().hex[:8]}"
+    resp = await client.post(
+        "/libraries",
+        headers=AUTH_HEADERS,
+        json={"id": other_id, "organization_id": "org-test", "name": f"Other {other_id}"},
+    )
+    assert resp.status_code == 201
+
+    content = f"# Shared Textbook {uuid.uuid4().hex}\n\nSame bytes everywhere."
+    first_id, first = await _import_and_wait(client, library["id"], content)
+    second_id, second = await _import_and_wait(client, other_id, content)
+    assert first["status"] == second["status"] == "ready"
+    assert (second["processing_stats"] or {}).get("reused_from_item") == first_id
+
+    first_original = CONTENT_DIR / "org-test" / library["id"] / first_id / "original" / "dup.md"
+    second_original = CONTENT_DIR / "org-test" / other_id / second_id / "original" / "dup.md"
+    assert first_original.stat().st_ino == second_original.stat().st_ino
+
+    resp = await client.get(
+        f"/libraries/{other_id}/items/{second_id}/content", headers=AUTH_HEADERS,
+    )
+    assert "Same bytes everywhere." in resp.text
+
+    blob = blob_service.blob_path(blob_service.hash_file(first_original))
+    assert blob.is_file()
+
+    # Still referenced by the second item after the first is deleted.
+    resp = await client.delete(
+        f"/libraries/{library['id']}/items/{first_id}", headers=AUTH_HEADERS,
+    )
+    assert resp.status_code == 200
+    assert blob.is_file()
+
+    # Garbage-collected once the last reference goes away.
+    resp = await client.delete(f"/libraries/{other_id}", headers=AUTH_HEADERS)
+    assert resp.status_code == 200
+    assert not blob.exists()
+
+
+@pytest.mark.asyncio
+async def test_identical_upload_in_another_org_is_imported_again(
+    client: AsyncClient, library: dict,
+):
+    """Output is reused within an organization only; the blob stays shared."""
+    from config import CONTENT_DIR  # noqa: PLC0415
+
+    other_id = f"lib-{uuid.uuid4().hex[:8]}"
+    resp = await client.post(
+        "/libraries",
+        headers=AUTH_HEADERS,
+        json={"id": other_id, "organization_id": "org-other", "name": f"Other {other_id}"},
+    )
+    assert resp.status_code == 201
+
+    content = f"# Cross-org Textbook {uuid.uuid4().hex}\n\nSame bytes, other org."
+    first_id, first = await _import_and_wait(client, library["id"], content)
+    second_id, second = await _import_and_wait(client, other_id, content)
+    assert first["status"] == second["status"] == "ready"
+    assert "reused_from_item" not in (second["processing_stats"] or {})
+
+    first_original = CONTENT_DIR / "org-test" / library["id"] / first_id / "original" / "dup.md"
+    second_original = CONTENT_DIR / "org-other" / other_id / second_id / "original" / "dup.md"
+    assert first_original.stat().st_ino == second_original.stat().st_ino
+
+    resp = await client.delete(f"/libraries/{other_id}", headers=AUTH_HEADERS)
+    assert resp.status_code == 200
@@ -219,3 +219,71 @@ async def test_items_filter_by_ids(client: AsyncClient, library: dict):
     data = resp.json()
     assert data["total"] == 1
     assert data["items"][0]["id"] == item1
+
+
+@pytest.mark.asyncio
+async def test_original_file_supports_etag_and_ranges(client: AsyncClient, library: dict):
+    """Original files carry an ETag, answer If-None-Match with 304 and serve byte ranges."""
+    lib_id = library["id"]
+    content = "# Range Test\n\n" + "0123456789" * 20
+    item_id = await _upload_md(client, lib_id, content, filename="range-test.md")
+    url = f"/libraries/{lib_id}/items/{item_id}/original/range-test.md"
+
+    full = await client.get(url, headers=AUTH_HEADERS)
+    assert full.status_code == 200
+    assert full.headers["accept-ranges"] == "bytes"
+    etag = full.headers["etag"]
+
+    not_modified = await client.get(url, headers={**AUTH_HEADERS, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    partial = await client.get(url, headers={**AUTH_HEADERS, "Range": "bytes=2-7"})
+    assert partial.status_code == 206
+    assert partial.content == full.content[2:8]
+    assert partial.headers["content-range"] == f"bytes 2-7/{len(full.content)}"
+
+    suffix = await client.get(url, headers={**AUTH_HEADERS, "Range": "bytes=-5"})
+    assert suffix.content == full.content[-5:]
+
+    stale = await client.get(url, headers={**AUTH_HEADERS, "Range": "bytes=0-3", "If-Range": '"old"'})
+    assert stale.status_code == 200
+
+    unsatisfiable = await client.get(url, headers={**AUTH_HEADERS, "Range": "bytes=99999-"})
+    assert unsatisfiable.status_code == 416
+
+
+@pytest.mark.asyncio
+async def test_status_event_stream_ends_when_ready(client: AsyncClient, library: dict):
+    """The events endpoint pushes status changes and closes at a terminal status."""
+    import json  # noqa: PLC0415
+
+    lib_id = library["id"]
+    resp = await client.post(
+        f"/libraries/{lib_id}/import/file",
+        headers=AUTH_HEADERS,
+        files={"file": ("events.md", io.BytesIO(b"# Events\n\nPushed."), "text/markdown")},
+        data={"plugin_name": "simple_import", "title": "Events"},
+    )
+    item_id = resp.json()["item_id"]
+
+    started = time.monotonic()
+    async with client.stream(
+        "GET", f"/libraries/{lib_id}/items/{item_id}/events", headers=AUTH_HEADERS,
+    ) as stream:
+        assert stream.headers["content-type"].startswith("text/event-stream")
+        body = (await stream.aread()).decode()
+    # Job pickup and completion are pushed, not found by a poll cycle.
+    assert time.monotonic() - started < _POLL_TIMEOUT
+
+    events = [
+        json.loads(line[len("data: "):])
+        for line in body.splitlines() if line.startswith("data: ")
+    ]
+    assert events[-1]["status"] == "ready"
+    assert events[-1]["item_id"] == item_id
+
+    missing = await client.get(
+        f"/libraries/{lib_id}/items/nonexistent/events", headers=AUTH_HEADERS,
+    )
+    assert missing.status_code == 404
@@ -139,3 +139,60 @@ async def test_import_invalid_zip(client: AsyncClient):
         files={"file": ("not-a-zip.zip", io.BytesIO(b"not a zip"), "application/zip")},
     )
     assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_skips_member_naming_the_item_directory(client: AsyncClient):
+    """A member named exactly ``content/<id>`` is skipped, not written over the item dir."""
+    manifest = {
+        "format_version": "1.0",
+        "type": "library_export",
+        "library": {"name": "Odd Archive"},
+        "items": [{"id": "old-item", "title": "Odd Item", "import_plugin": "simple_import"}],
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("manifest.json", json.dumps(manifest))
+        zf.writestr("content/old-item", b"not a directory")
+        zf.writestr("content/old-item/content/full.md", "# Odd Item\n\nStill imported.")
+
+    resp = await client.post(
+        "/libraries/import",
+        headers=AUTH_HEADERS,
+        params={"organization_id": "org-odd"},
+        files={"file": ("odd.zip", io.BytesIO(buffer.getvalue()), "application/zip")},
+    )
+    assert resp.status_code == 201
+    new_lib_id = resp.json()["library_id"]
+
+    resp = await client.get(f"/libraries/{new_lib_id}/items", headers=AUTH_HEADERS)
+    new_item_id = resp.json()["items"][0]["id"]
+    resp = await client.get(
+        f"/libraries/{new_lib_id}/items/{new_item_id}/content", headers=AUTH_HEADERS,
+    )
+    assert "Still imported." in resp.text
+
+
+def test_stream_library_zip_yields_chunks_with_manifest_last(tmp_path, monkeypatch):
+    """The streamed archive is produced incrementally and stays a valid ZIP."""
+    import os
+
+    from services import export_service
+
+    monkeypatch.setattr(export_service, "CONTENT_DIR", tmp_path)
+    item_dir = tmp_path / "org-s" / "lib-s" / "item-1"
+    (item_dir / "original").mkdir(parents=True)
+    payload = os.urandom(3 * export_service._ZIP_CHUNK_SIZE)  # incompressible
+    (item_dir / "original" / "big.bin").write_bytes(payload)
+    (item_dir / "metadata.json").write_text("{}")
+
+    manifest = {"format_version": "1.0", "type": "library_export",
+                "library": {"name": "S"}, "items": [{"id": "item-1"}]}
+    chunks = list(export_service._iter_library_zip("lib-s", "org-s", manifest))
+
+    assert len(chunks) > 3
+    assert max(len(c) for c in chunks) < 2 * export_service._ZIP_CHUNK_SIZE
+    zf = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert zf.namelist()[-1] == "manifest.json"
+    assert zf.read("content/item-1/original/big.bin") == payload
+    assert zf.testzip() is None
@@ -0,0 +1,63 @@
+"""Tests for concurrent, cached LLM image descriptions."""
+
+import threading
+import time
+
+
+def test_descriptions_run_concurrently_and_are_cached(tmp_path):
+    """Unseen images are described in parallel; repeats and re-runs hit the cache."""
+    from plugins.image_descriptions import DescriptionCache, describe_images  # noqa: PLC0415
+
+    cache = DescriptionCache(tmp_path / "descriptions.db")
+    images = [b"image-a", b"image-b", b"image-a", b"image-c"]
+    calls: list[int] = []
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def describe(index: int) -> str:
+        nonlocal in_flight, peak
+        with lock:
+            calls.append(index)
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return f"described {images[index].decode()}"
+
+    results, served = describe_images(
+        images, describe, model="m", prompt="p", cache=cache, max_workers=4,
+    )
+    assert results == [
+        "described image-a", "described image-b", "described image-a", "described image-c",
+    ]
+    assert sorted(calls) == [0, 1, 3]
+    assert served == 1
+    assert peak > 1
+
+    calls.clear()
+    results, served = describe_images(images, describe, model="m", prompt="p", cache=cache)
+    assert calls == []
+    assert served == 4
+
+    # A different prompt is a different cache entry.
+    describe_images(images[:1], describe, model="m", prompt="other", cache=cache)
+    assert calls == [0]
+
+
+def test_failed_descriptions_are_not_cached(tmp_path):
+    """A ``None`` result is returned as-is and retried on the next run."""
+    from plugins.image_descriptions import DescriptionCache, describe_images  # noqa: PLC0415
+
+    cache = DescriptionCache(tmp_path / "descriptions.db")
+    results, served = describe_images(
+        [b"broken"], lambda index: None, model="m", prompt="p", cache=cache,
+    )
+    assert results == [None]
+    assert served == 0
+
+    results, _ = describe_images(
+        [b"broken"], lambda index: "recovered", model="m", prompt="p", cache=cache,
+    )
+    assert results == ["recovered"]
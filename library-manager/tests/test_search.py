@@ -0,0 +1,97 @@
+"""Tests for full-text search over library content."""
+
+import asyncio
+import io
+import time
+
+import pytest
+from httpx import AsyncClient
+
+AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+
+_POLL_TIMEOUT = 15
+
+
+async def _import_and_wait(client, lib_id, title, content):
+    """Upload a markdown file and poll until it is ready."""
+    resp = await client.post(
+        f"/libraries/{lib_id}/import/file",
+        headers=AUTH_HEADERS,
+        files={"file": (f"{title}.md", io.BytesIO(content.encode()), "text/markdown")},
+        data={"plugin_name": "simple_import", "title": title},
+    )
+    item_id = resp.json()["item_id"]
+    deadline = time.monotonic() + _POLL_TIMEOUT
+    while time.monotonic() < deadline:
+        resp = await client.get(
+            f"/libraries/{lib_id}/items/{item_id}/status", headers=AUTH_HEADERS,
+        )
+        if resp.json()["status"] in ("ready", "failed"):
+            return item_id
+        await asyncio.sleep(0.3)
+    raise AssertionError("import did not finish")
+
+
+@pytest.mark.asyncio
+async def test_search_finds_items_and_tracks_deletes(client: AsyncClient, library: dict):
+    """Search returns ranked snippets and forgets deleted items."""
+    lib_id = library["id"]
+    photo_id = await _import_and_wait(
+        client, lib_id, "Botany",
+        "# Plants\n\nPhotosynthesis converts light into chemical energy.",
+    )
+    await _import_and_wait(
+        client, lib_id, "History",
+        "# Rome\n\nThe empire was founded by Augustus.",
+    )
+
+    resp = await client.get(
+        f"/libraries/{lib_id}/search", params={"q": "photosynthesis"}, headers=AUTH_HEADERS,
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 1
+    hit = body["results"][0]
+    assert hit["item_id"] == photo_id
+    assert "<mark>Photosynthesis</mark>" in hit["snippet"]
+    assert hit["permalink"].endswith(f"/{photo_id}/content/full.md")
+
+    # Prefix and stemmed matches; FTS syntax in user input is treated as text.
+    resp = await client.get(
+        f"/libraries/{lib_id}/search", params={"q": 'photo* "convert'}, headers=AUTH_HEADERS,
+    )
+    assert resp.json()["total"] == 1
+
+    resp = await client.delete(f"/libraries/{lib_id}/items/{photo_id}", headers=AUTH_HEADERS)
+    assert resp.status_code == 200
+    resp = await client.get(
+        f"/libraries/{lib_id}/search", params={"q": "photosynthesis"}, headers=AUTH_HEADERS,
+    )
+    assert resp.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_query_without_words(client: AsyncClient, library: dict):
+    """A query with only punctuation is a client error."""
+    resp = await client.get(
+        f"/libraries/{library['id']}/search", params={"q": '"*'}, headers=AUTH_HEADERS,
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_escapes_markup(client: AsyncClient, library: dict):
+    """Markup in the indexed text comes back escaped; only matches are marked."""
+    lib_id = library["id"]
+    await _import_and_wait(
+        client, lib_id, "Injected",
+        "# Notes\n\nChlorophyll <img src=x onerror=alert(1)> & <b>pigments</b>.",
+    )
+
+    resp = await client.get(
+        f"/libraries/{lib_id}/search", params={"q": "chlorophyll"}, headers=AUTH_HEADERS,
+    )
+    snippet = resp.json()["results"][0]["snippet"]
+    assert "<mark>Chlorophyll</mark>" in snippet
+    assert "&lt;img src=x onerror=alert(1)&gt; &amp; &lt;b&gt;pigments&lt;/b&gt;" in snippet
+    assert "<img" not in snippet and "<b>" not in snippet
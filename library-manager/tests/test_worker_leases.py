@@ -0,0 +1,143 @@
+"""Tests for leased job claims shared by several worker processes."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+
+
+def _add_job(db, job_id: str, library_id: str, **fields) -> None:
+    from database.models import ImportJob  # noqa: PLC0415
+
+    db.add(ImportJob(
+        id=job_id,
+        content_item_id="fake-item",
+        library_id=library_id,
+        organization_id="org-test",
+        source_type="file",
+        plugin_name="simple_import",
+        title="Lease Job",
+        **fields,
+    ))
+    db.commit()
+
+
+def test_claim_is_exclusive_and_lease_guarded():
+    """Two owners never claim the same job; only the owner can renew it."""
+    from database.connection import get_session_direct  # noqa: PLC0415
+    from database.models import ImportJob  # noqa: PLC0415
+    from tasks.worker import claim_next_job, renew_lease  # noqa: PLC0415
+
+    db = get_session_direct()
+    try:
+        _add_job(db, "lease-job-001", "lib-lease", status="pending")
+
+        claimed = [claim_next_job(db, owner="worker-a"), claim_next_job(db, owner="worker-b")]
+        assert claimed == ["lease-job-001", None]
+
+        job = db.query(ImportJob).filter(ImportJob.id == "lease-job-001").first()
+        assert job.status == "processing"
+        assert job.lease_owner == "worker-a"
+        assert job.attempts == 1
+
+        assert renew_lease(db, "lease-job-001", owner="worker-a")
+        assert not renew_lease(db, "lease-job-001", owner="worker-b")
+    finally:
+        db.query(ImportJob).filter(ImportJob.id == "lease-job-001").delete()
+        db.commit()
+        db.close()
+
+
+def test_expired_lease_is_requeued():
+    """A processing job whose lease expired goes back to pending; a live one stays."""
+    from database.connection import get_session_direct  # noqa: PLC0415
+    from database.models import ImportJob  # noqa: PLC0415
+    from tasks.worker import recover_stale_jobs  # noqa: PLC0415
+
+    now = datetime.now(UTC)
+    db = get_session_direct()
+    try:
+        _add_job(db, "lease-job-002", "lib-lease", status="processing", attempts=1,
+                 lease_owner="dead-worker", lease_expires_at=now - timedelta(seconds=5))
+        _add_job(db, "lease-job-003", "lib-lease", status="processing", attempts=1,
+                 lease_owner="live-worker", lease_expires_at=now + timedelta(minutes=5))
+
+        recover_stale_jobs()
+
+        db.expire_all()
+        expired = db.query(ImportJob).filter(ImportJob.id == "lease-job-002").first()
+        live = db.query(ImportJob).filter(ImportJob.id == "lease-job-003").first()
+        assert expired.status == "pending"
+        assert expired.lease_owner is None
+        assert live.status == "processing"
+        assert live.lease_owner == "live-worker"
+    finally:
+        db.query(ImportJob).filter(
+            ImportJob.id.in_(["lease-job-002", "lease-job-003"])
+        ).delete()
+        db.commit()
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_internal_api_keys_handed_out_once(client: AsyncClient):
+    """External workers collect a job's keys from the API exactly once."""
+    from tasks.worker import store_api_keys  # noqa: PLC0415
+
+    store_api_keys("lease-job-004", {"openai": "sk-test"})
+    url = "/internal/jobs/lease-job-004/api-keys"
+
+    resp = await client.post(url)
+    assert resp.status_code in (401, 403)
+
+    resp = await client.post(url, headers=AUTH_HEADERS)
+    assert resp.json() == {"api_keys": {"openai": "sk-test"}}
+
+    resp = await client.post(url, headers=AUTH_HEADERS)
+    assert resp.json() == {"api_keys": {}}
+
+
+@pytest.mark.parametrize("job_fails", [False, True])
+def test_job_finishing_after_losing_its_lease_leaves_the_new_owner_alone(monkeypatch, job_fails):
+    """A worker whose lease was taken over mid-job does not finalize the job."""
+    from database.connection import get_session_direct  # noqa: PLC0415
+    from database.models import ImportJob  # noqa: PLC0415
+    from services import import_service  # noqa: PLC0415
+    from tasks import worker  # noqa: PLC0415
+
+    def import_while_lease_is_stolen(db, job, api_keys):
+        # Another worker reaps the expired lease and claims the job meanwhile.
+        other = get_session_direct()
+        try:
+            other.query(ImportJob).filter(ImportJob.id == job.id).update(
+                {"lease_owner": "worker-b", "attempts": 2}
+            )
+            other.commit()
+        finally:
+            other.close()
+        if job_fails:
+            raise RuntimeError("plugin crashed")
+
+    monkeypatch.setattr(import_service, "execute_import_job", import_while_lease_is_stolen)
+    monkeypatch.setattr(worker, "_fetch_api_keys", lambda job_id: {})
+
+    db = get_session_direct()
+    try:
+        _add_job(db, "lease-job-005", "lib-lease", status="processing", attempts=1,
+                 lease_owner=worker.WORKER_ID,
+                 lease_expires_at=datetime.now(UTC) + timedelta(minutes=5))
+
+        worker._process_job_sync("lease-job-005")
+
+        db.expire_all()
+        job = db.query(ImportJob).filter(ImportJob.id == "lease-job-005").first()
+        assert job.status == "processing"
+        assert job.lease_owner == "worker-b"
+        assert job.completed_at is None
+        assert job.error_message is None
+    finally:
+        db.query(ImportJob).filter(ImportJob.id == "lease-job-005").delete()
+        db.commit()
+        db.close()
@@ -325,6 +325,28 @@ ENABLE_REALTIME_CHAT_SAVE = (
     os.environ.get("ENABLE_REALTIME_CHAT_SAVE", "False").lower() == "true"
 )
 
+# Real-time saves are coalesced: the streamed message is written at most once
+# per interval or once every N content deltas, plus on completion/abort.
+REALTIME_CHAT_SAVE_INTERVAL_MS = os.environ.get("REALTIME_CHAT_SAVE_INTERVAL_MS", 1000)
+
+if REALTIME_CHAT_SAVE_INTERVAL_MS == "":
+    REALTIME_CHAT_SAVE_INTERVAL_MS = 1000
+else:
+    try:
+        REALTIME_CHAT_SAVE_INTERVAL_MS = int(REALTIME_CHAT_SAVE_INTERVAL_MS)
+    except Exception:
+        REALTIME_CHAT_SAVE_INTERVAL_MS = 1000
+
+REALTIME_CHAT_SAVE_MAX_DELTAS = os.environ.get("REALTIME_CHAT_SAVE_MAX_DELTAS", 100)
+
+if REALTIME_CHAT_SAVE_MAX_DELTAS == "":
+    REALTIME_CHAT_SAVE_MAX_DELTAS = 100
+else:
+    try:
+        REALTIME_CHAT_SAVE_MAX_DELTAS = int(REALTIME_CHAT_SAVE_MAX_DELTAS)
+    except Exception:
+        REALTIME_CHAT_SAVE_MAX_DELTAS = 100
+
 ####################################
 # REDIS
 ####################################
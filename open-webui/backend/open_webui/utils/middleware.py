@@ -70,6 +70,8 @@ from open_webui.env import (
     GLOBAL_LOG_LEVEL,
     BYPASS_MODEL_ACCESS_CONTROL,
     ENABLE_REALTIME_CHAT_SAVE,
+    REALTIME_CHAT_SAVE_INTERVAL_MS,
+    REALTIME_CHAT_SAVE_MAX_DELTAS,
 )
 from open_webui.constants import TASKS
 
@@ -79,6 +81,59 @@ log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
 
+class RealtimeMessageSaver:
+    """
+    Coalesces streamed message content into throttled database writes.
+
+    Every upsert reloads and rewrites the whole chat row, so saving on each
+    delta is quadratic in the size of the chat. Instead, the latest content is
+    kept in memory and written at most once per `interval_ms` or once every
+    `max_deltas` updates; callers must `flush()` on completion and on abort.
+    """
+
+    def __init__(
+        self,
+        chat_id: str,
+        message_id: str,
+        interval_ms: int = REALTIME_CHAT_SAVE_INTERVAL_MS,
+        max_deltas: int = REALTIME_CHAT_SAVE_MAX_DELTAS,
+    ):
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.interval = max(interval_ms, 0) / 1000
+        self.max_deltas = max(max_deltas, 1)
+
+        self.pending_content = None
+        self.pending_deltas = 0
+        self.last_flush = time.monotonic()
+
+    def update(self, content: str):
+        self.pending_content = content
+        self.pending_deltas += 1
+
+        if (
+            self.pending_deltas >= self.max_deltas
+            or time.monotonic() - self.last_flush >= self.interval
+        ):
+            self.flush()
+
+    def flush(self):
+        if self.pending_content is None:
+            return
+
+        Chats.upsert_message_to_chat_by_id_and_message_id(
+            self.chat_id,
+            self.message_id,
+            {
+                "content": self.pending_content,
+            },
+        )
+
+        self.pending_content = None
+        self.pending_deltas = 0
+        self.last_flush = time.monotonic()
+
+
 async def chat_completion_filter_functions_handler(request, body, model, extra_params):
     skip_files = None
 
@@ -1058,6 +1113,12 @@ async def process_chat_response(
             )
             content = message.get("content", "") if message else ""
 
+            saver = (
+                RealtimeMessageSaver(metadata["chat_id"], metadata["message_id"])
+                if ENABLE_REALTIME_CHAT_SAVE
+                else None
+            )
+
             try:
                 for event in events:
                     await event_emitter(
@@ -1189,15 +1250,9 @@ async def process_chat_response(
                                             # Show ongoing thought process
                                             content = f'{ongoing_content}<details type="reasoning" done="false">\n<summary>Thinking…</summary>\n{reasoning_display_content}\n</details>\n'
 
-                                if ENABLE_REALTIME_CHAT_SAVE:
-                                    # Save message in the database
-                                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                                        metadata["chat_id"],
-                                        metadata["message_id"],
-                                        {
-                                            "content": content,
-                                        },
-                                    )
+                                if saver:
+                                    # Save message in the database (throttled)
+                                    saver.update(content)
                                 else:
                                     data = {
                                         "content": content,
@@ -1219,7 +1274,10 @@ async def process_chat_response(
                 title = Chats.get_chat_title_by_id(metadata["chat_id"])
                 data = {"done": True, "content": content, "title": title}
 
-                if not ENABLE_REALTIME_CHAT_SAVE:
+                if saver:
+                    # Persist whatever the throttle has not written yet
+                    saver.flush()
+                else:
                     # Save message in the database
                     Chats.upsert_message_to_chat_by_id_and_message_id(
                         metadata["chat_id"],
@@ -1256,7 +1314,9 @@ async def process_chat_response(
                 print("Task was cancelled!")
                 await event_emitter({"type": "task-cancelled"})
 
-                if not ENABLE_REALTIME_CHAT_SAVE:
+                if saver:
+                    saver.flush()
+                else:
                     # Save message in the database
                     Chats.upsert_message_to_chat_by_id_and_message_id(
                         metadata["chat_id"],
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+LAMB AAC Session Storage Benchmark - cost of saving long agent sessions
+
+Drives AACSessionManager.update_conversation through sessions of N agent
+steps against a throwaway local LAMB database. Each step adds the model's
+tool call, the tool result and a tool audit entry, and the session is saved
+after every step, as the AAC router does after each turn.
+
+Usage:
+    python testing/load/aac_session_storage_benchmark.py
+    python testing/load/aac_session_storage_benchmark.py --steps 1000 --sessions 3
+    python testing/load/aac_session_storage_benchmark.py --mode legacy   # single-JSON rewrite
+
+``--mode legacy`` replays the previous storage, which serialized and
+rewrote the whole conversation JSON on every save.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def legacy_update(mgr, session_id, user_email, conversation, tool_audit, counter):
+    """The save before append-only storage: rewrite the whole envelope."""
+    stored = json.dumps({"messages": conversation, "pending_action": None,
+                         "skill_info": None, "tool_audit": tool_audit},
+                        default=str, ensure_ascii=False)
+    counter["bytes"] += len(stored.encode())
+    conn = mgr.db.get_connection()
+    try:
+        conn.execute(f"UPDATE {mgr._table} SET conversation = ?, updated_at = ? WHERE id = ? AND user_email = ?",
+                     (stored, datetime.utcnow().isoformat(), session_id, user_email))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def step_messages(step, result_bytes):
+    call_id = f"call_{step}"
+    command = f"lamb assistant get {step % 50}"
+    return [
+        {"role": "assistant", "content": None, "tool_calls": [{
+            "id": call_id, "type": "function",
+            "function": {"name": "lamb", "arguments": json.dumps({"command": command})}}]},
+        {"role": "tool", "tool_call_id": call_id,
+         "content": json.dumps({"success": True, "data": {"id": step, "system_prompt": "x" * result_bytes}})},
+    ], {"command": command, "action_key": "assistant.get", "success": True, "elapsed_ms": 12.0}
+
+
+def run_session(mgr, mode, steps, result_bytes, checkpoints):
+    user_email = "bench@example.com"
+    session = mgr.create_session(user_email, 1, title="benchmark")
+    conversation = [{"role": "user", "content": "Review all my assistants"}]
+    audit = []
+    counter = {"bytes": 0}
+    save_ms = []
+    for step in range(steps):
+        messages, audit_entry = step_messages(step, result_bytes)
+        conversation.extend(messages)
+        audit.append(audit_entry)
+        started = time.perf_counter()
+        if mode == "legacy":
+            legacy_update(mgr, session["id"], user_email, conversation, audit, counter)
+        else:
+            counter["bytes"] += sum(len(json.dumps(m, ensure_ascii=False).encode()) for m in messages)
+            counter["bytes"] += len(json.dumps(audit_entry).encode())
+            mgr.update_conversation(session["id"], user_email, conversation, tool_audit=audit)
+        save_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    loaded = mgr.get_session(session["id"], user_email)
+    read_ms = (time.perf_counter() - started) * 1000
+    assert len(loaded["conversation"]) == len(conversation)
+    assert len(loaded["tool_audit"]) == steps
+
+    return {
+        "total_save_s": sum(save_ms) / 1000,
+        "mean_save_ms": statistics.mean(save_ms),
+        "p99_save_ms": percentile(save_ms, 99),
+        "save_ms_at": {str(c): statistics.mean(save_ms[max(0, c - 10):c]) for c in checkpoints if c <= steps},
+        "payload_mb_written": counter["bytes"] / 1e6,
+        "read_ms": read_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AAC session save cost over long sessions")
+    parser.add_argument("--steps", type=int, default=1000, help="Agent steps per session")
+    parser.add_argument("--sessions", type=int, default=3, help="Sessions to run (results are averaged)")
+    parser.add_argument("--result-bytes", type=int, default=1500, help="Size of each tool result payload")
+    parser.add_argument("--mode", choices=("append", "legacy"), default="append", help="Storage to exercise")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aac_sessions_"))
+    owi_dir = workdir / "owi"
+    owi_dir.mkdir()
+    os.environ["OWI_PATH"] = str(owi_dir)
+    os.environ["LAMB_DB_PATH"] = str(workdir)
+    os.environ.setdefault("OWI_BASE_URL", "http://owi.invalid")
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    # The system organization bootstrap talks to Open WebUI; not part of this test
+    with patch("lamb.owi_bridge.owi_users.OwiUserManager"), \
+            patch("lamb.database_manager.OwiUserManager"):
+        from lamb.aac.session_manager import AACSessionManager
+        mgr = AACSessionManager()
+
+    checkpoints = [10, 100, 250, 500, 750, 1000]
+    runs = [run_session(mgr, args.mode, args.steps, args.result_bytes, checkpoints)
+            for _ in range(args.sessions)]
+
+    def avg(key):
+        return round(statistics.mean(r[key] for r in runs), 2)
+
+    report = {
+        "mode": args.mode,
+        "steps": args.steps,
+        "sessions": args.sessions,
+        "result_bytes": args.result_bytes,
+        "total_save_s": avg("total_save_s"),
+        "mean_save_ms": avg("mean_save_ms"),
+        "p99_save_ms": avg("p99_save_ms"),
+        "save_ms_at_step": {k: round(statistics.mean(r["save_ms_at"][k] for r in runs), 2)
+                            for k in runs[0]["save_ms_at"]},
+        "payload_mb_written": avg("payload_mb_written"),
+        "read_ms": avg("read_ms"),
+        "db_mb": round(os.path.getsize(mgr.db.db_path) / 1e6, 1),
+        "workdir": str(workdir),
+    }
+
+    print(f"\nAAC session storage: {args.steps} steps x {args.sessions} sessions, mode={args.mode}")
+    print(f"total save time per session: {report['total_save_s']:.2f} s "
+          f"(mean {report['mean_save_ms']:.2f} ms, p99 {report['p99_save_ms']:.2f} ms)")
+    print("save ms at step: " + ", ".join(f"{k}: {v:.2f}" for k, v in report["save_ms_at_step"].items()))
+    print(f"payload written per session: {report['payload_mb_written']:.1f} MB")
+    print(f"full session read: {report['read_ms']:.1f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
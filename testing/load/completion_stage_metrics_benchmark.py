@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+LAMB Completion Stage Metrics Benchmark - cost of per-stage instrumentation
+
+Runs run_lamb_assistant in-process against stub plugins (no database, no
+LLM) and measures what the stage timer adds to each request:
+
+- ``timer``: one StageTimer with the marks, histogram updates and
+  Server-Timing header of a streamed request, on its own
+- ``pipeline``: the whole run_lamb_assistant call with metrics on and off,
+  with the connector answering after ``--latency-ms``
+- ``debug_payload``: the debug dump of a chat payload at INFO level, eager
+  ``json.dumps(indent=2)`` versus ``LazyJSON``
+
+Usage:
+    python testing/load/completion_stage_metrics_benchmark.py
+    python testing/load/completion_stage_metrics_benchmark.py --requests 2000 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+STAGES = ("assistant_lookup", "task_routing", "plugin_load", "rag", "prompt_processing",
+          "connector", "first_token", "stream", "usage_logging")
+
+
+def chat_payload(turns):
+    """A chat request of realistic size: system prompt, RAG context and history."""
+    messages = [{"role": "system", "content": "You are a helpful course assistant. " * 40}]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"Question {i} about the course material " * 8})
+        messages.append({"role": "assistant", "content": f"Answer {i} citing the syllabus " * 20})
+    return {"model": "lamb_assistant.1", "stream": True, "messages": messages}
+
+
+def time_timer(StageTimer, count):
+    """Microseconds per request spent in the stage timer alone."""
+    started = time.perf_counter()
+    for _ in range(count):
+        timer = StageTimer()
+        for stage in STAGES:
+            timer.mark(stage)
+        timer.observe("time_to_first_token", 0.1)
+        timer.add_header({})
+        timer.finish()
+    return (time.perf_counter() - started) / count * 1e6
+
+
+def time_pipeline(completions, payload, count, latency_s):
+    """Median milliseconds of a non-streaming run_lamb_assistant call."""
+    assistant = SimpleNamespace(id=1, owner="bench@example.com", organization_id=None)
+    response = {"id": "bench", "choices": [{"message": {"role": "assistant", "content": "ok"}}]}
+
+    async def connector(**kwargs):
+        if latency_s:
+            await asyncio.sleep(latency_s)
+        return response
+
+    async def rag(*args, **kwargs):
+        return None
+
+    async def no_task(**kwargs):
+        return None
+
+    patches = [
+        patch.object(completions, "get_assistant_details", return_value=assistant),
+        patch.object(completions, "parse_plugin_config", return_value={
+            "connector": "bench", "llm": "bench", "prompt_processor": "simple", "rag_processor": "bench"}),
+        patch.object(completions, "maybe_route_non_streaming_task", side_effect=no_task),
+        patch.object(completions, "load_and_validate_plugins", return_value=({}, {"bench": connector}, {})),
+        patch.object(completions, "get_rag_context", side_effect=rag),
+        patch.object(completions, "process_completion_request", return_value=payload["messages"]),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        request = dict(payload, stream=False)
+
+        async def run():
+            timings = []
+            for _ in range(count):
+                t0 = time.perf_counter()
+                await completions.run_lamb_assistant(request, 1)
+                timings.append((time.perf_counter() - t0) * 1000)
+            return timings
+
+        return statistics.median(asyncio.run(run()))
+    finally:
+        for p in patches:
+            p.stop()
+
+
+def time_debug_payload(LazyJSON, payload, count):
+    """Microseconds per debug call at INFO level, eager versus lazy."""
+    logger = logging.getLogger("bench.debug_payload")
+    logger.setLevel(logging.INFO)
+
+    started = time.perf_counter()
+    for _ in range(count):
+        logger.debug("Payload: %s", json.dumps(payload, indent=2))
+    eager = (time.perf_counter() - started) / count * 1e6
+
+    started = time.perf_counter()
+    for _ in range(count):
+        logger.debug("Payload: %s", LazyJSON(payload, indent=2))
+    lazy = (time.perf_counter() - started) / count * 1e6
+    return eager, lazy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Overhead of completion stage metrics")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per measurement")
+    parser.add_argument("--latency-ms", type=float, default=50.0,
+                        help="Simulated connector latency for the pipeline run")
+    parser.add_argument("--turns", type=int, default=10, help="Conversation turns in the payload")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Alternating off/on rounds; the median round is reported")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="stage_metrics_"))
+    owi_dir = workdir / "owi"
+    owi_dir.mkdir()
+    os.environ["OWI_PATH"] = str(owi_dir)
+    os.environ["LAMB_DB_PATH"] = str(workdir)
+    os.environ.setdefault("OWI_BASE_URL", "http://owi.invalid")
+    os.environ["GLOBAL_LOG_LEVEL"] = "WARNING"
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    # The system organization bootstrap talks to Open WebUI; not part of this test
+    with patch("lamb.owi_bridge.owi_users.OwiUserManager"), \
+            patch("lamb.database_manager.OwiUserManager"):
+        import config
+        from lamb.completions import main as completions
+        from lamb.completions.stage_metrics import StageTimer, stage_metrics
+        from lamb.logging_config import LazyJSON
+
+    payload = chat_payload(args.turns)
+    latency_s = args.latency_ms / 1000
+
+    def measure(enabled):
+        config.COMPLETION_METRICS_ENABLED = enabled
+        config.COMPLETION_SERVER_TIMING = enabled
+        return {
+            "timer_us": time_timer(StageTimer, args.requests * 10),
+            "pipeline_no_latency_ms": time_pipeline(completions, payload, args.requests, 0),
+            "pipeline_ms": time_pipeline(completions, payload, max(1, args.requests // 20), latency_s),
+        }
+
+    measure(True)  # warm up imports, caches and the allocator
+    # Alternate the modes so drift on the host hits both equally
+    rounds = {"off": [], "on": []}
+    for _ in range(args.rounds):
+        for mode in ("off", "on"):
+            rounds[mode].append(measure(mode == "on"))
+    results = {
+        mode: {key: round(statistics.median(r[key] for r in runs), 4) for key in runs[0]}
+        for mode, runs in rounds.items()
+    }
+    stage_metrics.reset()
+
+    eager_us, lazy_us = time_debug_payload(LazyJSON, payload, args.requests)
+    # The pipeline difference is within noise of the stubbed plugins, so the
+    # overhead is charged as the timer's full cost with metrics on
+    timer_ms = results["on"]["timer_us"] / 1000
+    report = {
+        "requests": args.requests,
+        "latency_ms": args.latency_ms,
+        "payload_kb": round(len(json.dumps(payload)) / 1024, 1),
+        "metrics": results,
+        "overhead_pct": round(timer_ms / results["off"]["pipeline_ms"] * 100, 4),
+        "debug_payload_us": {"eager": round(eager_us, 1), "lazy": round(lazy_us, 2)},
+    }
+
+    print(f"\nCompletion stage metrics: {args.requests} requests, connector latency {args.latency_ms} ms")
+    print(f"  stage timer alone        {results['on']['timer_us']:>8.2f} us/request")
+    for mode in ("off", "on"):
+        r = results[mode]
+        print(f"  pipeline, metrics {mode:<4}  {r['pipeline_no_latency_ms'] * 1000:>8.1f} us (no latency)"
+              f"   {r['pipeline_ms']:>8.2f} ms (with latency)")
+    print(f"  overhead                 {report['overhead_pct']:>8.3f} %"
+          f"  of a {results['off']['pipeline_ms']:.1f} ms request")
+    print(f"  debug payload ({report['payload_kb']} KB) at INFO: eager {eager_us:.1f} us, lazy {lazy_us:.2f} us")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
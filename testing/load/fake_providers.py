@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+LAMB Fake Providers - local stand-ins for the LLM, embeddings and OWI APIs
+
+One aiohttp server that answers the network calls the LAMB stack makes to
+outside services, with configurable latency and token rate:
+
+- ``POST /v1/chat/completions``: OpenAI-compatible chat, streamed or not.
+  Waits ``--ttft-ms`` before the first token, then emits
+  ``--completion-tokens`` tokens at ``--tokens-per-s``.
+- ``POST /v1/embeddings``: OpenAI-compatible embeddings. Vectors are derived
+  from a hash of the text, so the same text always gets the same vector.
+- ``GET /v1/models``: a single fake model.
+- ``POST /api/v1/auths/signin``: the Open WebUI token mint used by LTI
+  launches (trusted-header sign-in).
+- ``GET /_stats``: request counters, for checking a run hit the fakes.
+
+Used by offline_benchmark.py; it can also be run on its own to point a
+development stack at it.
+
+Usage:
+    python testing/load/fake_providers.py --port 8911
+    python testing/load/fake_providers.py --port 8911 --ttft-ms 800 --tokens-per-s 30
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import struct
+import time
+import uuid
+
+from aiohttp import web
+
+MODEL = "fake-model"
+EMBEDDING_MODEL = "fake-embedding"
+
+
+def fake_embedding(text, dim):
+    """A unit vector that depends only on the text."""
+    values = []
+    counter = 0
+    while len(values) < dim:
+        digest = hashlib.sha256(f"{counter}:{text}".encode()).digest()
+        values.extend(v / 2**31 - 1 for v in struct.unpack("<8I", digest))
+        counter += 1
+    values = values[:dim]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+def prompt_tokens(messages):
+    """Rough token count of the prompt (4 characters per token)."""
+    chars = 0
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        chars += len(content)
+    return max(1, chars // 4)
+
+
+class FakeProviders:
+    """Request handlers sharing the latency settings and counters."""
+
+    def __init__(self, ttft_ms=300.0, tokens_per_s=50.0, completion_tokens=60,
+                 embedding_latency_ms=20.0, embedding_dim=384):
+        self.ttft_s = ttft_ms / 1000
+        self.tokens_per_s = tokens_per_s
+        self.completion_tokens = completion_tokens
+        self.embedding_latency_s = embedding_latency_ms / 1000
+        self.embedding_dim = embedding_dim
+        self.started = time.time()
+        self.counters = {"chat": 0, "chat_stream": 0, "embeddings": 0,
+                         "embedded_texts": 0, "signin": 0, "tokens": 0}
+
+    def settings(self):
+        return {
+            "ttft_ms": self.ttft_s * 1000,
+            "tokens_per_s": self.tokens_per_s,
+            "completion_tokens": self.completion_tokens,
+            "embedding_latency_ms": self.embedding_latency_s * 1000,
+            "embedding_dim": self.embedding_dim,
+        }
+
+    def _token_count(self, body):
+        limit = body.get("max_tokens") or body.get("max_completion_tokens")
+        return min(self.completion_tokens, limit) if limit else self.completion_tokens
+
+    async def chat(self, request):
+        body = await request.json()
+        tokens = self._token_count(body)
+        usage = {"prompt_tokens": prompt_tokens(body.get("messages", [])), "completion_tokens": tokens}
+        usage["total_tokens"] = usage["prompt_tokens"] + tokens
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model") or MODEL
+        self.counters["tokens"] += tokens
+
+        if not body.get("stream"):
+            self.counters["chat"] += 1
+            await asyncio.sleep(self.ttft_s + tokens / self.tokens_per_s)
+            return web.json_response({
+                "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": " ".join(["token"] * tokens)}}],
+                "usage": usage,
+            })
+
+        self.counters["chat_stream"] += 1
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+
+        def chunk(delta, finish_reason=None, **extra):
+            data = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                    **extra}
+            return f"data: {json.dumps(data)}\n\n".encode()
+
+        await asyncio.sleep(self.ttft_s)
+        await response.write(chunk({"role": "assistant", "content": ""}))
+        interval = 1 / self.tokens_per_s
+        for i in range(tokens):
+            await response.write(chunk({"content": "token" if i == 0 else " token"}))
+            await asyncio.sleep(interval)
+        await response.write(chunk({}, "stop"))
+        if (body.get("stream_options") or {}).get("include_usage"):
+            await response.write(f"data: {json.dumps({'id': completion_id, 'object': 'chat.completion.chunk', 'choices': [], 'usage': usage})}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def embeddings(self, request):
+        body = await request.json()
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+        self.counters["embeddings"] += 1
+        self.counters["embedded_texts"] += len(texts)
+        await asyncio.sleep(self.embedding_latency_s)
+        dim = body.get("dimensions") or self.embedding_dim
+        vectors = [fake_embedding(text, dim) for text in texts]
+        if body.get("encoding_format") == "base64":
+            # The openai client asks for packed float32 by default
+            vectors = [base64.b64encode(struct.pack(f"<{dim}f", *v)).decode() for v in vectors]
+        return web.json_response({
+            "object": "list",
+            "model": body.get("model") or EMBEDDING_MODEL,
+            "data": [{"object": "embedding", "index": i, "embedding": vector}
+                     for i, vector in enumerate(vectors)],
+            "usage": {"prompt_tokens": sum(len(t) // 4 for t in texts), "total_tokens": sum(len(t) // 4 for t in texts)},
+        })
+
+    async def models(self, request):
+        return web.json_response({"object": "list", "data": [
+            {"id": MODEL, "object": "model", "owned_by": "fake"},
+            {"id": EMBEDDING_MODEL, "object": "model", "owned_by": "fake"},
+        ]})
+
+    async def signin(self, request):
+        # Open WebUI trusted-header sign-in: the caller names the user in headers
+        self.counters["signin"] += 1
+        email = request.headers.get("X-User-Email", "")
+        return web.json_response({"token": f"fake-owi-token-{hashlib.sha1(email.encode()).hexdigest()[:16]}",
+                                  "email": email})
+
+    async def stats(self, request):
+        return web.json_response({"uptime_s": round(time.time() - self.started, 1),
+                                  "settings": self.settings(), "counters": self.counters})
+
+
+def create_app(providers):
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/v1/chat/completions", providers.chat)
+    app.router.add_post("/v1/embeddings", providers.embeddings)
+    app.router.add_get("/v1/models", providers.models)
+    app.router.add_post("/api/v1/auths/signin", providers.signin)
+    app.router.add_get("/_stats", providers.stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake LLM, embeddings and OWI endpoints for offline benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8911)
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="Delay before the first token")
+    parser.add_argument("--tokens-per-s", type=float, default=50.0, help="Token rate after the first token")
+    parser.add_argument("--completion-tokens", type=int, default=60, help="Tokens per completion")
+    parser.add_argument("--embedding-latency-ms", type=float, default=20.0, help="Delay per embeddings call")
+    parser.add_argument("--embedding-dim", type=int, default=384, help="Embedding vector size")
+    args = parser.parse_args()
+
+    providers = FakeProviders(args.ttft_ms, args.tokens_per_s, args.completion_tokens,
+                              args.embedding_latency_ms, args.embedding_dim)
+    web.run_app(create_app(providers), host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
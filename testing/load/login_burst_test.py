@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+LAMB Login Burst Test - event-loop responsiveness during password hashing
+
+Simulates the start of a class: fires a burst of concurrent logins at
+/creator/login while probing an unrelated, cheap endpoint (/status by
+default) at a fixed interval. Each login costs a 12-round bcrypt verify;
+with hashing on the bounded pool (lamb/password_hasher.py) the probe p99
+should stay in the low milliseconds instead of growing with the burst.
+
+Usage:
+    python testing/load/login_burst_test.py --email user@example.com --password secret
+    python testing/load/login_burst_test.py --logins 200 --probe-path /status --output burst.json
+
+Run once against a build without the hashing pool (or with
+PASSWORD_HASH_WORKERS=1) to get a baseline for comparison.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import Counter
+
+import aiohttp
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(label, latencies_ms):
+    return {
+        "label": label,
+        "count": len(latencies_ms),
+        "p50_ms": round(percentile(latencies_ms, 50), 1),
+        "p95_ms": round(percentile(latencies_ms, 95), 1),
+        "p99_ms": round(percentile(latencies_ms, 99), 1),
+        "max_ms": round(max(latencies_ms), 1) if latencies_ms else 0.0,
+        "mean_ms": round(statistics.mean(latencies_ms), 1) if latencies_ms else 0.0,
+    }
+
+
+async def login(session, url, email, password, results):
+    start = time.perf_counter()
+    try:
+        async with session.post(f"{url}/creator/login",
+                                data={"email": email, "password": password}) as response:
+            await response.read()
+            status = response.status
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        status = 0
+    results.append((status, (time.perf_counter() - start) * 1000))
+
+
+async def probe(session, url, path, interval, stop, latencies):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            async with session.get(f"{url}{path}") as response:
+                await response.read()
+            latencies.append((time.perf_counter() - start) * 1000)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            latencies.append(float("inf"))
+        await asyncio.sleep(interval)
+
+
+async def run(args):
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        # Baseline: probe latency with no load
+        baseline = []
+        idle = asyncio.Event()
+        probe_task = asyncio.create_task(
+            probe(session, args.url, args.probe_path, args.probe_interval, idle, baseline))
+        await asyncio.sleep(args.baseline_seconds)
+        idle.set()
+        await probe_task
+
+        # Burst: all logins at once while probing
+        during = []
+        login_results = []
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(
+            probe(session, args.url, args.probe_path, args.probe_interval, stop, during))
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            login(session, args.url, args.email, args.password, login_results)
+            for _ in range(args.logins)
+        ))
+        burst_seconds = time.perf_counter() - started
+        stop.set()
+        await probe_task
+
+    login_latencies = [ms for _, ms in login_results]
+    report = {
+        "logins": args.logins,
+        "burst_seconds": round(burst_seconds, 2),
+        "login_status": dict(Counter(status for status, _ in login_results)),
+        "login_latency": summarize("login", login_latencies),
+        "probe_idle": summarize(f"{args.probe_path} idle", baseline),
+        "probe_during_burst": summarize(f"{args.probe_path} during burst", during),
+    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Login burst vs. unrelated-endpoint latency")
+    parser.add_argument("--url", default="http://localhost:9099", help="LAMB backend URL")
+    parser.add_argument("--email", required=True, help="Creator account email")
+    parser.add_argument("--password", required=True, help="Creator account password")
+    parser.add_argument("--logins", type=int, default=200, help="Concurrent logins in the burst")
+    parser.add_argument("--probe-path", default="/status", help="Unrelated endpoint to probe")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="Seconds between probes")
+    parser.add_argument("--baseline-seconds", type=float, default=3, help="Idle probing before the burst")
+    parser.add_argument("--timeout", type=float, default=120, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    print(f"\n{args.logins} logins in {report['burst_seconds']}s  status={report['login_status']}")
+    print(f"{'':28s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s}")
+    for key in ("probe_idle", "probe_during_burst", "login_latency"):
+        row = report[key]
+        print(f"{row['label']:28s} {row['p50_ms']:8.1f} {row['p95_ms']:8.1f} "
+              f"{row['p99_ms']:8.1f} {row['max_ms']:8.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    failed = sum(n for status, n in report["login_status"].items() if status not in (200, 503))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
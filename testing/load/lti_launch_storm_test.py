@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+LAMB LTI Launch Storm Test - many students launching one activity at once
+
+Runs LtiActivityManager.handle_student_launch for N students concurrently
+against throwaway local SQLite files (a LAMB database and a minimal Open
+WebUI database), the way uvicorn's threadpool runs it during the first
+minute of a class. The OWI token mint is an HTTP call to Open WebUI and is
+stubbed out, so the numbers isolate LAMB's own work: user lookup/creation,
+password hashing, OWI group membership writes and the activity user record.
+
+A second wave relaunches the same students (returning users).
+
+Usage:
+    python testing/load/lti_launch_storm_test.py
+    python testing/load/lti_launch_storm_test.py --students 500 --concurrency 64
+    python testing/load/lti_launch_storm_test.py --mode legacy   # pre-fast-path launch
+
+``--mode legacy`` replays the previous launch sequence (uncached activity
+lookup, bcrypt hash of a random password per new student, separate
+read/modify/write of the group JSON per launch) for comparison.
+"""
+
+import argparse
+import json
+import os
+import secrets
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(label, latencies_ms, seconds):
+    return {
+        "label": label,
+        "count": len(latencies_ms),
+        "seconds": round(seconds, 2),
+        "launches_per_s": round(len(latencies_ms) / seconds, 1) if seconds else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 50), 1),
+        "p95_ms": round(percentile(latencies_ms, 95), 1),
+        "p99_ms": round(percentile(latencies_ms, 99), 1),
+        "max_ms": round(max(latencies_ms), 1) if latencies_ms else 0.0,
+        "mean_ms": round(statistics.mean(latencies_ms), 1) if latencies_ms else 0.0,
+    }
+
+
+def create_owi_database(path):
+    """Minimal Open WebUI schema: the tables the LTI launch touches."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE user (
+            id TEXT PRIMARY KEY, name TEXT NOT NULL, email TEXT NOT NULL,
+            role TEXT NOT NULL, profile_image_url TEXT NOT NULL, api_key TEXT,
+            created_at INTEGER NOT NULL, updated_at INTEGER NOT NULL,
+            last_active_at INTEGER NOT NULL, settings TEXT, info TEXT, oauth_sub TEXT
+        );
+        CREATE UNIQUE INDEX user_email ON user (email);
+        CREATE TABLE auth (
+            id TEXT PRIMARY KEY, email TEXT NOT NULL, password TEXT NOT NULL,
+            active INTEGER NOT NULL
+        );
+        CREATE TABLE "group" (
+            id TEXT PRIMARY KEY, user_id TEXT, name TEXT, description TEXT,
+            data TEXT, meta TEXT, permissions TEXT, user_ids TEXT,
+            created_at INTEGER, updated_at INTEGER
+        );
+    """)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.commit()
+    conn.close()
+
+
+def legacy_launch(manager, activity, username, display_name, lms_user_id):
+    """The launch sequence before the fast path, for comparison."""
+    activity = manager.db_manager.get_lti_activity_by_resource_link(activity['resource_link_id'])
+    email = manager.generate_student_email(username, activity['resource_link_id'])
+    owi_user = manager.owi_user_manager.get_user_by_email(email)
+    if not owi_user:
+        owi_user = manager.owi_user_manager.create_user(
+            name=display_name, email=email,
+            password=secrets.token_urlsafe(32), role="user")
+        if not owi_user:
+            return None
+    manager.owi_group_manager.add_user_to_group_by_email(
+        group_id=activity['owi_group_id'], user_email=email)
+    manager.db_manager.create_lti_activity_user(
+        activity_id=activity['id'], user_email=email, user_name=username,
+        user_display_name=display_name, lms_user_id=lms_user_id,
+        owi_user_id=owi_user.get('id', ''))
+    return manager.owi_user_manager.get_auth_token(email, display_name)
+
+
+def run_wave(launch, students, concurrency):
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    start_gate = threading.Event()
+
+    def one(student):
+        start_gate.wait()
+        started = time.perf_counter()
+        token = launch(student)
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            latencies.append(elapsed)
+            if not token:
+                failures.append(student)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(one, student) for student in students]
+        started = time.perf_counter()
+        start_gate.set()
+        for future in futures:
+            future.result()
+        seconds = time.perf_counter() - started
+    return latencies, failures, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent LTI student launches against local SQLite")
+    parser.add_argument("--students", type=int, default=500, help="Students launching the activity")
+    parser.add_argument("--concurrency", type=int, default=40,
+                        help="Concurrent launches (uvicorn threadpool size)")
+    parser.add_argument("--mode", choices=("fast", "legacy"), default="fast",
+                        help="Launch path to exercise")
+    parser.add_argument("--hash-workers", type=int, default=None,
+                        help="PASSWORD_HASH_WORKERS for the run (default: config)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="lti_storm_"))
+    owi_dir = workdir / "owi"
+    lamb_dir = workdir / "lamb"
+    owi_dir.mkdir()
+    lamb_dir.mkdir()
+    create_owi_database(owi_dir / "webui.db")
+
+    os.environ["OWI_PATH"] = str(owi_dir)
+    os.environ["LAMB_DB_PATH"] = str(lamb_dir)
+    os.environ.setdefault("OWI_BASE_URL", "http://owi.invalid")
+    if args.hash_workers:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(args.hash_workers)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from lamb.owi_bridge.owi_users import OwiUserManager
+    from lamb.password_hasher import get_password_hasher
+
+    # Token minting is an HTTP call to Open WebUI; not part of this test
+    with patch.object(OwiUserManager, "get_auth_token", lambda self, email, name: f"token-{email}"):
+        from lamb.lti_activity_manager import LtiActivityManager
+        from lamb.owi_bridge.owi_group_batcher import get_group_membership_batcher
+
+        manager = LtiActivityManager()
+        instructor = manager.owi_user_manager.create_user(
+            "Instructor", "instructor@example.com", "", "user", password_hash="x")
+        group = manager.owi_group_manager.create_group("lti_activity_storm", instructor["id"])
+        org_id = manager.db_manager.get_organization_by_slug("lamb")["id"]
+        manager.db_manager.create_lti_activity(
+            resource_link_id="storm", organization_id=org_id, owi_group_id=group["id"],
+            owi_group_name="lti_activity_storm", configured_by_email="instructor@example.com")
+        activity = manager.db_manager.get_lti_activity_by_resource_link("storm")
+
+        if args.mode == "fast":
+            def launch(student):
+                resolved = manager.resolve_activity("storm")
+                return manager.handle_student_launch(resolved, student, student.title(), student)
+        else:
+            def launch(student):
+                return legacy_launch(manager, activity, student, student.title(), student)
+
+        students = [f"student{i:04d}" for i in range(args.students)]
+        hasher = get_password_hasher()
+
+        waves = []
+        for label in ("new students", "returning students"):
+            hashes_before = hasher.stats()["completed"]
+            latencies, failures, seconds = run_wave(launch, students, args.concurrency)
+            row = summarize(label, latencies, seconds)
+            row["failures"] = len(failures)
+            row["bcrypt_operations"] = hasher.stats()["completed"] - hashes_before
+            waves.append(row)
+
+        group_row = manager.owi_group_manager.get_group_by_id(group["id"])
+        members = group_row["user_ids"]
+        if isinstance(members, str):
+            members = json.loads(members)
+        batcher_stats = get_group_membership_batcher().stats() if args.mode == "fast" else None
+
+    hasher.shutdown()
+    report = {
+        "mode": args.mode,
+        "students": args.students,
+        "concurrency": args.concurrency,
+        "waves": waves,
+        "group_members": len(members),
+        "lost_group_additions": args.students - len(members),
+        "group_batcher": batcher_stats,
+        "workdir": str(workdir),
+    }
+
+    print(f"\nLTI launch storm: {args.students} students, concurrency {args.concurrency}, mode={args.mode}")
+    print(f"{'':20s} {'launch/s':>9s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s} {'bcrypt':>7s} {'fail':>5s}")
+    for row in waves:
+        print(f"{row['label']:20s} {row['launches_per_s']:9.1f} {row['p50_ms']:8.1f} {row['p95_ms']:8.1f} "
+              f"{row['p99_ms']:8.1f} {row['max_ms']:8.1f} {row['bcrypt_operations']:7d} {row['failures']:5d}")
+    print(f"group members: {report['group_members']} (lost additions: {report['lost_group_additions']})")
+    if batcher_stats:
+        print(f"group writes: {batcher_stats['writes']} for {batcher_stats['requests']} additions")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    failed = sum(row["failures"] for row in waves) + max(0, report["lost_group_additions"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
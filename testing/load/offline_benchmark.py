@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+LAMB Offline Benchmark - full-stack scenarios against local fake providers
+
+Starts the LAMB backend, the KB server and the library manager as real
+uvicorn processes on a throwaway data directory, with every outside
+dependency (LLM, embeddings, Open WebUI sign-in) answered by
+fake_providers.py. No network access or provider keys are needed, so runs
+are reproducible and can be compared across commits.
+
+Scenarios (see SCENARIOS; each one starts only the services it needs):
+
+- ``chat_burst``: streamed completions from many students at once
+- ``rag_heavy``: streamed completions through simple_rag over a KB collection
+- ``ingestion_flood``: concurrent uploads to the KB server and library
+  manager, timed until every file is processed
+- ``lti_storm``: a class launching one LTI activity at once
+
+Usage:
+    python testing/load/offline_benchmark.py --output before.json
+    python testing/load/offline_benchmark.py --scenarios chat_burst,lti_storm --set chat_burst.requests=500
+    python testing/load/offline_benchmark.py --compare before.json --max-regression 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+
+from lti_launch_storm_test import create_owi_database, percentile
+
+REPO_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = REPO_DIR / "backend"
+KB_SERVER_DIR = REPO_DIR / "lamb-kb-server-stable" / "backend"
+LIBRARY_DIR = REPO_DIR / "library-manager" / "backend"
+FAKE_PROVIDERS = Path(__file__).resolve().parent / "fake_providers.py"
+
+TOKEN = "offline-bench-token"
+LTI_KEY = "lamb"
+LTI_SECRET = "offline-bench-lti-secret"
+OWNER = "bench@example.com"
+
+SCENARIOS = {
+    "chat_burst": {
+        "description": "Streamed completions from many students at once, no RAG",
+        "services": ("backend",),
+        "params": {"requests": 200, "concurrency": 50},
+    },
+    "rag_heavy": {
+        "description": "Streamed completions through simple_rag over a seeded KB collection",
+        "services": ("backend", "kb"),
+        "params": {"requests": 100, "concurrency": 20, "documents": 40, "document_kb": 8, "top_k": 5},
+    },
+    "ingestion_flood": {
+        "description": "Concurrent file uploads, timed until every file is processed",
+        "services": ("kb", "library"),
+        "params": {"files": 60, "concurrency": 20, "file_kb": 16, "targets": "kb,library", "timeout_s": 600},
+    },
+    "lti_storm": {
+        "description": "A class launching one LTI activity at once (signed LTI 1.1 launches)",
+        "services": ("backend",),
+        "params": {"students": 200, "concurrency": 50},
+    },
+}
+
+
+# --- Services -----------------------------------------------------------------
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Service:
+    """One stack process, with its output in <workdir>/<name>.log."""
+
+    def __init__(self, name, cmd, cwd, env, port, health_path, workdir):
+        self.name = name
+        self.cmd = cmd
+        self.cwd = cwd
+        self.env = env
+        self.url = f"http://127.0.0.1:{port}"
+        self.health_url = self.url + health_path
+        self.log_path = Path(workdir) / f"{name}.log"
+        self.process = None
+
+    def start(self, timeout=90):
+        self.log = open(self.log_path, "wb")
+        self.process = subprocess.Popen(self.cmd, cwd=self.cwd, env=self.env,
+                                        stdout=self.log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                with urllib.request.urlopen(self.health_url, timeout=2):
+                    return self
+            except urllib.error.HTTPError as e:
+                if e.code < 500:  # up, but the health route wants auth
+                    return self
+            except (urllib.error.URLError, OSError):
+                pass
+            time.sleep(0.25)
+        self.stop()
+        tail = self.log_path.read_text(errors="replace").splitlines()[-20:]
+        raise RuntimeError(f"{self.name} did not start; last log lines:\n" + "\n".join(tail))
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.process:
+            self.log.close()
+
+
+def uvicorn(port):
+    return [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning", "--no-access-log"]
+
+
+def backend_env(workdir, fake_url, backend_url, kb_url):
+    """Environment of the backend process, also used to seed its database."""
+    return {
+        "LAMB_DB_PATH": str(workdir / "lamb"),
+        "OWI_PATH": str(workdir / "owi"),
+        "OWI_BASE_URL": fake_url,
+        "OWI_PUBLIC_BASE_URL": fake_url,
+        "OPENAI_BASE_URL": f"{fake_url}/v1",
+        "OPENAI_API_KEY": "fake-key",
+        "OPENAI_MODEL": "fake-model",
+        "LAMB_BEARER_TOKEN": TOKEN,
+        "LAMB_WEB_HOST": backend_url,
+        "LAMB_BACKEND_HOST": backend_url,
+        "LAMB_KB_SERVER": kb_url,
+        "LAMB_KB_SERVER_TOKEN": TOKEN,
+        "SIGNUP_SECRET_KEY": "offline-bench",
+        "LAMB_JWT_SECRET": "offline-bench-jwt-secret",
+        "OWI_ADMIN_NAME": "Admin",
+        "OWI_ADMIN_EMAIL": "admin@example.com",
+        "OWI_ADMIN_PASSWORD": "offline-bench-admin",
+        "LTI_GLOBAL_CONSUMER_KEY": LTI_KEY,
+        "LTI_GLOBAL_SECRET": LTI_SECRET,
+        "DB_MAINTENANCE_ENABLED": "false",
+        "GLOBAL_LOG_LEVEL": "WARNING",
+    }
+
+
+# --- Seeding ------------------------------------------------------------------
+
+def document_text(i, size_kb):
+    """A unique course document of about size_kb kilobytes."""
+    paragraph = (f"Section {i}. The course covers topic {i} with readings, weekly exercises and an "
+                 f"assessment rubric. Students submit reflections on topic {i} before the seminar. ")
+    return (paragraph * (size_kb * 1024 // len(paragraph) + 1))[:size_kb * 1024]
+
+
+async def wait_until(check, timeout_s, interval=0.25):
+    """Poll an async check until it returns a truthy value; returns seconds waited."""
+    started = time.perf_counter()
+    while not await check():
+        if time.perf_counter() - started > timeout_s:
+            raise TimeoutError(f"not done after {timeout_s}s")
+        await asyncio.sleep(interval)
+    return time.perf_counter() - started
+
+
+async def kb_create_collection(session, kb_url, name):
+    payload = {"name": name, "owner": OWNER, "visibility": "private",
+               "embeddings_model": {"model": "default", "vendor": "default",
+                                    "api_endpoint": "default", "apikey": "default"}}
+    async with session.post(f"{kb_url}/collections", json=payload, headers=auth_header()) as resp:
+        if resp.status >= 300:
+            raise RuntimeError(f"KB collection create: HTTP {resp.status}: {(await resp.text())[:200]}")
+        return (await resp.json())["id"]
+
+
+async def kb_ingest(session, kb_url, collection_id, name, text):
+    form = aiohttp.FormData()
+    form.add_field("file", text.encode(), filename=name, content_type="text/plain")
+    form.add_field("plugin_name", "simple_ingest")
+    form.add_field("plugin_params", json.dumps({"chunk_size": 1000, "chunk_unit": "char", "chunk_overlap": 100}))
+    async with session.post(f"{kb_url}/collections/{collection_id}/ingest-file",
+                            data=form, headers=auth_header()) as resp:
+        if resp.status >= 300:
+            raise RuntimeError(f"HTTP {resp.status}: {(await resp.text())[:200]}")
+
+
+async def kb_progress(session, kb_url, collection_id):
+    """(finished, failed) ingestion jobs of a collection."""
+    async with session.get(f"{kb_url}/collections/{collection_id}/ingestion-status",
+                           headers=auth_header()) as resp:
+        by_status = (await resp.json()).get("by_status", {})
+    return by_status.get("completed", 0) + by_status.get("failed", 0), by_status.get("failed", 0)
+
+
+async def wait_for_processing(progress, expected, timeout_s):
+    """Wait until ``expected`` items are finished; returns how many failed."""
+    failed = 0
+
+    async def done():
+        nonlocal failed
+        finished, failed = await progress()
+        return finished >= expected
+
+    await wait_until(done, timeout_s)
+    return failed
+
+
+async def seed_rag_collection(session, kb_url, params):
+    collection_id = await kb_create_collection(session, kb_url, "offline-bench-rag")
+    for i in range(params["documents"]):
+        await kb_ingest(session, kb_url, collection_id, f"course-{i}.txt", document_text(i, params["document_kb"]))
+    failed = await wait_for_processing(lambda: kb_progress(session, kb_url, collection_id), params["documents"], 600)
+    if failed:
+        raise RuntimeError(f"{failed} of the RAG documents failed to ingest")
+    return collection_id
+
+
+def seed_lamb(env, rag_collection_id, top_k):
+    """Create the benchmark creator, assistants and LTI activity before the backend starts."""
+    os.environ.update(env)
+    Path(env["LAMB_DB_PATH"]).mkdir()
+    Path(env["OWI_PATH"]).mkdir()
+    create_owi_database(Path(env["OWI_PATH"]) / "webui.db")
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from lamb.database_manager import LambDatabaseManager
+    from lamb.lamb_classes import Assistant
+    from lamb.lti_activity_manager import LtiActivityManager
+
+    db = LambDatabaseManager()
+    db.create_creator_user(OWNER, "Benchmark Creator", "offline-bench-password")
+    org_id = db.get_organization_by_slug("lamb")["id"]
+
+    def assistant(name, rag_processor, collections):
+        metadata = {"connector": "openai", "llm": "fake-model",
+                    "prompt_processor": "simple_augment", "rag_processor": rag_processor}
+        return db.add_assistant(Assistant(
+            name=name, description="Offline benchmark assistant", owner=OWNER, organization_id=org_id,
+            api_callback=json.dumps(metadata), system_prompt="You are a helpful course assistant.",
+            prompt_template="{context}\n\n{user_input}", pre_retrieval_endpoint="",
+            post_retrieval_endpoint="", RAG_endpoint="", RAG_Top_k=top_k, RAG_collections=collections))
+
+    ids = {"chat": assistant("bench_chat", "", "")}
+    if rag_collection_id is not None:
+        ids["rag"] = assistant("bench_rag", "simple_rag", str(rag_collection_id))
+
+    manager = LtiActivityManager()
+    instructor = manager.owi_user_manager.create_user(
+        "Instructor", "instructor@example.com", "", "user", password_hash="x")
+    group = manager.owi_group_manager.create_group("lti_activity_bench", instructor["id"])
+    db.create_lti_activity(resource_link_id="offline-bench", organization_id=org_id, owi_group_id=group["id"],
+                           owi_group_name="lti_activity_bench", configured_by_email=OWNER)
+    return ids
+
+
+# --- Load generation ----------------------------------------------------------
+
+def auth_header():
+    return {"Authorization": f"Bearer {TOKEN}"}
+
+
+def latency_stats(values):
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0}
+    return {"p50": round(percentile(values, 50), 1), "p95": round(percentile(values, 95), 1),
+            "p99": round(percentile(values, 99), 1), "max": round(max(values), 1),
+            "mean": round(statistics.mean(values), 1)}
+
+
+async def run_requests(total, concurrency, one):
+    """Call ``one(i)`` for every i with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    results = []
+
+    async def worker(i):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                extra, error = await one(i) or {}, None
+            except Exception as e:
+                extra, error = {}, f"{type(e).__name__}: {e}"
+            results.append({"ms": (time.perf_counter() - started) * 1000, "error": error, **extra})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(total)))
+    return results, time.perf_counter() - started
+
+
+def summarize(results, seconds):
+    ok = [r for r in results if not r["error"]]
+    errors = sorted({r["error"] for r in results if r["error"]})
+    return {
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "error_samples": errors[:3],
+        "seconds": round(seconds, 2),
+        "throughput_per_s": round(len(ok) / seconds, 2) if seconds else 0.0,
+        "latency_ms": latency_stats([r["ms"] for r in ok]),
+    }
+
+
+def parse_server_timing(header):
+    stages = {}
+    for part in filter(None, (p.strip() for p in header.split(","))):
+        name, _, duration = part.partition(";dur=")
+        try:
+            stages[name] = float(duration)
+        except ValueError:
+            pass
+    return stages
+
+
+async def stream_completion(session, backend_url, assistant_id, i):
+    """One streamed completion; returns time to first token and the Server-Timing stages."""
+    payload = {"model": f"lamb_assistant.{assistant_id}", "stream": True,
+               "messages": [{"role": "user", "content": f"Question {i}: what does topic {i % 40} cover?"}]}
+    started = time.perf_counter()
+    async with session.post(f"{backend_url}/v1/chat/completions", json=payload, headers=auth_header()) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}: {(await resp.text())[:200]}")
+        ttft_ms = None
+        async for line in resp.content:
+            if ttft_ms is None and line.startswith(b"data: {"):
+                choices = json.loads(line[6:]).get("choices") or [{}]
+                if choices[0].get("delta", {}).get("content"):
+                    ttft_ms = (time.perf_counter() - started) * 1000
+        if ttft_ms is None:
+            raise RuntimeError("stream ended without content")
+        return {"ttft_ms": ttft_ms, "timing": parse_server_timing(resp.headers.get("Server-Timing", ""))}
+
+
+async def completions_scenario(session, ctx, assistant_id, params):
+    results, seconds = await run_requests(
+        params["requests"], params["concurrency"],
+        lambda i: stream_completion(session, ctx["backend"], assistant_id, i))
+    report = summarize(results, seconds)
+    ok = [r for r in results if not r["error"]]
+    report["ttft_ms"] = latency_stats([r["ttft_ms"] for r in ok])
+    stages = {}
+    for r in ok:
+        for stage, ms in r["timing"].items():
+            stages.setdefault(stage, []).append(ms)
+    report["server_timing_p50_ms"] = {stage: round(percentile(v, 50), 1) for stage, v in stages.items()}
+    return report
+
+
+async def chat_burst(session, ctx, params):
+    return await completions_scenario(session, ctx, ctx["assistants"]["chat"], params)
+
+
+async def rag_heavy(session, ctx, params):
+    return await completions_scenario(session, ctx, ctx["assistants"]["rag"], params)
+
+
+async def ingestion_flood(session, ctx, params):
+    files = [(f"flood-{uuid.uuid4().hex[:8]}-{i}.txt", document_text(1000 + i, params["file_kb"]))
+             for i in range(params["files"])]
+    report = {}
+    for target in params["targets"].split(","):
+        if target == "kb":
+            collection_id = await kb_create_collection(session, ctx["kb"], f"offline-bench-flood-{uuid.uuid4().hex[:6]}")
+
+            def upload(i):
+                return kb_ingest(session, ctx["kb"], collection_id, *files[i])
+
+            def progress():
+                return kb_progress(session, ctx["kb"], collection_id)
+        else:
+            library_id = str(uuid.uuid4())
+            async with session.post(f"{ctx['library']}/libraries", headers=auth_header(),
+                                    json={"id": library_id, "organization_id": "1", "name": "offline-bench"}) as resp:
+                if resp.status >= 300:
+                    raise RuntimeError(f"library create: HTTP {resp.status}: {(await resp.text())[:200]}")
+
+            async def upload(i):
+                name, text = files[i]
+                form = aiohttp.FormData()
+                form.add_field("file", text.encode(), filename=name, content_type="text/plain")
+                form.add_field("plugin_name", "simple_import")
+                form.add_field("title", name)
+                async with session.post(f"{ctx['library']}/libraries/{library_id}/import/file",
+                                        data=form, headers=auth_header()) as resp:
+                    if resp.status >= 300:
+                        raise RuntimeError(f"HTTP {resp.status}: {(await resp.text())[:200]}")
+
+            async def count(status):
+                async with session.get(f"{ctx['library']}/libraries/{library_id}/items",
+                                       params={"status": status, "limit": 1}, headers=auth_header()) as resp:
+                    return (await resp.json())["total"]
+
+            async def progress():
+                failed = await count("failed")
+                return await count("ready") + failed, failed
+
+        started = time.perf_counter()
+        results, upload_s = await run_requests(len(files), params["concurrency"], upload)
+        row = summarize(results, upload_s)
+        row["processing_failures"] = await wait_for_processing(progress, len(files) - row["errors"],
+                                                               params["timeout_s"])
+        drain_s = time.perf_counter() - started
+        # Uploads are accepted fast and processed in the background: the
+        # throughput that matters is files fully processed per second
+        row["accept_latency_ms"] = row.pop("latency_ms")
+        row["drain_s"] = round(drain_s, 2)
+        row["throughput_per_s"] = round((len(files) - row["errors"] - row["processing_failures"]) / drain_s, 2)
+        report[target] = row
+    return report
+
+
+async def lti_storm(session, ctx, params):
+    from lamb.lti_activity_manager import LtiActivityManager
+
+    url = f"{ctx['backend']}/lamb/v1/lti/launch"
+
+    async def launch(i):
+        form = {
+            "oauth_consumer_key": LTI_KEY, "oauth_signature_method": "HMAC-SHA1",
+            "oauth_timestamp": str(int(time.time())), "oauth_nonce": uuid.uuid4().hex,
+            "oauth_version": "1.0", "lti_message_type": "basic-lti-launch-request",
+            "lti_version": "LTI-1p0", "resource_link_id": "offline-bench", "roles": "Learner",
+            "user_id": f"student{i:05d}", "ext_user_username": f"student{i:05d}",
+            "lis_person_name_full": f"Student {i}",
+        }
+        form["oauth_signature"] = LtiActivityManager._compute_oauth_signature(form, "POST", url, LTI_SECRET)
+        async with session.post(url, data=form, allow_redirects=False) as resp:
+            if resp.status != 303:
+                raise RuntimeError(f"HTTP {resp.status}: {(await resp.text())[:200]}")
+
+    results, seconds = await run_requests(params["students"], params["concurrency"], launch)
+    return summarize(results, seconds)
+
+
+RUNNERS = {"chat_burst": chat_burst, "rag_heavy": rag_heavy,
+           "ingestion_flood": ingestion_flood, "lti_storm": lti_storm}
+
+
+# --- Comparison ---------------------------------------------------------------
+
+def headline_metrics(report):
+    """Flatten each scenario (and ingestion target) to its throughput and p95/p99."""
+    metrics = {}
+
+    def walk(prefix, node):
+        if "throughput_per_s" in node:
+            latency = node.get("latency_ms") or node.get("accept_latency_ms")
+            metrics[f"{prefix}.throughput_per_s"] = node["throughput_per_s"]
+            metrics[f"{prefix}.p95_ms"] = latency["p95"]
+            metrics[f"{prefix}.p99_ms"] = latency["p99"]
+            if "ttft_ms" in node:
+                metrics[f"{prefix}.ttft_p95_ms"] = node["ttft_ms"]["p95"]
+            return
+        for key, child in node.items():
+            if isinstance(child, dict):
+                walk(f"{prefix}.{key}", child)
+
+    for name, result in report["scenarios"].items():
+        walk(name, result)
+    return metrics
+
+
+def compare(report, baseline, max_regression):
+    """Print the change of every headline metric; returns the regressed ones."""
+    current, before = headline_metrics(report), headline_metrics(baseline)
+    print(f"\nCompared with {baseline.get('commit', '?')} ({baseline.get('started_at', '?')}):")
+    if report["providers"] != baseline.get("providers"):
+        print("  note: the fake provider settings differ from the baseline")
+    for name in sorted(report["scenarios"].keys() & baseline.get("scenarios", {}).keys()):
+        if report["scenarios"][name]["params"] != baseline["scenarios"][name]["params"]:
+            print(f"  note: {name} parameters differ from the baseline")
+    regressions = []
+    for key in sorted(current.keys() & before.keys()):
+        old, new = before[key], current[key]
+        change = (new - old) / old * 100 if old else 0.0
+        # Lower is better for latencies, higher for throughput
+        worse = -change if key.endswith("throughput_per_s") else change
+        flag = ""
+        if max_regression is not None and worse > max_regression:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"  {key:<42} {old:>10.1f} -> {new:>10.1f}  {change:+7.1f}%{flag}")
+    return regressions
+
+
+# --- Main ---------------------------------------------------------------------
+
+def scenario_rows(scenarios):
+    """(label, result) per scenario, and per target for ingestion_flood."""
+    for name, result in scenarios.items():
+        if "throughput_per_s" in result:
+            yield name, result
+        else:
+            yield from ((f"{name}.{target}", row) for target, row in result.items()
+                        if isinstance(row, dict) and "requests" in row)
+
+
+def parse_overrides(pairs, params):
+    """Apply ``scenario.param=value`` overrides, keeping each default's type."""
+    for pair in pairs:
+        key, _, value = pair.partition("=")
+        scenario, _, name = key.partition(".")
+        if scenario not in params or name not in params[scenario]:
+            raise SystemExit(f"Unknown parameter: {key}")
+        params[scenario][name] = type(params[scenario][name])(value)
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_DIR,
+                               capture_output=True, text=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run_scenarios(selected, params, ctx):
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=600)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        if "kb" in ctx and "rag_heavy" in selected:
+            print("Seeding the RAG collection...")
+            ctx["rag_collection"] = await seed_rag_collection(session, ctx["kb"], params["rag_heavy"])
+        start_backend = ctx.pop("start_backend", None)
+        if start_backend:
+            start_backend()
+        results = {}
+        for name in selected:
+            print(f"Running {name}...")
+            result = await RUNNERS[name](session, ctx, params[name])
+            results[name] = {"description": SCENARIOS[name]["description"], "params": params[name], **result}
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-stack LAMB benchmark against local fake providers")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--set", action="append", default=[], metavar="SCENARIO.PARAM=VALUE",
+                        help="Override a scenario parameter (repeatable)")
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="Fake LLM delay before the first token")
+    parser.add_argument("--tokens-per-s", type=float, default=50.0, help="Fake LLM token rate")
+    parser.add_argument("--completion-tokens", type=int, default=60, help="Tokens per fake completion")
+    parser.add_argument("--embedding-latency-ms", type=float, default=20.0, help="Fake embeddings delay per call")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline report to compare against")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="Exit 1 if a p95/p99 rises or a throughput falls by more than this percent")
+    parser.add_argument("--keep", action="store_true", help="Keep the temp directory with data and service logs")
+    args = parser.parse_args()
+
+    selected = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in selected if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+    params = {name: dict(spec["params"]) for name, spec in SCENARIOS.items()}
+    parse_overrides(args.set, params)
+
+    needed = set()
+    for name in selected:
+        needed |= set(params[name]["targets"].split(",")) if name == "ingestion_flood" \
+            else set(SCENARIOS[name]["services"])
+
+    workdir = Path(tempfile.mkdtemp(prefix="lamb_offline_bench_"))
+    ports = {name: free_port() for name in ("fake", "backend", "kb", "library")}
+    ctx = {name: f"http://127.0.0.1:{port}" for name, port in ports.items()}
+    services = []
+
+    def start(service):
+        print(f"Starting {service.name} on {service.url}...")
+        services.append(service.start())
+
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    try:
+        start(Service("fake_providers", [
+            sys.executable, str(FAKE_PROVIDERS), "--port", str(ports["fake"]),
+            "--ttft-ms", str(args.ttft_ms), "--tokens-per-s", str(args.tokens_per_s),
+            "--completion-tokens", str(args.completion_tokens),
+            "--embedding-latency-ms", str(args.embedding_latency_ms),
+        ], REPO_DIR, dict(os.environ), ports["fake"], "/_stats", workdir))
+
+        if "kb" in needed:
+            # The KB server keeps its data next to its code, so run a copy
+            kb_dir = workdir / "kb-server"
+            shutil.copytree(KB_SERVER_DIR, kb_dir,
+                            ignore=shutil.ignore_patterns("data", "__pycache__", "tests", "test_files", ".env"))
+            start(Service("kb_server", uvicorn(ports["kb"]), kb_dir, dict(
+                os.environ, LAMB_API_KEY=TOKEN, EMBEDDINGS_VENDOR="openai", EMBEDDINGS_MODEL="fake-embedding",
+                EMBEDDINGS_ENDPOINT=f"{ctx['fake']}/v1", EMBEDDINGS_APIKEY="fake-key",
+                KB_CONFIG_PATH=str(workdir / "kb-config.json"), HOME_URL=ctx["kb"], GLOBAL_LOG_LEVEL="WARNING",
+            ), ports["kb"], "/health", workdir))
+
+        if "library" in needed:
+            start(Service("library_manager", uvicorn(ports["library"]), LIBRARY_DIR, dict(
+                os.environ, DATA_DIR=str(workdir / "library"), LAMB_API_TOKEN=TOKEN, PORT=str(ports["library"]),
+                LOG_LEVEL="WARNING",
+            ), ports["library"], "/health", workdir))
+
+        if "backend" in needed:
+            env = backend_env(workdir, ctx["fake"], ctx["backend"], ctx["kb"])
+
+            def start_backend():
+                # Runs after the RAG collection exists, so the assistant can point at it
+                ctx["assistants"] = seed_lamb(env, ctx.get("rag_collection"), params["rag_heavy"]["top_k"])
+                start(Service("backend", uvicorn(ports["backend"]), BACKEND_DIR,
+                              dict(os.environ, **env), ports["backend"], "/status", workdir))
+            ctx["start_backend"] = start_backend
+
+        scenarios = asyncio.run(run_scenarios(selected, params, ctx))
+        with urllib.request.urlopen(f"{ctx['fake']}/_stats") as resp:
+            providers = json.load(resp)
+    except RuntimeError as e:
+        print(f"\n{e}\nService logs are in {workdir}", file=sys.stderr)
+        return 2
+    finally:
+        for service in reversed(services):
+            service.stop()
+
+    report = {
+        "harness_version": 1,
+        "commit": git_commit(),
+        "started_at": started_at,
+        "host": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "providers": providers["settings"],
+        "provider_calls": providers["counters"],
+        "scenarios": scenarios,
+    }
+
+    print(f"\nOffline benchmark at {report['commit']} (fake LLM: {args.ttft_ms:g} ms to first token, "
+          f"{args.tokens_per_s:g} tokens/s)")
+    print(f"{'':28s} {'req':>5s} {'err':>4s} {'req/s':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s}")
+    for label, row in scenario_rows(scenarios):
+        latency = row.get("latency_ms") or row["accept_latency_ms"]
+        print(f"{label:28s} {row['requests']:5d} {row['errors']:4d} {row['throughput_per_s']:8.2f} "
+              f"{latency['p50']:8.1f} {latency['p95']:8.1f} {latency['p99']:8.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+
+    if args.keep:
+        print(f"Data and service logs kept in {workdir}")
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    errors = sum(row["errors"] + row.get("processing_failures", 0) for _, row in scenario_rows(scenarios))
+    return 1 if errors or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
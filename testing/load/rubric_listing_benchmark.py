@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+LAMB Rubric Listing Benchmark - rubric list pages over a large rubric library
+
+Seeds a throwaway local LAMB database with N rubrics (a shared public
+library in one organization plus one creator's own rubrics) and times the
+listing calls behind /creator/rubrics: first page, filtered page, deep page
+and total count, for both the public library and "my rubrics".
+
+Usage:
+    python testing/load/rubric_listing_benchmark.py
+    python testing/load/rubric_listing_benchmark.py --rubrics 50000 --repeat 20
+    python testing/load/rubric_listing_benchmark.py --mode legacy   # JSON_EXTRACT filters + full parse
+
+``--mode legacy`` replays the previous listing queries, which filtered with
+JSON_EXTRACT on rubric_data and parsed every full rubric on the page.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+SUBJECTS = ["Mathematics", "History", "Biology", "Chemistry", "Physics", "Literature",
+            "Geography", "Music", "Art", "Computer Science", "Economics", "Philosophy"]
+GRADES = [f"Grade {g}" for g in range(1, 13)] + ["University"]
+OWNER = "bench@example.com"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def make_rubric(i, rng):
+    """A rubric of realistic size: 4 criteria with 4 performance levels each."""
+    return {
+        "title": f"Rubric {i}",
+        "description": f"Assessment rubric number {i} for project work",
+        "metadata": {"subject": rng.choice(SUBJECTS), "gradeLevel": rng.choice(GRADES),
+                     "createdAt": "2026-01-01T00:00:00", "modifiedAt": "2026-01-01T00:00:00"},
+        "criteria": [{
+            "id": f"c{c}", "name": f"Criterion {c}", "weight": 25,
+            "description": "What the student is expected to demonstrate " * 3,
+            "levels": [{"id": f"l{c}{lv}", "score": 4 - lv, "label": f"Level {lv}",
+                        "description": "Observable evidence of this level of performance " * 3}
+                       for lv in range(4)],
+        } for c in range(4)],
+        "scoringType": "points",
+        "maxScore": 16,
+    }
+
+
+def seed(db, org_id, count, own_share, list_metadata):
+    """Insert rubrics in one transaction; metadata columns filled as create_rubric does."""
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        rubric = make_rubric(i, rng)
+        own = i % own_share == 0
+        rows.append((str(uuid.uuid4()), org_id, OWNER if own else f"teacher{i % 500}@example.com",
+                     rubric["title"], rubric["description"], *list_metadata(rubric),
+                     json.dumps(rubric), 0 if own else 1, i % 997 == 0, 1_700_000_000 + i, 1_700_000_000 + i))
+    conn = db.get_connection()
+    conn.executemany(f"""
+        INSERT INTO {db.table_prefix}rubrics (
+            rubric_id, organization_id, owner_email, title, description,
+            subject, grade_level, criteria_count, max_score,
+            rubric_data, is_public, is_showcase, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def legacy_list(db, where, params, order_by, limit, offset):
+    """The listing query before the metadata columns: full rows, JSON filters."""
+    conn = db.get_connection()
+    try:
+        cursor = conn.execute(f"""
+            SELECT r.*, o.slug as organization_slug
+            FROM {db.table_prefix}rubrics r
+            JOIN {db.table_prefix}organizations o ON r.organization_id = o.id
+            WHERE {where}
+            ORDER BY {order_by}
+            LIMIT ? OFFSET ?
+        """, params + [limit, offset])
+        columns = [desc[0] for desc in cursor.description]
+        rubrics = []
+        for row in cursor.fetchall():
+            rubric = dict(zip(columns, row))
+            rubric["rubric_data"] = json.loads(rubric["rubric_data"])
+            rubrics.append(rubric)
+        return rubrics
+    finally:
+        conn.close()
+
+
+def legacy_count(db, where, params):
+    conn = db.get_connection()
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {db.table_prefix}rubrics r WHERE {where}", params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def legacy_calls(db, org_id):
+    public = "r.organization_id = ? AND r.is_public = 1"
+    public_order = "r.is_showcase DESC, r.updated_at DESC"
+    subject = " AND JSON_EXTRACT(r.rubric_data, '$.metadata.subject') LIKE ?"
+    own = "r.owner_email = ?"
+    return {
+        "public_first_page": lambda: legacy_list(db, public, [org_id], public_order, 10, 0),
+        "public_subject_page": lambda: legacy_list(db, public + subject, [org_id, "%chem%"], public_order, 10, 0),
+        "public_deep_page": lambda: legacy_list(db, public, [org_id], public_order, 10, 2000),
+        "public_subject_count": lambda: legacy_count(db, public + subject, [org_id, "%chem%"]),
+        "own_first_page": lambda: legacy_list(db, own, [OWNER], "r.updated_at DESC", 10, 0),
+        "own_subject_page": lambda: legacy_list(db, own + subject, [OWNER, "%chem%"], "r.updated_at DESC", 10, 0),
+    }
+
+
+def indexed_calls(rubrics, org_id):
+    chem = {"subject": "chem"}
+    return {
+        "public_first_page": lambda: rubrics.get_public_rubrics(org_id, 10, 0, include_system_org=False),
+        "public_subject_page": lambda: rubrics.get_public_rubrics(org_id, 10, 0, chem, include_system_org=False),
+        "public_deep_page": lambda: rubrics.get_public_rubrics(org_id, 10, 2000, include_system_org=False),
+        "public_subject_count": lambda: rubrics.count_public_rubrics(org_id, chem, include_system_org=False),
+        "own_first_page": lambda: rubrics.get_rubrics_by_owner(OWNER, 10, 0),
+        "own_subject_page": lambda: rubrics.get_rubrics_by_owner(OWNER, 10, 0, chem),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rubric list page latency over a large library")
+    parser.add_argument("--rubrics", type=int, default=50000, help="Rubrics to seed")
+    parser.add_argument("--own-share", type=int, default=10,
+                        help="Every Nth rubric belongs to the benchmark creator (private)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed repetitions per call")
+    parser.add_argument("--mode", choices=("indexed", "legacy"), default="indexed", help="Listing to exercise")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="rubric_listing_"))
+    owi_dir = workdir / "owi"
+    owi_dir.mkdir()
+    os.environ["OWI_PATH"] = str(owi_dir)
+    os.environ["LAMB_DB_PATH"] = str(workdir)
+    os.environ.setdefault("OWI_BASE_URL", "http://owi.invalid")
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    # The system organization bootstrap talks to Open WebUI; not part of this test
+    with patch("lamb.owi_bridge.owi_users.OwiUserManager"), \
+            patch("lamb.database_manager.OwiUserManager"):
+        from lamb.evaluaitor import rubric_database
+        rubrics = rubric_database.RubricDatabaseManager()
+    db = rubrics.db_manager
+    org_id = db.create_organization("bench", "Benchmark School")
+
+    started = time.perf_counter()
+    seed(db, org_id, args.rubrics, args.own_share, rubric_database._list_metadata)
+    seed_s = time.perf_counter() - started
+
+    if args.mode == "legacy":
+        # The previous schema had no listing indexes
+        conn = db.get_connection()
+        conn.execute(f"DROP INDEX idx_{db.table_prefix}rubrics_owner_list")
+        conn.execute(f"DROP INDEX idx_{db.table_prefix}rubrics_public_list")
+        conn.commit()
+        conn.close()
+        calls = legacy_calls(db, org_id)
+    else:
+        calls = indexed_calls(rubrics, org_id)
+    results = {}
+    for name, call in calls.items():
+        call()  # warm the page cache
+        timings = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - t0) * 1000)
+        results[name] = {"median_ms": round(statistics.median(timings), 2),
+                         "p95_ms": round(percentile(timings, 95), 2)}
+
+    report = {
+        "mode": args.mode,
+        "rubrics": args.rubrics,
+        "repeat": args.repeat,
+        "seed_s": round(seed_s, 1),
+        "db_mb": round(os.path.getsize(db.db_path) / 1e6, 1),
+        "calls": results,
+        "workdir": str(workdir),
+    }
+
+    print(f"\nRubric listing: {args.rubrics} rubrics, mode={args.mode}, {args.repeat} runs per call")
+    for name, timing in results.items():
+        print(f"  {name:<22} median {timing['median_ms']:>8.2f} ms   p95 {timing['p95_ms']:>8.2f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())